@@ -0,0 +1,11 @@
+"""Benchmarks for sweet_validation
+
+Run the benchmarks and store the results as baseline:
+
+    python -m benchmarks run --output baseline.json
+
+Compare a new run against the baseline:
+
+    python -m benchmarks run --output current.json
+    python -m benchmarks compare baseline.json current.json --threshold 0.2
+"""
@@ -0,0 +1,140 @@
+import argparse
+import sys
+
+from .importtime import BUDGET_MS, import_time
+from .runner import BenchmarkResults, compare, load_results
+from .suites import SUITES
+from .synthetic import CONSTRAINTS
+
+PRESETS = {
+    "quick": {"rows": [10_000], "columns": [10], "keys": [1_000], "datasets": [10]},
+    "full": {
+        "rows": [10_000, 100_000, 1_000_000],
+        "columns": [10, 50],
+        "keys": [1_000, 10_000, 100_000],
+        "datasets": [10, 100],
+    },
+}
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(v) for v in value.split(",")]
+
+
+def _str_list(value: str) -> list[str]:
+    return [v for v in value.split(",") if v]
+
+
+def run(args: argparse.Namespace) -> int:
+    params = dict(PRESETS[args.preset])
+    for name in ("rows", "columns", "keys", "datasets"):
+        if getattr(args, name) is not None:
+            params[name] = getattr(args, name)
+    results = BenchmarkResults()
+    for suite in args.suite:
+        SUITES[suite](
+            results,
+            constraints=args.constraints,
+            invalid_fraction=args.invalid_fraction,
+            repeat=args.repeat,
+            **params,
+        )
+    if args.output:
+        results.save(args.output)
+    return 0
+
+
+def compare_cmd(args: argparse.Namespace) -> int:
+    comparison = compare(
+        load_results(args.baseline), load_results(args.current), args.threshold
+    )
+    for c in comparison:
+        flag = "SLOWER" if c["regression"] else ""
+        print(
+            f"{c['name']:<60} {c['baseline']:>10.4f}s {c['current']:>10.4f}s "
+            f"{c['ratio']:>6.2f}x {flag}"
+        )
+    regressions = [c for c in comparison if c["regression"]]
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) slower than the baseline by more "
+            f"than {args.threshold:.0%}"
+        )
+        return 1
+    return 0
+
+
+def importtime_cmd(args: argparse.Namespace) -> int:
+    failed = 0
+    for module in args.module:
+        ms = import_time(module)
+        over = args.budget_ms > 0 and ms > args.budget_ms
+        failed += over
+        print(f"{module:<40} {ms:>10.1f}ms {'OVER BUDGET' if over else ''}")
+    return 1 if failed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmarks for sweet_validation"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="Run benchmarks")
+    p_run.add_argument(
+        "--suite",
+        type=_str_list,
+        default=list(SUITES),
+        help=f"Comma separated suites to run. Available: {', '.join(SUITES)}",
+    )
+    p_run.add_argument("--preset", choices=list(PRESETS), default="quick")
+    p_run.add_argument("--rows", type=_int_list, help="Comma separated row counts")
+    p_run.add_argument("--columns", type=_int_list, help="Comma separated columns")
+    p_run.add_argument("--keys", type=_int_list, help="Comma separated key counts")
+    p_run.add_argument(
+        "--datasets", type=_int_list, help="Comma separated dataset counts"
+    )
+    p_run.add_argument(
+        "--constraints",
+        type=_str_list,
+        default=None,
+        help=f"Comma separated constraint mix. Available: {', '.join(CONSTRAINTS)}",
+    )
+    p_run.add_argument("--invalid-fraction", type=float, default=0.0)
+    p_run.add_argument("--repeat", type=int, default=3)
+    p_run.add_argument("--output", help="Json file to store the results")
+    p_run.set_defaults(func=run)
+
+    p_cmp = sub.add_parser("compare", help="Compare results against a baseline")
+    p_cmp.add_argument("baseline", help="Json file with baseline results")
+    p_cmp.add_argument("current", help="Json file with current results")
+    p_cmp.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown that is flagged. Defaults to 0.1 (10%%)",
+    )
+    p_cmp.set_defaults(func=compare_cmd)
+
+    p_imp = sub.add_parser("importtime", help="Measure the import time of modules")
+    p_imp.add_argument(
+        "--module",
+        type=_str_list,
+        default=["sweet_validation", "sweet_validation.registry"],
+        help="Comma separated modules to import",
+    )
+    p_imp.add_argument(
+        "--budget-ms",
+        type=float,
+        default=BUDGET_MS,
+        help="Exit with status 1 if a module takes longer to import. Defaults to "
+        f"{BUDGET_MS:g}ms, 0 disables the check",
+    )
+    p_imp.set_defaults(func=importtime_cmd)
+
+    args = parser.parse_args(argv)
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Measure the import time of modules in a fresh interpreter"""
+
+import subprocess
+import sys
+
+__all__ = ["BUDGET_MS", "import_time", "loaded_modules", "parse_importtime"]
+
+# import time budget of the lazy packages in milliseconds. Importing them only
+# loads the standard library, which takes a few milliseconds; the budget leaves
+# room for slow machines but fails if pandas or sqlalchemy is imported eagerly.
+BUDGET_MS = 50.0
+
+
+def parse_importtime(stderr: str) -> dict[str, float]:
+    """Parse the output of `python -X importtime`
+
+    Args:
+        stderr (str): Standard error of the interpreter
+
+    Returns:
+        dict[str, float]: Cumulative import time in milliseconds by module
+    """
+    times: dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # header line
+        times[parts[2].strip()] = int(parts[1]) / 1000
+    return times
+
+
+def import_time(module: str) -> float:
+    """Cumulative import time of a module in a fresh interpreter
+
+    Args:
+        module (str): Name of the module, e.g., sweet_validation.registry
+
+    Returns:
+        float: Import time in milliseconds
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)[module]
+
+
+def loaded_modules(statement: str) -> set[str]:
+    """Top level packages loaded by a statement in a fresh interpreter
+
+    Args:
+        statement (str): Python statement, e.g., import sweet_validation
+
+    Returns:
+        set[str]: Names of the loaded top level packages
+    """
+    code = (
+        f"{statement}\nimport sys\n"
+        "print('\\n'.join({m.partition('.')[0] for m in sys.modules}))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(proc.stdout.split())
@@ -0,0 +1,143 @@
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+__all__ = ["BenchmarkResults", "compare", "load_results", "measure"]
+
+
+def measure(
+    func: Callable[..., Any],
+    repeat: int = 3,
+    setup: Callable[[], Any] | None = None,
+) -> dict[str, float]:
+    """Time a function
+
+    Args:
+        func (Callable[..., Any]): Function to time. If setup is given, the
+            function is called with the return value of setup.
+        repeat (int, optional): Number of timed runs. Defaults to 3.
+        setup (Callable[[], Any] | None, optional): Function called before each
+            run that is not included in the timing. Defaults to None.
+
+    Returns:
+        dict[str, float]: Minimum and median run time in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        args = (setup(),) if setup is not None else ()
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return {"seconds": min(timings), "median": statistics.median(timings)}
+
+
+class BenchmarkResults:
+    """Collection of benchmark results that can be stored as json baseline
+
+    Each result is identified by a name, e.g., `validate[rows=1000,columns=10]`,
+    and holds the minimum run time in seconds together with the number of
+    operations and the parameters of the benchmark.
+    """
+
+    results: dict[str, dict[str, Any]]
+
+    def __init__(self) -> None:
+        self.results = {}
+
+    def add(
+        self,
+        name: str,
+        timing: dict[str, float],
+        ops: int = 1,
+        **params: Any,
+    ) -> None:
+        """Add a result
+
+        Args:
+            name (str): Name of the benchmark
+            timing (dict[str, float]): Timing as returned by `measure`
+            ops (int, optional): Number of operations per run, e.g., rows or
+                keys. Defaults to 1.
+            **params: Parameters of the benchmark
+        """
+        key = name + "[" + ",".join(f"{k}={v}" for k, v in params.items()) + "]"
+        self.results[key] = {
+            **timing,
+            "ops": ops,
+            "ops_per_second": ops / timing["seconds"] if timing["seconds"] else None,
+            "params": params,
+        }
+        print(f"{key:<60} {timing['seconds']:>10.4f}s")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the results including machine information to a dictionary"""
+        return {
+            "meta": {
+                "created": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": self.results,
+        }
+
+    def save(self, path: str | Path) -> None:
+        """Store the results as json file
+
+        Args:
+            path (str | Path): Target file
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def load_results(path: str | Path) -> dict[str, dict[str, Any]]:
+    """Load results stored by `BenchmarkResults.save`
+
+    Args:
+        path (str | Path): Json file
+
+    Returns:
+        dict[str, dict[str, Any]]: Results by benchmark name
+    """
+    with open(path) as f:
+        return json.load(f)["results"]  # type: ignore[no-any-return]
+
+
+def compare(
+    baseline: dict[str, dict[str, Any]],
+    current: dict[str, dict[str, Any]],
+    threshold: float = 0.1,
+) -> list[dict[str, Any]]:
+    """Compare benchmark results against a baseline
+
+    Only benchmarks present in both results are compared.
+
+    Args:
+        baseline (dict[str, dict[str, Any]]): Baseline results by name
+        current (dict[str, dict[str, Any]]): Current results by name
+        threshold (float, optional): Relative slowdown that is flagged, e.g.,
+            0.1 flags benchmarks that are more than 10% slower. Defaults to 0.1.
+
+    Returns:
+        list[dict[str, Any]]: Comparison for each benchmark with name, baseline
+            and current seconds, ratio, and whether it is a regression
+    """
+    comparison = []
+    for name in sorted(baseline.keys() & current.keys()):
+        base, cur = baseline[name]["seconds"], current[name]["seconds"]
+        ratio = cur / base if base else float("inf")
+        comparison.append(
+            {
+                "name": name,
+                "baseline": base,
+                "current": cur,
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return comparison
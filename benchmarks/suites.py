@@ -0,0 +1,120 @@
+from functools import partial
+from typing import Any
+
+import pandas as pd
+
+from sweet_validation.registry import InMemoryRegistry
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.validator import DefaultValidator
+
+from .runner import BenchmarkResults, measure
+from .synthetic import make_frame, make_schema
+
+__all__ = ["SUITES", "bench_registry", "bench_schema_manager", "bench_validate"]
+
+
+def bench_validate(
+    results: BenchmarkResults,
+    rows: list[int],
+    columns: list[int],
+    constraints: list[str] | None = None,
+    invalid_fraction: float = 0.0,
+    repeat: int = 3,
+    **kwargs: Any,
+) -> None:
+    """Benchmark DefaultValidator.validate on synthetic frames"""
+    for n_rows in rows:
+        for n_columns in columns:
+            df, schema = make_frame(n_rows, n_columns, constraints, invalid_fraction)
+            results.add(
+                "validate",
+                measure(partial(DefaultValidator.validate, df, schema), repeat),
+                ops=n_rows,
+                rows=n_rows,
+                columns=n_columns,
+                invalid=invalid_fraction,
+            )
+
+
+def bench_schema_manager(
+    results: BenchmarkResults,
+    keys: list[int],
+    repeat: int = 3,
+    **kwargs: Any,
+) -> None:
+    """Benchmark adding, getting and listing schemas of a SchemaManager"""
+    schema = make_schema(5, ["minimum", "enum"])
+    for n_keys in keys:
+        add = partial(_add_schemas, schema=schema, n=n_keys)
+        results.add(
+            "schema_manager.add",
+            measure(add, repeat=repeat, setup=SchemaManager),
+            ops=n_keys,
+            keys=n_keys,
+        )
+        manager = SchemaManager()
+        _add_schemas(manager, schema, n_keys)
+        get = partial(_get_schemas, manager, n_keys)
+        results.add("schema_manager.get", measure(get, repeat), ops=n_keys, keys=n_keys)
+        results.add(
+            "schema_manager.list",
+            measure(partial(getattr, manager, "schemas"), repeat),
+            keys=n_keys,
+        )
+        manager.clear_and_close()
+
+
+def bench_registry(
+    results: BenchmarkResults,
+    datasets: list[int],
+    rows: list[int],
+    columns: list[int],
+    constraints: list[str] | None = None,
+    repeat: int = 3,
+    **kwargs: Any,
+) -> None:
+    """Benchmark the end-to-end ingest of datasets into an InMemoryRegistry"""
+    for n_rows in rows:
+        for n_columns in columns:
+            df, schema = make_frame(n_rows, n_columns, constraints)
+            for n_datasets in datasets:
+                results.add(
+                    "registry.add_data",
+                    measure(
+                        partial(_ingest, df=df, n_datasets=n_datasets),
+                        repeat=repeat,
+                        setup=partial(_empty_registry, schema),
+                    ),
+                    ops=n_datasets,
+                    datasets=n_datasets,
+                    rows=n_rows,
+                    columns=n_columns,
+                )
+
+
+def _add_schemas(manager: SchemaManager, schema: dict[str, Any], n: int) -> None:
+    for i in range(n):
+        manager.add_schema(f"schema_{i}", schema)
+
+
+def _get_schemas(manager: SchemaManager, n: int) -> None:
+    for i in range(n):
+        manager[f"schema_{i}"]
+
+
+def _empty_registry(schema: dict[str, Any]) -> InMemoryRegistry:
+    registry = InMemoryRegistry(DefaultValidator(), SchemaManager())
+    registry.add_schema("synthetic", schema)
+    return registry
+
+
+def _ingest(registry: InMemoryRegistry, df: pd.DataFrame, n_datasets: int) -> None:
+    for i in range(n_datasets):
+        registry.add_data(f"data_{i}", "synthetic", df)
+
+
+SUITES = {
+    "validate": bench_validate,
+    "schema_manager": bench_schema_manager,
+    "registry": bench_registry,
+}
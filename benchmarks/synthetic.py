@@ -0,0 +1,159 @@
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["CONSTRAINTS", "column_name", "make_frame", "make_schema"]
+
+# constraint kinds that can be mixed into synthetic schemas
+CONSTRAINTS = [
+    "minimum",
+    "maximum",
+    "enum",
+    "pattern",
+    "maxLength",
+    "required",
+    "unique",
+]
+
+ENUM_VALUES = ["a", "b", "c", "d"]
+
+
+def make_schema(columns: int, constraints: list[str] | None = None) -> dict[str, Any]:
+    """Create a frictionless schema with the given number of columns
+
+    Constraint kinds are assigned to the columns in turn, i.e., column i gets
+    the constraint `constraints[i % len(constraints)]`.
+
+    Args:
+        columns (int): Number of columns
+        constraints (list[str] | None, optional): Constraint kinds to mix. Defaults
+            to None which uses all kinds in CONSTRAINTS. An empty list creates
+            columns without constraints.
+
+    Returns:
+        dict[str, Any]: Frictionless schema complying with the SWEET standard
+    """
+    constraints = CONSTRAINTS if constraints is None else constraints
+    fields = []
+    for i in range(columns):
+        kind = constraints[i % len(constraints)] if constraints else None
+        fields.append(_make_field(column_name(i), kind))
+    return {
+        "name": "synthetic",
+        "title": "Synthetic benchmark table",
+        "description": "Synthetic table with a configurable mix of constraints",
+        "fields": fields,
+    }
+
+
+def column_name(i: int) -> str:
+    """Name of the i-th column using lower case letters only, e.g., col_a, col_ba
+
+    Field names in the SWEET standard may not contain digits.
+    """
+    name = ""
+    while True:
+        i, rest = divmod(i, 26)
+        name = chr(ord("a") + rest) + name
+        if i == 0:
+            return f"col_{name}"
+
+
+def make_frame(
+    rows: int,
+    columns: int,
+    constraints: list[str] | None = None,
+    invalid_fraction: float = 0.0,
+    seed: int = 0,
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Create a synthetic dataframe together with its schema
+
+    Args:
+        rows (int): Number of rows
+        columns (int): Number of columns
+        constraints (list[str] | None, optional): Constraint kinds to mix. See
+            `make_schema`. Defaults to None.
+        invalid_fraction (float, optional): Share of rows per column that violate
+            the constraint of the column. Defaults to 0.0.
+        seed (int, optional): Seed of the random number generator. Defaults to 0.
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, Any]]: Data and frictionless schema
+    """
+    rng = np.random.default_rng(seed)
+    schema = make_schema(columns, constraints)
+    data = {}
+    for field in schema["fields"]:
+        kind = next(iter(field.get("constraints", {})), None)
+        values = _make_values(kind, rows, rng)
+        n_invalid = int(rows * invalid_fraction)
+        if kind is not None and n_invalid:
+            idx = rng.choice(rows, size=n_invalid, replace=False)
+            values = _make_invalid(kind, values, idx)
+        data[field["name"]] = values
+    return pd.DataFrame(data), schema
+
+
+def _make_field(name: str, kind: str | None) -> dict[str, Any]:
+    """Create a frictionless field definition for a constraint kind"""
+    if kind is None:
+        return {"name": name, "type": "integer"}
+    if kind == "minimum":
+        return {"name": name, "type": "integer", "constraints": {"minimum": 0}}
+    if kind == "maximum":
+        return {"name": name, "type": "integer", "constraints": {"maximum": 999}}
+    if kind == "unique":
+        return {"name": name, "type": "integer", "constraints": {"unique": True}}
+    if kind == "required":
+        return {"name": name, "type": "number", "constraints": {"required": True}}
+    if kind == "enum":
+        return {"name": name, "type": "string", "constraints": {"enum": ENUM_VALUES}}
+    if kind == "pattern":
+        return {
+            "name": name,
+            "type": "string",
+            "constraints": {"pattern": "^id_[0-9]+$"},
+        }
+    if kind == "maxLength":
+        return {"name": name, "type": "string", "constraints": {"maxLength": 8}}
+    raise ValueError(f"Unknown constraint kind '{kind}'. Use one of {CONSTRAINTS}")
+
+
+def _make_values(kind: str | None, rows: int, rng: np.random.Generator) -> np.ndarray:
+    """Create values that satisfy the constraint kind"""
+    if kind in (None, "minimum", "maximum"):
+        return rng.integers(0, 1000, size=rows)
+    if kind == "unique":
+        return rng.permutation(rows)
+    if kind == "required":
+        return rng.random(size=rows)
+    if kind == "enum":
+        return rng.choice(np.array(ENUM_VALUES, dtype=object), size=rows)
+    if kind == "pattern":
+        return np.array([f"id_{i}" for i in rng.integers(0, 10**6, size=rows)])
+    if kind == "maxLength":
+        return np.array(["abcdefgh"[: i + 1] for i in rng.integers(0, 8, size=rows)])
+    raise ValueError(f"Unknown constraint kind '{kind}'. Use one of {CONSTRAINTS}")
+
+
+def _make_invalid(kind: str, values: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """Replace the values at the given positions by violations of the constraint"""
+    values = (
+        values.astype(object) if kind in ("enum", "pattern", "maxLength") else values
+    )
+    if kind == "minimum":
+        values[idx] = -1
+    elif kind == "maximum":
+        values[idx] = 1000
+    elif kind == "unique":
+        values[idx] = values[0]
+    elif kind == "required":
+        values[idx] = np.nan
+    elif kind == "enum":
+        values[idx] = "z"
+    elif kind == "pattern":
+        values[idx] = "no id"
+    elif kind == "maxLength":
+        values[idx] = "a" * 20
+    return values
@@ -0,0 +1,39 @@
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+__all__ = ["lazy_exports"]
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create module level `__getattr__` and `__dir__` functions that import
+    exported attributes on first access
+
+    This keeps importing a package cheap: heavy dependencies like pandas or
+    SQLAlchemy are only loaded once an attribute that needs them is used.
+
+    Args:
+        package (str): Name of the package, i.e., `__name__` of the `__init__`
+        exports (dict[str, str]): Exported attribute names mapped to the
+            relative name of the module that defines them, e.g.,
+            {"DefaultValidator": ".default"}
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: `__getattr__` and
+            `__dir__` for the package
+    """
+    namespace = vars(import_module(package))
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(exports[name], package), name)
+        namespace[name] = value  # later accesses skip __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
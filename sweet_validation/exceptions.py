@@ -1,4 +1,4 @@
-from .validator import ValidationReport
+from .validator.validation_report import ValidationReport
 
 
 class DataValidationError(Exception):
@@ -9,6 +9,6 @@ class DataValidationError(Exception):
     ):
         message = message or "Validation failed."
         if report:
-            message += f"\n{report.errors}"
+            message += f"\n{report.summary()}"
         self.report = report
         super().__init__(message)
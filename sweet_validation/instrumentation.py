@@ -0,0 +1,368 @@
+import threading
+import time
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, TypeVar, cast
+
+__all__ = [
+    "AggregatingCollector",
+    "Instrumentation",
+    "PhaseRecord",
+    "instrumented",
+    "percentile",
+    "phase",
+]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# stack of active spans per thread; nested spans are phases of the outermost one
+_local = threading.local()
+
+
+def _stack() -> list["_Span"]:
+    stack: list[_Span] | None = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+class PhaseRecord:
+    """Measurement of a single phase of an operation
+
+    Attributes:
+        operation (str): Name of the outermost operation, e.g., registry.add_data
+        phase (str): Name of the phase, e.g., validate. The record covering the
+            whole operation has the phase "total".
+        duration (float): Wall time in seconds
+        rows (int | None): Number of rows processed if known
+        bytes (int | None): Number of bytes processed if known
+        queries (int): Number of SQL statements executed during the phase
+    """
+
+    __slots__ = ("operation", "phase", "duration", "rows", "bytes", "queries")
+
+    def __init__(
+        self,
+        operation: str,
+        phase: str,
+        rows: int | None = None,
+        bytes: int | None = None,
+    ) -> None:
+        self.operation = operation
+        self.phase = phase
+        self.duration = 0.0
+        self.rows = rows
+        self.bytes = bytes
+        self.queries = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"PhaseRecord(operation={self.operation!r}, phase={self.phase!r}, "
+            f"duration={self.duration:.6f}, rows={self.rows}, bytes={self.bytes}, "
+            f"queries={self.queries})"
+        )
+
+
+class _Span:
+    """Context manager that measures one phase and emits its record"""
+
+    __slots__ = ("_instrumentation", "_start", "record")
+
+    def __init__(self, instrumentation: "Instrumentation", record: PhaseRecord):
+        self._instrumentation = instrumentation
+        self.record = record
+
+    def __enter__(self) -> PhaseRecord:
+        _stack().append(self)
+        self._start = time.perf_counter()
+        return self.record
+
+    def __exit__(self, *exc: Any) -> None:
+        self.record.duration = time.perf_counter() - self._start
+        _stack().pop()
+        self._instrumentation._emit(self.record)
+
+
+class _NullSpan:
+    """Context manager used if instrumentation is disabled"""
+
+    __slots__ = ()
+    # attributes set on the record by callers are discarded
+    _record = PhaseRecord("", "")
+
+    def __enter__(self) -> PhaseRecord:
+        return self._record
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Instrumentation:
+    """Records the duration, rows, bytes and SQL queries of operations and their
+    phases and passes the records to callbacks
+
+    Without callbacks, the instrumentation is disabled and measuring returns a
+    no-op context manager. Phases entered while an operation is active on the
+    same thread are attributed to that operation, also if they are measured by
+    another component, e.g., the SchemaManager called by a registry.
+
+    Example:
+
+        .. code-block:: python
+        collector = AggregatingCollector()
+        instrumentation = Instrumentation(callbacks=[collector])
+        manager = SchemaManager(instrumentation=instrumentation)
+        registry = InMemoryRegistry(DefaultValidator(), manager)
+        ...
+        print(collector.report())
+    """
+
+    _callbacks: list[Callable[[PhaseRecord], None]]
+
+    def __init__(
+        self, callbacks: list[Callable[[PhaseRecord], None]] | None = None
+    ) -> None:
+        """Initialize the instrumentation
+
+        Args:
+            callbacks (list[Callable[[PhaseRecord], None]] | None, optional):
+                Functions called with each finished record. Defaults to None.
+        """
+        self._callbacks = list(callbacks) if callbacks else []
+
+    @property
+    def enabled(self) -> bool:
+        """True if at least one callback is registered"""
+        return bool(self._callbacks)
+
+    def add_callback(self, callback: Callable[[PhaseRecord], None]) -> None:
+        """Register a callback that receives each finished record
+
+        Args:
+            callback (Callable[[PhaseRecord], None]): Callback
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[PhaseRecord], None]) -> None:
+        """Remove a registered callback
+
+        Args:
+            callback (Callable[[PhaseRecord], None]): Callback
+
+        Raises:
+            ValueError: If the callback is not registered
+        """
+        self._callbacks.remove(callback)
+
+    def operation(
+        self, name: str, rows: int | None = None, bytes: int | None = None
+    ) -> Any:
+        """Measure an operation
+
+        If another operation is already active on the thread, the operation is
+        recorded as phase of the active operation.
+
+        Args:
+            name (str): Name of the operation, e.g., registry.add_data
+            rows (int | None, optional): Number of rows. Defaults to None.
+            bytes (int | None, optional): Number of bytes. Defaults to None.
+
+        Returns:
+            Context manager yielding the PhaseRecord, which can be updated
+        """
+        if not self._callbacks:
+            return _NULL_SPAN
+        stack = _stack()
+        if stack:
+            record = PhaseRecord(stack[0].record.operation, name, rows, bytes)
+        else:
+            record = PhaseRecord(name, "total", rows, bytes)
+        return _Span(self, record)
+
+    def phase(
+        self, name: str, rows: int | None = None, bytes: int | None = None
+    ) -> Any:
+        """Measure a phase of the active operation
+
+        Args:
+            name (str): Name of the phase, e.g., validate
+            rows (int | None, optional): Number of rows. Defaults to None.
+            bytes (int | None, optional): Number of bytes. Defaults to None.
+
+        Returns:
+            Context manager yielding the PhaseRecord, which can be updated
+        """
+        if not self._callbacks:
+            return _NULL_SPAN
+        stack = _stack()
+        operation = stack[0].record.operation if stack else name
+        return _Span(self, PhaseRecord(operation, name, rows, bytes))
+
+    def count_query(self, *args: Any, **kwargs: Any) -> None:
+        """Count a SQL statement for all active phases on the current thread
+
+        The signature allows the method to be used as SQLAlchemy event listener.
+        """
+        for span in _stack():
+            span.record.queries += 1
+
+    def attach_engine(self, engine: Any) -> None:
+        """Count SQL statements executed by a SQLAlchemy engine
+
+        Args:
+            engine (Engine): SQLAlchemy engine
+        """
+        from sqlalchemy import event
+
+        event.listen(engine, "before_cursor_execute", self.count_query)
+
+    def _emit(self, record: PhaseRecord) -> None:
+        for callback in self._callbacks:
+            callback(record)
+
+
+def phase(name: str, rows: int | None = None, bytes: int | None = None) -> Any:
+    """Measure a phase using the instrumentation of the active operation
+
+    Components that do not own an instrumentation, like validators, use this
+    function. It is a no-op if no operation is active on the current thread.
+
+    Args:
+        name (str): Name of the phase, e.g., validator.compile
+        rows (int | None, optional): Number of rows. Defaults to None.
+        bytes (int | None, optional): Number of bytes. Defaults to None.
+
+    Returns:
+        Context manager yielding the PhaseRecord, which can be updated
+    """
+    stack = getattr(_local, "stack", None)
+    if not stack:
+        return _NULL_SPAN
+    return stack[-1]._instrumentation.phase(name, rows=rows, bytes=bytes)
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """Decorator measuring a method as operation of the object's instrumentation
+
+    The object needs an `_instrumentation` attribute.
+
+    Args:
+        name (str): Name of the operation
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            instrumentation = self._instrumentation
+            if not instrumentation._callbacks:
+                return func(self, *args, **kwargs)
+            with instrumentation.operation(name):
+                return func(self, *args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+class AggregatingCollector:
+    """Callback that aggregates records by operation and phase
+
+    Durations are kept per operation and phase to compute percentiles. Rows,
+    bytes and queries are summed.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._durations: dict[tuple[str, str], list[float]] = {}
+        self._totals: dict[tuple[str, str], dict[str, int]] = {}
+
+    def __call__(self, record: PhaseRecord) -> None:
+        key = (record.operation, record.phase)
+        with self._lock:
+            self._durations.setdefault(key, []).append(record.duration)
+            totals = self._totals.setdefault(key, {"rows": 0, "bytes": 0, "queries": 0})
+            totals["rows"] += record.rows or 0
+            totals["bytes"] += record.bytes or 0
+            totals["queries"] += record.queries
+
+    def clear(self) -> None:
+        """Remove all collected records"""
+        with self._lock:
+            self._durations.clear()
+            self._totals.clear()
+
+    def summary(
+        self, percentiles: tuple[float, ...] = (50, 90, 99)
+    ) -> dict[tuple[str, str], dict[str, float]]:
+        """Aggregate the collected records
+
+        Args:
+            percentiles (tuple[float, ...], optional): Percentiles of the duration
+                to compute. Defaults to (50, 90, 99).
+
+        Returns:
+            dict[tuple[str, str], dict[str, float]]: Statistics by (operation,
+                phase) with count, total, mean, max, the percentiles (e.g. p50),
+                as well as the sum of rows, bytes and queries
+        """
+        with self._lock:
+            items = [
+                (k, sorted(v), dict(self._totals[k]))
+                for k, v in self._durations.items()
+            ]
+        summary: dict[tuple[str, str], dict[str, float]] = {}
+        for key, durations, totals in items:
+            stats: dict[str, float] = {
+                "count": len(durations),
+                "total": sum(durations),
+                "mean": sum(durations) / len(durations),
+                "max": durations[-1],
+            }
+            for p in percentiles:
+                stats[f"p{p:g}"] = percentile(durations, p)
+            stats.update(totals)
+            summary[key] = stats
+        return summary
+
+    def report(self, percentiles: tuple[float, ...] = (50, 90, 99)) -> str:
+        """Format the summary as table
+
+        Args:
+            percentiles (tuple[float, ...], optional): Percentiles of the duration
+                to show. Defaults to (50, 90, 99).
+
+        Returns:
+            str: Table with one line per operation and phase. Durations are in
+                milliseconds.
+        """
+        columns = ["count"] + [f"p{p:g}" for p in percentiles] + ["rows", "queries"]
+        lines = [
+            f"{'operation':<32} {'phase':<32}" + "".join(f"{c:>10}" for c in columns)
+        ]
+        for (operation, phase_), stats in sorted(self.summary(percentiles).items()):
+            values = [f"{stats['count']:>10.0f}"]
+            values += [f"{stats[f'p{p:g}'] * 1000:>10.3f}" for p in percentiles]
+            values += [f"{stats['rows']:>10.0f}", f"{stats['queries']:>10.0f}"]
+            lines.append(f"{operation:<32} {phase_:<32}" + "".join(values))
+        return "\n".join(lines)
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Percentile of sorted values using linear interpolation
+
+    Args:
+        values (list[float]): Sorted values, at least one
+        p (float): Percentile between 0 and 100
+
+    Returns:
+        float: Percentile
+    """
+    if len(values) == 1:
+        return values[0]
+    pos = (len(values) - 1) * p / 100
+    lower = int(pos)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (pos - lower)
@@ -0,0 +1,352 @@
+"""Command line interface of sweet_validation
+
+Example:
+
+    .. code-block:: bash
+    # validate all csv and parquet files of a directory against a schema file
+    sweetvalidation validate data/ --schema schema.yaml --workers 8 > reports.ndjson
+    # validate against a schema registered in a SchemaManager database
+    sweetvalidation validate --file-list files.txt --schema sales --db schemas.db
+    # serve a registry to other processes over a Unix socket
+    sweetvalidation serve --db registry.db --storage data/ --socket /tmp/registry.sock
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, TextIO
+
+from .utils import DATA_SUFFIXES, read_data_file
+
+__all__ = ["main"]
+
+# schema and settings of the worker process, set by _init_worker
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(schema: dict[str, Any], max_errors: int | None) -> None:
+    from .validator import DefaultValidator
+
+    _worker["schema"] = schema
+    _worker["validator"] = DefaultValidator(max_errors=max_errors)
+
+
+def _validate_file(path: str) -> dict[str, Any]:
+    """Validate one file in a worker and return its report as dictionary
+
+    Errors while reading or validating the file are reported instead of raised,
+    so that one broken file does not stop the batch.
+    """
+    start = time.perf_counter()
+    result: dict[str, Any] = {"type": "file", "file": path}
+    schema = _worker["schema"]
+    try:
+        parsed = None
+        if Path(path).suffix == ".csv":
+            from .validator.csv_reader import read_csv_with_schema
+
+            data, parsed = read_csv_with_schema(path, schema)
+        else:
+            data = read_data_file(path)
+        read = time.perf_counter()
+        report = _worker["validator"].validate(data, schema)
+        if parsed is not None and not parsed.valid:
+            report = _combine_reports(parsed, report)
+        result.update(report.to_dict())
+        result["rows"] = len(data)
+        result["read_seconds"] = read - start
+        result["validate_seconds"] = time.perf_counter() - read
+    except Exception as e:
+        result.update({"valid": False, "rows": 0, "error": f"{type(e).__name__}: {e}"})
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _combine_reports(parsed: Any, report: Any) -> Any:
+    """Add the parse errors of the csv reader to the report of the validator
+
+    Unparsable values are missing in the data, so the validator alone could
+    consider the file valid.
+    """
+    import numpy as np
+    import pandas as pd
+
+    from .validator.validation_report import ValidationReport
+
+    counts = dict(parsed.failure_counts)
+    for key, count in (report.failure_counts or {}).items():
+        counts[key] = counts.get(key, 0) + count
+    rows = [r.failing_rows for r in (parsed, report) if r.failing_rows is not None]
+    cases = [r.failure_cases for r in (parsed, report) if r.failure_cases is not None]
+    return ValidationReport.from_counts(
+        counts,
+        failing_rows=np.unique(np.concatenate(rows)) if rows else None,
+        failure_cases=pd.concat(cases, ignore_index=True) if cases else None,
+        truncated=report.truncated,
+    )
+
+
+def collect_files(paths: Iterable[str | Path]) -> list[str]:
+    """Expand directories to the csv and parquet files they contain
+
+    Args:
+        paths (Iterable[str | Path]): Files and directories
+
+    Returns:
+        list[str]: Files; files of a directory are sorted by name
+    """
+    files: list[str] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files += sorted(str(f) for f in path.iterdir() if f.suffix in DATA_SUFFIXES)
+        else:
+            files.append(str(path))
+    return files
+
+
+def load_schema(schema: str, fn_db: str | None = None) -> dict[str, Any]:
+    """Load a schema from a file or a SchemaManager database
+
+    Schema files are checked against the SWEET metadata standard.
+
+    Args:
+        schema (str): Path to a schema file or key of a registered schema
+        fn_db (str | None, optional): SchemaManager database used to look up the
+            key. Defaults to None.
+
+    Returns:
+        dict[str, Any]: Schema
+
+    Raises:
+        KeyError: If the schema is neither a file nor a registered key
+        FileNotFoundError: If the database does not exist
+    """
+    from .schema_manager import SchemaManager
+    from .utils import read_schema_from_file
+
+    if Path(schema).is_file():
+        manager = SchemaManager()
+        schema_ = read_schema_from_file(schema)
+        manager.validate_schema(schema_)
+        manager.close()
+        return schema_
+    if fn_db is None:
+        raise KeyError(f"Schema file {schema} not found. Use --db to look up keys.")
+    if not Path(fn_db).is_file():
+        # SchemaManager would create an empty database
+        raise FileNotFoundError(f"Database {fn_db} not found")
+    manager = SchemaManager(fn_db)
+    try:
+        return dict(manager[schema])
+    finally:
+        manager.close()
+
+
+def validate_files(
+    files: list[str],
+    schema: dict[str, Any],
+    workers: int = 1,
+    max_errors: int | None = None,
+    chunksize: int = 1,
+) -> Iterator[dict[str, Any]]:
+    """Validate files against a schema on a process pool
+
+    Args:
+        files (list[str]): Csv and parquet files
+        schema (dict[str, Any]): Frictionless schema
+        workers (int, optional): Number of processes. If 1, the files are
+            validated in the current process. Defaults to 1.
+        max_errors (int | None, optional): Number of failure cases after which
+            the validation of a file stops. Defaults to None.
+        chunksize (int, optional): Number of files sent to a worker at once.
+            Defaults to 1.
+
+    Yields:
+        dict[str, Any]: Report of each file in the order of the files
+    """
+    if workers == 1:
+        _init_worker(schema, max_errors)
+        yield from map(_validate_file, files)
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(schema, max_errors)
+    ) as pool:
+        yield from pool.map(_validate_file, files, chunksize=chunksize)
+
+
+def summarize(reports: list[dict[str, Any]], seconds: float) -> dict[str, Any]:
+    """Summarize the reports of a batch
+
+    Args:
+        reports (list[dict[str, Any]]): Reports of the files
+        seconds (float): Wall time of the batch
+
+    Returns:
+        dict[str, Any]: Summary with counts, throughput and latency percentiles
+    """
+    from .instrumentation import percentile
+
+    latencies = sorted(r["seconds"] for r in reports)
+    rows = sum(r["rows"] for r in reports)
+    summary: dict[str, Any] = {
+        "type": "summary",
+        "files": len(reports),
+        "valid": sum(bool(r["valid"]) for r in reports),
+        "invalid": sum(not r["valid"] and "error" not in r for r in reports),
+        "errors": sum("error" in r for r in reports),
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds if seconds > 0 else None,
+    }
+    for p in (50, 90, 99):
+        summary[f"latency_p{p}"] = percentile(latencies, p) if latencies else None
+    summary["latency_max"] = latencies[-1] if latencies else None
+    return summary
+
+
+def validate_cmd(args: argparse.Namespace, out: TextIO) -> int:
+    paths = list(args.files)
+    if args.file_list:
+        with open(args.file_list) as f:
+            paths += [line.strip() for line in f if line.strip()]
+    files = collect_files(paths)
+    schema = load_schema(args.schema, args.db)
+    start = time.perf_counter()
+    reports = []
+    for report in validate_files(
+        files, schema, args.workers, args.max_errors, args.chunksize
+    ):
+        reports.append(report)
+        out.write(json.dumps(report, default=str) + "\n")
+        out.flush()
+    summary = summarize(reports, time.perf_counter() - start)
+    out.write(json.dumps(summary) + "\n")
+    print(
+        f"{summary['files']} files, {summary['valid']} valid, "
+        f"{summary['invalid']} invalid, {summary['errors']} errors, "
+        f"{summary['rows']} rows in {summary['seconds']:.2f}s",
+        file=sys.stderr,
+    )
+    return 0 if summary["valid"] == summary["files"] else 1
+
+
+def serve_cmd(args: argparse.Namespace) -> int:
+    from .registry import InMemoryRegistry, RegistryServer, ValidationCache
+    from .schema_manager import SchemaManager
+    from .storage import ParquetStorage
+    from .validator import DefaultValidator
+
+    registry = InMemoryRegistry(
+        validator=DefaultValidator(max_errors=args.max_errors),
+        schema_manager=SchemaManager(args.db),
+        storage=ParquetStorage(args.storage) if args.storage else None,
+    )
+    address = args.socket or ("127.0.0.1", args.port)
+    server = RegistryServer(
+        registry,
+        address,
+        workers=args.workers,
+        validation_cache=ValidationCache(),
+        snapshot_dir=args.snapshot_dir,
+    )
+    print(f"Serving the registry on {address}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point of the sweetvalidation command
+
+    Args:
+        argv (list[str] | None, optional): Arguments. Defaults to None which uses
+            the arguments of the process.
+
+    Returns:
+        int: Exit status. 1 if any file is invalid or could not be validated.
+    """
+    parser = argparse.ArgumentParser(
+        prog="sweetvalidation", description="Validate data against SWEET schemas"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_val = sub.add_parser(
+        "validate",
+        help="Validate csv and parquet files",
+        description="Validate csv and parquet files against a schema. Writes one "
+        "json report per file and a final summary as NDJSON.",
+    )
+    p_val.add_argument("files", nargs="*", help="Files or directories to validate")
+    p_val.add_argument("--file-list", help="Text file with one file path per line")
+    p_val.add_argument(
+        "--schema", required=True, help="Schema file or key of a registered schema"
+    )
+    p_val.add_argument("--db", help="SchemaManager database to look up schema keys")
+    p_val.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes. Defaults to the number of CPUs",
+    )
+    p_val.add_argument(
+        "--chunksize", type=int, default=1, help="Files sent to a worker at once"
+    )
+    p_val.add_argument(
+        "--max-errors",
+        type=int,
+        default=1000,
+        help="Failure cases after which the validation of a file stops",
+    )
+    p_val.add_argument("--output", help="NDJSON output file. Defaults to stdout")
+
+    p_srv = sub.add_parser(
+        "serve",
+        help="Serve a registry to other processes",
+        description="Serve a registry over a Unix socket or localhost HTTP. "
+        "Connect with sweet_validation.registry.RegistryClient.",
+    )
+    p_srv.add_argument("--db", help="SchemaManager database. Defaults to in-memory")
+    p_srv.add_argument(
+        "--storage", help="Directory of Parquet files. Defaults to in-memory"
+    )
+    address = p_srv.add_mutually_exclusive_group(required=True)
+    address.add_argument("--socket", help="Path of the Unix socket")
+    address.add_argument("--port", type=int, help="Port on 127.0.0.1")
+    p_srv.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of validation processes. Defaults to the number of CPUs",
+    )
+    p_srv.add_argument(
+        "--max-errors",
+        type=int,
+        default=1000,
+        help="Failure cases after which the validation of a frame stops",
+    )
+    p_srv.add_argument(
+        "--snapshot-dir",
+        help="Directory of the snapshots of clients. Defaults to no snapshots",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        return serve_cmd(args)
+    try:
+        if args.output:
+            with open(args.output, "w") as out:
+                return validate_cmd(args, out)
+        return validate_cmd(args, sys.stdout)
+    except (KeyError, FileNotFoundError) as e:
+        parser.error(str(e.args[0]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
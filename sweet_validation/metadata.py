@@ -0,0 +1,85 @@
+from typing import Any
+
+__all__ = ["key_fields", "series_group_fields", "time_field", "time_fields"]
+
+# frictionless types of fields that can serve as time fields
+_TIME_TYPES = ("datetime", "date")
+
+
+def _field_types(schema: dict[str, Any]) -> dict[str, str]:
+    return {
+        field["name"]: field.get("type", "any") for field in schema.get("fields", [])
+    }
+
+
+def time_fields(schema: dict[str, Any]) -> list[tuple[str, str | None]]:
+    """Time fields declared by the `timeFields` of the SWEET metastandard
+
+    Only entries that refer to a datetime or date field are returned.
+
+    Args:
+        schema (dict[str, Any]): Schema
+
+    Returns:
+        list[tuple[str, str | None]]: Tuples of field name and frequency, which
+            is None if not declared
+    """
+    types = _field_types(schema)
+    return [
+        (entry["field"], entry.get("frequency"))
+        for entry in schema.get("timeFields") or []
+        if types.get(entry.get("field", "")) in _TIME_TYPES
+    ]
+
+
+def time_field(schema: dict[str, Any]) -> str | None:
+    """Name of the main time field, i.e., the first of the time fields
+
+    Args:
+        schema (dict[str, Any]): Schema
+
+    Returns:
+        str | None: Name of the time field or None if the schema has none
+    """
+    fields = time_fields(schema)
+    return fields[0][0] if fields else None
+
+
+def key_fields(schema: dict[str, Any]) -> list[str]:
+    """Fields that jointly form the key of a row
+
+    If the schema has a `valueField`, all other fields form the key.
+
+    Args:
+        schema (dict[str, Any]): Schema
+
+    Returns:
+        list[str]: Names of the fields in schema order; empty without value field
+    """
+    value = (schema.get("valueField") or {}).get("field")
+    if value is None:
+        return []
+    return [name for name in _field_types(schema) if name != value]
+
+
+def series_group_fields(schema: dict[str, Any]) -> list[str]:
+    """Fields that identify a single time series within a table
+
+    If the schema has a `valueField`, all other fields form the key of a row,
+    so the series are identified by the key without the time fields. Otherwise
+    the series are identified by the `locationFields`.
+
+    Args:
+        schema (dict[str, Any]): Schema
+
+    Returns:
+        list[str]: Names of the fields in schema order; empty if the table holds a
+            single series
+    """
+    times = {name for name, _ in time_fields(schema)}
+    keys = key_fields(schema)
+    if keys:
+        return [name for name in keys if name not in times]
+    types = _field_types(schema)
+    locations = {entry.get("field") for entry in schema.get("locationFields") or []}
+    return [name for name in types if name in locations and name not in times]
@@ -1,3 +1,28 @@
-from .protocols import StorageProtocol, ValidatorProtocol
+from typing import TYPE_CHECKING
 
-__all__ = ["StorageProtocol", "ValidatorProtocol"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .protocols import (
+        QueryStorageProtocol,
+        ShardProtocol,
+        StorageProtocol,
+        ValidatorProtocol,
+    )
+
+__all__ = [
+    "QueryStorageProtocol",
+    "ShardProtocol",
+    "StorageProtocol",
+    "ValidatorProtocol",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "QueryStorageProtocol": ".protocols",
+        "ShardProtocol": ".protocols",
+        "StorageProtocol": ".protocols",
+        "ValidatorProtocol": ".protocols",
+    },
+)
@@ -1,6 +1,10 @@
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Any, Protocol, runtime_checkable
 
 __all__ = [
+    "QueryStorageProtocol",
+    "ShardProtocol",
     "StorageProtocol",
     "ValidatorProtocol",
 ]
@@ -22,12 +26,34 @@ class StorageProtocol(Protocol):
             This method is already implemented and calls delete and save.
     """
 
-    def save(self, key: Any, value: Any, **kwargs: Any) -> None: ...
-    def load(self, key: Any, **kwargs: Any) -> Any: ...
-    def delete(self, key: Any, **kwargs: Any) -> Any: ...
-    def exists(self, key: Any, **kwargs: Any) -> bool: ...
+    def save(self, key: Any, value: Any) -> None: ...
+    def load(self, key: Any) -> Any: ...
+    def delete(self, key: Any) -> Any: ...
+    def exists(self, key: Any) -> bool: ...
     def list(self) -> list[Any]: ...
-    def replace(self, key: Any, value: Any, **kwargs: Any) -> Any: ...
+    def replace(self, key: Any, value: Any) -> Any: ...
+
+
+@runtime_checkable
+class QueryStorageProtocol(StorageProtocol, Protocol):
+    """Protocol for storage backends that can select rows and columns
+
+    Implementing it is optional. Registries use it to answer queries without
+    loading the whole data item. Backends should push the column projection and
+    the filters down, so that only matching rows and columns are read.
+
+    Methods:
+        query: Load the rows of a value matching filters given as tuples of
+            column, operator and value, e.g., ("country", "==", "DE"), and only
+            the given columns. Operators are ==, !=, <, <=, >, >=, in and not in.
+    """
+
+    def query(
+        self,
+        key: Any,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[tuple[str, str, Any]] | None = None,
+    ) -> Any: ...
 
 
 @runtime_checkable
@@ -43,5 +69,59 @@ class ValidatorProtocol(Protocol):
             indicating if the data is valid
     """
 
-    def validate(self, data: Any, schema: Any, **kwargs: Any) -> Any: ...
-    def is_valid(self, data: Any, schema: Any, **kwargs: Any) -> bool: ...
+    def validate(self, data: Any, schema: Any) -> Any: ...
+    def is_valid(self, data: Any, schema: Any) -> bool: ...
+
+
+@runtime_checkable
+class ShardProtocol(Protocol):
+    """Protocol for the shards of a ShardedRegistry
+
+    Shards implement the registry interface used by the ShardedRegistry, e.g.,
+    an InMemoryRegistry in the same process or a RegistryClient of a registry
+    served by another process. Besides the methods of a registry, shards
+    implement the following methods:
+
+    Methods:
+        has_data: Check if a data key exists on the shard.
+        check_schema_replacement: Check the data of a schema against a new
+            schema without writing anything and return the new time ranges by
+            data key.
+        apply_schema_replacement: Replace a schema checked before with the time
+            ranges returned by check_schema_replacement.
+        restore_data: Store data moved from another shard under its content
+            description without validating it again.
+        list_data_starts: List the data in a time window together with their
+            first point in time.
+    """
+
+    @property
+    def schemas(self) -> list[str]: ...
+    @property
+    def data(self) -> list[str]: ...
+    def add_schema(self, key: str, schema: Any) -> None: ...
+    def get_schema(self, key: str) -> Any: ...
+    def delete_schema(self, key: str) -> None: ...
+    def check_schema_replacement(
+        self, key: str, schema: Any
+    ) -> dict[str, tuple[Any, Any]]: ...
+    def apply_schema_replacement(
+        self, key: str, schema: Any, ranges: dict[str, tuple[Any, Any]]
+    ) -> None: ...
+    def add_data(self, key: str, schema_key: str, data: Any) -> None: ...
+    def restore_data(self, key: str, info: dict[str, Any], data: Any) -> None: ...
+    def has_data(self, key: str) -> bool: ...
+    def get_data(self, key: str, start: Any = None, end: Any = None) -> Any: ...
+    def query_data(
+        self,
+        key: str,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[tuple[str, str, Any]] | None = None,
+    ) -> Any: ...
+    def replace_data(self, key: str, data: Any) -> None: ...
+    def delete_data(self, key: str) -> None: ...
+    def get_data_info(self, key: str) -> dict[str, Any]: ...
+    def list_data(self) -> list[tuple[str, str]]: ...
+    def list_data_starts(
+        self, start: Any = None, end: Any = None, schema_key: str | None = None
+    ) -> list[tuple[str, datetime]]: ...
@@ -1,3 +1,38 @@
-from .inmemory import InMemoryRegistry
+from typing import TYPE_CHECKING
 
-__all__ = ["InMemoryRegistry"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .cache import ValidationCache
+    from .client import RegistryClient
+    from .inmemory import InMemoryRegistry
+    from .pipeline import IngestError, IngestPipeline, IngestResult
+    from .server import RegistryServer, ValidationPool
+    from .sharded import ShardedRegistry
+
+__all__ = [
+    "IngestError",
+    "IngestPipeline",
+    "IngestResult",
+    "InMemoryRegistry",
+    "RegistryClient",
+    "RegistryServer",
+    "ShardedRegistry",
+    "ValidationCache",
+    "ValidationPool",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "IngestError": ".pipeline",
+        "IngestPipeline": ".pipeline",
+        "IngestResult": ".pipeline",
+        "InMemoryRegistry": ".inmemory",
+        "RegistryClient": ".client",
+        "RegistryServer": ".server",
+        "ShardedRegistry": ".sharded",
+        "ValidationCache": ".cache",
+        "ValidationPool": ".server",
+    },
+)
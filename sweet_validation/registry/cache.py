@@ -0,0 +1,225 @@
+import json
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from ..validator.validation_report import ValidationReport
+
+__all__ = ["ValidationCache"]
+
+
+class ValidationCache:
+    """A bounded cache of validation reports
+
+    Reports are keyed by the fingerprint of the data and the fingerprint of the
+    schema. If the cache is full, the least recently used report is dropped.
+    Optionally, the cache is persisted to a json file with `save` and read back
+    with `load`. The file stores the dictionary representation of the reports,
+    i.e., without failing rows and with a sample of the failure cases only, and
+    the identifier of the validator, so that a file written by another validator
+    or with other settings is rejected.
+
+    Example:
+
+        .. code-block:: python
+        validator = DefaultValidator()
+        cache = ValidationCache(
+            maxsize=10_000, path="validation_cache.json", validator=validator
+        )
+        if cache.path.exists():
+            cache.load()
+        registry = InMemoryRegistry(
+            validator=validator,
+            schema_manager=SchemaManager(),
+            validation_cache=cache,
+        )
+        ...
+        print(cache.stats)
+        cache.save()
+    """
+
+    maxsize: int
+    path: Path | None
+    validator_id: str | None
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        path: str | Path | None = None,
+        validator: Any = None,
+    ) -> None:
+        """Initialize the cache
+
+        Args:
+            maxsize (int, optional): Maximum number of reports kept in the cache.
+                Defaults to 1024.
+            path (str | Path | None, optional): Default file of `save` and
+                `load`. The file is not read on initialization. Defaults to None.
+            validator (Any, optional): Validator whose reports are cached or its
+                identifier as string. Stored in the persisted file and compared on
+                load. Defaults to None.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.path = Path(path) if path else None
+        self.validator_id = (
+            validator
+            if validator is None or isinstance(validator, str)
+            else _validator_id(validator)
+        )
+        self.hits = 0
+        self.misses = 0
+        self._reports: OrderedDict[tuple[str, str], ValidationReport] = OrderedDict()
+        self._lock = Lock()
+
+    def get(
+        self, data_fingerprint: str, schema_fingerprint: str
+    ) -> ValidationReport | None:
+        """Return the cached report and update the hit statistics
+
+        Args:
+            data_fingerprint (str): Fingerprint of the data
+            schema_fingerprint (str): Fingerprint of the schema
+
+        Returns:
+            ValidationReport | None: Cached report or None if not in the cache
+        """
+        key = (data_fingerprint, schema_fingerprint)
+        with self._lock:
+            report = self._reports.get(key)
+            if report is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._reports.move_to_end(key)
+            return report
+
+    def put(
+        self, data_fingerprint: str, schema_fingerprint: str, report: ValidationReport
+    ) -> None:
+        """Add a report to the cache
+
+        Args:
+            data_fingerprint (str): Fingerprint of the data
+            schema_fingerprint (str): Fingerprint of the schema
+            report (ValidationReport): Validation report
+        """
+        key = (data_fingerprint, schema_fingerprint)
+        with self._lock:
+            self._reports[key] = report
+            self._reports.move_to_end(key)
+            while len(self._reports) > self.maxsize:
+                self._reports.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all reports and reset the statistics"""
+        with self._lock:
+            self._reports.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._reports)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache
+
+        Returns:
+            float: Hit rate between 0 and 1. 0 if no lookup happened yet.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics
+
+        Returns:
+            dict[str, Any]: Hits, misses, hit rate, size, and maximum size
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self),
+            "maxsize": self.maxsize,
+        }
+
+    def _resolve_path(self, path: str | Path | None) -> Path:
+        resolved = Path(path) if path else self.path
+        if resolved is None:
+            raise ValueError("No path provided for the validation cache")
+        return resolved
+
+    def save(self, path: str | Path | None = None) -> None:
+        """Persist the cached reports to a json file
+
+        Args:
+            path (str | Path | None, optional): Target file. Defaults to None
+                which uses the path provided during initialization.
+
+        Raises:
+            ValueError: If no path is given
+        """
+        path = self._resolve_path(path)
+        with self._lock:
+            items = list(self._reports.items())
+        content = {
+            "validator": self.validator_id,
+            "reports": [
+                {"data": data, "schema": schema, "report": report.to_dict()}
+                for (data, schema), report in items
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(content, f)
+
+    def load(self, path: str | Path | None = None) -> None:
+        """Load reports from a file created by `save`
+
+        Loaded reports are added to the cache respecting its maximum size.
+
+        Args:
+            path (str | Path | None, optional): File to load. Defaults to None
+                which uses the path provided during initialization.
+
+        Raises:
+            ValueError: If no path is given, the file is not a validation cache,
+                or it was written for another validator
+            FileNotFoundError: If the file does not exist
+        """
+        path = self._resolve_path(path)
+        with open(path, encoding="utf-8") as f:
+            try:
+                content = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path} is not a validation cache: {e}") from None
+        if not isinstance(content, dict) or "reports" not in content:
+            raise ValueError(f"{path} is not a validation cache")
+        if content.get("validator") != self.validator_id:
+            raise ValueError(
+                f"Validation cache {path} was written by validator "
+                f"{content.get('validator')!r}, expected {self.validator_id!r}"
+            )
+        for item in content["reports"]:
+            report = ValidationReport.from_dict(item["report"])
+            self.put(item["data"], item["schema"], report)
+
+
+def _validator_id(validator: Any) -> str:
+    """Qualified class name and public attributes, i.e., settings, of a validator"""
+    cls = type(validator)
+    settings = {
+        name: value
+        for name, value in getattr(validator, "__dict__", {}).items()
+        if not name.startswith("_")
+    }
+    return (
+        f"{cls.__module__}.{cls.__qualname__}"
+        f"{json.dumps(settings, sort_keys=True, default=repr)}"
+    )
@@ -0,0 +1,480 @@
+from __future__ import annotations
+
+import http.client
+import socket
+import threading
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import DataValidationError
+from ..storage.query import Filter
+from ..validator.validation_report import ValidationReport
+from .wire import CONTENT_TYPE, decode_message, encode_message
+
+__all__ = ["RegistryClient"]
+
+# exceptions of the server raised with the same type by the client
+_EXCEPTIONS: dict[str, type[Exception]] = {
+    exception.__name__: exception
+    for exception in (
+        KeyError,
+        ValueError,
+        TypeError,
+        FileNotFoundError,
+        FileExistsError,
+        ImportError,
+    )
+}
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float | None = None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._path)
+        self.sock = sock
+
+
+class RegistryClient:
+    """Client of a `RegistryServer` with the interface of `InMemoryRegistry`
+
+    Dataframes are sent and received in the Arrow IPC format. Each thread uses
+    its own persistent connection, so a client can be shared between threads;
+    concurrent requests are validated in parallel by the server. The client
+    implements the ShardProtocol and can serve as shard of a ShardedRegistry.
+
+    Example:
+
+        .. code-block:: python
+        with RegistryClient("/tmp/registry.sock") as registry:
+            registry.add_data("generation_2024", "generation", data)
+            report = registry.validate(other_data, "generation")
+    """
+
+    def __init__(
+        self, address: str | Path | tuple[str, int], timeout: float | None = None
+    ) -> None:
+        """Initialize the client
+
+        Args:
+            address (str | Path | tuple[str, int]): Path of the Unix socket or
+                (host, port) of the server
+            timeout (float | None, optional): Socket timeout in seconds.
+                Defaults to None which waits without limit.
+        """
+        self._address = address
+        self._timeout = timeout
+        self._local = threading.local()
+        self._connections: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> RegistryClient:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connections of all threads"""
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            if isinstance(self._address, tuple):
+                host, port = self._address
+                connection = http.client.HTTPConnection(
+                    host, port, timeout=self._timeout
+                )
+            else:
+                connection = _UnixHTTPConnection(str(self._address), self._timeout)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _request(self, operation: str, data: Any = None, **args: Any) -> Any:
+        """Send a request and return the result
+
+        Raises:
+            KeyError, ValueError, ...: Raised by the registry of the server
+            DataValidationError: If the data does not conform to the schema
+            RuntimeError: If the server failed otherwise
+        """
+        message = encode_message({"args": args}, data)
+        connection = self._connection()
+        try:
+            connection.request(
+                "POST",
+                f"/{operation}",
+                body=message,
+                headers={"Content-Type": CONTENT_TYPE},
+            )
+            response = connection.getresponse()
+            body = response.read()
+        except (ConnectionError, http.client.HTTPException):
+            connection.close()  # reconnect with the next request
+            raise
+        header, result, _ = decode_message(body)
+        error = header.get("error")
+        if error is None:
+            return result
+        if error["type"] == "DataValidationError":
+            report = error.get("report")
+            raise DataValidationError(
+                error["message"],
+                report=ValidationReport.from_dict(report) if report else None,
+            )
+        exception = _EXCEPTIONS.get(error["type"])
+        if exception is None:
+            raise RuntimeError(f"{error['type']}: {error['message']}")
+        raise exception(error["message"])
+
+    # -------- schema related methods
+    def add_schema(self, key: str, schema: Any) -> None:
+        """Add schema to the registry, see `InMemoryRegistry.add_schema`
+
+        A schema given as path is read by the server, which resolves relative
+        paths against the working directory of the client.
+
+        Args:
+            key (str): Key of schema
+            schema (Any): Schema or path of a schema file
+
+        Raises:
+            KeyError: If the schema already exists
+        """
+        if isinstance(schema, str | Path):
+            schema = str(Path(schema).resolve())
+        self._request("add_schema", key=key, schema=schema)
+
+    def get_schema(self, key: str) -> Any:
+        """Given the key of schema, return the schema
+
+        Args:
+            key (str): Key of schema
+
+        Returns:
+            Any: Schema
+
+        Raises:
+            KeyError: If the schema does not exist
+        """
+        return self._request("get_schema", key=key)
+
+    def delete_schema(self, key: str) -> None:
+        """Given the key of schema, delete the schema
+
+        Args:
+            key (str): Key of schema to delete
+
+        Raises:
+            KeyError: If the schema does not exist
+            ValueError: If data associated with the schema still exist
+        """
+        self._request("delete_schema", key=key)
+
+    def replace_schema(self, key: str, schema: Any) -> None:
+        """Replace a schema, see `InMemoryRegistry.replace_schema`
+
+        Args:
+            key (str): Key of schema
+            schema (Any): New schema
+
+        Raises:
+            KeyError: If the schema does not exist
+            DataValidationError: If the data does not conform to the schema
+        """
+        if isinstance(schema, str | Path):
+            schema = str(Path(schema).resolve())
+        self._request("replace_schema", key=key, schema=schema)
+
+    def check_schema_replacement(
+        self, key: str, schema: Any
+    ) -> dict[str, tuple[Any, Any]]:
+        """Check the data of a schema against its replacement without writing
+
+        See `InMemoryRegistry.check_schema_replacement`.
+
+        Args:
+            key (str): Key of schema
+            schema (Any): New schema
+
+        Returns:
+            dict[str, tuple[Any, Any]]: New time ranges by data key if the time
+                field changed
+
+        Raises:
+            KeyError: If the schema does not exist
+            DataValidationError: If the data does not conform to the schema
+        """
+        if isinstance(schema, str | Path):
+            schema = str(Path(schema).resolve())
+        ranges = self._request("check_schema_replacement", key=key, schema=schema)
+        return {data_key: tuple(time_range) for data_key, time_range in ranges.items()}
+
+    def apply_schema_replacement(
+        self, key: str, schema: Any, ranges: dict[str, tuple[Any, Any]]
+    ) -> None:
+        """Write a schema replacement checked by `check_schema_replacement`
+
+        Args:
+            key (str): Key of schema
+            schema (Any): New schema
+            ranges (dict[str, tuple[Any, Any]]): New time ranges by data key as
+                returned by `check_schema_replacement`
+        """
+        if isinstance(schema, str | Path):
+            schema = str(Path(schema).resolve())
+        self._request("apply_schema_replacement", key=key, schema=schema, ranges=ranges)
+
+    @property
+    def schemas(self) -> list[str]:
+        """List all schemas
+
+        Returns:
+            list[str]: List of schema keys
+        """
+        return self._request("schemas")  # type: ignore[no-any-return]
+
+    # -------- data related methods
+    def add_data(self, key: str, schema_key: str, data: Any) -> None:
+        """Add data to the registry. The data is validated given the schema.
+
+        Args:
+            key (str): Key of data
+            schema_key (str): Key of schema
+            data (Any): Dataframe or json serializable data
+
+        Raises:
+            KeyError: If the data already exists or the schema does not exist
+            DataValidationError: If the data does not conform to the schema
+        """
+        self._request("add_data", data, key=key, schema_key=schema_key)
+
+    def validate(self, data: Any, schema_key: str) -> ValidationReport:
+        """Validate data against a registered schema without storing it
+
+        Args:
+            data (Any): Dataframe or json serializable data
+            schema_key (str): Key of schema
+
+        Returns:
+            ValidationReport: Validation report without failing rows
+
+        Raises:
+            KeyError: If the schema does not exist
+        """
+        report = self._request("validate", data, schema_key=schema_key)
+        return ValidationReport.from_dict(report)
+
+    def restore_data(self, key: str, info: dict[str, Any], data: Any) -> None:
+        """Store data under its recorded content description without validation
+
+        See `InMemoryRegistry.restore_data`.
+
+        Args:
+            key (str): Key of data
+            info (dict[str, Any]): Content description as returned by
+                `get_data_info`
+            data (Any): Dataframe or json serializable data
+
+        Raises:
+            KeyError: If the data already exists or the schema does not exist
+        """
+        self._request("restore_data", data, key=key, info=info)
+
+    def has_data(self, key: str) -> bool:
+        """Whether data exists
+
+        Args:
+            key (str): Key of data
+
+        Returns:
+            bool: True if the data exists
+        """
+        return bool(self._request("has_data", key=key))
+
+    def get_data(self, key: str, start: Any = None, end: Any = None) -> Any:
+        """Given the key of data, return the data, see `InMemoryRegistry.get_data`
+
+        Args:
+            key (str): Key of data
+            start (str | datetime | None, optional): First point in time.
+                Defaults to None.
+            end (str | datetime | None, optional): Point in time after the
+                window. Defaults to None.
+
+        Returns:
+            Any: Data
+
+        Raises:
+            KeyError: If the data does not exist
+        """
+        return self._request("get_data", key=key, start=start, end=end)
+
+    def query_data(
+        self,
+        key: str,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[Filter] | None = None,
+    ) -> Any:
+        """Given the key of data, return the matching rows and columns
+
+        See `InMemoryRegistry.query_data`.
+
+        Args:
+            key (str): Key of data
+            columns (Sequence[str] | None, optional): Columns to return. Defaults
+                to None which returns all columns.
+            filters (Sequence[Filter] | None, optional): Predicates combined with
+                a logical and. Defaults to None which returns all rows.
+
+        Returns:
+            Any: Matching rows and columns of the data
+
+        Raises:
+            KeyError: If the data or a column does not exist
+        """
+        return self._request("query_data", key=key, columns=columns, filters=filters)
+
+    def delete_data(self, key: str) -> None:
+        """Given the key of data delete it
+
+        Args:
+            key (str): Key of data to delete
+
+        Raises:
+            KeyError: If the data does not exist
+        """
+        self._request("delete_data", key=key)
+
+    def replace_data(self, key: str, data: Any) -> None:
+        """Replace a data in the registry
+
+        Args:
+            key (str): Key of data
+            data (Any): New data
+
+        Raises:
+            KeyError: If the data does not exist
+            DataValidationError: If the data does not conform to the schema
+        """
+        self._request("replace_data", data, key=key)
+
+    def get_data_info(self, key: str) -> dict[str, Any]:
+        """Given the key of data, return its content description
+
+        Args:
+            key (str): Key of data
+
+        Returns:
+            dict[str, Any]: Content description, see
+                `InMemoryRegistry.get_data_info`
+
+        Raises:
+            KeyError: If the data does not exist
+        """
+        return self._request("get_data_info", key=key)  # type: ignore[no-any-return]
+
+    def list_data(self) -> list[tuple[str, str]]:
+        """List all data
+
+        Returns:
+            list[tuple[str, str]]: List of data tuples (id, id_schema)
+        """
+        return [(key, schema_key) for key, schema_key in self._request("list_data")]
+
+    def list_data_in_window(
+        self, start: Any = None, end: Any = None, schema_key: str | None = None
+    ) -> list[str]:
+        """List the data with at least one point in time in [start, end)
+
+        Args:
+            start (str | datetime | None, optional): First point in time.
+                Defaults to None.
+            end (str | datetime | None, optional): Point in time after the
+                window. Defaults to None.
+            schema_key (str | None, optional): Only list data of this schema.
+                Defaults to None.
+
+        Returns:
+            list[str]: Data keys sorted by their first point in time
+        """
+        return self._request(  # type: ignore[no-any-return]
+            "list_data_in_window", start=start, end=end, schema_key=schema_key
+        )
+
+    def list_data_starts(
+        self, start: Any = None, end: Any = None, schema_key: str | None = None
+    ) -> list[tuple[str, datetime]]:
+        """List the data in the window [start, end) with their first point in time
+
+        Args:
+            start (str | datetime | None, optional): First point in time.
+                Defaults to None.
+            end (str | datetime | None, optional): Point in time after the
+                window. Defaults to None.
+            schema_key (str | None, optional): Only list data of this schema.
+                Defaults to None.
+
+        Returns:
+            list[tuple[str, datetime]]: Tuples of data key and first point in
+                time, sorted by the first point in time
+        """
+        starts = self._request(
+            "list_data_starts", start=start, end=end, schema_key=schema_key
+        )
+        return [(key, time_min) for key, time_min in starts]
+
+    @property
+    def data(self) -> list[str]:
+        """List all data keys
+
+        Returns:
+            list[str]: List of data keys
+        """
+        return self._request("data")  # type: ignore[no-any-return]
+
+    # -------- snapshot related methods
+    def snapshot(self, path: str | Path, max_workers: int | None = None) -> None:
+        """Write a snapshot of the registry on the server
+
+        Args:
+            path (str | Path): Directory of the snapshot relative to the
+                snapshot directory of the server
+            max_workers (int | None, optional): Number of threads writing data.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the server has no snapshot directory or the path is
+                outside of it
+        """
+        self._request("snapshot", path=str(path), max_workers=max_workers)
+
+    def restore(self, path: str | Path, max_workers: int | None = None) -> None:
+        """Restore a snapshot on the server, see `InMemoryRegistry.restore`
+
+        Args:
+            path (str | Path): Directory of the snapshot relative to the
+                snapshot directory of the server
+            max_workers (int | None, optional): Number of threads reading data.
+                Defaults to None.
+
+        Raises:
+            FileNotFoundError: If there is no snapshot at path
+            ValueError: If the snapshot version is not supported, the server has
+                no snapshot directory or the path is outside of it
+            KeyError: If a schema or data key of the snapshot already exists
+        """
+        self._request("restore", path=str(path), max_workers=max_workers)
@@ -1,29 +1,107 @@
-from typing import Any
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from ..exceptions import DataValidationError
-from ..protocols import ValidatorProtocol
-from ..schema_manager import SchemaManager
-from ..storage import InMemoryStorage
+from ..instrumentation import Instrumentation, instrumented
+from ..metadata import time_field
+from ..protocols.protocols import (
+    QueryStorageProtocol,
+    StorageProtocol,
+    ValidatorProtocol,
+)
+from ..storage.inmemory import InMemoryStorage
+from ..storage.query import Filter, query_frame
+from ..utils import data_fingerprint, data_size, schema_fingerprint
+from ..validator.schema_diff import (
+    SchemaChange,
+    SchemaDiff,
+    diff_schemas,
+    select_columns,
+)
+from ..validator.statistics import column_statistics, undecided_changes
+from ..validator.validation_report import ValidationReport
+from .cache import ValidationCache
+from .metadata_index import MetadataIndex
+from .snapshot import read_snapshot, write_snapshot
+from .time_index import TimeIndex, time_range, to_timestamp
+
+if TYPE_CHECKING:
+    from ..schema_manager import SchemaManager
+
+
+# content description of data that is kept when data is moved between registries
+_RESTORED_INFO = (
+    "content_hash",
+    "n_rows",
+    "n_bytes",
+    "time_min",
+    "time_max",
+    "statistics",
+    "ingested_at",
+)
 
 
 class InMemoryRegistry:
     _schema_manager: SchemaManager
-    _data_store: InMemoryStorage
+    # write-through index of the metadata of the schema manager
+    _index: MetadataIndex
+    _data_store: StorageProtocol
     _validator: ValidatorProtocol
+    _validation_cache: ValidationCache | None
+    _instrumentation: Instrumentation
+    # time indexes of data held in memory by data key, built on first use
+    _time_indexes: dict[str, TimeIndex]
+    _collect_statistics: bool
 
     def __init__(
-        self, validator: ValidatorProtocol, schema_manager: SchemaManager
+        self,
+        validator: ValidatorProtocol,
+        schema_manager: SchemaManager,
+        validation_cache: ValidationCache | None = None,
+        instrumentation: Instrumentation | None = None,
+        storage: StorageProtocol | None = None,
+        collect_statistics: bool = True,
     ) -> None:
         """Initialize the registry with schema manager and storage
 
+        The schemas and the relations of data and schemas are loaded from the
+        schema manager into an in-memory index that every mutation of the
+        registry writes through. Metadata lookups are therefore dictionary
+        operations. The registry must be the only writer of the schema manager.
+
         Args:
             validator (Any): Validator to validate data against schema
+            schema_manager (SchemaManager): Manager of schemas and relations
+            validation_cache (ValidationCache | None, optional): Cache of
+                validation reports. If provided, data that has already been
+                validated against the same schema is not validated again.
+                Defaults to None which disables caching.
+            instrumentation (Instrumentation | None, optional): Instrumentation
+                that records the duration of each operation and its phases.
+                Defaults to None which uses the instrumentation of the schema
+                manager.
+            storage (StorageProtocol | None, optional): Storage of the data.
+                Defaults to None which uses an InMemoryStorage.
+            collect_statistics (bool, optional): Whether to compute column
+                statistics of dataframes on add and replace. They allow to
+                decide most constraint changes of `replace_schema` without
+                loading data. Defaults to True.
         """
         self._schema_manager = schema_manager
+        self._index = MetadataIndex(schema_manager)
         self._validator = validator
-        self._data_store = InMemoryStorage()
+        self._data_store = storage if storage is not None else InMemoryStorage()
+        self._validation_cache = validation_cache
+        self._instrumentation = instrumentation or schema_manager.instrumentation
+        self._time_indexes = {}
+        self._collect_statistics = collect_statistics
 
     # -------- schema related methods
+    @instrumented("registry.add_schema")
     def add_schema(self, key: str, schema: Any) -> None:
         """Add schema to the registry. The schema is validated against the metadata
         standard. If the schema already exists, a KeyError is raised.
@@ -35,8 +113,12 @@ class InMemoryRegistry:
         Raises:
             KeyError: If the schema already exists
         """
-        self._schema_manager.add_schema(key=key, schema=schema)
+        if key in self._index.schemas:
+            raise KeyError(f"Schema key '{key}' already exists")
+        parsed = self._schema_manager.add_schema(key=key, schema=schema)
+        self._index.set_schema(key, parsed)
 
+    @instrumented("registry.get_schema")
     def get_schema(self, key: str) -> Any:
         """Given the key of schema, return the schema
 
@@ -49,8 +131,9 @@ class InMemoryRegistry:
         Raises:
             KeyError: If the schema does not exist
         """
-        return self._schema_manager[key]
+        return self._index.get_schema(key)
 
+    @instrumented("registry.delete_schema")
     def delete_schema(self, key: str) -> None:
         """Given the key of schema delete it
 
@@ -62,25 +145,92 @@ class InMemoryRegistry:
                 the schema still exist
         """
         self._schema_manager.delete_schema(key=key)
+        self._index.delete_schema(key)
 
+    @instrumented("registry.replace_schema")
     def replace_schema(self, key: str, schema: Any) -> None:
         """Replace a schema in the registry
 
+        The new schema is compared field by field with the old schema, see
+        `diff_schemas`. Data is only validated again if a constraint was
+        tightened, and then only the affected columns are checked against the
+        tightened constraints. Changes of the documentation or loosened
+        constraints do not load any data. Neither do tightened constraints that
+        hold according to the column statistics recorded at ingest, e.g., a new
+        maximum above the largest value.
+
         Args:
             key (str): Key of schema
             schema (Any): New schema
 
+        Raises:
+            KeyError: If the schema does not exist
+            DataValidationError: If the data does not conform to the schema
+        """
+        ranges = self.check_schema_replacement(key, schema)
+        self.apply_schema_replacement(key, schema, ranges)
+
+    @instrumented("registry.check_schema_replacement")
+    def check_schema_replacement(
+        self, key: str, schema: Any
+    ) -> dict[str, tuple[Any, Any]]:
+        """Check that the data of a schema conforms to its replacement
+
+        Nothing is written, so that several registries can check a replacement
+        before any of them applies it with `apply_schema_replacement`, e.g., the
+        shards of a ShardedRegistry.
+
+        Args:
+            key (str): Key of schema
+            schema (Any): New schema
+
+        Returns:
+            dict[str, tuple[Any, Any]]: New time ranges by data key if the time
+                field changed
+
         Raises:
             KeyError: If the schema does not exist
             DataValidationError: If the data does not conform to the schema
         """
         # ensure that new schema is valid
         self._schema_manager.validate_schema(schema)
-        for data_key in self._schema_manager.list_data_for_schema(key):
-            data = self.get_data(data_key)
-            self._validate_data(data=data, schema=schema)
-        # replacement
-        self._schema_manager.replace_schema(key, schema)
+        old = self.get_schema(key)
+        with self._instrumentation.phase("schema_diff"):
+            diff = diff_schemas(old, schema)
+            tightened = diff.tightened
+        time_changed = time_field(schema) != time_field(old)
+        ranges = {}
+        if tightened or time_changed:
+            infos = self._schema_manager.list_data_info(key_schema=key)
+            for info in infos:
+                # constraints that the column statistics prove need no scan
+                changes = undecided_changes(tightened, schema, info["statistics"])
+                if not changes and not time_changed:
+                    continue
+                data = self.get_data(info["id"])
+                if changes:
+                    self._revalidate_data(data, schema, diff, changes)
+                if time_changed:
+                    ranges[info["id"]] = time_range(data, schema)
+        return ranges
+
+    @instrumented("registry.apply_schema_replacement")
+    def apply_schema_replacement(
+        self, key: str, schema: Any, ranges: dict[str, tuple[Any, Any]]
+    ) -> None:
+        """Write a checked schema replacement
+
+        Args:
+            key (str): Key of schema
+            schema (Any): New schema
+            ranges (dict[str, tuple[Any, Any]]): New time ranges by data key as
+                returned by `check_schema_replacement`
+        """
+        parsed = self._schema_manager.replace_schema(key, schema)
+        self._index.set_schema(key, parsed)
+        for data_key, (time_min, time_max) in ranges.items():
+            self._schema_manager.update_time_range(data_key, time_min, time_max)
+            self._time_indexes.pop(data_key, None)
 
     @property
     def schemas(self) -> list[str]:
@@ -89,9 +239,10 @@ class InMemoryRegistry:
         Returns:
             list[str]: List of schema keys
         """
-        return self._schema_manager.schemas
+        return list(self._index.schemas)
 
     # -------- data related methods
+    @instrumented("registry.add_data")
     def add_data(self, key: str, schema_key: str, data: Any) -> None:
         """Add data to the registry. The data is validated given the schema.
 
@@ -103,30 +254,254 @@ class InMemoryRegistry:
         Raises:
             KeyError: If the schema does not exist
         """
-        if key in self._schema_manager.data:
-            raise KeyError(f"Data {key} already exists")
-        if schema_key not in self.schemas:
-            raise KeyError(f"Schema {schema_key} does not exist")
-        # validate data
-        self._validate_data(data=data, schema=self.get_schema(schema_key))
-        # add data
-        self._schema_manager.add_data(key=key, key_schema=schema_key)
-        self._data_store.save(key, data)
-
-    def get_data(self, key: str) -> Any:
+        instrumentation = self._instrumentation
+        with instrumentation.phase("metadata"):
+            if key in self._index.data_schema:
+                raise KeyError(f"Data {key} already exists")
+            if schema_key not in self._index.schemas:
+                raise KeyError(f"Schema {schema_key} does not exist")
+        with instrumentation.phase("schema_fetch"):
+            schema = self.get_schema(schema_key)
+        info = self._prepare_data(data, schema)
+        self._store_data(key, schema_key, data, info)
+
+    @instrumented("registry.prepare_data")
+    def prepare_data(
+        self,
+        data: Any,
+        schema: dict[str, Any],
+        report: ValidationReport | None = None,
+    ) -> dict[str, Any]:
+        """Describe and validate data before storing it with `add_prepared_data`
+        or `replace_prepared_data`
+
+        Together, the methods do the work of `add_data` or `replace_data` in two
+        steps. This step does not access the schema manager and can therefore
+        run on other threads than the one owning the database connection, e.g.,
+        the validator threads of an ingest pipeline.
+
+        Args:
+            data (Any): Data to be added
+            schema (dict[str, Any]): Schema of the data as returned by
+                `get_schema`
+            report (ValidationReport | None, optional): Report of a validation of
+                the data against schema that already took place, e.g., on a
+                worker process. Defaults to None which validates the data.
+
+        Returns:
+            dict[str, Any]: Content description of the data
+
+        Raises:
+            DataValidationError: If data does not conform to schema
+        """
+        return self._prepare_data(data, schema, report)
+
+    @instrumented("registry.add_prepared_data")
+    def add_prepared_data(
+        self, key: str, schema_key: str, data: Any, info: dict[str, Any]
+    ) -> None:
+        """Add data validated by `prepare_data` without validating it again
+
+        Args:
+            key (str): Key of data
+            schema_key (str): Key of the schema passed to `prepare_data`
+            data (Any): Data passed to `prepare_data`
+            info (dict[str, Any]): Content description returned by
+                `prepare_data`
+
+        Raises:
+            KeyError: If the data already exists or the schema does not exist
+        """
+        self._store_data(key, schema_key, data, info)
+
+    @instrumented("registry.replace_prepared_data")
+    def replace_prepared_data(self, key: str, data: Any, info: dict[str, Any]) -> None:
+        """Replace data validated by `prepare_data` without validating it again
+
+        As with `replace_data`, the replacement is a no-op if the content hash
+        of the new data equals the stored content hash.
+
+        Args:
+            key (str): Key of data
+            data (Any): Data passed to `prepare_data`
+            info (dict[str, Any]): Content description returned by
+                `prepare_data` for the schema of the data
+
+        Raises:
+            KeyError: If the data does not exist
+        """
+        if info["content_hash"] and info["content_hash"] == self._index.data_hash[key]:
+            return
+        self._replace_stored_data(key, data, info)
+
+    @instrumented("registry.restore_data")
+    def restore_data(self, key: str, info: dict[str, Any], data: Any) -> None:
+        """Store data under its recorded content description without validation
+
+        Used to move data that was validated before, e.g., from a snapshot or
+        another registry with the same schema.
+
+        Args:
+            key (str): Key of data
+            info (dict[str, Any]): Content description as returned by
+                `get_data_info`
+            data (Any): Data
+
+        Raises:
+            KeyError: If the data already exists or the schema does not exist
+        """
+        described = {field: info.get(field) for field in _RESTORED_INFO}
+        self._store_data(key, info["id_schema"], data, described)
+
+    @instrumented("registry.get_data")
+    def get_data(self, key: str, start: Any = None, end: Any = None) -> Any:
         """Given the key of data, return the data
 
+        If a start or end is given, only the rows whose time field lies in the
+        window [start, end) are returned. The time field is the first entry of
+        the `timeFields` of the schema. Data held in memory is sliced by binary
+        search on a sorted index of the time field, which is built on first use.
+        For other storages supporting queries, the window is pushed down as
+        filter.
+
+        Example:
+
+            .. code-block:: python
+            registry.get_data("generation", start="2024-01-01", end="2024-02-01")
+
         Args:
             key (str): Key of data
+            start (str | datetime | None, optional): First point in time. Naive
+                times are in UTC. Defaults to None.
+            end (str | datetime | None, optional): Point in time after the
+                window. Naive times are in UTC. Defaults to None.
 
         Returns:
             Any: Data
 
         Raises:
             KeyError: If the data does not exist
+            ValueError: If a window is given but the schema of the data has no
+                datetime or date time field
+        """
+        store = self._data_store
+        if start is None and end is None:
+            return store.load(key)
+        field = time_field(self.get_schema(self._index.get_data_schema_key(key)))
+        if field is None:
+            raise ValueError(f"Schema of data '{key}' has no time field")
+        if isinstance(store, QueryStorageProtocol) and not isinstance(
+            store, InMemoryStorage
+        ):
+            filters: list[Filter] = []
+            if start is not None:
+                filters.append((field, ">=", to_timestamp(start)))
+            if end is not None:
+                filters.append((field, "<", to_timestamp(end)))
+            return store.query(key, filters=filters)
+        data = store.load(key)
+        index = self._time_indexes.get(key)
+        if index is None:
+            index = self._time_indexes[key] = TimeIndex(data[field])
+        return data.iloc[index.positions(start, end)]
+
+    @instrumented("registry.list_data_in_window")
+    def list_data_in_window(
+        self, start: Any = None, end: Any = None, schema_key: str | None = None
+    ) -> list[str]:
+        """List the data with a point in time in the window [start, end)
+
+        The time ranges of the data are recorded in the metadata tables, so that
+        no data is loaded.
+
+        Args:
+            start (str | datetime | None, optional): First point in time. Naive
+                times are in UTC. Defaults to None.
+            end (str | datetime | None, optional): Point in time after the
+                window. Naive times are in UTC. Defaults to None.
+            schema_key (str | None, optional): Only list data of this schema.
+                Defaults to None.
+
+        Returns:
+            list[str]: Data keys sorted by their first point in time
+        """
+        return self._schema_manager.list_data_in_window(
+            start=to_timestamp(start) if start is not None else None,
+            end=to_timestamp(end) if end is not None else None,
+            key_schema=schema_key,
+        )
+
+    @instrumented("registry.list_data_starts")
+    def list_data_starts(
+        self, start: Any = None, end: Any = None, schema_key: str | None = None
+    ) -> list[tuple[str, datetime]]:
+        """List the data in the window [start, end) with their first point in time
+
+        Selects the same data as `list_data_in_window` without loading data.
+
+        Args:
+            start (str | datetime | None, optional): First point in time. Naive
+                times are in UTC. Defaults to None.
+            end (str | datetime | None, optional): Point in time after the
+                window. Naive times are in UTC. Defaults to None.
+            schema_key (str | None, optional): Only list data of this schema.
+                Defaults to None.
+
+        Returns:
+            list[tuple[str, datetime]]: Tuples of data key and first point in
+                time in UTC, sorted by the first point in time
+        """
+        return self._schema_manager.list_data_starts(
+            start=to_timestamp(start) if start is not None else None,
+            end=to_timestamp(end) if end is not None else None,
+            key_schema=schema_key,
+        )
+
+    @instrumented("registry.query_data")
+    def query_data(
+        self,
+        key: str,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[Filter] | None = None,
+    ) -> Any:
+        """Given the key of data, return the matching rows and columns
+
+        If the storage implements the QueryStorageProtocol, the query is pushed
+        down to the storage, e.g., a ParquetStorage only reads the requested
+        columns and the row groups that may match. Otherwise the data is loaded
+        and filtered in memory.
+
+        Example:
+
+            .. code-block:: python
+            registry.query_data(
+                "generation",
+                columns=["timestamp", "value"],
+                filters=[("country", "==", "DE"), ("timestamp", ">=", start)],
+            )
+
+        Args:
+            key (str): Key of data
+            columns (Sequence[str] | None, optional): Columns to return. Defaults
+                to None which returns all columns.
+            filters (Sequence[Filter] | None, optional): Predicates as tuples of
+                column, operator and value that are combined with a logical and.
+                Operators are ==, !=, <, <=, >, >=, in and not in. Missing values
+                never match. Defaults to None which returns all rows.
+
+        Returns:
+            Any: Matching rows and columns of the data
+
+        Raises:
+            KeyError: If the data or a column does not exist
+            ValueError: If a filter is malformed
         """
-        return self._data_store.load(key)
+        store = self._data_store
+        if isinstance(store, QueryStorageProtocol):
+            return store.query(key, columns=columns, filters=filters)
+        return query_frame(store.load(key), columns=columns, filters=filters)
 
+    @instrumented("registry.delete_data")
     def delete_data(self, key: str) -> None:
         """Given the key of data delete it
 
@@ -137,11 +512,17 @@ class InMemoryRegistry:
             IntegrityError: If the data does not exist
         """
         self._schema_manager.delete_data(key=key)
+        self._index.delete_data(key)
         self._data_store.delete(key)
+        self._time_indexes.pop(key, None)
 
+    @instrumented("registry.replace_data")
     def replace_data(self, key: str, data: Any) -> None:
         """Replace a data in the registry
 
+        If the content hash of the new data equals the stored content hash, the
+        replacement is a no-op and neither validation nor storage takes place.
+
         Args:
             key (str): Key of data
             data (Any): New data
@@ -150,12 +531,49 @@ class InMemoryRegistry:
             KeyError: If the data does not exist
             ValidationError: If the data does not conform to the schema
         """
-        schema = self._schema_manager.get_data_schema(key)
+        instrumentation = self._instrumentation
+        schema_key = self._index.get_data_schema_key(key)
+        info = self._describe_data(data)
+        if info["content_hash"] and info["content_hash"] == self._index.data_hash[key]:
+            return
+        with instrumentation.phase("schema_fetch"):
+            schema = self.get_schema(schema_key)
+        info.update(self._describe_columns(data, schema))
         # check data against schema
-        self._validate_data(data=data, schema=schema)
-        # replacement
-        self._data_store.replace(key, data)
+        with instrumentation.phase("validate", info["n_rows"], info["n_bytes"]):
+            self._validate_data(data, schema, key_data=info["content_hash"])
+        self._replace_stored_data(key, data, info)
+
+    @instrumented("registry.get_data_info")
+    def get_data_info(self, key: str) -> dict[str, Any]:
+        """Given the key of data, return its content description without loading
+        the data
+
+        Args:
+            key (str): Key of data
+
+        Returns:
+            dict[str, Any]: Dictionary with the keys id, id_schema, content_hash,
+                n_rows, n_bytes, time_min, time_max, statistics, and ingested_at
+                (UTC)
+
+        Raises:
+            KeyError: If the data does not exist
+        """
+        return self._schema_manager.get_data_info(key)
+
+    def has_data(self, key: str) -> bool:
+        """Whether data exists, answered from the metadata index
+
+        Args:
+            key (str): Key of data
 
+        Returns:
+            bool: True if the data exists
+        """
+        return key in self._index.data_schema
+
+    @instrumented("registry.list_data")
     def list_data(self) -> list[tuple[str, str]]:
         """List all data
 
@@ -165,21 +583,236 @@ class InMemoryRegistry:
         Raises:
             IntegrityError: If the data does not exist
         """
-        return self._schema_manager.list_data()
+        return list(self._index.data_schema.items())
+
+    # -------- snapshot related methods
+    @instrumented("registry.snapshot")
+    def snapshot(self, path: str | Path, max_workers: int | None = None) -> None:
+        """Write all schemas, data and their content descriptions to a directory
+
+        Dataframes are written in the Arrow IPC (feather) format if pyarrow is
+        installed, other data is pickled. The data items are written in
+        parallel. An existing snapshot at path is replaced once the new snapshot
+        is complete.
+
+        Args:
+            path (str | Path): Directory of the snapshot
+            max_workers (int | None, optional): Number of threads writing data.
+                Defaults to None which uses the default of ThreadPoolExecutor.
+        """
+        write_snapshot(self, path, max_workers=max_workers)
+
+    @instrumented("registry.restore")
+    def restore(self, path: str | Path, max_workers: int | None = None) -> None:
+        """Restore the schemas and data of a snapshot written by `snapshot`
+
+        The data is not validated again: the content hashes, sizes, time ranges
+        and ingestion times of the snapshot are stored as they are. Only restore
+        snapshots from trusted sources, since data that is not a dataframe is
+        unpickled.
+
+        Args:
+            path (str | Path): Directory of the snapshot
+            max_workers (int | None, optional): Number of threads reading data.
+                Defaults to None which uses the default of ThreadPoolExecutor.
+
+        Raises:
+            FileNotFoundError: If there is no snapshot at path
+            ValueError: If the snapshot version is not supported
+            KeyError: If a schema or data key of the snapshot already exists
+        """
+        read_snapshot(self, path, max_workers=max_workers)
+
+    def _describe_data(
+        self, data: Any, schema: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Describe the content of data as stored in the data table
+
+        Args:
+            data (Any): Data item
+            schema (dict[str, Any] | None, optional): Schema of the data. If
+                given, the time range of the time field and the column
+                statistics are included. Defaults to None.
+
+        Returns:
+            dict[str, Any]: Content hash, number of rows and size in bytes, and
+                with schema the first and last point in time and the column
+                statistics
+        """
+        with self._instrumentation.phase("fingerprint") as record:
+            n_rows, n_bytes = data_size(data)
+            record.rows, record.bytes = n_rows, n_bytes
+            info = {
+                "content_hash": data_fingerprint(data),
+                "n_rows": n_rows,
+                "n_bytes": n_bytes,
+            }
+        if schema is not None:
+            info.update(self._describe_columns(data, schema))
+        return info
+
+    def _prepare_data(
+        self,
+        data: Any,
+        schema: dict[str, Any],
+        report: ValidationReport | None = None,
+    ) -> dict[str, Any]:
+        """Describe data and validate it against schema unless a report is given
+
+        Returns:
+            dict[str, Any]: Content description of the data
+
+        Raises:
+            DataValidationError: If data does not conform to schema
+        """
+        if report is not None and not report.valid:
+            raise DataValidationError("Data does not conform to schema", report=report)
+        info = self._describe_data(data, schema)
+        if report is None:
+            with self._instrumentation.phase(
+                "validate", info["n_rows"], info["n_bytes"]
+            ):
+                self._validate_data(data, schema, key_data=info["content_hash"])
+        return info
+
+    def _describe_columns(self, data: Any, schema: dict[str, Any]) -> dict[str, Any]:
+        """Describe the time range and the columns of data
+
+        Args:
+            data (Any): Data item
+            schema (dict[str, Any]): Schema of the data
+
+        Returns:
+            dict[str, Any]: First and last point in time and column statistics
+        """
+        time_min, time_max = time_range(data, schema)
+        info: dict[str, Any] = {
+            "time_min": time_min,
+            "time_max": time_max,
+            "statistics": None,
+        }
+        if self._collect_statistics:
+            with self._instrumentation.phase("statistics", *data_size(data)):
+                info["statistics"] = column_statistics(data)
+        return info
+
+    def _store_data(
+        self, key: str, schema_key: str, data: Any, info: dict[str, Any]
+    ) -> None:
+        """Store validated data and its content description
+
+        Args:
+            key (str): Key of data
+            schema_key (str): Key of schema
+            data (Any): Validated data
+            info (dict[str, Any]): Content description of the data
+
+        Raises:
+            KeyError: If the data already exists or the schema does not exist
+        """
+        with self._instrumentation.phase("store", info["n_rows"], info["n_bytes"]):
+            # the data is stored first, so that a failing save leaves no
+            # metadata of data that does not exist
+            self._data_store.save(key, data)
+            try:
+                self._schema_manager.add_data(key=key, key_schema=schema_key, **info)
+            except BaseException:
+                self._data_store.delete(key)
+                raise
+            self._index.add_data(key, schema_key, info["content_hash"])
+
+    def _replace_stored_data(self, key: str, data: Any, info: dict[str, Any]) -> None:
+        """Replace stored data and its content description by validated data
+
+        Args:
+            key (str): Key of data
+            data (Any): Validated data
+            info (dict[str, Any]): Content description of the data
+
+        Raises:
+            KeyError: If the data does not exist
+        """
+        with self._instrumentation.phase("store", info["n_rows"], info["n_bytes"]):
+            self._data_store.replace(key, data)
+            self._schema_manager.update_data(key=key, **info)
+            self._index.replace_data(key, info["content_hash"])
+            self._time_indexes.pop(key, None)
+
+    def _revalidate_data(
+        self,
+        data: Any,
+        schema: dict[str, Any],
+        diff: SchemaDiff,
+        changes: Sequence[SchemaChange],
+    ) -> None:
+        """Validate data valid against the old schema against tightened changes
+
+        Args:
+            data (Any): Data to be validated
+            schema (dict[str, Any]): New schema
+            diff (SchemaDiff): Difference of the old and new schema
+            changes (Sequence[SchemaChange]): Tightened changes to check
+
+        Raises:
+            DataValidationError: If data does not conform to the new schema
+        """
+        revalidation = diff.revalidation_schema(changes)
+        if revalidation is None:  # nothing to check
+            return
+        columns = select_columns(data, diff.revalidation_columns(revalidation))
+        if columns is None:
+            self._validate_data(data=data, schema=schema)
+        else:
+            self._validate_data(data=columns, schema=revalidation)
 
-    def _validate_data(self, data: Any, schema: dict[str, Any]) -> None:
+    def _validate_data(
+        self, data: Any, schema: dict[str, Any], key_data: str | None = None
+    ) -> None:
         """Validate data against schema
 
         Args:
             data (Any): Data to be validated
             schema (dict[str, Any]): Schema to validate against
+            key_data (str | None, optional): Fingerprint of the data if already
+                known. Defaults to None.
 
         Raises:
             DataValidationError: If data does not conform to schema
         """
         # check data against schema
-        if not self._validator.is_valid(data, schema):
-            raise DataValidationError("Data does not conform to schema")
+        report = self._get_validation_report(
+            data=data, schema=schema, key_data=key_data
+        )
+        if not report.valid:
+            raise DataValidationError("Data does not conform to schema", report=report)
+
+    def _get_validation_report(
+        self, data: Any, schema: dict[str, Any], key_data: str | None = None
+    ) -> ValidationReport:
+        """Validate data against schema using the validation cache if enabled
+
+        Data that cannot be fingerprinted is always validated.
+
+        Args:
+            data (Any): Data to be validated
+            schema (dict[str, Any]): Schema to validate against
+            key_data (str | None, optional): Fingerprint of the data if already
+                known. Defaults to None.
+
+        Returns:
+            ValidationReport: Validation report
+        """
+        cache = self._validation_cache
+        if cache is not None and key_data is None:
+            key_data = data_fingerprint(data)
+        if cache is None or key_data is None:
+            return self._validator.validate(data, schema)  # type: ignore[no-any-return]
+        key_schema = schema_fingerprint(schema)
+        report = cache.get(key_data, key_schema)
+        if report is None:
+            report = self._validator.validate(data, schema)
+            cache.put(key_data, key_schema, report)
+        return report
 
     @property
     def data(self) -> list[str]:
@@ -188,4 +821,4 @@ class InMemoryRegistry:
         Returns:
             list[str]: List of data keys
         """
-        return self._schema_manager.data
+        return list(self._index.data_schema)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..utils import FingerprintedSchema
+
+if TYPE_CHECKING:
+    from ..schema_manager import SchemaManager
+
+__all__ = ["MetadataIndex"]
+
+
+class MetadataIndex:
+    """Write-through in-memory index of the metadata of a SchemaManager
+
+    The index holds the parsed schemas, the schema key and content hash of each
+    data key and the data keys of each schema, so that lookups on the hot path
+    of a registry are dictionary operations instead of database queries. It is
+    loaded once from the database with two queries. Afterwards the owner writes
+    each mutation to the database first and then applies it to the index, so
+    that a failing database write leaves the index unchanged.
+
+    The index assumes that its owner is the only writer of the database. Call
+    `load` after the database was modified otherwise.
+
+    Attributes:
+        schemas (dict[str, FingerprintedSchema]): Parsed schemas by key
+        data_schema (dict[str, str]): Schema key by data key in insertion order
+        data_hash (dict[str, str | None]): Content hash by data key
+        schema_data (dict[str, dict[str, None]]): Data keys by schema key as
+            ordered sets
+    """
+
+    def __init__(self, schema_manager: SchemaManager) -> None:
+        """Load the index from the database of a schema manager
+
+        Args:
+            schema_manager (SchemaManager): Manager of schemas and relations
+        """
+        self._schema_manager = schema_manager
+        self.schemas: dict[str, FingerprintedSchema] = {}
+        self.data_schema: dict[str, str] = {}
+        self.data_hash: dict[str, str | None] = {}
+        self.schema_data: dict[str, dict[str, None]] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Rebuild the index from the database"""
+        self.schemas = self._schema_manager.load_schemas()
+        self.schema_data = {key: {} for key in self.schemas}
+        self.data_schema = {}
+        self.data_hash = {}
+        for info in self._schema_manager.list_data_info():
+            self.add_data(info["id"], info["id_schema"], info["content_hash"])
+
+    def get_schema(self, key: str) -> FingerprintedSchema:
+        """Return the parsed schema of a key
+
+        Args:
+            key (str): Schema key
+
+        Returns:
+            FingerprintedSchema: Schema
+
+        Raises:
+            KeyError: If the schema does not exist
+        """
+        try:
+            return self.schemas[key]
+        except KeyError:
+            raise KeyError(f"Schema key '{key}' not found") from None
+
+    def get_data_schema_key(self, key: str) -> str:
+        """Return the schema key of a data key
+
+        Args:
+            key (str): Data key
+
+        Returns:
+            str: Schema key
+
+        Raises:
+            KeyError: If the data does not exist
+        """
+        try:
+            return self.data_schema[key]
+        except KeyError:
+            raise KeyError(f"Data key '{key}' not found") from None
+
+    def set_schema(self, key: str, schema: FingerprintedSchema) -> None:
+        """Record an added or replaced schema"""
+        self.schemas[key] = schema
+        self.schema_data.setdefault(key, {})
+
+    def delete_schema(self, key: str) -> None:
+        """Record a deleted schema"""
+        self.schemas.pop(key, None)
+        self.schema_data.pop(key, None)
+
+    def add_data(
+        self, key: str, schema_key: str, content_hash: str | None = None
+    ) -> None:
+        """Record added data"""
+        self.data_schema[key] = schema_key
+        self.data_hash[key] = content_hash
+        self.schema_data.setdefault(schema_key, {})[key] = None
+
+    def replace_data(self, key: str, content_hash: str | None) -> None:
+        """Record replaced data"""
+        self.data_hash[key] = content_hash
+
+    def delete_data(self, key: str) -> None:
+        """Record deleted data"""
+        self.data_hash.pop(key, None)
+        schema_key = self.data_schema.pop(key, None)
+        if schema_key is not None:
+            self.schema_data.get(schema_key, {}).pop(key, None)
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..utils import read_data_file
+
+if TYPE_CHECKING:
+    from .inmemory import InMemoryRegistry
+
+__all__ = ["IngestError", "IngestPipeline", "IngestResult"]
+
+# returned to the worker threads once the run is cancelled
+_STOP = object()
+# seconds a worker thread waits on a queue before checking for cancellation
+_POLL = 0.05
+
+
+class IngestError:
+    """Failure of a single item of an ingest pipeline
+
+    Attributes:
+        key (str): Key of the data
+        stage (str): Stage in which the item failed: schema, read, validate or
+            store
+        error (Exception): The exception. Validation failures are
+            DataValidationError carrying the validation report.
+    """
+
+    __slots__ = ("key", "stage", "error")
+
+    def __init__(self, key: str, stage: str, error: Exception) -> None:
+        self.key = key
+        self.stage = stage
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (
+            f"IngestError(key={self.key!r}, stage={self.stage!r}, error={self.error!r})"
+        )
+
+
+class IngestResult:
+    """Outcome of an ingest pipeline run
+
+    Attributes:
+        stored (list[str]): Keys of the data stored in the registry
+        skipped (list[str]): Keys skipped because the checkpoint marks them done
+        failed (list[IngestError]): Items that failed
+        seconds (float): Wall time of the run
+    """
+
+    def __init__(self) -> None:
+        self.stored: list[str] = []
+        self.skipped: list[str] = []
+        self.failed: list[IngestError] = []
+        self.seconds = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"IngestResult(stored={len(self.stored)}, skipped={len(self.skipped)}, "
+            f"failed={len(self.failed)}, seconds={self.seconds:.3f})"
+        )
+
+
+class IngestPipeline:
+    """Ingest many data items into a registry with overlapping I/O and validation
+
+    Items pass three stages connected by bounded queues:
+
+    - read: reader threads load the data of an item, e.g., parse a file
+    - validate: validator threads fingerprint and validate the data
+    - store: the calling thread stores valid data in the registry
+
+    Storing happens on the calling thread because the SchemaManager's SQLite
+    connection must not be shared between threads. The bounded queues limit
+    the number of items held in memory at once.
+
+    A failing item is recorded in the result and passed to `on_error`; the
+    pipeline continues with the next item. If a checkpoint file is given, the
+    key of each stored item is appended to it, and keys found in the file are
+    skipped, so that an interrupted run resumes where it stopped.
+
+    Example:
+
+        .. code-block:: python
+        pipeline = IngestPipeline(registry, readers=4, validators=2,
+                                  checkpoint="ingest.checkpoint")
+        items = ((f.stem, "sales", f) for f in Path("data").glob("*.csv"))
+        result = pipeline.run(items)
+        for failure in result.failed:
+            print(failure.key, failure.stage, failure.error)
+    """
+
+    def __init__(
+        self,
+        registry: InMemoryRegistry,
+        reader: Callable[[Any], Any] | None = None,
+        readers: int = 2,
+        validators: int = 2,
+        queue_size: int = 8,
+        checkpoint: str | Path | None = None,
+        on_error: Callable[[IngestError], None] | None = None,
+    ) -> None:
+        """Initialize the pipeline
+
+        Args:
+            registry (InMemoryRegistry): Registry the data is added to
+            reader (Callable[[Any], Any] | None, optional): Function loading the
+                data of an item from its source. Defaults to None which reads csv
+                and parquet files with read_data_file. Csv files are parsed into
+                the types of the fields of the item's schema; values that cannot
+                be parsed fail the item in the read stage.
+            readers (int, optional): Number of reader threads. Defaults to 2.
+            validators (int, optional): Number of validator threads. Defaults to 2.
+            queue_size (int, optional): Capacity of each queue between stages.
+                Defaults to 8.
+            checkpoint (str | Path | None, optional): File recording the stored
+                keys. Defaults to None which disables checkpointing.
+            on_error (Callable[[IngestError], None] | None, optional): Called for
+                each failing item. Defaults to None.
+
+        Raises:
+            ValueError: If a number of threads or the queue size is below 1
+        """
+        if min(readers, validators, queue_size) < 1:
+            raise ValueError("readers, validators and queue_size must be at least 1")
+        self._registry = registry
+        self._reader = reader
+        self._readers = readers
+        self._validators = validators
+        self._queue_size = queue_size
+        self._checkpoint = Path(checkpoint) if checkpoint is not None else None
+        self._on_error = on_error
+
+    def completed(self) -> set[str]:
+        """Keys recorded as stored in the checkpoint file
+
+        Returns:
+            set[str]: Stored keys; empty without checkpoint file
+        """
+        if self._checkpoint is None or not self._checkpoint.exists():
+            return set()
+        with open(self._checkpoint) as f:
+            return {json.loads(line)["key"] for line in f if line.strip()}
+
+    def run(self, items: Iterable[tuple[str, str, Any]]) -> IngestResult:
+        """Ingest items into the registry
+
+        Args:
+            items (Iterable[tuple[str, str, Any]]): Items as tuples of data key,
+                schema key and source passed to the reader
+
+        Returns:
+            IngestResult: Stored, skipped and failed items
+        """
+        start = time.perf_counter()
+        result = IngestResult()
+        done = self.completed()
+        read_q: queue.Queue[Any] = queue.Queue(self._queue_size)
+        validate_q: queue.Queue[Any] = queue.Queue(self._queue_size)
+        store_q: queue.Queue[Any] = queue.Queue(self._queue_size)
+        # set when the run ends, which stops the worker threads
+        cancel = threading.Event()
+        threads = [
+            threading.Thread(
+                target=self._work,
+                args=(self._read, cancel, read_q, validate_q, store_q),
+                daemon=True,
+            )
+            for _ in range(self._readers)
+        ] + [
+            threading.Thread(
+                target=self._work,
+                args=(self._validate, cancel, validate_q, store_q),
+                daemon=True,
+            )
+            for _ in range(self._validators)
+        ]
+        for thread in threads:
+            thread.start()
+
+        schemas: dict[str, Any] = {}
+        pending = 0
+        checkpoint = open(self._checkpoint, "a") if self._checkpoint else None
+        try:
+            for key, schema_key, source in self._skip(items, done, result):
+                try:
+                    if schema_key not in schemas:
+                        schemas[schema_key] = self._registry.get_schema(schema_key)
+                except KeyError as e:
+                    self._fail(result, IngestError(key, "schema", e))
+                    continue
+                item = (key, schema_key, schemas[schema_key], source)
+                # store finished items while the read queue is full
+                while True:
+                    try:
+                        read_q.put_nowait(item)
+                        pending += 1
+                        break
+                    except queue.Full:
+                        pending -= self._store_next(store_q, cancel, result, checkpoint)
+            while pending:
+                pending -= self._store_next(store_q, cancel, result, checkpoint)
+        finally:
+            cancel.set()
+            for thread in threads:
+                thread.join()
+            if checkpoint is not None:
+                checkpoint.close()
+        result.seconds = time.perf_counter() - start
+        return result
+
+    @staticmethod
+    def _skip(
+        items: Iterable[tuple[str, str, Any]], done: set[str], result: IngestResult
+    ) -> Iterator[tuple[str, str, Any]]:
+        for key, schema_key, source in items:
+            if key in done:
+                result.skipped.append(key)
+            else:
+                yield key, schema_key, source
+
+    @staticmethod
+    def _get(q: queue.Queue[Any], cancel: threading.Event) -> Any:
+        """Next item of a queue or _STOP once the run is cancelled"""
+        while not cancel.is_set():
+            try:
+                return q.get(timeout=_POLL)
+            except queue.Empty:
+                continue
+        return _STOP
+
+    @staticmethod
+    def _put(q: queue.Queue[Any], item: Any, cancel: threading.Event) -> None:
+        """Put an item into a queue unless the run is cancelled"""
+        while not cancel.is_set():
+            try:
+                q.put(item, timeout=_POLL)
+                return
+            except queue.Full:
+                continue
+
+    @staticmethod
+    def _work(
+        target: Callable[..., None], cancel: threading.Event, *queues: Any
+    ) -> None:
+        """Run a stage on a worker thread and cancel the run if it fails
+
+        Failures of single items are passed on as IngestError; an exception
+        escaping the stage would otherwise leave the calling thread waiting for
+        items that never arrive.
+        """
+        try:
+            target(*queues, cancel)
+        except BaseException:
+            cancel.set()
+            raise
+
+    def _read(
+        self,
+        read_q: queue.Queue[Any],
+        validate_q: queue.Queue[Any],
+        store_q: queue.Queue[Any],
+        cancel: threading.Event,
+    ) -> None:
+        while (item := self._get(read_q, cancel)) is not _STOP:
+            key, schema_key, schema, source = item
+            try:
+                if self._reader is None:
+                    data = read_data_file(source, schema)
+                else:
+                    data = self._reader(source)
+            except Exception as e:
+                self._put(store_q, IngestError(key, "read", e), cancel)
+                continue
+            self._put(validate_q, (key, schema_key, schema, data), cancel)
+
+    def _validate(
+        self,
+        validate_q: queue.Queue[Any],
+        store_q: queue.Queue[Any],
+        cancel: threading.Event,
+    ) -> None:
+        while (item := self._get(validate_q, cancel)) is not _STOP:
+            key, schema_key, schema, data = item
+            try:
+                info = self._registry.prepare_data(data, schema)
+            except Exception as e:
+                self._put(store_q, IngestError(key, "validate", e), cancel)
+                continue
+            self._put(store_q, (key, schema_key, data, info), cancel)
+
+    def _store_next(
+        self,
+        store_q: queue.Queue[Any],
+        cancel: threading.Event,
+        result: IngestResult,
+        checkpoint: Any,
+    ) -> int:
+        """Store the next validated item or record its failure
+
+        Returns:
+            int: Number of finished items, i.e., 1
+
+        Raises:
+            RuntimeError: If the run was cancelled because a worker thread failed
+        """
+        item = self._get(store_q, cancel)
+        if item is _STOP:
+            raise RuntimeError("Ingest pipeline stopped since a worker thread failed")
+        if isinstance(item, IngestError):
+            self._fail(result, item)
+            return 1
+        key, schema_key, data, info = item
+        try:
+            self._registry.add_prepared_data(key, schema_key, data, info)
+        except Exception as e:
+            self._fail(result, IngestError(key, "store", e))
+            return 1
+        result.stored.append(key)
+        if checkpoint is not None:
+            checkpoint.write(json.dumps({"key": key}) + "\n")
+            checkpoint.flush()
+        return 1
+
+    def _fail(self, result: IngestResult, error: IngestError) -> None:
+        result.failed.append(error)
+        if self._on_error is not None:
+            self._on_error(error)
@@ -0,0 +1,501 @@
+from __future__ import annotations
+
+import os
+import queue
+import socketserver
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..exceptions import DataValidationError
+from ..utils import data_fingerprint, schema_fingerprint
+from ..validator.validation_report import ValidationReport
+from .cache import ValidationCache
+from .wire import CONTENT_TYPE, decode_frame, decode_message, encode_message
+
+if TYPE_CHECKING:
+    from ..protocols.protocols import ValidatorProtocol
+    from .inmemory import InMemoryRegistry
+
+__all__ = ["RegistryServer", "ValidationPool"]
+
+# hosts a tcp server may bind to; the server has no authentication
+_LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+# operations executed as registry calls with the arguments of the request
+_REGISTRY_OPS = (
+    "add_schema",
+    "get_schema",
+    "delete_schema",
+    "replace_schema",
+    "check_schema_replacement",
+    "apply_schema_replacement",
+    "has_data",
+    "get_data",
+    "query_data",
+    "delete_data",
+    "get_data_info",
+    "list_data",
+    "list_data_in_window",
+    "list_data_starts",
+)
+# operations reading or writing a snapshot in the snapshot directory
+_SNAPSHOT_OPS = ("snapshot", "restore")
+_PROPERTIES = ("schemas", "data")
+# operations carrying data that is validated on the worker processes
+_DATA_OPS = ("add_data", "replace_data", "validate")
+# exceptions reported to the client by type, others are reported as RuntimeError
+_EXCEPTIONS = (
+    DataValidationError,
+    KeyError,
+    ValueError,
+    TypeError,
+    FileNotFoundError,
+    FileExistsError,
+    ImportError,
+)
+_STOP = object()
+
+# validator of the worker process, set by _init_worker
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(validator: ValidatorProtocol) -> None:
+    _worker["validator"] = validator
+
+
+def _validate_batch(
+    schemas: dict[str, dict[str, Any]], items: list[tuple[str, bytes]]
+) -> list[tuple[ValidationReport, str | None] | Exception]:
+    """Validate a batch of frames in a worker
+
+    Errors are returned per item, so that one broken item does not fail the
+    other items of the batch.
+
+    Args:
+        schemas (dict[str, dict[str, Any]]): Schemas of the batch by fingerprint
+        items (list[tuple[str, bytes]]): Schema fingerprint and Arrow IPC payload
+            of each frame
+
+    Returns:
+        list[tuple[ValidationReport, str | None] | Exception]: Report and
+            fingerprint of each frame, or the exception raised for it
+    """
+    results: list[tuple[ValidationReport, str | None] | Exception] = []
+    for key_schema, payload in items:
+        try:
+            data = decode_frame(payload)
+            report = _worker["validator"].validate(data, schemas[key_schema])
+            results.append((report, data_fingerprint(data)))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class ValidationPool:
+    """Validates dataframes on worker processes in micro-batches
+
+    Requests arriving within `batch_window` seconds of each other are sent to a
+    worker as one task, up to `max_batch` frames. Batching amortizes the task
+    overhead of the process pool over many small frames; each schema is sent once
+    per batch. Frames are passed to the workers in the Arrow IPC format in which
+    they arrived at the server, so they are not serialized again.
+    """
+
+    def __init__(
+        self,
+        validator: ValidatorProtocol,
+        workers: int | None = None,
+        max_batch: int = 32,
+        batch_window: float = 0.002,
+    ) -> None:
+        """Start the worker processes
+
+        Args:
+            validator (ValidatorProtocol): Validator copied to each worker
+            workers (int | None, optional): Number of processes. Defaults to None
+                which uses the number of CPUs.
+            max_batch (int, optional): Maximum number of frames per task.
+                Defaults to 32.
+            batch_window (float, optional): Seconds to wait for further requests
+                after the first request of a batch. 0 only batches requests
+                that are already waiting. Defaults to 0.002.
+
+        Raises:
+            ValueError: If workers or max_batch is below 1
+        """
+        workers = workers or os.cpu_count() or 1
+        if min(workers, max_batch) < 1:
+            raise ValueError("workers and max_batch must be at least 1")
+        self._max_batch = max_batch
+        self._batch_window = batch_window
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(validator,)
+        )
+        # start the workers before any request thread exists
+        list(self._pool.map(int, range(workers)))
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._batcher = threading.Thread(target=self._run, daemon=True)
+        self._batcher.start()
+
+    def validate(
+        self, payload: bytes, schema: dict[str, Any]
+    ) -> Future[tuple[ValidationReport, str | None]]:
+        """Submit a frame for validation
+
+        Args:
+            payload (bytes): Frame in the Arrow IPC stream format
+            schema (dict[str, Any]): Schema to validate against
+
+        Returns:
+            Future[tuple[ValidationReport, str | None]]: Report and fingerprint
+                of the frame
+        """
+        future: Future[tuple[ValidationReport, str | None]] = Future()
+        self._queue.put((payload, schema, future))
+        return future
+
+    def close(self) -> None:
+        """Validate the submitted frames and stop the workers"""
+        self._queue.put(_STOP)
+        self._batcher.join()
+        self._pool.shutdown()
+
+    def _run(self) -> None:
+        stopped = False
+        while not stopped:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self._batch_window
+            while len(batch) < self._max_batch:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopped = True
+                    break
+                batch.append(item)
+            self._submit(batch)
+
+    def _submit(self, batch: list[tuple[bytes, dict[str, Any], Future[Any]]]) -> None:
+        schemas: dict[str, dict[str, Any]] = {}
+        items = []
+        for payload, schema, _ in batch:
+            key_schema = schema_fingerprint(schema)
+            schemas.setdefault(key_schema, dict(schema))
+            items.append((key_schema, payload))
+        futures = [future for _, _, future in batch]
+
+        def done(task: Future[Any]) -> None:
+            try:
+                results = task.result()
+            except Exception as e:  # e.g., a worker died
+                results = [e] * len(futures)
+            for future, result in zip(futures, results, strict=True):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+        self._pool.submit(_validate_batch, schemas, items).add_done_callback(done)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: Any
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        rejected = self._reject()
+        if rejected is not None:
+            status, response = rejected
+        else:
+            status, response = self.server.registry_server._handle(
+                self.path.strip("/"), body
+            )
+        self.send_response(status)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def _reject(self) -> tuple[int, bytes] | None:
+        """Error response for requests that do not come from a RegistryClient
+
+        Browsers send form posts with another content type, and requests of a
+        page whose domain resolves to localhost carry that domain as Host
+        header, so that web pages cannot use the server.
+        """
+        if self.headers.get("Content-Type") != CONTENT_TYPE:
+            error = ValueError(f"The content type must be {CONTENT_TYPE}")
+            return 415, encode_message({"error": RegistryServer._error(error)})
+        host = self.headers.get("Host", "")
+        # strip the port of "host:port" and the brackets of "[::1]:port"
+        name = host.rsplit(":", 1)[0] if host.count(":") == 1 else host
+        if name.startswith("["):
+            name = name[1 : name.find("]")]
+        if name not in _LOCAL_HOSTS:
+            error = ValueError(f"The host must be one of {_LOCAL_HOSTS}")
+            return 403, encode_message({"error": RegistryServer._error(error)})
+        return None
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class RegistryServer:
+    """Serve a registry to other processes over a Unix socket or localhost HTTP
+
+    Requests are HTTP POST requests to /<operation>, e.g., /add_data, whose body
+    is a message of the wire format, see `sweet_validation.registry.wire`:
+    dataframes travel in the Arrow IPC format. The operations are the methods of
+    `InMemoryRegistry` and `validate`, which validates data against a registered
+    schema without storing it. Use `RegistryClient` to connect to the server.
+
+    Requests are received on threads, but the registry is only used on the
+    thread running `serve_forever`, since the SchemaManager's SQLite connection
+    must not be shared between threads. Dataframes sent with add_data,
+    replace_data and validate are validated on a `ValidationPool` of worker
+    processes before the registry call. The registry then stores the data with
+    the report of the worker, see `InMemoryRegistry.prepare_data`, without
+    validating it again. Revalidation of stored data by replace_schema happens
+    in the registry.
+
+    The server has no authentication. A Unix socket is protected by its file
+    permissions; TCP servers only bind to localhost and only accept requests
+    with the content type of the wire format and a localhost Host header.
+    Snapshots are only written to and restored from the snapshot directory.
+
+    Example:
+
+        .. code-block:: python
+        registry = InMemoryRegistry(DefaultValidator(), SchemaManager("registry.db"))
+        server = RegistryServer(registry, "/tmp/registry.sock", workers=4)
+        server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        registry: InMemoryRegistry,
+        address: str | Path | tuple[str, int] = ("127.0.0.1", 0),
+        workers: int | None = None,
+        max_batch: int = 32,
+        batch_window: float = 0.002,
+        validation_cache: ValidationCache | None = None,
+        snapshot_dir: str | Path | None = None,
+    ) -> None:
+        """Initialize the server
+
+        Args:
+            registry (InMemoryRegistry): Registry to serve
+            address (str | Path | tuple[str, int], optional): Path of a Unix
+                socket or (host, port) of a localhost TCP server. Port 0 picks a
+                free port. Defaults to ("127.0.0.1", 0).
+            workers (int | None, optional): Number of validation processes.
+                Defaults to None which uses the number of CPUs.
+            max_batch (int, optional): Maximum number of frames validated by a
+                worker at once. Defaults to 32.
+            batch_window (float, optional): Seconds to wait for further requests
+                to batch with. Defaults to 0.002.
+            validation_cache (ValidationCache | None, optional): Cache of the
+                reports of the workers. Frames that were validated against the
+                same schema before are not sent to the workers again. Defaults to
+                None which validates every frame.
+            snapshot_dir (str | Path | None, optional): Directory holding the
+                snapshots written and restored by the snapshot and restore
+                operations, whose paths are relative to it. Defaults to None
+                which disables both operations.
+
+        Raises:
+            ValueError: If a TCP address is not a localhost address
+        """
+        if isinstance(address, tuple) and address[0] not in _LOCAL_HOSTS:
+            raise ValueError(f"The registry server only binds to {_LOCAL_HOSTS}")
+        self._registry = registry
+        self._address = address if isinstance(address, tuple) else Path(address)
+        self._workers = workers
+        self._max_batch = max_batch
+        self._batch_window = batch_window
+        self._validation_cache = validation_cache
+        self._snapshot_dir = Path(snapshot_dir) if snapshot_dir is not None else None
+        self._calls: queue.Queue[Any] = queue.Queue()
+        self._server: socketserver.BaseServer | None = None
+        self._pool: ValidationPool | None = None
+        self._ready = threading.Event()
+
+    @property
+    def address(self) -> str | tuple[str, int]:
+        """Bound address: path of the Unix socket or (host, port)
+
+        Waits until the server is listening.
+        """
+        self._ready.wait()
+        assert self._server is not None
+        address = self._server.server_address
+        if isinstance(address, tuple):
+            return address[0], address[1]
+        return str(address)
+
+    def serve_forever(self) -> None:
+        """Serve requests until `shutdown` is called
+
+        Must be called on the thread that created the registry.
+        """
+        self._pool = ValidationPool(
+            self._registry._validator,
+            self._workers,
+            self._max_batch,
+            self._batch_window,
+        )
+        if isinstance(self._address, Path):
+            if self._address.is_socket():
+                self._address.unlink()  # stale socket of a previous server
+            self._server = _UnixHTTPServer(str(self._address), _Handler)
+        else:
+            self._server = ThreadingHTTPServer(self._address, _Handler)
+        self._server.registry_server = self  # type: ignore[attr-defined]
+        listener = threading.Thread(target=self._server.serve_forever, daemon=True)
+        listener.start()
+        self._ready.set()
+        try:
+            while (call := self._calls.get()) is not _STOP:
+                function, args, future = call
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(function(*args))
+                    except BaseException as e:
+                        future.set_exception(e)
+        finally:
+            self._server.shutdown()
+            listener.join()
+            self._server.server_close()
+            self._pool.close()
+            if isinstance(self._address, Path):
+                self._address.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """Stop `serve_forever` after the pending registry calls; thread safe"""
+        self._calls.put(_STOP)
+
+    def _call(self, function: Any, *args: Any) -> Any:
+        """Run a function on the registry thread and return its result"""
+        future: Future[Any] = Future()
+        self._calls.put((function, args, future))
+        return future.result()
+
+    def _handle(self, operation: str, body: bytes) -> tuple[int, bytes]:
+        """Execute a request
+
+        Returns:
+            tuple[int, bytes]: Http status and response message
+        """
+        try:
+            header, data, payload = decode_message(body)
+            result = self._execute(operation, header.get("args", {}), data, payload)
+            return 200, encode_message({}, result)
+        except _EXCEPTIONS as e:
+            return 400, encode_message({"error": self._error(e)})
+        except Exception as e:
+            return 500, encode_message({"error": self._error(e)})
+
+    @staticmethod
+    def _error(e: Exception) -> dict[str, Any]:
+        error: dict[str, Any] = {"type": type(e).__name__}
+        if not isinstance(e, _EXCEPTIONS):
+            error["type"] = "RuntimeError"
+        error["message"] = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+        if isinstance(e, DataValidationError):
+            error["message"] = "Data does not conform to schema"
+            if e.report is not None:
+                error["report"] = e.report.to_dict()
+        return error
+
+    def _execute(
+        self, operation: str, args: dict[str, Any], data: Any, payload: Any
+    ) -> Any:
+        registry = self._registry
+        if operation in _PROPERTIES:
+            return self._call(getattr, registry, operation)
+        if operation in _REGISTRY_OPS:
+            return self._call(lambda: getattr(registry, operation)(**args))
+        if operation in _SNAPSHOT_OPS:
+            args = {**args, "path": self._snapshot_path(args["path"])}
+            return self._call(lambda: getattr(registry, operation)(**args))
+        if operation == "restore_data":  # data validated by another registry
+            return self._call(registry.restore_data, args["key"], args["info"], data)
+        if operation not in _DATA_OPS:
+            raise ValueError(f"Unknown operation '{operation}'")
+        if operation == "replace_data":
+            info = self._call(registry.get_data_info, args["key"])
+            args = {**args, "schema_key": info["id_schema"]}
+        schema = self._call(registry.get_schema, args["schema_key"])
+        report = None
+        if payload is not None:
+            report = self._validate(payload, data, schema)
+        if operation == "validate":
+            if report is None:  # data that is not a frame, e.g., a file path
+                report = self._call(registry._get_validation_report, data, schema)
+            return report.to_dict()
+        return self._call(self._store, operation, args, data, schema, report)
+
+    def _store(
+        self,
+        operation: str,
+        args: dict[str, Any],
+        data: Any,
+        schema: Any,
+        report: ValidationReport | None,
+    ) -> None:
+        """Store data with the report of its validation; runs on the registry thread"""
+        registry = self._registry
+        current = registry.get_schema(args["schema_key"])
+        if current is not schema:  # replaced since the validation
+            report = None
+        info = registry.prepare_data(data, current, report=report)
+        if operation == "add_data":
+            registry.add_prepared_data(args["key"], args["schema_key"], data, info)
+        else:
+            registry.replace_prepared_data(args["key"], data, info)
+
+    def _validate(
+        self, payload: memoryview, data: Any, schema: dict[str, Any]
+    ) -> ValidationReport:
+        """Validate a frame on the pool unless its report is cached"""
+        assert self._pool is not None
+        cache = self._validation_cache
+        if cache is None:
+            report, _ = self._pool.validate(payload.tobytes(), schema).result()
+            return report
+        key_data = data_fingerprint(data)
+        key_schema = schema_fingerprint(schema)
+        cached = cache.get(key_data, key_schema) if key_data is not None else None
+        if cached is not None:
+            return cached
+        report, key_data = self._pool.validate(payload.tobytes(), schema).result()
+        if key_data is not None:
+            cache.put(key_data, key_schema, report)
+        return report
+
+    def _snapshot_path(self, path: str) -> Path:
+        """Resolve the path of a snapshot within the snapshot directory
+
+        Raises:
+            ValueError: If snapshots are disabled or the path is outside of the
+                snapshot directory
+        """
+        if self._snapshot_dir is None:
+            raise ValueError("Snapshots are disabled, set the snapshot_dir")
+        root = self._snapshot_dir.resolve()
+        resolved = (root / path).resolve()
+        if root not in resolved.parents:
+            raise ValueError(f"The snapshot path '{path}' is outside of {root}")
+        return resolved
@@ -0,0 +1,453 @@
+from __future__ import annotations
+
+import hashlib
+from bisect import bisect
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from ..protocols.protocols import ShardProtocol
+from ..storage.query import Filter
+
+__all__ = ["HashRing", "ShardedRegistry"]
+
+
+def _hash(value: str) -> int:
+    """Stable 64 bit hash of a string, independent of PYTHONHASHSEED"""
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class HashRing:
+    """Consistent hash ring that maps keys to shard names
+
+    Each shard is placed on the ring at `virtual_nodes` positions derived from
+    its name. A key belongs to the shard at the first position after the hash of
+    the key. Adding or removing a shard therefore only moves the keys between
+    the shard and its neighbours, about 1/N of all keys.
+    """
+
+    def __init__(self, names: Sequence[str], virtual_nodes: int = 64) -> None:
+        """Place the shards on the ring
+
+        Args:
+            names (Sequence[str]): Names of the shards
+            virtual_nodes (int, optional): Positions per shard. More positions
+                spread the keys more evenly. Defaults to 64.
+
+        Raises:
+            ValueError: If no shard is given
+        """
+        if not names:
+            raise ValueError("A hash ring needs at least one shard")
+        points = sorted(
+            (_hash(f"{name}#{i}"), name) for name in names for i in range(virtual_nodes)
+        )
+        self.names = list(names)
+        self._hashes = [point for point, _ in points]
+        self._names = [name for _, name in points]
+
+    def __getitem__(self, key: str) -> str:
+        """Name of the shard of a key"""
+        position = bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._names[position]
+
+
+class ShardedRegistry:
+    """Registry that distributes data over several registries by key
+
+    Each shard is a registry with its own SchemaManager and storage, e.g., a
+    SQLite file and a ParquetStorage directory per shard, so that the write
+    throughput and number of data items are not bound by a single database.
+    Shards implement the ShardProtocol: an InMemoryRegistry in this process or
+    a RegistryClient of a RegistryServer in another process.
+    Data keys are routed to shards by a consistent hash ring. Schemas are
+    replicated to all shards, so that each shard validates its data on its own;
+    replacements are checked on all shards before any shard applies them.
+    Listings fan out to all shards.
+
+    Shards can be added or removed while the registry stays available: `reshard`
+    switches to a new ring and `migrate` moves the affected data in batches
+    without validating it again. Until the migration is done, keys are looked
+    up on their new shard first and then on their old shard.
+
+    Example:
+
+        .. code-block:: python
+        shards = {
+            f"shard_{i}": InMemoryRegistry(
+                validator=DefaultValidator(),
+                schema_manager=SchemaManager(f"shard_{i}.db"),
+                storage=ParquetStorage(f"shard_{i}"),
+            )
+            for i in range(4)
+        }
+        registry = ShardedRegistry(shards)
+        registry.add_schema("generation", "generation.yaml")
+        registry.add_data("generation_2024", "generation", data)
+    """
+
+    def __init__(
+        self, shards: Mapping[str, ShardProtocol], virtual_nodes: int = 64
+    ) -> None:
+        """Initialize the registry with named shards
+
+        Args:
+            shards (Mapping[str, ShardProtocol]): Registries by shard name.
+                The names determine the placement on the hash ring and must stay
+                the same across restarts.
+            virtual_nodes (int, optional): Positions of each shard on the hash
+                ring. Defaults to 64.
+
+        Raises:
+            ValueError: If no shard is given
+        """
+        self._virtual_nodes = virtual_nodes
+        self._shards = dict(shards)
+        self._ring = HashRing(list(self._shards), virtual_nodes)
+        # ring and shards before a resharding until its migration is done
+        self._old_ring: HashRing | None = None
+        self._old_shards: dict[str, ShardProtocol] = {}
+        self._pending: list[str] = []
+
+    @property
+    def shards(self) -> dict[str, ShardProtocol]:
+        """Registries by shard name"""
+        return dict(self._shards)
+
+    def shard_for(self, key: str) -> str:
+        """Name of the shard a data key is routed to
+
+        Args:
+            key (str): Key of data
+
+        Returns:
+            str: Name of the shard
+        """
+        return self._ring[key]
+
+    def _all_shards(self) -> list[ShardProtocol]:
+        """Current shards and, during a migration, the shards to be removed"""
+        shards = list(self._shards.values())
+        shards += [s for n, s in self._old_shards.items() if n not in self._shards]
+        return shards
+
+    def _locate(self, key: str) -> ShardProtocol:
+        """Registry holding a data key
+
+        Raises:
+            KeyError: If the data does not exist
+        """
+        shard = self._shards[self._ring[key]]
+        if shard.has_data(key):
+            return shard
+        if self._old_ring is not None:
+            old = self._old_shards[self._old_ring[key]]
+            if old.has_data(key):
+                return old
+        raise KeyError(f"Data key '{key}' not found")
+
+    # -------- schema related methods
+    def add_schema(self, key: str, schema: Any) -> None:
+        """Add a schema to all shards
+
+        Args:
+            key (str): Key of schema
+            schema (Any): Schema to be added
+
+        Raises:
+            KeyError: If the schema already exists
+        """
+        added: list[ShardProtocol] = []
+        try:
+            for shard in self._all_shards():
+                shard.add_schema(key, schema)
+                added.append(shard)
+        except Exception:
+            for shard in added:
+                shard.delete_schema(key)
+            raise
+
+    def get_schema(self, key: str) -> Any:
+        """Given the key of schema, return the schema
+
+        Args:
+            key (str): Key of schema
+
+        Returns:
+            Any: Schema
+
+        Raises:
+            KeyError: If the schema does not exist
+        """
+        return next(iter(self._shards.values())).get_schema(key)
+
+    def delete_schema(self, key: str) -> None:
+        """Delete a schema from all shards
+
+        Args:
+            key (str): Key of schema to delete
+
+        Raises:
+            KeyError: If the schema does not exist
+            ValueError: If data associated with the schema still exist
+        """
+        shards = self._all_shards()
+        for shard in shards:
+            if any(schema_key == key for _, schema_key in shard.list_data()):
+                raise ValueError(
+                    f"Data associated with schema key '{key}' still exists"
+                )
+        for shard in shards:
+            shard.delete_schema(key)
+
+    def replace_schema(self, key: str, schema: Any) -> None:
+        """Replace a schema on all shards
+
+        The data of all shards is checked against the new schema before the
+        schema is replaced on any shard, see `InMemoryRegistry.replace_schema`.
+
+        Args:
+            key (str): Key of schema
+            schema (Any): New schema
+
+        Raises:
+            KeyError: If the schema does not exist
+            DataValidationError: If the data does not conform to the schema
+        """
+        shards = self._all_shards()
+        checked = [shard.check_schema_replacement(key, schema) for shard in shards]
+        for shard, ranges in zip(shards, checked, strict=True):
+            shard.apply_schema_replacement(key, schema, ranges)
+
+    @property
+    def schemas(self) -> list[str]:
+        """List all schemas
+
+        Returns:
+            list[str]: List of schema keys
+        """
+        return next(iter(self._shards.values())).schemas
+
+    # -------- data related methods
+    def add_data(self, key: str, schema_key: str, data: Any) -> None:
+        """Add data to its shard. The data is validated given the schema.
+
+        Args:
+            key (str): Key of data
+            schema_key (str): Key of schema
+            data (Any): Data to be added
+
+        Raises:
+            KeyError: If the data already exists or the schema does not exist
+            DataValidationError: If the data does not conform to the schema
+        """
+        if self._old_ring is not None:
+            old = self._old_shards[self._old_ring[key]]
+            if old.has_data(key):
+                raise KeyError(f"Data {key} already exists")
+        self._shards[self._ring[key]].add_data(key, schema_key, data)
+
+    def get_data(self, key: str, start: Any = None, end: Any = None) -> Any:
+        """Given the key of data, return the data
+
+        Args:
+            key (str): Key of data
+            start (str | datetime | None, optional): First point in time, see
+                `InMemoryRegistry.get_data`. Defaults to None.
+            end (str | datetime | None, optional): Point in time after the
+                window. Defaults to None.
+
+        Returns:
+            Any: Data
+
+        Raises:
+            KeyError: If the data does not exist
+        """
+        return self._locate(key).get_data(key, start=start, end=end)
+
+    def query_data(
+        self,
+        key: str,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[Filter] | None = None,
+    ) -> Any:
+        """Given the key of data, return the matching rows and columns
+
+        See `InMemoryRegistry.query_data`.
+
+        Args:
+            key (str): Key of data
+            columns (Sequence[str] | None, optional): Columns to return. Defaults
+                to None which returns all columns.
+            filters (Sequence[Filter] | None, optional): Predicates combined with
+                a logical and. Defaults to None which returns all rows.
+
+        Returns:
+            Any: Matching rows and columns of the data
+
+        Raises:
+            KeyError: If the data or a column does not exist
+        """
+        return self._locate(key).query_data(key, columns=columns, filters=filters)
+
+    def replace_data(self, key: str, data: Any) -> None:
+        """Replace data on its shard
+
+        Args:
+            key (str): Key of data
+            data (Any): New data
+
+        Raises:
+            KeyError: If the data does not exist
+            DataValidationError: If the data does not conform to the schema
+        """
+        self._locate(key).replace_data(key, data)
+
+    def delete_data(self, key: str) -> None:
+        """Given the key of data delete it
+
+        Args:
+            key (str): Key of data to delete
+
+        Raises:
+            KeyError: If the data does not exist
+        """
+        self._locate(key).delete_data(key)
+
+    def get_data_info(self, key: str) -> dict[str, Any]:
+        """Given the key of data, return its content description
+
+        Args:
+            key (str): Key of data
+
+        Returns:
+            dict[str, Any]: Content description, see
+                `InMemoryRegistry.get_data_info`
+
+        Raises:
+            KeyError: If the data does not exist
+        """
+        return self._locate(key).get_data_info(key)
+
+    def list_data(self) -> list[tuple[str, str]]:
+        """List all data of all shards
+
+        Returns:
+            list[tuple[str, str]]: List of data tuples (id, id_schema)
+        """
+        return [item for shard in self._all_shards() for item in shard.list_data()]
+
+    def list_data_in_window(
+        self, start: Any = None, end: Any = None, schema_key: str | None = None
+    ) -> list[str]:
+        """List the data of all shards with a point in time in [start, end)
+
+        Args:
+            start (str | datetime | None, optional): First point in time.
+                Defaults to None.
+            end (str | datetime | None, optional): Point in time after the
+                window. Defaults to None.
+            schema_key (str | None, optional): Only list data of this schema.
+                Defaults to None.
+
+        Returns:
+            list[str]: Data keys sorted by their first point in time
+        """
+        matches = []
+        for shard in self._all_shards():
+            for key, time_min in shard.list_data_starts(start, end, schema_key):
+                matches.append((time_min, key))
+        return [key for _, key in sorted(matches)]
+
+    @property
+    def data(self) -> list[str]:
+        """List all data keys of all shards
+
+        Returns:
+            list[str]: List of data keys
+        """
+        return [key for shard in self._all_shards() for key in shard.data]
+
+    # -------- resharding
+    @property
+    def resharding(self) -> bool:
+        """True while data is migrated after `reshard`"""
+        return self._old_ring is not None
+
+    def reshard(self, shards: Mapping[str, ShardProtocol]) -> int:
+        """Switch to a new set of shards
+
+        Shards are identified by name: shards that keep their name keep their
+        data except for the keys that now belong to a new shard. Schemas are
+        replicated to the new shards. The data is moved by `migrate`, in the
+        meantime all operations remain available.
+
+        Example:
+
+            .. code-block:: python
+            registry.reshard({**registry.shards, "shard_4": new_registry})
+            while registry.migrate(max_items=1000):
+                pass  # serve requests in between
+
+        Args:
+            shards (Mapping[str, ShardProtocol]): Registries by shard name
+
+        Returns:
+            int: Number of data items to migrate
+
+        Raises:
+            ValueError: If a resharding is still in progress or no shard is given
+        """
+        if self.resharding:
+            raise ValueError("Finish the migration of the previous resharding")
+        ring = HashRing(list(shards), self._virtual_nodes)
+        source = next(iter(self._shards.values()))
+        for shard in shards.values():
+            present = set(shard.schemas)
+            for key in source.schemas:
+                if key not in present:
+                    shard.add_schema(key, dict(source.get_schema(key)))
+        self._old_ring, self._old_shards = self._ring, self._shards
+        self._ring, self._shards = ring, dict(shards)
+        self._pending = [
+            key
+            for name, shard in self._old_shards.items()
+            for key in shard.data
+            if ring[key] != name or shards.get(name) is not shard
+        ]
+        if not self._pending:
+            self._finish_resharding()
+        return len(self._pending)
+
+    def migrate(self, max_items: int | None = None) -> int:
+        """Move data to the shards of the current ring
+
+        Data is copied with its recorded content description and then deleted
+        from its old shard; it is not validated again since all shards share
+        the schemas.
+
+        Args:
+            max_items (int | None, optional): Number of data items to move.
+                Defaults to None which moves all.
+
+        Returns:
+            int: Number of data items still to migrate
+        """
+        if self._old_ring is None:
+            return 0
+        n_items = len(self._pending) if max_items is None else max_items
+        for _ in range(min(n_items, len(self._pending))):
+            key = self._pending.pop()
+            old = self._old_shards[self._old_ring[key]]
+            if not old.has_data(key):
+                continue  # deleted in the meantime
+            info = old.get_data_info(key)
+            self._shards[self._ring[key]].restore_data(key, info, old.get_data(key))
+            old.delete_data(key)
+        if not self._pending:
+            self._finish_resharding()
+        return len(self._pending)
+
+    def _finish_resharding(self) -> None:
+        self._old_ring = None
+        self._old_shards = {}
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+if TYPE_CHECKING:
+    from .inmemory import InMemoryRegistry
+
+__all__ = ["read_snapshot", "write_snapshot"]
+
+SNAPSHOT_VERSION = 1
+MANIFEST = "manifest.json"
+# fields of the data info stored as iso strings
+_DATETIME_INFO = ("time_min", "time_max", "ingested_at")
+
+
+def _feather() -> Any:
+    """pyarrow.feather or None if pyarrow is not installed"""
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return None
+    return feather
+
+
+def _write_item(directory: Path, key: str, data: Any) -> tuple[str, str]:
+    """Write a data item and return its file name and format
+
+    Dataframes are written in the Arrow IPC (feather) format if pyarrow is
+    installed, other data is pickled. Dataframes that Arrow cannot represent,
+    e.g., with object columns of mixed types, are pickled as well.
+    """
+    import pandas as pd
+
+    name = quote(key, safe="")
+    feather = _feather()
+    if feather is not None and isinstance(data, pd.DataFrame):
+        import pyarrow as pa
+
+        file = f"{name}.arrow"
+        try:
+            feather.write_feather(data, directory / file, compression="lz4")
+            return file, "arrow"
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            (directory / file).unlink(missing_ok=True)
+    file = f"{name}.pickle"
+    with open(directory / file, "wb") as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return file, "pickle"
+
+
+def _read_item(directory: Path, file: str, fmt: str) -> Any:
+    if fmt == "arrow":
+        feather = _feather()
+        if feather is None:
+            raise ImportError(
+                "Restoring dataframes requires pyarrow. Install it with "
+                "`pip install sweet_validation[arrow]`."
+            )
+        return feather.read_feather(directory / file)
+    with open(directory / file, "rb") as f:
+        return pickle.load(f)
+
+
+def write_snapshot(
+    registry: InMemoryRegistry, path: str | Path, max_workers: int | None = None
+) -> None:
+    """Write the schemas, the data metadata and all data of a registry
+
+    The snapshot is a directory with a json manifest holding the schemas and
+    the content description of each data item, and one file per data item.
+    Data items are written in parallel. The snapshot is first written to a
+    temporary directory, which then replaces an existing snapshot at path. If
+    writing fails, the temporary directory is removed and an existing snapshot
+    is kept.
+
+    Args:
+        registry (InMemoryRegistry): Registry
+        path (str | Path): Directory of the snapshot
+        max_workers (int | None, optional): Number of threads writing data.
+            Defaults to None which uses the default of ThreadPoolExecutor.
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    (tmp / "data").mkdir(parents=True)
+
+    schema_manager = registry._schema_manager
+    schemas = {key: dict(registry.get_schema(key)) for key in registry.schemas}
+    infos = schema_manager.list_data_info()
+    for info in infos:
+        for field in _DATETIME_INFO:
+            if info.get(field) is not None:
+                info[field] = info[field].isoformat()
+
+    store = registry._data_store
+
+    def write(info: dict[str, Any]) -> None:
+        data = store.load(info["id"])
+        info["file"], info["format"] = _write_item(tmp / "data", info["id"], data)
+
+    try:
+        # only the data store is used on the worker threads; the metadata was
+        # fetched above as an in-memory SchemaManager is bound to this thread
+        with ThreadPoolExecutor(max_workers) as executor:
+            list(executor.map(write, infos))
+        manifest = {"version": SNAPSHOT_VERSION, "schemas": schemas, "data": infos}
+        with open(tmp / MANIFEST, "w") as f:
+            json.dump(manifest, f)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    if path.exists():
+        shutil.rmtree(path)
+    os.replace(tmp, path)
+
+
+def read_snapshot(
+    registry: InMemoryRegistry, path: str | Path, max_workers: int | None = None
+) -> None:
+    """Restore the schemas and data of a snapshot into a registry
+
+    The data is not validated again; the content hashes and descriptions of the
+    snapshot are stored as they are. Data files are read in parallel.
+
+    Args:
+        registry (InMemoryRegistry): Registry
+        path (str | Path): Directory of the snapshot
+        max_workers (int | None, optional): Number of threads reading data.
+            Defaults to None which uses the default of ThreadPoolExecutor.
+
+    Raises:
+        FileNotFoundError: If there is no snapshot at path
+        ValueError: If the snapshot version is not supported
+        KeyError: If a schema or data key of the snapshot already exists in
+            the registry
+    """
+    path = Path(path)
+    with open(path / MANIFEST) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {manifest.get('version')}")
+    existing = set(registry.schemas).intersection(manifest["schemas"])
+    existing |= set(registry.data).intersection(i["id"] for i in manifest["data"])
+    if existing:
+        raise KeyError(f"Keys {sorted(existing)} already exist in the registry")
+
+    for key, schema in manifest["schemas"].items():
+        registry.add_schema(key, schema)
+
+    def read(info: dict[str, Any]) -> Any:
+        return _read_item(path / "data", info["file"], info["format"])
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        # results are stored on this thread as they arrive, in manifest order
+        for info, data in zip(
+            manifest["data"], executor.map(read, manifest["data"]), strict=True
+        ):
+            for field in _DATETIME_INFO:
+                value = info.get(field)
+                info[field] = datetime.fromisoformat(value) if value else None
+            registry.restore_data(info["id"], info, data)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from ..metadata import time_field
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = ["TimeIndex", "time_range", "to_timestamp"]
+
+
+def to_timestamp(value: Any) -> datetime:
+    """Convert a point in time to a naive datetime in UTC
+
+    Timezone aware values are converted to UTC; naive values are assumed to be
+    in UTC already, as stored by SQLite.
+
+    Args:
+        value (str | datetime | pd.Timestamp | np.datetime64): Point in time
+
+    Returns:
+        datetime: Naive datetime in UTC
+    """
+    import pandas as pd
+
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp.to_pydatetime()
+
+
+def _utc_values(column: Any) -> np.ndarray[Any, Any]:
+    """Values of a time column as naive UTC datetime64[ns] array"""
+    import pandas as pd
+
+    values = pd.to_datetime(column, errors="coerce")
+    if getattr(values.dtype, "tz", None) is not None:
+        values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+    return values.to_numpy(dtype="datetime64[ns]")  # type: ignore[no-any-return]
+
+
+def time_range(
+    data: Any, schema: dict[str, Any]
+) -> tuple[datetime | None, datetime | None]:
+    """First and last point in time of data with a time field
+
+    Args:
+        data (Any): Data item
+        schema (dict[str, Any]): Schema of the data
+
+    Returns:
+        tuple[datetime | None, datetime | None]: Minimum and maximum of the time
+            field as naive UTC datetimes, or None if the schema has no time
+            field, the data is not a dataframe or all times are missing
+    """
+    field = time_field(schema)
+    columns = getattr(data, "columns", None)
+    if field is None or columns is None or field not in columns:
+        return None, None
+    import numpy as np
+
+    values = _utc_values(data[field])
+    values = values[~np.isnat(values)]
+    if not len(values):
+        return None, None
+    return to_timestamp(values.min()), to_timestamp(values.max())
+
+
+class TimeIndex:
+    """Sorted index of the time field of a dataframe
+
+    Rows of a time window are found by binary search on the sorted times. If
+    the data is already sorted by time, a window is returned as slice without
+    copying the index.
+
+    Attributes:
+        times (np.ndarray): Sorted times as naive UTC datetime64[ns]
+        order (np.ndarray | None): Row positions in time order or None if the
+            data is sorted
+    """
+
+    __slots__ = ("times", "order")
+
+    def __init__(self, column: Any) -> None:
+        """Build the index
+
+        Args:
+            column (pd.Series): Time column of the data. Missing times are
+                sorted last and never match a window.
+        """
+        import numpy as np
+
+        times = _utc_values(column)
+        if len(times) < 2 or bool(np.all(times[1:] >= times[:-1])):
+            self.order = None
+            self.times = times
+        else:
+            # stable sort keeps rows with equal times in their original order
+            self.order = np.argsort(times, kind="stable")
+            self.times = times[self.order]
+
+    def positions(self, start: Any = None, end: Any = None) -> Any:
+        """Row positions with a time in [start, end)
+
+        Args:
+            start (Any, optional): First point in time. Defaults to None which
+                does not bound the window.
+            end (Any, optional): Point in time after the window. Defaults to None
+                which does not bound the window.
+
+        Returns:
+            slice | np.ndarray: Slice if the data is sorted, else the sorted row
+                positions
+        """
+        import numpy as np
+
+        # missing times are sorted last and excluded from unbounded windows
+        n_valid = len(self.times) - int(np.isnat(self.times).sum())
+        valid = self.times[:n_valid]
+        lo = 0 if start is None else self._search(valid, start)
+        hi = n_valid if end is None else self._search(valid, end)
+        hi = max(lo, hi)
+        if self.order is None:
+            return slice(lo, hi)
+        return np.sort(self.order[lo:hi])
+
+    @staticmethod
+    def _search(times: np.ndarray[Any, Any], value: Any) -> int:
+        import numpy as np
+
+        target = np.datetime64(to_timestamp(value), "ns")
+        return int(np.searchsorted(times, target, side="left"))
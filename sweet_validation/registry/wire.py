@@ -0,0 +1,158 @@
+"""Wire format of the registry server
+
+A message is a json header followed by an optional binary payload:
+
+    | header length (4 bytes, big endian) | json header | payload |
+
+Dataframes travel as payload in the Arrow IPC stream format, so that neither
+side converts values to text and the receiver reads the columns without copying
+them. All other values are part of the json header; datetimes, dates and times are
+tagged to survive the round trip.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from datetime import date, datetime, time
+from typing import Any
+
+import numpy as np
+
+__all__ = [
+    "CONTENT_TYPE",
+    "decode_frame",
+    "decode_message",
+    "encode_frame",
+    "encode_message",
+]
+
+CONTENT_TYPE = "application/vnd.sweet-registry"
+_LENGTH = struct.Struct(">I")
+_DATETIME_TAG = "$datetime"
+_DATE_TAG = "$date"
+_TIME_TAG = "$time"
+# decoders of the tagged values; datetime is a subclass of date
+_TAGS = {
+    _DATETIME_TAG: datetime.fromisoformat,
+    _DATE_TAG: date.fromisoformat,
+    _TIME_TAG: time.fromisoformat,
+}
+
+
+def _ipc() -> Any:
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError(
+            "The registry server requires pyarrow. Install it with "
+            "`pip install sweet_validation[arrow]`."
+        ) from None
+    return pa
+
+
+def encode_frame(data: Any) -> bytes:
+    """Serialize a dataframe to the Arrow IPC stream format
+
+    Args:
+        data (pd.DataFrame): Dataframe
+
+    Returns:
+        bytes: Arrow IPC stream including the pandas metadata, e.g., the index
+            and extension dtypes
+    """
+    pa = _ipc()
+    table = pa.Table.from_pandas(data)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()  # type: ignore[no-any-return]
+
+
+def decode_frame(payload: bytes | memoryview) -> Any:
+    """Deserialize a dataframe from the Arrow IPC stream format
+
+    Args:
+        payload (bytes | memoryview): Arrow IPC stream
+
+    Returns:
+        pd.DataFrame: Dataframe
+    """
+    pa = _ipc()
+    with pa.ipc.open_stream(pa.py_buffer(payload)) as reader:
+        return reader.read_all().to_pandas()
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE_TAG: value.isoformat()}
+    if isinstance(value, time):
+        return {_TIME_TAG: value.isoformat()}
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} cannot be sent")
+
+
+def _object_hook(value: dict[str, Any]) -> Any:
+    if len(value) == 1:
+        ((tag, text),) = value.items()
+        if tag in _TAGS:
+            return _TAGS[tag](text)
+    return value
+
+
+def encode_message(header: dict[str, Any], data: Any = None) -> bytes:
+    """Encode a message
+
+    A dataframe is sent as Arrow IPC payload and marked in the header by
+    `"frame": true`; other data is stored under "data" in the header.
+
+    Args:
+        header (dict[str, Any]): Json serializable header
+        data (Any, optional): Data sent with the message. Defaults to None.
+
+    Returns:
+        bytes: Message
+
+    Raises:
+        TypeError: If the header or data cannot be serialized
+    """
+    import pandas as pd
+
+    payload = b""
+    if isinstance(data, pd.DataFrame):
+        header = {**header, "frame": True}
+        payload = encode_frame(data)
+    elif data is not None:
+        header = {**header, "data": data}
+    encoded = json.dumps(header, default=_default).encode("utf-8")
+    return _LENGTH.pack(len(encoded)) + encoded + payload
+
+
+def decode_message(message: bytes) -> tuple[dict[str, Any], Any, memoryview | None]:
+    """Decode a message
+
+    Args:
+        message (bytes): Message as created by `encode_message`
+
+    Returns:
+        tuple[dict[str, Any], Any, memoryview | None]: Header, data and the Arrow
+            IPC payload if the data is a dataframe
+
+    Raises:
+        ValueError: If the message is malformed
+    """
+    if len(message) < _LENGTH.size:
+        raise ValueError("Message is too short")
+    (length,) = _LENGTH.unpack_from(message)
+    start = _LENGTH.size
+    try:
+        header = json.loads(message[start : start + length], object_hook=_object_hook)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Malformed message header: {e}") from None
+    if header.pop("frame", False):
+        payload = memoryview(message)[start + length :]
+        return header, decode_frame(payload), payload
+    return header, header.pop("data", None), None
@@ -1,3 +1,10 @@
-from .schema_manager import SchemaManager
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .schema_manager import SchemaManager
 
 __all__ = ["SchemaManager"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {"SchemaManager": ".schema_manager"})
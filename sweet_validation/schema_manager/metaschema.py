@@ -0,0 +1,122 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from ..utils import FingerprintedSchema, read_schema_from_file, schema_fingerprint
+
+__all__ = ["clear_metaschema_cache", "combine_metaschemas", "validate_against"]
+
+# combined metaschemas keyed by the paths and modification times of their parts
+_combined: dict[tuple[Any, ...], FingerprintedSchema] = {}
+# compiled jsonschema validators keyed by the fingerprint of the metaschema
+_validators: OrderedDict[str, Any] = OrderedDict()
+_max_validators = 32
+_lock = threading.Lock()
+
+
+def _part_key(schema: str | Path | dict[str, Any]) -> tuple[Any, ...]:
+    """Cache key of one part of the metaschema
+
+    Files are identified by their resolved path, modification time and size, so
+    that a changed file is read again. Dictionaries are identified by content.
+    """
+    if isinstance(schema, dict):
+        return ("dict", schema_fingerprint(schema))
+    path = Path(schema).resolve()
+    stat = os.stat(path)
+    return ("file", str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def combine_metaschemas(
+    schemas: list[str | Path | dict[str, Any]],
+) -> FingerprintedSchema:
+    """Combine a list of json schemas to a single schema
+
+    The combined schema is cached for the process. The returned schema is shared
+    and must not be modified.
+
+    Args:
+        schemas (list[str | Path | dict[str, Any]]): List of schemas to combine
+            If a string or pathlib.Path is provided, it is assumed to be the path
+            to a schema file in json or yaml format.
+
+    Returns:
+        FingerprintedSchema: Combined schema
+    """
+    key = tuple(_part_key(schema) for schema in schemas)
+    with _lock:
+        combined = _combined.get(key)
+    if combined is not None:
+        return combined
+    schemas_ = [read_schema_from_file(schema) for schema in schemas]
+    combined = FingerprintedSchema(
+        {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "title": "Combined metadata schema",
+            "allOf": [
+                {"$ref": f"#/definitions/schema{i}"} for i in range(len(schemas_))
+            ],
+            "definitions": {f"schema{i}": s for i, s in enumerate(schemas_)},
+        }
+    )
+    with _lock:
+        return _combined.setdefault(key, combined)
+
+
+def _compiled_validator(metaschema: dict[str, Any]) -> Any:
+    """Compiled jsonschema validator for a metaschema
+
+    The metaschema itself is checked once when the validator is created.
+
+    Args:
+        metaschema (dict[str, Any]): Metaschema
+
+    Returns:
+        jsonschema.protocols.Validator: Validator
+    """
+    fingerprint = schema_fingerprint(metaschema)
+    with _lock:
+        validator = _validators.get(fingerprint)
+        if validator is not None:
+            _validators.move_to_end(fingerprint)
+            return validator
+    from jsonschema.validators import validator_for
+
+    cls = validator_for(metaschema)
+    cls.check_schema(metaschema)
+    validator = cls(metaschema)
+    with _lock:
+        _validators[fingerprint] = validator
+        if len(_validators) > _max_validators:
+            _validators.popitem(last=False)
+    return validator
+
+
+def validate_against(instance: dict[str, Any], metaschema: dict[str, Any]) -> None:
+    """Validate a schema against a metaschema
+
+    Behaves like `jsonschema.validate` but reuses the compiled validator of the
+    metaschema.
+
+    Args:
+        instance (dict[str, Any]): Schema to check
+        metaschema (dict[str, Any]): Metaschema
+
+    Raises:
+        jsonschema.exceptions.ValidationError: If the schema is not valid
+        jsonschema.exceptions.SchemaError: If the metaschema is not valid
+    """
+    from jsonschema.exceptions import best_match
+
+    error = best_match(_compiled_validator(metaschema).iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+def clear_metaschema_cache() -> None:
+    """Remove all cached metaschemas and validators"""
+    with _lock:
+        _combined.clear()
+        _validators.clear()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import Connection, Engine, delete, func, insert, inspect, select
+
+from ..utils import schema_fingerprint
+from .models import Base, SchemaContent, SchemaVersion, utcnow
+from .models import Data as DataTable
+from .models import Schema as SchemaTable
+
+__all__ = ["SCHEMA_VERSION", "migrate"]
+
+# version of the table layout of models.py
+# 1: schemas (id, schema) and data (id, id_schema), without version table
+# 2: schema contents by hash, content description of data, version table
+SCHEMA_VERSION = 2
+
+# columns of the tables of version 1
+_V1_LAYOUT = {"schemas": {"id", "schema"}, "data": {"id", "id_schema"}}
+
+
+def _read_version(connection: Connection) -> int | None:
+    """Version of the table layout of a database
+
+    Returns:
+        int | None: Version or None for an empty database
+
+    Raises:
+        ValueError: If the database has no version and an unknown layout
+    """
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    if SchemaVersion.__tablename__ in tables:
+        version = connection.execute(select(func.max(SchemaVersion.version))).scalar()
+        if version is not None:
+            return int(version)
+    if not tables - {SchemaVersion.__tablename__}:
+        return None
+    layout = {
+        table: {column["name"] for column in inspector.get_columns(table)}
+        for table in tables
+    }
+    if layout == _V1_LAYOUT:
+        return 1
+    current = {
+        table.name: {column.name for column in table.columns}
+        for table in Base.metadata.sorted_tables
+        if table.name != SchemaVersion.__tablename__
+    }
+    if layout == current:  # created before the version table was added
+        return SCHEMA_VERSION
+    raise ValueError(
+        f"The database has no schema version and an unknown layout of the tables "
+        f"{sorted(tables)}. It was not created by a released version of "
+        "sweet_validation and cannot be upgraded."
+    )
+
+
+def _upgrade_1(connection: Connection) -> None:
+    """Store schema contents by hash and describe the content of data
+
+    The tables of version 1 are renamed, the tables of the current layout are
+    created and the rows are copied. Data get no content description, their
+    ingestion time is the time of the upgrade.
+    """
+    connection.exec_driver_sql("ALTER TABLE data RENAME TO data_v1")
+    connection.exec_driver_sql("ALTER TABLE schemas RENAME TO schemas_v1")
+    Base.metadata.create_all(connection)
+    contents: dict[str, str] = {}
+    schemas = []
+    for key, content in connection.exec_driver_sql("SELECT id, schema FROM schemas_v1"):
+        fingerprint = schema_fingerprint(json.loads(content))
+        contents.setdefault(fingerprint, content)
+        schemas.append({"id": key, "hash": fingerprint})
+    if contents:
+        connection.execute(
+            insert(SchemaContent),
+            [{"hash": h, "schema": content} for h, content in contents.items()],
+        )
+        connection.execute(insert(SchemaTable), schemas)
+    data = connection.exec_driver_sql("SELECT id, id_schema FROM data_v1").all()
+    if data:
+        now = utcnow()
+        connection.execute(
+            insert(DataTable),
+            [
+                {"id": key, "id_schema": schema, "ingested_at": now}
+                for key, schema in data
+            ],
+        )
+    connection.exec_driver_sql("DROP TABLE data_v1")
+    connection.exec_driver_sql("DROP TABLE schemas_v1")
+
+
+def _write_version(connection: Connection) -> None:
+    table = Base.metadata.tables[SchemaVersion.__tablename__]
+    Base.metadata.create_all(connection, tables=[table])
+    connection.execute(delete(SchemaVersion))
+    connection.execute(insert(SchemaVersion), [{"version": SCHEMA_VERSION}])
+
+
+# upgrade from the version of the key to the next version
+_UPGRADES: dict[int, Callable[[Connection], Any]] = {1: _upgrade_1}
+
+
+def migrate(engine: Engine) -> None:
+    """Create the tables of an empty database or upgrade an older layout
+
+    The upgrade runs in a single transaction with foreign keys disabled, so a
+    failing upgrade leaves the database unchanged.
+
+    Args:
+        engine (Engine): SQLite engine of the database
+
+    Raises:
+        ValueError: If the database was created by a newer version of
+            sweet_validation or has an unknown layout
+    """
+    with engine.connect() as connection:
+        version = _read_version(connection)
+        connection.rollback()
+        if version == SCHEMA_VERSION:
+            if not inspect(connection).has_table(SchemaVersion.__tablename__):
+                _write_version(connection)
+                connection.commit()
+            return
+        if version is not None and version > SCHEMA_VERSION:
+            raise ValueError(
+                f"The database has schema version {version}, but this version of "
+                f"sweet_validation supports up to version {SCHEMA_VERSION}"
+            )
+        # foreign keys cannot be switched within a transaction; keep references
+        # to renamed tables pointing to the original names
+        connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        connection.exec_driver_sql("PRAGMA legacy_alter_table=ON")
+        try:
+            connection.exec_driver_sql("BEGIN")
+            if version is None:
+                Base.metadata.create_all(connection)
+            else:
+                for step in range(version, SCHEMA_VERSION):
+                    _UPGRADES[step](connection)
+            _write_version(connection)
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+        finally:
+            connection.exec_driver_sql("PRAGMA legacy_alter_table=OFF")
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+            connection.commit()
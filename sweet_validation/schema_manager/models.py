@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
 from sqlalchemy import TEXT, ForeignKey
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -8,12 +10,31 @@ class Base(DeclarativeBase):  # type: ignore
     pass  # Inherit from DeclarativeBase
 
 
+class SchemaVersion(Base):
+    __tablename__ = "schema_version"
+
+    # version of the table layout, see migrations.SCHEMA_VERSION
+    version: Mapped[int] = mapped_column(primary_key=True)
+
+
+class SchemaContent(Base):
+    __tablename__ = "schema_contents"
+
+    # sha256 of the canonical json representation of the schema
+    hash: Mapped[str] = mapped_column(primary_key=True)
+    schema: Mapped[str] = mapped_column(TEXT, nullable=False)
+    schema_items: Mapped[list[Schema]] = relationship(back_populates="content")
+
+
 class Schema(Base):
     __tablename__ = "schemas"
 
     id: Mapped[str] = mapped_column(primary_key=True)
     data_items: Mapped[list[Data]] = relationship(back_populates="schema")
-    schema: Mapped[str] = mapped_column(TEXT, nullable=False)
+    hash: Mapped[str] = mapped_column(
+        ForeignKey("schema_contents.hash"), nullable=False
+    )
+    content: Mapped[SchemaContent] = relationship(back_populates="schema_items")
 
 
 class Data(Base):
@@ -24,3 +45,19 @@ class Data(Base):
         ForeignKey("schemas.id")
     )  # Type-annotated, ForeignKey
     schema: Mapped[Schema] = relationship(back_populates="data_items")
+    # description of the stored content; None if unknown for the data type
+    content_hash: Mapped[str | None] = mapped_column(nullable=True)
+    n_rows: Mapped[int | None] = mapped_column(nullable=True)
+    n_bytes: Mapped[int | None] = mapped_column(nullable=True)
+    # first and last value of the time field in UTC; None without time field
+    time_min: Mapped[datetime | None] = mapped_column(nullable=True, index=True)
+    time_max: Mapped[datetime | None] = mapped_column(nullable=True, index=True)
+    # json encoded column statistics; None if unknown for the data type
+    statistics: Mapped[str | None] = mapped_column(TEXT, nullable=True)
+    # time of the last add or replace in UTC
+    ingested_at: Mapped[datetime] = mapped_column(default=lambda: utcnow())
+
+
+def utcnow() -> datetime:
+    """Current time in UTC without timezone information as stored by SQLite"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
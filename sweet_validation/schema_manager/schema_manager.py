@@ -3,30 +3,37 @@ from __future__ import annotations
 import json
 from collections.abc import Generator
 from contextlib import contextmanager
+from copy import deepcopy
+from datetime import datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
-import jsonschema
-from sqlalchemy import Engine, create_engine, event
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, sessionmaker
 
-from ..utils import read_schema_from_file
-from .models import Base
+from ..instrumentation import Instrumentation, instrumented
+from ..utils import FingerprintedSchema, read_schema_from_file, schema_fingerprint
+from .metaschema import combine_metaschemas, validate_against
+from .migrations import migrate
 from .models import Data as DataTable
 from .models import Schema as SchemaTable
+from .models import SchemaContent as SchemaContentTable
+from .models import utcnow
 
 __all__ = ["SchemaManager"]
 
 
 BASE_SCHEMA = Path(__file__).parent / "meta_schemas" / "frictionlessv1.json"
-SWEET_EXTENSIONS = [Path(__file__).parent / "meta_schemas" / "sweet_metastandard.yaml"]
+# prebuilt from sweet_metastandard.yaml so that no yaml is parsed at construction
+SWEET_EXTENSIONS = [Path(__file__).parent / "meta_schemas" / "sweet_metastandard.json"]
 
 
-@event.listens_for(Engine, "connect")  # type: ignore
 def set_sqlite_pragma(dbapi_connection: Any, connection_record: Any) -> None:
     """Enable foreign key support for SQLite connections
 
-    Only needed for sqlite connections
+    Only needed for sqlite connections. The listener is registered on the engine
+    of each schema manager, so engines of other libraries are not affected.
 
     see: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#foreign-key-support"""
     if (
@@ -40,15 +47,23 @@ def set_sqlite_pragma(dbapi_connection: Any, connection_record: Any) -> None:
 __all__ = ["SchemaManager"]
 
 
+def _dump_statistics(statistics: dict[str, Any] | None) -> str | None:
+    """Encode column statistics as json for the data table"""
+    return None if statistics is None else json.dumps(statistics)
+
+
 class SchemaManager:
     """A simple relation manager based on SQLite
 
     The underlying database is in-memory if no filename is provided.
     If a filename is provided, the database is stored in the file.
-    The database has two tables: Schema and Data. The schema table stores the
-    schema key and the schema itself. The data table stores the data key and the
-    schema key associated with the data. Note that data table does not store data
-    but only the key to access the data.
+    The database has three tables: SchemaContent, Schema and Data. The schema
+    content table stores each distinct schema once, identified by the hash of its
+    canonical json representation. The schema table maps the schema key to the
+    hash of its content, so that keys with identical schemas share one entry.
+    The data table stores the data key and the schema key associated with the
+    data. Note that data table does not store data but only the key to access
+    the data.
 
     Attributes:
         schemas: List of schema keys
@@ -59,10 +74,16 @@ class SchemaManager:
         delete_schema: Delete a schema given the key
         replace_schema: Replace a schema in the database
         list_data_for_schema: Get the data keys associated with the schema key
+        fingerprint: Get the content hash of the schema given the key
+        load_schemas: Get all schemas with a single query
 
         # data management methods
         add_data: Insert data into the database
+        update_data: Update the content description of data
         list_data: Fetch all data keys
+        get_data_info: Get the content description of data
+        list_data_info: Get the content description of all data
+        list_data_in_window: Get the data keys overlapping a time window
         delete_data: Delete data given the key
         get_data_schema: Get the schema key associated with the data key
 
@@ -109,6 +130,7 @@ class SchemaManager:
         fn_db: str | None = None,
         metaschema_base: str | Path | dict[str, Any] | None = None,
         metaschema_extensions: list[str | Path | dict[str, Any]] | None = None,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         """Initialize the database engine and session factory
         Args:
@@ -127,7 +149,11 @@ class SchemaManager:
                 If None: the SWEET standard extensions are used.
                 If an empty list is passed no additional extensions are used.
                 Default is None.
+            instrumentation (Instrumentation | None): Instrumentation that records
+                the duration and number of SQL queries of all operations.
+                Default is None, which disables instrumentation.
         """
+        self._instrumentation = instrumentation or Instrumentation()
         # create the meta-data schema
         metaschema_base = metaschema_base or BASE_SCHEMA
         if metaschema_extensions is None:
@@ -136,6 +162,9 @@ class SchemaManager:
             schemas = [metaschema_base] + metaschema_extensions
         self._metaschema: dict[str, Any] = self._combine_metaschemas(schemas)
 
+        # parsed schemas by content hash; shared by all keys with the same schema
+        self._schema_cache: dict[str, FingerprintedSchema] = {}
+
         # self._meta_schema = self._create_schema_from_file(meta_schema)
         # create the engine and the tables
         conn_str = f"sqlite:///{fn_db}" if fn_db else "sqlite:///:memory:"
@@ -153,22 +182,16 @@ class SchemaManager:
     ) -> dict[str, Any]:
         """Combine a list of json schemas to a single schema
 
+        The combined schema is cached for the process, see
+        `metaschema.combine_metaschemas`.
+
         Args:
             schemas (list[dict[str, Any]]): List of schemas to combine
 
         Returns:
             dict[str, Any]: Combined schema
         """
-        schemas_ = [read_schema_from_file(schema) for schema in schemas]
-        combined_schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "Combined metadata schema",
-            "allOf": [
-                {"$ref": f"#/definitions/schema{i}"} for i in range(len(schemas_))
-            ],
-            "definitions": {f"schema{i}": s for i, s in enumerate(schemas_)},
-        }
-        return combined_schema
+        return combine_metaschemas(schemas)
 
     def _create_and_check_schema(
         self, schema: str | Path | dict[str, Any]
@@ -190,6 +213,7 @@ class SchemaManager:
 
     # --------- schema management methods
     @property
+    @instrumented("schema_manager.schemas")
     def schemas(self) -> list[str]:
         """Fetch all schema keys
 
@@ -203,9 +227,13 @@ class SchemaManager:
                 if schema.id != self.key_meta_schema
             ]
 
+    @instrumented("schema_manager.get_schema")
     def __getitem__(self, key: str) -> dict[str, Any]:
         """Get the schema given the key
 
+        Schemas are parsed once per content hash. The returned schema is shared
+        by all keys with identical content and must not be modified.
+
         Args:
             key (str): Schema key
 
@@ -213,15 +241,90 @@ class SchemaManager:
             KeyError: If the schema key does not exist
 
         Returns:
-            str: Schema
+            FingerprintedSchema: Schema together with its content hash
         """
         with self.get_session() as session:
-            schema = session.query(SchemaTable).filter(SchemaTable.id == key).first()
+            schema = session.get(SchemaTable, key)
             if not schema:
                 raise KeyError(f"Schema key '{key}' not found")
-            return cast(dict[str, Any], json.loads(schema.schema))
+            return self._cached_schema(schema.hash, schema.content.schema)
 
-    def add_schema(self, key: str, schema: str | Path | dict[str, Any]) -> None:
+    @instrumented("schema_manager.load_schemas")
+    def load_schemas(self) -> dict[str, FingerprintedSchema]:
+        """Get all schemas with a single query
+
+        Returns:
+            dict[str, FingerprintedSchema]: Schemas by key as returned by
+                `__getitem__`
+        """
+        with self.get_session() as session:
+            rows = session.query(
+                SchemaTable.id, SchemaTable.hash, SchemaContentTable.schema
+            ).join(SchemaContentTable)
+            return {
+                key: self._cached_schema(fingerprint, content)
+                for key, fingerprint, content in rows.all()
+                if key != self.key_meta_schema
+            }
+
+    def _cached_schema(
+        self, fingerprint: str, content: str | dict[str, Any]
+    ) -> FingerprintedSchema:
+        """Return the parsed schema of a content hash, parsing it only once
+
+        A schema given as dictionary is copied, so that changes of the caller
+        to the dictionary or its nested fields do not reach the cache.
+
+        Args:
+            fingerprint (str): Content hash of the schema
+            content (str | dict[str, Any]): Schema as json string or dictionary
+
+        Returns:
+            FingerprintedSchema: Schema shared by all keys with this content
+        """
+        cached = self._schema_cache.get(fingerprint)
+        if cached is None:
+            if isinstance(content, str):
+                schema = json.loads(content)
+            else:
+                schema = deepcopy(content)
+            cached = FingerprintedSchema(schema, fingerprint=fingerprint)
+            self._schema_cache[fingerprint] = cached
+        return cached
+
+    def _has_schema(self, key: str) -> bool:
+        """Check whether a schema key exists with a point query"""
+        with self.get_session() as session:
+            return key != self.key_meta_schema and (
+                session.get(SchemaTable, key) is not None
+            )
+
+    @instrumented("schema_manager.fingerprint")
+    def fingerprint(self, key: str) -> str:
+        """Get the content hash of the schema given the key
+
+        The fingerprint is stable, i.e., identical schemas have the same
+        fingerprint independent of their key or the order of their entries.
+
+        Args:
+            key (str): Schema key
+
+        Raises:
+            KeyError: If the schema key does not exist
+
+        Returns:
+            str: Hex encoded sha256 hash of the canonical schema
+        """
+        with self.get_session() as session:
+            schema = session.get(SchemaTable, key)
+            if not schema:
+                raise KeyError(f"Schema key '{key}' not found")
+            return str(schema.hash)
+
+    @instrumented("schema_manager.add_schema")
+    def add_schema(
+        self, key: str, schema: str | Path | dict[str, Any]
+    ) -> FingerprintedSchema:
         """Insert a schema into the database given the key
 
         Args:
@@ -230,17 +333,22 @@ class SchemaManager:
                 If a string or pathlib.Path is provided, it is assumed to be the
                 path to a schema file in json or yaml format.
 
+        Returns:
+            FingerprintedSchema: Parsed schema as returned by `__getitem__`
+
         Raises:
             KeyError: If the schema key already exists
         """
-        if key in self.schemas:
+        if self._has_schema(key):
             raise KeyError(f"Schema key '{key}' already exists")
 
         schema = self._create_and_check_schema(schema)
 
         # convert schema to json string and store in database
-        self._write_schema_to_db(key, schema)
+        fingerprint = self._write_schema_to_db(key, schema)
+        return self._cached_schema(fingerprint, schema)
 
+    @instrumented("schema_manager.delete_schema")
     def delete_schema(self, key: str) -> None:
         """Delete a schema given the key
 
@@ -251,36 +359,52 @@ class SchemaManager:
             KeyError: If schema does not exist
             ValueError: If some data is still associated with the schema
         """
-        if key not in self.schemas:
-            raise KeyError(f"Schema key '{key}' not found")
-        if self.list_data_for_schema(key):
-            raise ValueError(f"Data associated with schema key '{key}' still exists")
         with self.get_session() as session:
-            session.query(SchemaTable).filter(SchemaTable.id == key).delete()
+            schema = session.get(SchemaTable, key)
+            if schema is None or key == self.key_meta_schema:
+                raise KeyError(f"Schema key '{key}' not found")
+            in_use = session.query(DataTable.id).filter(DataTable.id_schema == key)
+            if in_use.first() is not None:
+                raise ValueError(
+                    f"Data associated with schema key '{key}' still exists"
+                )
+            fingerprint = schema.hash
+            session.delete(schema)
+            session.flush()
+            self._delete_orphan_content(session, fingerprint)
             session.commit()
 
-    def replace_schema(self, key: str, schema: str | Path | dict[str, Any]) -> None:
+    @instrumented("schema_manager.replace_schema")
+    def replace_schema(
+        self, key: str, schema: str | Path | dict[str, Any]
+    ) -> FingerprintedSchema:
         """Replace a schema in the database
 
         Args:
             key (str): Schema key
             schema (str | Schema): New schema
 
+        Returns:
+            FingerprintedSchema: Parsed new schema as returned by `__getitem__`
+
         Raises:
             KeyError: If the schema key does not exist
         """
-        if key not in self.schemas:
-            raise KeyError(f"Schema key '{key}' not found")
-
         schema = self._create_and_check_schema(schema)
 
-        schema = json.dumps(schema)
         with self.get_session() as session:
-            session.query(SchemaTable).filter(SchemaTable.id == key).update(
-                {"schema": schema}
-            )
+            db_schema = session.get(SchemaTable, key)
+            if db_schema is None or key == self.key_meta_schema:
+                raise KeyError(f"Schema key '{key}' not found")
+            fingerprint = self._add_content(session, schema)
+            old_fingerprint = db_schema.hash
+            db_schema.hash = fingerprint
+            session.flush()
+            self._delete_orphan_content(session, old_fingerprint)
             session.commit()
+        return self._cached_schema(fingerprint, schema)
 
+    @instrumented("schema_manager.list_data_for_schema")
     def list_data_for_schema(self, key: str) -> list[str]:
         """Get the data keys associated with the schema key
 
@@ -294,6 +418,7 @@ class SchemaManager:
             data = session.query(DataTable).filter(DataTable.id_schema == key).all()
             return [str(d.id) for d in data]
 
+    @instrumented("schema_manager.validate_schema")
     def validate_schema(self, schema: str | Path | dict[str, Any]) -> None:
         """Check if a schema is valid given the metadata schema
 
@@ -307,22 +432,57 @@ class SchemaManager:
         """
         if isinstance(schema, str | Path):
             schema = read_schema_from_file(schema)
-        jsonschema.validate(instance=schema, schema=self._metaschema)
+        validate_against(schema, self._metaschema)
 
-    def _write_schema_to_db(self, key: str, schema: dict[str, Any]) -> None:
+    def _write_schema_to_db(self, key: str, schema: dict[str, Any]) -> str:
         """Write a schema to the database
 
         Args:
             key (str): Schema key
             schema (dict[str, Any]): Schema
+
+        Returns:
+            str: Content hash of the schema
         """
-        my_schema = json.dumps(schema)
         with self.get_session() as session:
-            session.add(SchemaTable(id=key, schema=my_schema))
+            fingerprint = self._add_content(session, schema)
+            session.add(SchemaTable(id=key, hash=fingerprint))
             session.commit()
+        return fingerprint
+
+    @staticmethod
+    def _add_content(session: Session, schema: dict[str, Any]) -> str:
+        """Add the schema content to the database unless it already exists
+
+        Args:
+            session (Session): Database session
+            schema (dict[str, Any]): Schema
+
+        Returns:
+            str: Content hash of the schema
+        """
+        fingerprint = schema_fingerprint(schema)
+        if session.get(SchemaContentTable, fingerprint) is None:
+            session.add(SchemaContentTable(hash=fingerprint, schema=json.dumps(schema)))
+        return fingerprint
+
+    def _delete_orphan_content(self, session: Session, fingerprint: str) -> None:
+        """Delete the schema content if no schema key references it anymore
+
+        Args:
+            session (Session): Database session
+            fingerprint (str): Content hash of the schema
+        """
+        in_use = session.query(SchemaTable.id).filter(SchemaTable.hash == fingerprint)
+        if in_use.first() is None:
+            session.query(SchemaContentTable).filter(
+                SchemaContentTable.hash == fingerprint
+            ).delete()
+            self._schema_cache.pop(fingerprint, None)
 
     # --------- data management methods
     @property
+    @instrumented("schema_manager.data")
     def data(self) -> list[str]:
         """List of all data keys
 
@@ -331,24 +491,275 @@ class SchemaManager:
         """
         return [d[0] for d in self.list_data()]
 
-    def add_data(self, key: str, key_schema: str) -> None:
+    @instrumented("schema_manager.add_data")
+    def add_data(
+        self,
+        key: str,
+        key_schema: str,
+        content_hash: str | None = None,
+        n_rows: int | None = None,
+        n_bytes: int | None = None,
+        time_min: datetime | None = None,
+        time_max: datetime | None = None,
+        statistics: dict[str, Any] | None = None,
+        ingested_at: datetime | None = None,
+    ) -> None:
         """Insert data into the database given the key and key of associated schema
 
         Args:
             key (str): Data key
             key_schema (str): Schema key
+            content_hash (str | None, optional): Hash of the data content.
+                Defaults to None.
+            n_rows (int | None, optional): Number of rows. Defaults to None.
+            n_bytes (int | None, optional): Size of the data in bytes.
+                Defaults to None.
+            time_min (datetime | None, optional): First point in time of the
+                data in UTC. Defaults to None.
+            time_max (datetime | None, optional): Last point in time of the data
+                in UTC. Defaults to None.
+            statistics (dict[str, Any] | None, optional): Statistics of the
+                columns of the data. Defaults to None.
+            ingested_at (datetime | None, optional): Time of ingestion in UTC,
+                e.g., when restoring a snapshot. Defaults to None which uses the
+                current time.
 
         Raises:
             KeyError: If the primary key or foreign constraint is violated
         """
-        if key in self.data:
-            raise KeyError(f"Data key '{key}' already exists")
-        if key_schema not in self.schemas:
+        if key_schema == self.key_meta_schema:
             raise KeyError(f"Schema key '{key_schema}' not found")
+        # the insert fails on a violated constraint, which is only then looked up
+        try:
+            self._insert_data(
+                DataTable(
+                    id=key,
+                    id_schema=key_schema,
+                    content_hash=content_hash,
+                    n_rows=n_rows,
+                    n_bytes=n_bytes,
+                    time_min=time_min,
+                    time_max=time_max,
+                    statistics=_dump_statistics(statistics),
+                    ingested_at=ingested_at or utcnow(),
+                )
+            )
+        except IntegrityError:
+            with self.get_session() as session:
+                if session.get(DataTable, key) is not None:
+                    raise KeyError(f"Data key '{key}' already exists") from None
+                raise KeyError(f"Schema key '{key_schema}' not found") from None
+
+    def _insert_data(self, data: DataTable) -> None:
+        """Insert a row into the data table
+
+        Args:
+            data (DataTable): Row of the data table
+
+        Raises:
+            IntegrityError: If the primary key or foreign constraint is violated
+        """
         with self.get_session() as session:
-            session.add(DataTable(id=key, id_schema=key_schema))
+            session.add(data)
             session.commit()
 
+    @instrumented("schema_manager.update_data")
+    def update_data(
+        self,
+        key: str,
+        content_hash: str | None = None,
+        n_rows: int | None = None,
+        n_bytes: int | None = None,
+        time_min: datetime | None = None,
+        time_max: datetime | None = None,
+        statistics: dict[str, Any] | None = None,
+    ) -> None:
+        """Update the content description of data after its content was replaced
+
+        The ingestion timestamp is set to the current time.
+
+        Args:
+            key (str): Data key
+            content_hash (str | None, optional): Hash of the data content.
+                Defaults to None.
+            n_rows (int | None, optional): Number of rows. Defaults to None.
+            n_bytes (int | None, optional): Size of the data in bytes.
+                Defaults to None.
+            time_min (datetime | None, optional): First point in time of the
+                data in UTC. Defaults to None.
+            time_max (datetime | None, optional): Last point in time of the data
+                in UTC. Defaults to None.
+            statistics (dict[str, Any] | None, optional): Statistics of the
+                columns of the data. Defaults to None.
+
+        Raises:
+            KeyError: If the data key does not exist
+        """
+        with self.get_session() as session:
+            updated = (
+                session.query(DataTable)
+                .filter(DataTable.id == key)
+                .update(
+                    {
+                        DataTable.content_hash: content_hash,
+                        DataTable.n_rows: n_rows,
+                        DataTable.n_bytes: n_bytes,
+                        DataTable.time_min: time_min,
+                        DataTable.time_max: time_max,
+                        DataTable.statistics: _dump_statistics(statistics),
+                        DataTable.ingested_at: utcnow(),
+                    }
+                )
+            )
+            if not updated:
+                raise KeyError(f"Data key '{key}' not found")
+            session.commit()
+
+    @instrumented("schema_manager.update_time_range")
+    def update_time_range(
+        self, key: str, time_min: datetime | None, time_max: datetime | None
+    ) -> None:
+        """Update the time range of data, e.g., after its time field changed
+
+        Args:
+            key (str): Data key
+            time_min (datetime | None): First point in time of the data in UTC
+            time_max (datetime | None): Last point in time of the data in UTC
+
+        Raises:
+            KeyError: If the data key does not exist
+        """
+        with self.get_session() as session:
+            data = session.get(DataTable, key)
+            if not data:
+                raise KeyError(f"Data key '{key}' not found")
+            data.time_min = time_min
+            data.time_max = time_max
+            session.commit()
+
+    @instrumented("schema_manager.list_data_in_window")
+    def list_data_in_window(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        key_schema: str | None = None,
+    ) -> list[str]:
+        """Get the keys of data with a point in time in the window [start, end)
+
+        Only the recorded time ranges are compared, so that data with a gap
+        spanning the whole window is included as well. Data without time range
+        is never included.
+
+        Args:
+            start (datetime | None, optional): First point in time in UTC.
+                Defaults to None which does not bound the window.
+            end (datetime | None, optional): Point in time after the window in
+                UTC. Defaults to None which does not bound the window.
+            key_schema (str | None, optional): Only include data of this schema.
+                Defaults to None.
+
+        Returns:
+            list[str]: Data keys sorted by their first point in time
+        """
+        return [key for key, _ in self.list_data_starts(start, end, key_schema)]
+
+    @instrumented("schema_manager.list_data_starts")
+    def list_data_starts(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        key_schema: str | None = None,
+    ) -> list[tuple[str, datetime]]:
+        """Get the data in the window [start, end) with their first point in time
+
+        Selects the same data as `list_data_in_window` in the same query.
+
+        Args:
+            start (datetime | None, optional): First point in time in UTC.
+                Defaults to None which does not bound the window.
+            end (datetime | None, optional): Point in time after the window in
+                UTC. Defaults to None which does not bound the window.
+            key_schema (str | None, optional): Only include data of this schema.
+                Defaults to None.
+
+        Returns:
+            list[tuple[str, datetime]]: Tuples (id, time_min) sorted by time_min
+        """
+        with self.get_session() as session:
+            query = session.query(DataTable.id, DataTable.time_min).filter(
+                DataTable.time_min.is_not(None), DataTable.time_max.is_not(None)
+            )
+            if start is not None:
+                query = query.filter(DataTable.time_max >= start)
+            if end is not None:
+                query = query.filter(DataTable.time_min < end)
+            if key_schema is not None:
+                query = query.filter(DataTable.id_schema == key_schema)
+            query = query.order_by(DataTable.time_min, DataTable.id)
+            return [(str(row.id), row.time_min) for row in query.all()]
+
+    @instrumented("schema_manager.get_data_info")
+    def get_data_info(self, key: str) -> dict[str, Any]:
+        """Get the content description of data without loading the data
+
+        Args:
+            key (str): Data key
+
+        Raises:
+            KeyError: If the data key does not exist
+
+        Returns:
+            dict[str, Any]: Dictionary with the keys id, id_schema, content_hash,
+                n_rows, n_bytes, time_min, time_max, statistics, and ingested_at
+                (UTC)
+        """
+        with self.get_session() as session:
+            data = session.get(DataTable, key)
+            if not data:
+                raise KeyError(f"Data key '{key}' not found")
+            return self._data_info(data)
+
+    @instrumented("schema_manager.list_data_info")
+    def list_data_info(self, key_schema: str | None = None) -> list[dict[str, Any]]:
+        """Get the content description of all data
+
+        Args:
+            key_schema (str | None, optional): Only include data of this schema.
+                Defaults to None.
+
+        Returns:
+            list[dict[str, Any]]: List of dictionaries as returned by
+                `get_data_info`
+        """
+        with self.get_session() as session:
+            query = session.query(DataTable)
+            if key_schema is not None:
+                query = query.filter(DataTable.id_schema == key_schema)
+            return [self._data_info(data) for data in query.all()]
+
+    @staticmethod
+    def _data_info(data: DataTable) -> dict[str, Any]:
+        """Convert a row of the data table to a dictionary
+
+        Args:
+            data (DataTable): Row of the data table
+
+        Returns:
+            dict[str, Any]: Content description of the data
+        """
+        return {
+            "id": data.id,
+            "id_schema": data.id_schema,
+            "content_hash": data.content_hash,
+            "n_rows": data.n_rows,
+            "n_bytes": data.n_bytes,
+            "time_min": data.time_min,
+            "time_max": data.time_max,
+            "statistics": json.loads(data.statistics) if data.statistics else None,
+            "ingested_at": data.ingested_at,
+        }
+
+    @instrumented("schema_manager.list_data")
     def list_data(self) -> list[tuple[str, str]]:
         """Fetch all data
 
@@ -360,6 +771,7 @@ class SchemaManager:
                 (data.id, data.id_schema) for data in session.query(DataTable).all()
             ]
 
+    @instrumented("schema_manager.delete_data")
     def delete_data(self, key: str) -> None:
         """Delete data given the key
 
@@ -369,12 +781,13 @@ class SchemaManager:
         Raises:
             KeyError: If the data key does not exist
         """
-        if key not in [d[0] for d in self.list_data()]:
-            raise KeyError(f"Data key '{key}' not found")
         with self.get_session() as session:
-            session.query(DataTable).filter(DataTable.id == key).delete()
+            deleted = session.query(DataTable).filter(DataTable.id == key).delete()
+            if not deleted:
+                raise KeyError(f"Data key '{key}' not found")
             session.commit()
 
+    @instrumented("schema_manager.get_data_schema")
     def get_data_schema(self, key: str) -> dict[str, Any]:
         """Get the schema key associated with the data key
 
@@ -390,6 +803,7 @@ class SchemaManager:
         key_schema = self.get_data_schema_key(key)
         return self[key_schema]
 
+    @instrumented("schema_manager.get_data_schema_key")
     def get_data_schema_key(self, key: str) -> str:
         """Get the schema key associated with the data key
 
@@ -403,22 +817,38 @@ class SchemaManager:
             str: Schema key
         """
         with self.get_session() as session:
-            data = session.query(DataTable).filter(DataTable.id == key).first()
+            data = session.get(DataTable, key)
             if not data:
                 raise KeyError(f"Data key '{key}' not found")
             return str(data.id_schema)
 
     # --------- db management methods
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Instrumentation used by the schema manager"""
+        return self._instrumentation
+
     def _init_db(self, conn_str: str) -> None:
         """Initialize the database with the metadata schema
 
+        The tables of a database created by an older version are upgraded, see
+        `migrations.migrate`.
+
         Args:
             conn_str (str): Connection string to the database
+
+        Raises:
+            ValueError: If the database was created by a newer version or has an
+                unknown layout
         """
         self._conn_str = conn_str
         self._engine = create_engine(self._conn_str)
-        Base.metadata.create_all(self._engine)  # Create tables if they don't exist
+        event.listen(self._engine, "connect", set_sqlite_pragma)
+        migrate(self._engine)  # create or upgrade the tables
         self._SessionLocal = sessionmaker(bind=self._engine)  # Create session factory
+        # counting is a no-op without an active operation, and callbacks may
+        # be added after the engine was created
+        self._instrumentation.attach_engine(self._engine)
 
     def _close_engine(self) -> None:
         """Close the database engine."""
@@ -434,7 +864,9 @@ class SchemaManager:
         with self.get_session() as session:
             session.query(DataTable).delete()
             session.query(SchemaTable).delete()
+            session.query(SchemaContentTable).delete()
             session.commit()
+        self._schema_cache.clear()
 
     def clear_and_close(self) -> None:
         """Clear all data in the database and close the engine"""
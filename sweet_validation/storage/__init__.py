@@ -1,3 +1,17 @@
-from .inmemory import InMemoryStorage
+from typing import TYPE_CHECKING
 
-__all__ = ["InMemoryStorage"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .inmemory import InMemoryStorage
+    from .parquet import ParquetStorage
+
+__all__ = ["InMemoryStorage", "ParquetStorage"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "InMemoryStorage": ".inmemory",
+        "ParquetStorage": ".parquet",
+    },
+)
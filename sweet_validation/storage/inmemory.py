@@ -1,6 +1,9 @@
+from collections.abc import Sequence
 from copy import deepcopy
 from typing import Any
 
+from .query import Filter, query_frame
+
 __all__ = ["InMemoryStorage"]
 
 
@@ -52,6 +55,31 @@ class InMemoryStorage:
         """
         return self._data[key]
 
+    def query(
+        self,
+        key: str,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[Filter] | None = None,
+    ) -> Any:
+        """Select rows and columns of a stored dataframe
+
+        Args:
+            key (str): The key of the value
+            columns (Sequence[str] | None, optional): Columns to return. Defaults
+                to None which returns all columns.
+            filters (Sequence[Filter] | None, optional): Predicates as tuples of
+                column, operator and value that are combined with a logical and.
+                Defaults to None which returns all rows.
+
+        Returns:
+            pd.DataFrame: Matching rows and columns
+
+        Raises:
+            KeyError: If the key or a column does not exist
+            ValueError: If a filter is malformed
+        """
+        return query_frame(self._data[key], columns=columns, filters=filters)
+
     def delete(self, key: str) -> None:
         """Delete a value from the storage
 
@@ -0,0 +1,191 @@
+import os
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote, unquote
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "The ParquetStorage requires pyarrow. Install it with "
+        "`pip install sweet_validation[arrow]`."
+    ) from e
+
+from .query import Filter, check_filters
+
+__all__ = ["ParquetStorage"]
+
+
+class ParquetStorage:
+    """A storage backend that stores dataframes as Parquet files in a directory.
+
+    Each data item is stored in its own file. Files are written to a temporary
+    file in the directory first and then moved over the target, so that a
+    failing write leaves no partial file and keeps the previous value. Queries
+    push the column projection and the filters down to the Parquet reader, which
+    only decodes the requested columns and skips row groups whose statistics
+    rule out a match.
+
+    Example:
+
+        .. code-block:: python
+        storage = ParquetStorage("data", row_group_size=100_000)
+        registry = InMemoryRegistry(validator, SchemaManager(), storage=storage)
+        registry.query_data("generation", columns=["value"],
+                            filters=[("country", "==", "DE")])
+    """
+
+    def __init__(
+        self, directory: str | Path, row_group_size: int | None = None
+    ) -> None:
+        """Initialize the storage backend
+
+        Args:
+            directory (str | Path): Directory of the Parquet files. It is created
+                if it does not exist.
+            row_group_size (int | None, optional): Maximum number of rows per row
+                group. Smaller row groups allow to skip more data in queries.
+                Defaults to None which uses the default of pyarrow.
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._row_group_size = row_group_size
+
+    def _path(self, key: str) -> Path:
+        # keys are quoted so that any key is a valid file name
+        return self._directory / f"{quote(key, safe='')}.parquet"
+
+    def save(self, key: str, value: Any) -> None:
+        """Save a dataframe to the storage
+
+        Args:
+            key (str): The key of the value
+            value (pd.DataFrame): The dataframe to save
+
+        Raises:
+            KeyError: If the key already exists
+        """
+        if self.exists(key):
+            raise KeyError(f"Key '{key}' already exists")
+        self._write(key, value)
+
+    def _write(self, key: str, value: Any) -> None:
+        """Write a dataframe to a temporary file and move it to the key's path
+
+        Raises:
+            pa.ArrowInvalid, pa.ArrowTypeError: If Arrow cannot represent the
+                dataframe, e.g., an object column of mixed types
+        """
+        table = pa.Table.from_pandas(value, preserve_index=True)
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=self._directory)
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp, row_group_size=self._row_group_size)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def load(self, key: str) -> Any:
+        """Load a dataframe from the storage
+
+        Args:
+            key (str): The key of the value
+
+        Returns:
+            pd.DataFrame: The dataframe stored at the key
+
+        Raises:
+            KeyError: If the key does not exist
+        """
+        return self.query(key)
+
+    def query(
+        self,
+        key: str,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[Filter] | None = None,
+    ) -> Any:
+        """Load the matching rows and columns of a dataframe
+
+        Args:
+            key (str): The key of the value
+            columns (Sequence[str] | None, optional): Columns to load. Defaults to
+                None which loads all columns.
+            filters (Sequence[Filter] | None, optional): Predicates as tuples of
+                column, operator and value that are combined with a logical and.
+                Defaults to None which loads all rows.
+
+        Returns:
+            pd.DataFrame: Matching rows and columns
+
+        Raises:
+            KeyError: If the key or a column does not exist
+            ValueError: If a filter is malformed
+        """
+        path = self._path(key)
+        if not path.exists():
+            raise KeyError(key)
+        filters = check_filters(filters)
+        names = pq.read_schema(path).names
+        requested = [*(columns or []), *(column for column, _, _ in filters)]
+        missing = [column for column in requested if column not in names]
+        if missing:
+            raise KeyError(f"Columns {missing} do not exist")
+        # read_pandas also reads the index columns when projecting
+        table = pq.read_pandas(
+            path,
+            columns=list(columns) if columns is not None else None,
+            filters=filters or None,
+        )
+        return table.to_pandas()
+
+    def delete(self, key: str) -> None:
+        """Delete a value from the storage
+
+        Args:
+            key (str): The key of the value
+
+        Raises:
+            KeyError: If the key does not exist
+        """
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    def exists(self, key: str) -> bool:
+        """Check if a value exists in the storage
+
+        Args:
+            key (str): The key of the value
+
+        Returns:
+            bool: True if the key exists, False otherwise
+        """
+        return self._path(key).exists()
+
+    def list(self) -> list[str]:
+        """List all keys in the storage
+
+        Returns:
+            list[str]: A list of all keys in the storage
+        """
+        return sorted(unquote(path.stem) for path in self._directory.glob("*.parquet"))
+
+    def replace(self, key: str, value: Any) -> None:
+        """Replace a value in the storage
+
+        Args:
+            key (str): The key of the value
+            value (pd.DataFrame): The new dataframe
+
+        Raises:
+            KeyError: If the key does not exist
+        """
+        if not self.exists(key):
+            raise KeyError(key)
+        self._write(key, value)
@@ -0,0 +1,92 @@
+from collections.abc import Sequence
+from typing import Any
+
+__all__ = ["Filter", "FILTER_OPERATORS", "check_filters", "query_frame"]
+
+# predicate as tuple of column, operator and value, e.g., ("country", "==", "DE")
+# as used by pyarrow.parquet and pd.read_parquet
+Filter = tuple[str, str, Any]
+
+FILTER_OPERATORS = ("==", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def check_filters(filters: Sequence[Filter] | None) -> list[Filter]:
+    """Check that filters are tuples of column, operator and value
+
+    Args:
+        filters (Sequence[Filter] | None): Filters
+
+    Returns:
+        list[Filter]: Filters as list, empty if None
+
+    Raises:
+        ValueError: If a filter is malformed or uses an unknown operator
+    """
+    checked = []
+    for predicate in filters or []:
+        if not isinstance(predicate, tuple | list) or len(predicate) != 3:
+            raise ValueError(
+                f"Filter {predicate!r} is not a tuple of column, operator and value"
+            )
+        column, op, value = predicate
+        if op not in FILTER_OPERATORS:
+            raise ValueError(
+                f"Unknown filter operator {op!r}. Use one of {FILTER_OPERATORS}"
+            )
+        if op in ("in", "not in"):
+            value = list(value)
+        checked.append((column, op, value))
+    return checked
+
+
+def query_frame(
+    data: Any,
+    columns: Sequence[str] | None = None,
+    filters: Sequence[Filter] | None = None,
+) -> Any:
+    """Select rows and columns of a pandas dataframe
+
+    The filters are combined with a logical and. As in SQL and pyarrow, missing
+    values never match a filter.
+
+    Args:
+        data (pd.DataFrame): Data
+        columns (Sequence[str] | None, optional): Columns to return. Defaults to
+            None which returns all columns.
+        filters (Sequence[Filter] | None, optional): Predicates the returned rows
+            fulfil. Defaults to None which returns all rows.
+
+    Returns:
+        pd.DataFrame: Matching rows and columns
+
+    Raises:
+        KeyError: If a column does not exist
+        ValueError: If a filter is malformed
+    """
+    mask = None
+    for column, op, value in check_filters(filters):
+        values = data[column]
+        if op == "in":
+            match = values.isin(value)
+        elif op == "not in":
+            match = ~values.isin(value)
+        elif op == "==":
+            match = values == value
+        elif op == "!=":
+            match = values != value
+        elif op == "<":
+            match = values < value
+        elif op == "<=":
+            match = values <= value
+        elif op == ">":
+            match = values > value
+        else:
+            match = values >= value
+        match = match & values.notna()
+        mask = match if mask is None else mask & match
+    if columns is not None:
+        missing = [c for c in columns if c not in data.columns]
+        if missing:
+            raise KeyError(f"Columns {missing} do not exist")
+        data = data[list(columns)]
+    return data if mask is None else data[mask.to_numpy(dtype=bool)]
@@ -1,3 +1,5 @@
+from datetime import date
+
 valid_schema = {
     "fields": [
         {"name": "id", "type": "integer"},
@@ -27,3 +29,44 @@ invalid_schema = {
         {"name": "name", "type": "string"},
     ],
 }
+
+# schema with all constraints supported by the polars and arrow validators
+constraints_schema = {
+    "name": "constraints",
+    "title": "Constraints",
+    "description": "Fields with all supported constraints",
+    "fields": [
+        {
+            "name": "a",
+            "type": "integer",
+            "constraints": {"minimum": 0, "maximum": 10, "required": True},
+        },
+        {
+            "name": "b",
+            "type": "string",
+            "constraints": {
+                "pattern": "[a-z]+",
+                "minLength": 2,
+                "maxLength": 4,
+                "enum": ["ab", "abc", "x"],
+            },
+        },
+        {"name": "c", "type": "number", "constraints": {"minimum": 0.5}},
+        {
+            "name": "d",
+            "type": "date",
+            "constraints": {"maximum": "2024-12-31", "unique": True},
+        },
+    ],
+    "primaryKey": ["a", "b"],
+}
+
+constraints_data = {
+    "a": [1, 1, 20, None, 1],
+    "b": ["ab", "Q", "abcdef", "ab", "ab"],
+    "c": [0.1, 1.0, 2.0, 3.0, 4.0],
+    "d": [
+        date.fromisoformat(d)
+        for d in ["2020-01-01", "2020-01-02", "2020-01-03", "2025-01-01", "2020-01-01"]
+    ],
+}
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sweet_validation.registry import InMemoryRegistry
+from sweet_validation.schema_manager import SchemaManager
+
+from .schemas import constraints_data as data
+from .schemas import constraints_schema as schema
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+from sweet_validation.validator import ArrowValidator  # noqa: E402
+
+dir_tmp = Path(__file__).parent / "_tmp"
+
+expected_counts = {
+    ("a", "not_nullable"): 1,
+    ("a", "in_range(0, 10)"): 1,
+    ("a", "multiple_fields_uniqueness"): 2,
+    ("b", "str_length(2, 4)"): 2,
+    ("b", "str_matches('[a-z]+')"): 1,
+    ("b", "isin(['ab', 'abc', 'x'])"): 2,
+    ("b", "multiple_fields_uniqueness"): 2,
+    ("c", "greater_than_or_equal_to(0.5)"): 1,
+    ("d", "less_than_or_equal_to(2024-12-31)"): 1,
+    ("d", "field_uniqueness"): 2,
+}
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 100])
+def test_failures(batch_size: int):
+    table = pa.table(data)
+    report = ArrowValidator(batch_size=batch_size).validate(table, schema)
+    assert not report.valid
+    assert report.failure_counts == expected_counts
+    np.testing.assert_array_equal(report.failing_rows, [0, 1, 2, 3, 4])
+    assert report.failure_cases["index"].dtype == np.int64
+    assert not ArrowValidator().is_valid(table, schema)
+
+
+def test_valid():
+    table = pa.table(data).slice(1, 1).set_column(1, "b", pa.array(["abc"]))
+    assert ArrowValidator().validate(table, schema).valid
+    assert ArrowValidator().is_valid(table.to_batches()[0], schema)
+
+
+def test_record_batch_reader():
+    table = pa.table(data)
+    reader = pa.RecordBatchReader.from_batches(
+        table.schema, table.to_batches(max_chunksize=2)
+    )
+    report = ArrowValidator().validate(reader, schema)
+    assert report.failure_counts == expected_counts
+
+
+def test_dictionary_encoded_strings():
+    table = pa.table(data)
+    table = table.set_column(1, "b", table["b"].dictionary_encode())
+    report = ArrowValidator().validate(table, schema)
+    assert report.failure_counts == expected_counts
+
+
+def test_structural_failures():
+    table = pa.table(data).drop_columns(["d"]).append_column("z", pa.array([1] * 5))
+    table = table.set_column(2, "c", table["c"].cast(pa.string()))
+    report = ArrowValidator().validate(table, schema)
+    assert report.errors["d"] == {"column_in_dataframe": 1}
+    assert report.errors["c"] == {"dtype('number')": 1}
+    assert report.errors["z"] == {"column_in_schema": 1}
+
+
+def test_max_errors_stops_reading():
+    table = pa.table({"a": list(range(-1000, 0)), "b": ["ab"] * 1000})
+    schema_ = {**schema, "fields": schema["fields"][:2], "primaryKey": []}
+    report = ArrowValidator(batch_size=100, max_errors=150).validate(table, schema_)
+    assert report.truncated
+    assert report.failure_counts[("a", "in_range(0, 10)")] < 1000
+    full = ArrowValidator(batch_size=100, max_failure_cases=10).validate(table, schema_)
+    assert full.failure_counts == {("a", "in_range(0, 10)"): 1000}
+    assert len(full.failure_cases) == 10
+
+
+def test_parquet_batches():
+    fn = dir_tmp / "data.parquet"
+    pq.write_table(pa.table(data), fn, row_group_size=2)
+    batches = pq.ParquetFile(fn).iter_batches(batch_size=2)
+    report = ArrowValidator().validate(batches, schema)
+    assert report.failure_counts == expected_counts
+    fn.unlink()
+
+
+def test_registry_with_arrow():
+    registry = InMemoryRegistry(ArrowValidator(), SchemaManager())
+    registry.add_schema("constraints", schema)
+    table = pa.table(data).slice(1, 1).set_column(1, "b", pa.array(["abc"]))
+    registry.add_data("data", "constraints", table)
+    assert registry.get_data("data").equals(table)
+
+
+def test_wrong_data_type():
+    with pytest.raises(TypeError):
+        ArrowValidator().validate(data, schema)
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.importtime import loaded_modules, parse_importtime
+from benchmarks.runner import compare, load_results
+from benchmarks.synthetic import CONSTRAINTS, column_name, make_frame
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.validator import DefaultValidator
+
+dir_tmp = Path(__file__).parent / "_tmp"
+
+
+def test_column_name():
+    assert column_name(0) == "col_a"
+    assert column_name(25) == "col_z"
+    assert column_name(26) == "col_ba"
+
+
+@pytest.mark.parametrize("kind", CONSTRAINTS)
+def test_make_frame(kind: str):
+    df, schema = make_frame(rows=100, columns=3, constraints=[kind])
+    assert df.shape == (100, 3)
+    SchemaManager().validate_schema(schema)
+    assert DefaultValidator.is_valid(df, schema)
+    df_invalid, _ = make_frame(100, 3, [kind], invalid_fraction=0.1)
+    assert not DefaultValidator.is_valid(df_invalid, schema)
+
+
+def test_compare():
+    baseline = {"a": {"seconds": 1.0}, "b": {"seconds": 1.0}, "c": {"seconds": 1.0}}
+    current = {"a": {"seconds": 1.05}, "b": {"seconds": 1.5}}
+    comparison = {c["name"]: c for c in compare(baseline, current, threshold=0.1)}
+    assert set(comparison) == {"a", "b"}
+    assert not comparison["a"]["regression"]
+    assert comparison["b"]["regression"]
+    assert comparison["b"]["ratio"] == 1.5
+
+
+def test_run_and_compare_cli():
+    fn = dir_tmp / "bench.json"
+    args = ["run", "--rows", "100", "--keys", "2", "--datasets", "2", "--repeat", "1"]
+    assert main([*args, "--output", str(fn)]) == 0
+    results = load_results(fn)
+    assert "validate[rows=100,columns=10,invalid=0.0]" in results
+    assert main(["compare", str(fn), str(fn)]) == 0
+    fn.unlink()
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:       300 |       1500 | json\n"
+    )
+    assert parse_importtime(stderr) == {"json.decoder": 0.12, "json": 1.5}
+
+
+def test_importtime_budget(capsys: pytest.CaptureFixture[str]):
+    # importing the package stays within the default budget
+    assert main(["importtime", "--module", "sweet_validation"]) == 0
+    assert main(["importtime", "--module", "json", "--budget-ms", "0.001"]) == 1
+    assert "OVER BUDGET" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "sweet_validation",
+        "sweet_validation.registry",
+        "sweet_validation.validator",
+        "sweet_validation.schema_manager",
+        "sweet_validation.exceptions",
+    ],
+)
+def test_import_is_lazy(module: str):
+    heavy = {"pandas", "pandera", "numpy", "sqlalchemy", "jsonschema", "yaml"}
+    assert not loaded_modules(f"import {module}") & heavy
+
+
+def test_lazy_exports():
+    import sweet_validation.registry as registry
+
+    assert "InMemoryRegistry" in dir(registry)
+    assert registry.InMemoryRegistry.__name__ == "InMemoryRegistry"
+    with pytest.raises(AttributeError):
+        registry.NotExported  # noqa: B018
@@ -0,0 +1,132 @@
+from datetime import date, time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sweet_validation.validator import DefaultValidator, read_csv_with_schema
+
+dir_tmp = Path(__file__).parent / "_tmp"
+
+schema = {
+    "name": "typed",
+    "title": "Typed",
+    "description": "Fields of all types parsed by the csv reader",
+    "missingValues": ["", "NA"],
+    "fields": [
+        {"name": "id", "type": "integer"},
+        {"name": "flag", "type": "boolean", "trueValues": ["yes"]},
+        {"name": "name", "type": "string"},
+        {"name": "ts", "type": "datetime", "format": "%d.%m.%Y %H:%M"},
+        {"name": "value", "type": "number"},
+    ],
+}
+
+
+def write(name: str, text: str) -> Path:
+    dir_tmp.mkdir(exist_ok=True)
+    path = dir_tmp / name
+    path.write_text(text)
+    return path
+
+
+@pytest.fixture(params=["c", "pyarrow"])
+def engine(request: pytest.FixtureRequest) -> str:
+    if request.param == "pyarrow":
+        pytest.importorskip("pyarrow")
+    return str(request.param)
+
+
+def test_typed_columns(engine: str):
+    path = write(
+        "typed.csv",
+        "id,flag,name,ts,value\n"
+        "1,yes,a,01.02.2024 10:00,1.5\n"
+        "2,false,NA,02.02.2024 11:30,NA\n",
+    )
+    data, report = read_csv_with_schema(path, schema, engine=engine)
+    assert report.valid
+    assert data.dtypes.to_dict() == {
+        "id": np.dtype("int64"),
+        "flag": np.dtype("bool"),
+        "name": pd.StringDtype("python"),
+        "ts": np.dtype("datetime64[ns]"),
+        "value": np.dtype("float64"),
+    }
+    assert data["flag"].tolist() == [True, False]
+    assert data["name"].isna().tolist() == [False, True]
+    assert data["ts"][1] == pd.Timestamp("2024-02-02 11:30")
+    assert DefaultValidator().validate(data.fillna({"name": "b"}), schema).valid
+
+
+def test_missing_values_keep_nullable_types():
+    path = write("nullable.csv", "id,flag,name,ts,value\nNA,,a,,1\n")
+    data, report = read_csv_with_schema(path, schema)
+    assert report.valid
+    assert str(data["id"].dtype) == "Int64"
+    assert str(data["flag"].dtype) == "boolean"
+
+
+def test_parse_errors(engine: str):
+    path = write(
+        "parse_errors.csv",
+        "id,flag,name,ts,value,extra\n"
+        "1,yes,a,01.02.2024 10:00,1.5,x\n"
+        "one,maybe,b,2024-02-02,2,x\n"
+        "2.5,false,c,02.02.2024 11:30,two,x\n",
+    )
+    data, report = read_csv_with_schema(path, schema, engine=engine)
+    assert not report.valid
+    assert report.failure_counts == {
+        ("extra", "column_in_schema"): 1,
+        ("id", "dtype('integer')"): 2,
+        ("flag", "dtype('boolean')"): 1,
+        ("value", "dtype('number')"): 1,
+        ("ts", "dtype('datetime')"): 1,
+    }
+    np.testing.assert_array_equal(report.failing_rows, [1, 2])
+    cases = report.failure_cases
+    assert cases[cases["column"] == "id"]["failure_case"].tolist() == ["one", "2.5"]
+    assert cases["index"].dtype == np.int64
+    # unparsable values are missing, extra columns are not read
+    assert list(data.columns) == ["id", "flag", "name", "ts", "value"]
+    assert data["id"].isna().tolist() == [False, True, True]
+
+
+def test_dates_times_and_field_booleans():
+    temporal = {
+        "fields": [
+            {"name": "day", "type": "date"},
+            {"name": "at", "type": "time", "format": "%H:%M"},
+            {"name": "a", "type": "boolean", "trueValues": ["y"], "falseValues": ["n"]},
+            {"name": "b", "type": "boolean", "trueValues": ["n"], "falseValues": ["y"]},
+        ]
+    }
+    path = write("temporal.csv", "day,at,a,b\n2024-02-01,10:30,y,n\n,,n,y\n")
+    data, report = read_csv_with_schema(path, temporal)
+    assert report.valid
+    assert data["day"].tolist() == [date(2024, 2, 1), None]
+    assert data["at"].tolist() == [time(10, 30), None]
+    # the boolean values of one field do not apply to another
+    assert data["a"].tolist() == [True, False]
+    assert data["b"].tolist() == [True, False]
+    assert DefaultValidator().validate(data, temporal).valid
+
+    path = write("temporal_errors.csv", "day,at,a,b\n01.02.2024,10:30:00,n,y\n")
+    _, report = read_csv_with_schema(path, temporal)
+    assert report.failure_counts == {
+        ("day", "dtype('date')"): 1,
+        ("at", "dtype('time')"): 1,
+    }
+
+
+def test_missing_column():
+    path = write("missing_column.csv", "id,name\n1,a\n")
+    data, report = read_csv_with_schema(path, schema)
+    assert list(data.columns) == ["id", "name"]
+    assert report.failure_counts == {
+        ("flag", "column_in_dataframe"): 1,
+        ("ts", "column_in_dataframe"): 1,
+        ("value", "column_in_dataframe"): 1,
+    }
@@ -31,7 +31,7 @@ def test_data_validation():
     df = pd.DataFrame(
         {
             "datetime": pd.date_range("2021-01-01", periods=length, freq="h"),
-            "country": [fake.country() for _ in range(length)],
+            "country": [fake.unique.country() for _ in range(length)],
             "value": [i + 1 for i in range(length)],
         }
     )
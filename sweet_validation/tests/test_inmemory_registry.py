@@ -1,6 +1,12 @@
+import shutil
+from copy import deepcopy
+from pathlib import Path
+
+import pandas as pd
 import pytest
 
 from sweet_validation.exceptions import DataValidationError
+from sweet_validation.instrumentation import AggregatingCollector, Instrumentation
 from sweet_validation.registry import InMemoryRegistry
 from sweet_validation.schema_manager import SchemaManager
 from sweet_validation.validator.dummy import DummyValidator
@@ -103,8 +109,12 @@ def test_replace_schema_raise_validation_error():
     registry.add_schema("skey", valid_schema)
     registry.add_data("dkey", "skey", data="data")
     registry._validator.response = False
+    # documentation changes do not validate the data again
+    registry.replace_schema("skey", valid_schema2)
+    tightened = deepcopy(valid_schema2)
+    tightened["fields"][0]["constraints"] = {"required": True}
     with pytest.raises(DataValidationError):
-        registry.replace_schema("skey", valid_schema2)
+        registry.replace_schema("skey", tightened)
 
 
 def test_replace_data():
@@ -121,6 +131,17 @@ def test_replace_data():
     assert registry.get_data("dkey") == "new_data"
 
 
+def test_replace_data_mixed_object_column():
+    registry = InMemoryRegistry(
+        validator=DummyValidator(), schema_manager=SchemaManager()
+    )
+    registry.add_schema("skey", valid_schema)
+    registry.add_data("dkey", "skey", data=pd.DataFrame({"a": [1, "a"]}))
+    # same string representation, different values
+    registry.replace_data("dkey", pd.DataFrame({"a": ["1", "a"]}))
+    assert registry.get_data("dkey")["a"].tolist() == ["1", "a"]
+
+
 def test_replace_data_raise_validation_error():
     registry = InMemoryRegistry(
         validator=DummyValidator(response=True), schema_manager=SchemaManager()
@@ -130,3 +151,139 @@ def test_replace_data_raise_validation_error():
     registry._validator.response = False
     with pytest.raises(DataValidationError):
         registry.replace_data("dkey", "new_data")
+
+
+def test_replace_data_identical_content_is_noop():
+    registry = InMemoryRegistry(
+        validator=DummyValidator(response=True), schema_manager=SchemaManager()
+    )
+    registry.add_schema("skey", valid_schema)
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+    registry.add_data("dkey", "skey", data=df)
+    info = registry.get_data_info("dkey")
+    assert info["n_rows"] == 2
+    assert info["n_bytes"] > 0
+    assert info["content_hash"] is not None
+    # identical content is neither validated nor stored
+    registry._validator.response = False
+    registry.replace_data("dkey", df.copy())
+    assert registry.get_data("dkey") is df
+    assert registry.get_data_info("dkey") == info
+    # changed content is validated and its description updated
+    registry._validator.response = True
+    registry.replace_data("dkey", df.iloc[:1])
+    new_info = registry.get_data_info("dkey")
+    assert new_info["n_rows"] == 1
+    assert new_info["content_hash"] != info["content_hash"]
+    assert new_info["ingested_at"] >= info["ingested_at"]
+
+
+@pytest.mark.parametrize("parquet", [False, True])
+def test_query_data(parquet: bool):
+    storage = None
+    if parquet:
+        pytest.importorskip("pyarrow")
+        from sweet_validation.storage import ParquetStorage
+
+        directory = Path(__file__).parent / "_tmp" / "registry_parquet"
+        shutil.rmtree(directory, ignore_errors=True)
+        storage = ParquetStorage(directory)
+    registry = InMemoryRegistry(
+        validator=DummyValidator(), schema_manager=SchemaManager(), storage=storage
+    )
+    registry.add_schema("skey", valid_schema)
+    data = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    registry.add_data("dkey", "skey", data=data)
+    result = registry.query_data("dkey", columns=["name"], filters=[("id", ">=", 2)])
+    assert result["name"].tolist() == ["b", "c"]
+    with pytest.raises(KeyError):
+        registry.query_data("unknown")
+
+
+def test_failed_save_leaves_no_metadata():
+    pa = pytest.importorskip("pyarrow")
+    from sweet_validation.storage import ParquetStorage
+
+    directory = Path(__file__).parent / "_tmp" / "registry_failed_save"
+    shutil.rmtree(directory, ignore_errors=True)
+    registry = InMemoryRegistry(
+        validator=DummyValidator(),
+        schema_manager=SchemaManager(),
+        storage=ParquetStorage(directory),
+    )
+    registry.add_schema("skey", valid_schema)
+    mixed = pd.DataFrame({"id": [1, 2], "name": ["a", 1]})
+    with pytest.raises((pa.ArrowInvalid, pa.ArrowTypeError)):
+        registry.add_data("dkey", "skey", data=mixed)
+    assert registry.data == [] and registry._schema_manager.list_data() == []
+
+    data = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+    registry.add_data("dkey", "skey", data=data)
+    with pytest.raises((pa.ArrowInvalid, pa.ArrowTypeError)):
+        registry.replace_data("dkey", mixed)
+    pd.testing.assert_frame_equal(registry.get_data("dkey"), data)
+
+
+def test_metadata_index():
+    manager = SchemaManager()
+    manager.add_schema("skey", valid_schema)
+    manager.add_data("dkey", "skey")
+    # the index is loaded from an existing schema manager
+    registry = InMemoryRegistry(validator=DummyValidator(), schema_manager=manager)
+    assert registry.schemas == ["skey"]
+    assert registry.list_data() == [("dkey", "skey")]
+    assert registry.get_schema("skey") == valid_schema
+
+    # a failing database write leaves the index unchanged
+    with pytest.raises(ValueError):
+        registry.delete_schema("skey")
+    assert registry.schemas == ["skey"]
+    registry.add_schema("skey2", valid_schema2)
+    registry.add_data("dkey2", "skey2", data="data")
+    registry.add_data("dkey3", "skey2", data="data")
+    registry.delete_data("dkey2")
+    assert registry.data == ["dkey", "dkey3"]
+    registry.delete_data("dkey3")
+    registry.delete_schema("skey2")
+    assert registry.schemas == ["skey"]
+    # the index is consistent with the database
+    assert manager.schemas == registry.schemas
+    assert manager.list_data() == registry.list_data()
+    assert registry._index.schema_data == {"skey": {"dkey": None}}
+
+
+def test_add_data_single_query():
+    collector = AggregatingCollector()
+    manager = SchemaManager(instrumentation=Instrumentation(callbacks=[collector]))
+    registry = InMemoryRegistry(validator=DummyValidator(), schema_manager=manager)
+    registry.add_schema("skey", valid_schema)
+    collector.clear()
+    registry.add_data("dkey", "skey", data="data")
+    registry.get_schema("skey")
+    summary = collector.summary()
+    assert summary[("registry.add_data", "total")]["queries"] == 1
+    assert summary[("registry.get_schema", "total")]["queries"] == 0
+    with pytest.raises(KeyError):
+        manager.add_data("dkey", "skey")
+    with pytest.raises(KeyError):
+        manager.add_data("other", "unknown")
+
+
+def test_replace_data_reads_metadata_index():
+    collector = AggregatingCollector()
+    manager = SchemaManager(instrumentation=Instrumentation(callbacks=[collector]))
+    registry = InMemoryRegistry(validator=DummyValidator(), schema_manager=manager)
+    registry.add_schema("skey", valid_schema)
+    registry.add_data("dkey", "skey", data=pd.DataFrame({"a": [1]}))
+    collector.clear()
+    registry.replace_data("dkey", pd.DataFrame({"a": [1]}))
+    assert collector.summary()[("registry.replace_data", "total")]["queries"] == 0
+    collector.clear()
+    registry.replace_data("dkey", pd.DataFrame({"a": [2]}))
+    assert collector.summary()[("registry.replace_data", "total")]["queries"] == 1
+    # the index holds the new hash, replacing with the same data is a no-op
+    collector.clear()
+    registry.replace_data("dkey", pd.DataFrame({"a": [2]}))
+    assert collector.summary()[("registry.replace_data", "total")]["queries"] == 0
+    info = registry.get_data_info("dkey")
+    assert registry._index.data_hash == {"dkey": info["content_hash"]}
@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from sweet_validation.storage import InMemoryStorage
@@ -66,3 +67,17 @@ def test_exists():
 def test_list():
     storage = InMemoryStorage(data={"key": "value", "key2": "value2"})
     assert storage.list() == ["key", "key2"]
+
+
+def test_query():
+    frame = pd.DataFrame({"country": ["DE", "FR", None], "value": [1.0, 2.0, 3.0]})
+    storage = InMemoryStorage(data={"key": frame})
+    result = storage.query("key", columns=["value"], filters=[("country", "==", "DE")])
+    pd.testing.assert_frame_equal(result, frame.loc[[0], ["value"]])
+    # missing values never match
+    result = storage.query("key", filters=[("country", "not in", ["FR"])])
+    assert result.index.tolist() == [0]
+    with pytest.raises(KeyError):
+        storage.query("key", columns=["unknown"])
+    with pytest.raises(ValueError):
+        storage.query("key", filters=[("value", "~", 1)])
@@ -0,0 +1,99 @@
+import pandas as pd
+
+from sweet_validation.instrumentation import (
+    AggregatingCollector,
+    Instrumentation,
+    PhaseRecord,
+    phase,
+)
+from sweet_validation.registry import InMemoryRegistry
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.validator import DefaultValidator
+
+from .schemas import valid_schema
+
+
+def test_disabled_instrumentation_is_noop():
+    instrumentation = Instrumentation()
+    assert not instrumentation.enabled
+    with instrumentation.operation("op") as record:
+        record.rows = 10
+    # phases outside of an operation are not recorded
+    with phase("phase") as record:
+        assert record.operation == ""
+
+
+def test_nested_phases_are_attributed_to_operation():
+    records: list[PhaseRecord] = []
+    instrumentation = Instrumentation(callbacks=[records.append])
+    with instrumentation.operation("op", rows=3):
+        with instrumentation.phase("inner", bytes=5):
+            with phase("component"):
+                pass
+        with instrumentation.operation("nested_op"):
+            instrumentation.count_query()
+    assert [(r.operation, r.phase) for r in records] == [
+        ("op", "component"),
+        ("op", "inner"),
+        ("op", "nested_op"),
+        ("op", "total"),
+    ]
+    assert records[1].bytes == 5
+    assert records[-1].rows == 3
+    assert records[-1].queries == 1
+    assert records[-1].duration >= records[1].duration
+
+
+def test_aggregating_collector():
+    collector = AggregatingCollector()
+    for duration in [0.1, 0.2, 0.3, 0.4, 0.5]:
+        record = PhaseRecord("op", "total", rows=10)
+        record.duration = duration
+        record.queries = 2
+        collector(record)
+    stats = collector.summary(percentiles=(50, 100))[("op", "total")]
+    assert stats["count"] == 5
+    assert stats["p50"] == 0.3
+    assert stats["p100"] == 0.5
+    assert stats["rows"] == 50
+    assert stats["queries"] == 10
+    assert "op" in collector.report()
+    collector.clear()
+    assert collector.summary() == {}
+
+
+def test_registry_instrumentation():
+    collector = AggregatingCollector()
+    manager = SchemaManager(instrumentation=Instrumentation(callbacks=[collector]))
+    registry = InMemoryRegistry(validator=DefaultValidator(), schema_manager=manager)
+    registry.add_schema("skey", valid_schema)
+    registry.add_data("dkey", "skey", pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}))
+    summary = collector.summary()
+    phases = {p for op, p in summary if op == "registry.add_data"}
+    assert {
+        "total",
+        "metadata",
+        "schema_fetch",
+        "fingerprint",
+        "validate",
+        "validator.compile",
+        "validator.check",
+        "store",
+    } <= phases
+    assert summary[("registry.add_data", "validator.check")]["rows"] == 2
+    assert summary[("registry.add_data", "store")]["queries"] > 0
+    assert (
+        summary[("registry.add_data", "total")]["queries"]
+        >= (summary[("registry.add_data", "metadata")]["queries"])
+    )
+    # operations of the schema manager are recorded on their own as well
+    assert ("schema_manager.get_schema", "total") in summary
+
+
+def test_callback_added_after_schema_manager():
+    instrumentation = Instrumentation()
+    manager = SchemaManager(instrumentation=instrumentation)
+    collector = AggregatingCollector()
+    instrumentation.add_callback(collector)
+    manager.add_schema("skey", valid_schema)
+    assert collector.summary()[("schema_manager.add_schema", "total")]["queries"] > 0
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from sweet_validation.metadata import key_fields
+from sweet_validation.utils import read_schema_from_file
+from sweet_validation.validator import DefaultValidator
+from sweet_validation.validator.keys import duplicated_keys, group_codes, key_failures
+
+fn_schema = Path(__file__).parent / "data" / "example_generation.yaml"
+
+
+def test_key_fields():
+    schema = read_schema_from_file(fn_schema)
+    assert key_fields(schema) == ["country", "datetime"]
+    schema.pop("valueField")
+    assert key_fields(schema) == []
+
+
+def test_group_codes():
+    data = pd.DataFrame({"a": ["x", "y", "x", None, None], "b": [1, 1, 1, 2, 2]})
+    codes = group_codes(data, ["a", "b"])
+    assert codes[0] == codes[2]
+    assert codes[3] == codes[4]
+    assert len(set(codes)) == 3
+    assert (group_codes(data, []) == 0).all()
+
+
+def test_group_codes_wide_keys_do_not_overflow():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({f"c{i}": rng.integers(0, 1000, 2000) for i in range(12)})
+    data = pd.concat([data, data.head(5)], ignore_index=True)
+    expected = data.duplicated(keep=False).to_numpy()
+    np.testing.assert_array_equal(duplicated_keys(data, list(data.columns)), expected)
+
+
+def test_key_failures():
+    schema = read_schema_from_file(fn_schema)
+    data = pd.DataFrame(
+        {
+            "country": ["DE", "DE", "FR", "DE"],
+            "datetime": pd.to_datetime(["2024-01-01 00:00"] * 3 + ["2024-01-01 01:00"]),
+            "value": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    cases = key_failures(data, schema)
+    # only the rows of the duplicated key are reported, for each key column
+    assert cases.groupby("column")["index"].apply(list).to_dict() == {
+        "country": [0, 1],
+        "datetime": [0, 1],
+    }
+    assert key_failures(data.drop(index=1), schema) is None
+
+    report = DefaultValidator().validate(data, schema)
+    assert report.failure_counts[("country", "key_uniqueness")] == 2
+    np.testing.assert_array_equal(report.failing_rows, [0, 1])
+    validator = DefaultValidator(check_keys=False, check_time_series=False)
+    assert validator.validate(data, schema).valid
@@ -0,0 +1,98 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from sweet_validation.main import main, summarize
+from sweet_validation.schema_manager import SchemaManager
+
+from .schemas import valid_schema
+
+dir_tmp = Path(__file__).parent / "_tmp"
+
+
+@pytest.fixture
+def files():
+    directory = dir_tmp / "cli"
+    directory.mkdir(exist_ok=True)
+    pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]}).to_csv(
+        directory / "a_valid.csv", index=False
+    )
+    pd.DataFrame({"id": ["x", "y"], "name": ["a", "b"]}).to_csv(
+        directory / "b_invalid.csv", index=False
+    )
+    (directory / "c_broken.parquet").write_text("not parquet")
+    (directory / "notes.txt").write_text("ignored")
+    fn_schema = directory / "schema.json"
+    with open(fn_schema, "w") as f:
+        json.dump(valid_schema, f)
+    yield directory, fn_schema
+    for f in directory.iterdir():
+        f.unlink()
+    directory.rmdir()
+
+
+def read_ndjson(fn: Path) -> list[dict]:
+    with open(fn) as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_directory(files, workers: int):
+    directory, fn_schema = files
+    fn_out = dir_tmp / "reports.ndjson"
+    args = ["validate", str(directory), "--schema", str(fn_schema)]
+    assert main([*args, "--workers", str(workers), "--output", str(fn_out)]) == 1
+    *reports, summary = read_ndjson(fn_out)
+    fn_out.unlink()
+    assert [Path(r["file"]).name for r in reports] == [
+        "a_valid.csv",
+        "b_invalid.csv",
+        "c_broken.parquet",
+    ]
+    assert reports[0]["valid"] and reports[0]["rows"] == 3
+    assert not reports[1]["valid"] and "error" not in reports[1]
+    # csv files are parsed with the types of the schema
+    assert {"column": "id", "check": "dtype('integer')", "count": 2} in reports[1][
+        "failure_counts"
+    ]
+    assert "error" in reports[2]
+    assert summary["type"] == "summary"
+    assert (summary["files"], summary["valid"], summary["invalid"]) == (3, 1, 1)
+    assert summary["errors"] == 1
+    assert summary["rows"] == 5
+
+
+def test_validate_registered_schema(files):
+    directory, _ = files
+    fn_db = dir_tmp / "cli.db"
+    manager = SchemaManager(str(fn_db))
+    manager.add_schema("test", valid_schema)
+    manager.close()
+    fn_list = directory / "files.txt"
+    fn_list.write_text(str(directory / "a_valid.csv") + "\n")
+    fn_out = dir_tmp / "reports.ndjson"
+    args = ["validate", "--file-list", str(fn_list), "--schema", "test"]
+    assert main([*args, "--db", str(fn_db), "--output", str(fn_out)]) == 0
+    assert len(read_ndjson(fn_out)) == 2
+    fn_out.unlink()
+    fn_db.unlink()
+    # unknown keys are usage errors
+    with pytest.raises(SystemExit):
+        main(["validate", "--schema", "unknown", str(directory)])
+    # a missing database is not created
+    with pytest.raises(SystemExit):
+        main([*args, "--db", str(fn_db)])
+    assert not fn_db.exists()
+
+
+def test_summarize():
+    reports = [
+        {"valid": True, "rows": 100, "seconds": 1.0},
+        {"valid": False, "rows": 100, "seconds": 3.0},
+    ]
+    summary = summarize(reports, seconds=2.0)
+    assert summary["rows_per_second"] == 100
+    assert summary["latency_p50"] == 2.0
+    assert summary["latency_max"] == 3.0
@@ -0,0 +1,73 @@
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+from sweet_validation.protocols import QueryStorageProtocol  # noqa: E402
+from sweet_validation.storage import ParquetStorage  # noqa: E402
+
+dir_tmp = Path(__file__).parent / "_tmp" / "parquet_storage"
+
+frame = pd.DataFrame(
+    {
+        "country": ["DE", "FR", "DE", None],
+        "value": [1.0, 2.0, 3.0, 4.0],
+        "hour": [0, 0, 1, 1],
+    }
+)
+
+
+@pytest.fixture
+def storage() -> ParquetStorage:
+    shutil.rmtree(dir_tmp, ignore_errors=True)
+    return ParquetStorage(dir_tmp, row_group_size=2)
+
+
+def test_save_load(storage: ParquetStorage):
+    assert isinstance(storage, QueryStorageProtocol)
+    storage.save("a/b", frame)
+    assert storage.exists("a/b")
+    assert storage.list() == ["a/b"]
+    pd.testing.assert_frame_equal(storage.load("a/b"), frame)
+    with pytest.raises(KeyError):
+        storage.save("a/b", frame)
+    storage.replace("a/b", frame.head(1))
+    assert len(storage.load("a/b")) == 1
+    storage.delete("a/b")
+    assert storage.list() == []
+    with pytest.raises(KeyError):
+        storage.load("a/b")
+    with pytest.raises(KeyError):
+        storage.delete("a/b")
+
+
+def test_failed_write_keeps_value(storage: ParquetStorage):
+    mixed = pd.DataFrame({"value": [1, "x"]})
+    with pytest.raises((pa.ArrowInvalid, pa.ArrowTypeError)):
+        storage.save("a", mixed)
+    assert not storage.exists("a")
+    storage.save("a", frame)
+    with pytest.raises((pa.ArrowInvalid, pa.ArrowTypeError)):
+        storage.replace("a", mixed)
+    pd.testing.assert_frame_equal(storage.load("a"), frame)
+    # no partial or temporary files are left behind
+    assert [path.name for path in dir_tmp.iterdir()] == ["a.parquet"]
+    with pytest.raises(KeyError):
+        storage.replace("b", frame)
+
+
+def test_query(storage: ParquetStorage):
+    storage.save("key", frame)
+    result = storage.query(
+        "key", columns=["value"], filters=[("country", "==", "DE"), ("hour", ">", 0)]
+    )
+    # the index labels of the stored dataframe are kept
+    pd.testing.assert_frame_equal(result, frame.loc[[2], ["value"]])
+    result = storage.query("key", filters=[("country", "in", ["DE", "FR"])])
+    assert result.index.tolist() == [0, 1, 2]
+    with pytest.raises(KeyError):
+        storage.query("key", filters=[("unknown", "==", 1)])
+    with pytest.raises(ValueError):
+        storage.query("key", filters=[("value", "like", 1)])
@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from .schemas import constraints_data as data
+from .schemas import constraints_schema as schema
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+from sweet_validation.validator import ArrowValidator, ParquetValidator  # noqa: E402
+
+dir_tmp = Path(__file__).parent / "_tmp"
+
+# integer column with range constraint and string column without constraints
+range_schema = {
+    "name": "range",
+    "title": "Range",
+    "description": "Integer values between 0 and 10",
+    "fields": [
+        {
+            "name": "a",
+            "type": "integer",
+            "constraints": {"minimum": 0, "maximum": 10, "required": True},
+        },
+        {"name": "b", "type": "string"},
+    ],
+}
+
+
+@pytest.fixture
+def fn():
+    fn = dir_tmp / "validate.parquet"
+    yield fn
+    fn.unlink()
+
+
+def write(fn: Path, a: np.ndarray, row_group_size: int) -> None:
+    table = pa.table({"a": a, "b": ["x"] * len(a)})
+    pq.write_table(table, fn, row_group_size=row_group_size)
+
+
+def test_same_report_as_arrow_validator(fn: Path):
+    pq.write_table(pa.table(data), fn, row_group_size=2)
+    report = ParquetValidator().validate(fn, schema)
+    expected = ArrowValidator().validate(pa.table(data), schema)
+    assert report.failure_counts == expected.failure_counts
+    np.testing.assert_array_equal(report.failing_rows, expected.failing_rows)
+
+
+def test_valid_file_needs_footer_only(fn: Path, monkeypatch):
+    write(fn, np.arange(1000) % 10, row_group_size=100)
+    assert ParquetValidator().plan(fn, range_schema) == {}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("row group decoded")
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_group", fail)
+    assert ParquetValidator().validate(fn, range_schema).valid
+
+
+def test_only_violating_row_groups_are_decoded(fn: Path):
+    a = np.arange(1000) % 10
+    a[750] = 42
+    write(fn, a, row_group_size=100)
+    validator = ParquetValidator()
+    assert validator.plan(fn, range_schema) == {7: ["a"]}
+    report = validator.validate(fn, range_schema)
+    assert report.failure_counts == {("a", "in_range(0, 10)"): 1}
+    np.testing.assert_array_equal(report.failing_rows, [750])
+    assert report.failure_cases["index"].tolist() == [750]
+
+
+def test_nulls_are_found_from_statistics(fn: Path):
+    table = pa.table({"a": pa.array([1, None, 3, 4]), "b": ["x"] * 4})
+    pq.write_table(table, fn, row_group_size=2)
+    assert ParquetValidator().plan(fn, range_schema) == {0: ["a"]}
+    report = ParquetValidator().validate(fn, range_schema)
+    assert report.failure_counts == {("a", "not_nullable"): 1}
+
+
+def test_arrow_data():
+    report = ParquetValidator().validate(pa.table(data), schema)
+    assert not report.valid
@@ -0,0 +1,153 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from sweet_validation.exceptions import DataValidationError
+from sweet_validation.registry import IngestPipeline, InMemoryRegistry
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.validator import DefaultValidator
+
+from .schemas import valid_schema
+
+dir_tmp = Path(__file__).parent / "_tmp"
+
+
+def make_registry() -> InMemoryRegistry:
+    registry = InMemoryRegistry(DefaultValidator(), SchemaManager())
+    registry.add_schema("schema", valid_schema)
+    return registry
+
+
+def frame(i: int) -> pd.DataFrame:
+    return pd.DataFrame({"id": [i, i + 1], "name": ["a", "b"]})
+
+
+def reader(source: int) -> pd.DataFrame:
+    if source == 3:
+        raise OSError("cannot read")
+    if source == 5:
+        return pd.DataFrame({"id": ["x"], "name": ["a"]})
+    return frame(source)
+
+
+@pytest.mark.parametrize("queue_size", [1, 8])
+def test_pipeline_routes_errors(queue_size: int):
+    registry = make_registry()
+    errors = []
+    pipeline = IngestPipeline(
+        registry,
+        reader=reader,
+        readers=3,
+        validators=2,
+        queue_size=queue_size,
+        on_error=errors.append,
+    )
+    items = [(f"data{i}", "schema", i) for i in range(20)]
+    items.append(("unknown", "no_schema", 0))
+    result = pipeline.run(items)
+    assert sorted(result.stored) == sorted(
+        f"data{i}" for i in range(20) if i not in (3, 5)
+    )
+    stages = {e.key: e.stage for e in result.failed}
+    assert stages == {"data3": "read", "data5": "validate", "unknown": "schema"}
+    assert errors == result.failed
+    failure = next(e for e in result.failed if e.key == "data5")
+    assert isinstance(failure.error, DataValidationError)
+    assert registry.get_data("data7").equals(frame(7))
+    assert registry.get_data_info("data7")["n_rows"] == 2
+    # storing an existing key fails in the store stage
+    result = pipeline.run([("data0", "schema", 0)])
+    assert [e.stage for e in result.failed] == ["store"]
+
+
+def test_pipeline_resumes_from_checkpoint():
+    fn_checkpoint = dir_tmp / "ingest.checkpoint"
+    fn_checkpoint.unlink(missing_ok=True)
+    registry = make_registry()
+    items = [(f"data{i}", "schema", i) for i in range(6)]
+
+    def interrupted():
+        yield from items[:4]
+        raise KeyboardInterrupt
+
+    pipeline = IngestPipeline(registry, reader=frame, checkpoint=fn_checkpoint)
+    with pytest.raises(KeyboardInterrupt):
+        pipeline.run(interrupted())
+    done = pipeline.completed()
+    assert done <= {f"data{i}" for i in range(4)}
+    result = pipeline.run(items)
+    assert sorted(result.skipped) == sorted(done)
+    assert sorted(result.stored + result.skipped) == [k for k, _, _ in items]
+    assert sorted(registry.data) == [k for k, _, _ in items]
+    fn_checkpoint.unlink()
+
+
+def test_pipeline_reads_files():
+    directory = dir_tmp / "ingest"
+    directory.mkdir(exist_ok=True)
+    for i in range(3):
+        frame(i).to_csv(directory / f"data{i}.csv", index=False)
+    (directory / "data3.csv").write_text("id,name\n1,a\nx,b\n")
+    registry = make_registry()
+    files = sorted(directory.glob("*.csv"))
+    result = IngestPipeline(registry).run((f.stem, "schema", f) for f in files)
+    assert sorted(result.stored) == ["data0", "data1", "data2"]
+    assert registry.get_data("data0")["id"].dtype == "int64"
+    # values that do not parse into the type of their field fail the read
+    [failure] = result.failed
+    assert (failure.key, failure.stage) == ("data3", "read")
+    assert failure.error.report.failure_counts == {("id", "dtype('integer')"): 1}
+    for f in files:
+        f.unlink()
+    directory.rmdir()
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_pipeline_stops_on_failing_worker():
+    def crashing_reader(source: int) -> pd.DataFrame:
+        raise SystemExit  # not an item failure
+
+    pipeline = IngestPipeline(make_registry(), reader=crashing_reader, readers=1)
+    with pytest.raises(RuntimeError):
+        pipeline.run([("data0", "schema", 0)])
+
+
+def test_prepare_data():
+    registry = make_registry()
+    schema = registry.get_schema("schema")
+    info = registry.prepare_data(frame(1), schema)
+    assert info["n_rows"] == 2
+    with pytest.raises(DataValidationError):
+        registry.prepare_data(pd.DataFrame({"id": ["x"], "name": ["a"]}), schema)
+    registry.add_prepared_data("data", "schema", frame(1), info)
+    assert registry.get_data_info("data")["content_hash"] == info["content_hash"]
+    with pytest.raises(KeyError):
+        registry.add_prepared_data("data", "schema", frame(1), info)
+
+
+def test_prepare_data_with_report():
+    registry = make_registry()
+    schema = registry.get_schema("schema")
+    invalid = pd.DataFrame({"id": ["x"], "name": ["a"]})
+    report = DefaultValidator().validate(invalid, schema)
+    with pytest.raises(DataValidationError) as error:
+        registry.prepare_data(invalid, schema, report=report)
+    assert error.value.report is report
+    # a valid report skips the validation
+    valid = DefaultValidator().validate(frame(1), schema)
+    info = registry.prepare_data(invalid, schema, report=valid)
+    assert info["n_rows"] == 1
+
+    registry.add_data("data", "schema", frame(1))
+    info = registry.prepare_data(frame(2), schema)
+    registry.replace_prepared_data("data", frame(2), info)
+    assert registry.get_data("data")["id"].tolist() == [2, 3]
+    assert registry.get_data_info("data")["content_hash"] == info["content_hash"]
+    with pytest.raises(KeyError):
+        registry.replace_prepared_data("missing", frame(2), info)
+
+
+def test_pipeline_invalid_settings():
+    with pytest.raises(ValueError):
+        IngestPipeline(make_registry(), readers=0)
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sweet_validation.registry import InMemoryRegistry
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.validator import DefaultValidator
+
+from .schemas import constraints_data as data
+from .schemas import constraints_schema as schema
+
+pl = pytest.importorskip("polars")
+from sweet_validation.validator import PolarsValidator  # noqa: E402
+
+
+def test_valid():
+    df = pl.DataFrame(data).slice(1, 1).with_columns(b=pl.lit("abc"))
+    report = PolarsValidator().validate(df, schema)
+    assert report.valid
+    assert report.errors == {}
+    assert PolarsValidator().is_valid(df.lazy(), schema)
+
+
+def test_failures_match_default_validator():
+    report = PolarsValidator().validate(pl.DataFrame(data), schema)
+    assert not report.valid
+    assert report.failure_counts == {
+        ("a", "not_nullable"): 1,
+        ("a", "in_range(0, 10)"): 1,
+        ("a", "multiple_fields_uniqueness"): 2,
+        ("b", "str_length(2, 4)"): 2,
+        ("b", "str_matches('[a-z]+')"): 1,
+        ("b", "isin(['ab', 'abc', 'x'])"): 2,
+        ("b", "multiple_fields_uniqueness"): 2,
+        ("c", "greater_than_or_equal_to(0.5)"): 1,
+        ("d", "less_than_or_equal_to(2024-12-31)"): 1,
+        ("d", "field_uniqueness"): 2,
+    }
+    np.testing.assert_array_equal(report.failing_rows, [0, 1, 2, 3, 4])
+    assert set(report.failure_cases.columns) == {
+        "column",
+        "check",
+        "failure_case",
+        "index",
+    }
+    # the counts of the value checks agree with pandera
+    expected = DefaultValidator.validate(pd.DataFrame(data), schema).failure_counts
+    for key in [("a", "in_range(0, 10)"), ("c", "greater_than_or_equal_to(0.5)")]:
+        assert report.failure_counts[key] == expected[key]
+    assert not PolarsValidator().is_valid(pl.DataFrame(data), schema)
+
+
+def test_structural_failures():
+    df = pl.DataFrame(data).drop("d").with_columns(pl.col("c").cast(pl.String), z=1)
+    report = PolarsValidator().validate(df, schema)
+    assert report.errors["d"] == {"column_in_dataframe": 1}
+    assert report.errors["c"] == {"dtype('number')": 1}
+    assert report.errors["z"] == {"column_in_schema": 1}
+
+
+def test_bounded_failure_cases():
+    df = pl.DataFrame({"a": list(range(-1000, 0)), "b": ["ab"] * 1000})
+    schema_ = {**schema, "fields": schema["fields"][:2], "primaryKey": []}
+    report = PolarsValidator(max_failure_cases=10).validate(df, schema_)
+    assert report.failure_counts == {("a", "in_range(0, 10)"): 1000}
+    assert len(report.failing_rows) == 1000
+    assert len(report.failure_cases) == 10
+
+
+def test_registry_with_polars():
+    registry = InMemoryRegistry(PolarsValidator(), SchemaManager())
+    registry.add_schema("constraints", schema)
+    df = pl.DataFrame(data).slice(1, 1).with_columns(b=pl.lit("abc"))
+    registry.add_data("data", "constraints", df)
+    assert registry.get_data("data").equals(df)
+
+
+def test_wrong_data_type():
+    with pytest.raises(TypeError):
+        PolarsValidator().validate(pd.DataFrame(data), schema)
@@ -0,0 +1,333 @@
+import http.client
+import shutil
+import threading
+from datetime import date, datetime, time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sweet_validation.exceptions import DataValidationError
+from sweet_validation.protocols import ShardProtocol
+from sweet_validation.registry import (
+    InMemoryRegistry,
+    RegistryClient,
+    RegistryServer,
+    ShardedRegistry,
+    ValidationCache,
+    ValidationPool,
+)
+from sweet_validation.registry.wire import (
+    CONTENT_TYPE,
+    decode_message,
+    encode_frame,
+    encode_message,
+)
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.utils import read_schema_from_file
+from sweet_validation.validator import DefaultValidator
+from sweet_validation.validator.validation_report import ValidationReport
+
+pytest.importorskip("pyarrow")
+
+fn_schema = Path(__file__).parent / "data" / "example_generation.yaml"
+dir_tmp = Path(__file__).parent / "_tmp"
+
+
+def generation(start: str = "2024-01-01", periods: int = 24) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "country": pd.Series("DE", index=range(periods), dtype="string"),
+            "datetime": pd.date_range(start, periods=periods, freq="h"),
+            "value": np.arange(periods, dtype=float),
+        }
+    )
+
+
+class RecordingPool(ValidationPool):
+    def __init__(self, *args, **kwargs) -> None:
+        self.batches = []
+        super().__init__(*args, **kwargs)
+
+    def _submit(self, batch) -> None:
+        self.batches.append(len(batch))
+        super()._submit(batch)
+
+
+class CountingValidator(DefaultValidator):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def validate(self, data, schema, max_errors=None):
+        self.calls += 1
+        return super().validate(data, schema, max_errors)
+
+
+def serve(address, validator=None, **kwargs) -> tuple[RegistryServer, threading.Thread]:
+    """Start a server on a thread, which also creates the registry"""
+    servers = []
+    started = threading.Event()
+
+    def run() -> None:
+        registry = InMemoryRegistry(validator or DefaultValidator(), SchemaManager())
+        servers.append(RegistryServer(registry, address, workers=2, **kwargs))
+        started.set()
+        servers[0].serve_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait()
+    return servers[0], thread
+
+
+@pytest.fixture
+def unix_server():
+    dir_tmp.mkdir(exist_ok=True)
+    server, thread = serve(dir_tmp / "registry.sock")
+    yield server
+    server.shutdown()
+    thread.join()
+
+
+def test_wire_format():
+    data = generation(periods=3)
+    data["code"] = pd.Categorical(["a", "b", "a"])
+    header = {"args": {"start": datetime(2024, 1, 1, 12)}}
+    decoded, frame, payload = decode_message(encode_message(header, data))
+    assert decoded == header
+    pd.testing.assert_frame_equal(frame, data)
+    assert payload is not None
+    assert decode_message(encode_message({}, ["a"]))[1] == ["a"]
+    # dates and times keep their type
+    values = {"day": date(2024, 1, 1), "at": time(10, 30), "ts": datetime(2024, 1, 1)}
+    decoded = decode_message(encode_message({"args": values}))[0]["args"]
+    assert decoded == values
+    assert [type(value) for value in decoded.values()] == [date, time, datetime]
+    with pytest.raises(ValueError):
+        decode_message(b"\x00\x00\x00\x05{]")
+
+
+def test_report_from_dict():
+    report = ValidationReport.from_counts(
+        {("value", "less_than(10)"): 3, (None, "column_in_schema"): 1},
+        failure_cases=pd.DataFrame({"column": ["value"], "failure_case": [12]}),
+        truncated=True,
+    )
+    restored = ValidationReport.from_dict(report.to_dict())
+    assert restored == report
+    assert restored.failure_cases["failure_case"].tolist() == ["12"]
+    plain = ValidationReport(valid=False, errors={"value": "missing"})
+    assert ValidationReport.from_dict(plain.to_dict()) == plain
+
+
+def test_client_unix_socket(unix_server: RegistryServer):
+    with RegistryClient(unix_server.address) as registry:
+        registry.add_schema("generation", fn_schema)
+        assert registry.schemas == ["generation"]
+        assert registry.get_schema("generation")["valueField"]["field"] == "value"
+        with pytest.raises(KeyError, match="already exists"):
+            registry.add_schema("generation", fn_schema)
+
+        data = generation()
+        registry.add_data("de", "generation", data)
+        registry.add_data("de_2", "generation", generation("2024-02-01"))
+        pd.testing.assert_frame_equal(registry.get_data("de"), data)
+        assert registry.data == ["de", "de_2"]
+        assert registry.list_data() == [("de", "generation"), ("de_2", "generation")]
+        info = registry.get_data_info("de")
+        assert info["time_min"] == datetime(2024, 1, 1)
+        assert info["n_rows"] == 24
+        window = registry.get_data("de", start=datetime(2024, 1, 1, 12))
+        assert len(window) == 12
+        assert registry.list_data_in_window("2024-01-15", "2024-03-01") == ["de_2"]
+        rows = registry.query_data("de", ["value"], [("value", ">=", 20)])
+        assert rows["value"].tolist() == [20.0, 21.0, 22.0, 23.0]
+
+        invalid = generation()
+        invalid.loc[0, "value"] = -10
+        report = registry.validate(invalid, "generation")
+        assert not report.valid and report.n_failures == 1
+        assert registry.validate(data, "generation").valid
+        with pytest.raises(DataValidationError) as error:
+            registry.add_data("invalid", "generation", invalid)
+        assert error.value.report == report
+        with pytest.raises(DataValidationError):
+            registry.replace_data("de", invalid)
+        with pytest.raises(KeyError):
+            registry.get_data("invalid")
+        with pytest.raises(KeyError):
+            registry.add_data("de", "generation", data)
+
+        registry.replace_data("de", generation(periods=48))
+        assert registry.get_data_info("de")["n_rows"] == 48
+        schema = read_schema_from_file(fn_schema)
+        schema["description"] = "Replaced"
+        registry.replace_schema("generation", schema)
+        assert registry.get_schema("generation")["description"] == "Replaced"
+        with pytest.raises(ValueError):
+            registry.delete_schema("generation")
+        registry.delete_data("de")
+        registry.delete_data("de_2")
+        registry.delete_schema("generation")
+        assert registry.schemas == []
+
+
+def test_client_date_filter(unix_server: RegistryServer):
+    schema = {
+        "name": "days",
+        "title": "Days",
+        "description": "Values by day",
+        "fields": [
+            {"name": "day", "type": "date"},
+            {"name": "value", "type": "number"},
+        ],
+    }
+    data = pd.DataFrame(
+        {"day": [date(2024, 1, 1), date(2024, 1, 2)], "value": [1.0, 2.0]}
+    )
+    with RegistryClient(unix_server.address) as registry:
+        registry.add_schema("days", schema)
+        registry.add_data("days", "days", data)
+        rows = registry.query_data("days", filters=[("day", "==", date(2024, 1, 2))])
+        assert rows["value"].tolist() == [2.0]
+
+
+def test_client_shards():
+    dir_tmp.mkdir(exist_ok=True)
+    served = [serve(dir_tmp / f"shard_{name}.sock") for name in ["a", "b"]]
+    clients = {
+        name: RegistryClient(server.address)
+        for name, (server, _) in zip(["a", "b"], served, strict=True)
+    }
+    try:
+        assert all(isinstance(c, ShardProtocol) for c in clients.values())
+        registry = ShardedRegistry(clients)
+        registry.add_schema("generation", fn_schema)
+        for i in range(6):
+            registry.add_data(
+                f"data_{i}", "generation", generation(f"2024-01-0{i + 1}")
+            )
+        assert registry.list_data_in_window("2024-01-03", "2024-01-05") == [
+            "data_2",
+            "data_3",
+        ]
+        schema = read_schema_from_file(fn_schema)
+        schema["timeFields"] = []
+        registry.replace_schema("generation", schema)
+        assert registry.list_data_in_window() == []
+
+        # move all data to a shard in this process
+        local = InMemoryRegistry(DefaultValidator(), SchemaManager())
+        registry.reshard({"local": local})
+        registry.migrate()
+        assert sorted(local.data) == [f"data_{i}" for i in range(6)]
+        assert all(client.data == [] for client in clients.values())
+    finally:
+        for client in clients.values():
+            client.close()
+        for server, thread in served:
+            server.shutdown()
+            thread.join()
+
+
+def test_concurrent_clients_tcp():
+    validator = CountingValidator()
+    cache = ValidationCache()
+    server, thread = serve(("127.0.0.1", 0), validator, validation_cache=cache)
+    try:
+        client = RegistryClient(server.address)
+        client.add_schema("generation", fn_schema)
+        errors = []
+
+        def add(i: int) -> None:
+            try:
+                client.add_data(f"data_{i}", "generation", generation(periods=i + 1))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=add, args=(i,)) for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert sorted(client.data) == sorted(f"data_{i}" for i in range(16))
+        assert client.get_data_info("data_7")["n_rows"] == 8
+        # the registry stored the data with the reports of the workers
+        assert validator.calls == 0
+        assert cache.misses == 16 and cache.hits == 0
+        assert client.validate(generation(periods=8), "generation").valid
+        assert cache.hits == 1
+        client.close()
+    finally:
+        server.shutdown()
+        thread.join()
+    with pytest.raises(ValueError):
+        RegistryServer(None, ("0.0.0.0", 8000))
+
+
+def test_validation_pool_micro_batches():
+    pool = RecordingPool(DefaultValidator(), workers=1, max_batch=4, batch_window=1)
+    schema = read_schema_from_file(fn_schema)
+    invalid = generation()
+    invalid.loc[0, "value"] = -1
+    frames = [generation(), invalid] * 5
+    futures = [pool.validate(encode_frame(frame), schema) for frame in frames]
+    results = [future.result() for future in futures]
+    pool.close()
+    assert [report.valid for report, _ in results] == [True, False] * 5
+    assert pool.batches == [4, 4, 2]
+
+
+def test_server_rejects_foreign_requests():
+    server, thread = serve(("127.0.0.1", 0))
+    try:
+        host, port = server.address
+        message = encode_message({"args": {}})
+        for headers, status in [
+            ({"Content-Type": "application/x-www-form-urlencoded"}, 415),
+            ({"Content-Type": CONTENT_TYPE, "Host": f"evil.example:{port}"}, 403),
+            ({"Content-Type": CONTENT_TYPE}, 200),
+        ]:
+            connection = http.client.HTTPConnection(host, port)
+            connection.request("POST", "/schemas", body=message, headers=headers)
+            response = connection.getresponse()
+            header, _, _ = decode_message(response.read())
+            connection.close()
+            assert response.status == status, header
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+def test_client_snapshots():
+    dir_snapshots = dir_tmp / "server_snapshots"
+    shutil.rmtree(dir_snapshots, ignore_errors=True)
+    dir_snapshots.mkdir(parents=True)
+    server, thread = serve(dir_tmp / "snapshots.sock", snapshot_dir=dir_snapshots)
+    try:
+        with RegistryClient(server.address) as registry:
+            registry.add_schema("generation", fn_schema)
+            registry.add_data("de", "generation", generation())
+            registry.snapshot("latest")
+            assert (dir_snapshots / "latest" / "manifest.json").exists()
+            for path in ["../outside", str(dir_tmp / "outside"), "."]:
+                with pytest.raises(ValueError, match="outside"):
+                    registry.snapshot(path)
+                with pytest.raises(ValueError, match="outside"):
+                    registry.restore(path)
+            assert not (dir_tmp / "outside").exists()
+    finally:
+        server.shutdown()
+        thread.join()
+
+    server, thread = serve(dir_tmp / "snapshots.sock")
+    try:
+        with RegistryClient(server.address) as registry:
+            with pytest.raises(ValueError, match="disabled"):
+                registry.restore("latest")
+    finally:
+        server.shutdown()
+        thread.join()
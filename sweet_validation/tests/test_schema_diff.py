@@ -0,0 +1,205 @@
+from copy import deepcopy
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sweet_validation.exceptions import DataValidationError
+from sweet_validation.registry import InMemoryRegistry
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.utils import read_schema_from_file
+from sweet_validation.validator import DefaultValidator
+from sweet_validation.validator.schema_diff import (
+    LOOSENING,
+    METADATA,
+    TIGHTENING,
+    diff_schemas,
+    select_columns,
+)
+
+fn_schema = Path(__file__).parent / "data" / "example_generation.yaml"
+
+
+def changes(old, new) -> set[tuple]:
+    return {(c.field, c.item, c.kind) for c in diff_schemas(old, new).changes}
+
+
+def generation(periods: int = 24) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "country": "DE",
+            "datetime": pd.date_range("2024-01-01", periods=periods, freq="h"),
+            "value": np.arange(periods, dtype=float),
+        }
+    )
+
+
+class RecordingValidator(DefaultValidator):
+    def __init__(self) -> None:
+        super().__init__()
+        self.schemas = []
+
+    def validate(self, data, schema, max_errors=None):
+        self.schemas.append((list(data.columns), schema))
+        return super().validate(data, schema, max_errors)
+
+
+def test_metadata_changes():
+    schema = read_schema_from_file(fn_schema)
+    new = deepcopy(schema)
+    new["description"] = "Updated"
+    new["fields"][2]["description"] = "Net generation"
+    new["valueField"]["unit"] = "GWh"
+    new["fields"] = new["fields"][::-1]
+    diff = diff_schemas(schema, new)
+    assert diff.metadata_only
+    assert diff.revalidation_schema() is None
+    assert changes(schema, new) == {
+        (None, "description", METADATA),
+        ("value", "description", METADATA),
+        (None, "valueField", METADATA),
+        (None, "fields", METADATA),
+    }
+
+
+def test_constraint_changes():
+    schema = read_schema_from_file(fn_schema)
+    loosened = deepcopy(schema)
+    loosened["fields"][2]["constraints"] = {"minimum": -10}
+    assert changes(schema, loosened) == {
+        ("value", "required", LOOSENING),
+        ("value", "minimum", LOOSENING),
+    }
+    assert diff_schemas(schema, loosened).revalidation_schema() is None
+
+    tightened = deepcopy(schema)
+    tightened["fields"][2]["constraints"].update(maximum=100, minimum=-1)
+    tightened["fields"][0]["constraints"]["enum"] = ["DE", "FR"]
+    diff = diff_schemas(schema, tightened)
+    assert changes(schema, tightened) == {
+        ("value", "maximum", TIGHTENING),
+        ("value", "minimum", LOOSENING),
+        ("country", "enum", TIGHTENING),
+    }
+    # only the tightened constraints of the affected fields are checked again
+    assert diff.revalidation_schema() == {
+        "fields": [
+            {
+                "name": "country",
+                "type": "string",
+                "constraints": {"enum": ["DE", "FR"]},
+            },
+            {"name": "value", "type": "number", "constraints": {"maximum": 100}},
+        ]
+    }
+    assert diff.revalidation_columns() == ["country", "value"]
+
+    widened = deepcopy(tightened)
+    widened["fields"][0]["constraints"]["enum"] = ["DE", "FR", "NL"]
+    assert changes(tightened, widened) == {("country", "enum", LOOSENING)}
+
+
+def test_field_and_table_changes():
+    schema = read_schema_from_file(fn_schema)
+    new = deepcopy(schema)
+    new["fields"][1]["type"] = "date"
+    new["fields"].append({"name": "unit", "type": "string"})
+    assert {
+        ("datetime", "type", TIGHTENING),
+        ("unit", "field", TIGHTENING),
+        (None, "timeFields", TIGHTENING),
+    } <= changes(schema, new)
+
+    # the key of the valueField is extended by the added field
+    new = deepcopy(schema)
+    new["fields"].append({"name": "unit", "type": "string"})
+    assert (None, "valueField", LOOSENING) in changes(schema, new)
+    assert (None, "timeFields", TIGHTENING) in changes(schema, new)
+
+    new = deepcopy(schema)
+    new["timeFields"] = [{"field": "datetime", "frequency": "daily"}]
+    diff = diff_schemas(schema, new)
+    revalidation = diff.revalidation_schema()
+    assert [f["name"] for f in revalidation["fields"]] == [
+        "country",
+        "datetime",
+        "value",
+    ]
+    assert revalidation["timeFields"] == new["timeFields"]
+
+    new = deepcopy(schema)
+    new.pop("timeFields")
+    new["fields"].pop(0)
+    # the key of the valueField loses a field
+    assert changes(schema, new) == {
+        ("country", "field", TIGHTENING),
+        (None, "timeFields", LOOSENING),
+        (None, "valueField", TIGHTENING),
+    }
+    assert diff_schemas(schema, new).revalidation_columns() == [
+        "datetime",
+        "value",
+        "country",
+    ]
+
+
+def test_primary_key_changes():
+    schema = {
+        "fields": [
+            {"name": "a", "type": "integer"},
+            {"name": "b", "type": "integer"},
+        ],
+        "primaryKey": "a",
+    }
+    new = {**schema, "primaryKey": ["a", "b"]}
+    assert changes(schema, new) == {
+        (None, "primaryKey", LOOSENING),
+        ("b", "required", TIGHTENING),
+    }
+    assert diff_schemas(schema, new).revalidation_schema() == {
+        "fields": [{"name": "b", "type": "integer", "constraints": {"required": True}}]
+    }
+    assert changes(new, schema) == {(None, "primaryKey", TIGHTENING)}
+    assert diff_schemas(new, schema).revalidation_schema()["primaryKey"] == "a"
+
+
+def test_select_columns():
+    data = generation(2)
+    assert list(select_columns(data, ["value", "missing"]).columns) == ["value"]
+    assert select_columns("data.csv", ["value"]) is None
+
+
+def test_replace_schema_minimal_revalidation():
+    validator = RecordingValidator()
+    registry = InMemoryRegistry(validator, SchemaManager())
+    registry.add_schema("generation", fn_schema)
+    for i in range(3):
+        registry.add_data(f"data_{i}", "generation", generation())
+    validator.schemas.clear()
+
+    schema = deepcopy(dict(registry.get_schema("generation")))
+    schema["description"] = "Updated"
+    schema["fields"][2]["constraints"].pop("minimum")
+    registry.replace_schema("generation", schema)
+    assert registry.get_schema("generation")["description"] == "Updated"
+    assert validator.schemas == []
+
+    schema = deepcopy(schema)
+    schema["fields"][2]["constraints"]["maximum"] = 10
+    with pytest.raises(DataValidationError) as error:
+        registry.replace_schema("generation", schema)
+    assert error.value.report.errors == {"value": {"less_than_or_equal_to(10)": 13}}
+    assert validator.schemas == [
+        (
+            ["value"],
+            {
+                "fields": [
+                    {"name": "value", "type": "number", "constraints": {"maximum": 10}}
+                ]
+            },
+        )
+    ]
+    assert (
+        "maximum" not in registry.get_schema("generation")["fields"][2]["constraints"]
+    )
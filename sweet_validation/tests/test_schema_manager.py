@@ -1,14 +1,20 @@
 import json
+import sqlite3
+from copy import deepcopy
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
 from ..schema_manager import SchemaManager
-from .schemas import valid_schema
+from ..schema_manager.migrations import SCHEMA_VERSION
+from ..schema_manager.models import SchemaContent as SchemaContentTable
+from .schemas import valid_schema, valid_schema2
 
 db_file = Path("tmp.db")
 dir_schema = Path(__file__).parent
 valid_schema_file = dir_schema / "valid_schema.json"
+fn_upgrade = dir_schema / "_tmp" / "upgrade.db"
 
 
 @pytest.fixture(autouse=True, scope="module")
@@ -131,3 +137,145 @@ def test_init_from_existing_db():
     assert relation_manager2.schemas == ["s_test"]
     assert relation_manager2.list_data() == [("test", "s_test")]
     relation_manager2.clear_and_close()
+
+
+@pytest.mark.parametrize("fn", [None, db_file])
+def test_identical_schemas_share_content(fn: str):
+    relation_manager = SchemaManager(fn_db=fn)
+    relation_manager.add_schema(key="test", schema=valid_schema)
+    relation_manager.add_schema(
+        key="test2", schema=dict(reversed(valid_schema.items()))
+    )
+    assert relation_manager.fingerprint("test") == relation_manager.fingerprint("test2")
+    # identical schemas are stored and parsed once
+    with relation_manager.get_session() as session:
+        assert session.query(SchemaContentTable).count() == 2  # incl. meta schema
+    assert relation_manager["test"] is relation_manager["test2"]
+    assert relation_manager["test"].fingerprint == relation_manager.fingerprint("test")
+    # content is kept as long as some key references it
+    relation_manager.delete_schema("test")
+    assert relation_manager["test2"] == valid_schema
+    relation_manager.replace_schema("test2", valid_schema2)
+    assert relation_manager["test2"] == valid_schema2
+    with relation_manager.get_session() as session:
+        assert session.query(SchemaContentTable).count() == 2
+    # raise KeyError if schema key does not exist
+    with pytest.raises(KeyError):
+        relation_manager.fingerprint("test")
+    relation_manager.clear_and_close()
+
+
+def test_cached_schema_is_a_copy():
+    manager = SchemaManager()
+    for method, original in [
+        (manager.add_schema, valid_schema),
+        (manager.replace_schema, valid_schema2),
+    ]:
+        schema = deepcopy(original)
+        method("test", schema)
+        # changes of the caller do not reach the cached schema
+        schema["fields"][0]["constraints"] = {"required": True}
+        schema["title"] = "Changed"
+        assert manager["test"] != schema
+        assert "constraints" not in manager["test"]["fields"][0]
+
+
+@pytest.mark.parametrize("fn", [None, db_file])
+def test_data_info(fn: str):
+    relation_manager = SchemaManager(fn_db=fn)
+    relation_manager.add_schema(key="s_test", schema=valid_schema)
+    relation_manager.add_data(key="test", key_schema="s_test")
+    info = relation_manager.get_data_info("test")
+    assert info["content_hash"] is None
+    assert isinstance(info["ingested_at"], datetime)
+    relation_manager.update_data("test", content_hash="abc", n_rows=2, n_bytes=10)
+    info_new = relation_manager.get_data_info("test")
+    assert info_new["content_hash"] == "abc"
+    assert (info_new["n_rows"], info_new["n_bytes"]) == (2, 10)
+    assert info_new["ingested_at"] >= info["ingested_at"]
+    assert relation_manager.list_data_info() == [info_new]
+    # raise KeyError if data key does not exist
+    with pytest.raises(KeyError):
+        relation_manager.get_data_info("test2")
+    with pytest.raises(KeyError):
+        relation_manager.update_data("test2")
+    relation_manager.clear_and_close()
+
+
+def create_v1_db(fn: Path, schemas: dict, data: dict) -> None:
+    """Create a database with the tables of schema version 1"""
+    connection = sqlite3.connect(fn)
+    connection.executescript(
+        "CREATE TABLE schemas (id VARCHAR NOT NULL, schema TEXT NOT NULL, "
+        "PRIMARY KEY (id));"
+        "CREATE TABLE data (id VARCHAR NOT NULL, id_schema VARCHAR NOT NULL, "
+        "PRIMARY KEY (id), FOREIGN KEY(id_schema) REFERENCES schemas (id));"
+    )
+    connection.executemany(
+        "INSERT INTO schemas VALUES (?, ?)",
+        [(key, json.dumps(schema)) for key, schema in schemas.items()],
+    )
+    connection.executemany("INSERT INTO data VALUES (?, ?)", list(data.items()))
+    connection.commit()
+    connection.close()
+
+
+def test_upgrade_v1_db():
+    fn_upgrade.parent.mkdir(exist_ok=True)
+    fn_upgrade.unlink(missing_ok=True)
+    create_v1_db(
+        fn_upgrade,
+        {"s_test": valid_schema, "s_copy": valid_schema, "s_test2": valid_schema2},
+        {"test": "s_test", "test2": "s_test2"},
+    )
+    relation_manager = SchemaManager(fn_db=fn_upgrade)
+    assert sorted(relation_manager.schemas) == ["s_copy", "s_test", "s_test2"]
+    assert relation_manager["s_test"] == valid_schema
+    assert relation_manager.fingerprint("s_copy") == relation_manager.fingerprint(
+        "s_test"
+    )
+    assert sorted(relation_manager.list_data()) == [
+        ("test", "s_test"),
+        ("test2", "s_test2"),
+    ]
+    assert relation_manager.get_data_info("test")["content_hash"] is None
+    with pytest.raises(ValueError):  # foreign keys are enforced again
+        relation_manager.delete_schema("s_test")
+    relation_manager.close()
+    connection = sqlite3.connect(fn_upgrade)
+    assert connection.execute("SELECT version FROM schema_version").fetchall() == [
+        (SCHEMA_VERSION,)
+    ]
+    connection.close()
+    fn_upgrade.unlink()
+
+
+def test_unsupported_db():
+    fn_upgrade.parent.mkdir(exist_ok=True)
+    fn_upgrade.unlink(missing_ok=True)
+    connection = sqlite3.connect(fn_upgrade)
+    connection.execute("CREATE TABLE schemas (key VARCHAR)")
+    connection.close()
+    with pytest.raises(ValueError, match="unknown layout"):
+        SchemaManager(fn_db=fn_upgrade)
+    fn_upgrade.unlink()
+
+    SchemaManager(fn_db=fn_upgrade).close()
+    connection = sqlite3.connect(fn_upgrade)
+    connection.execute("UPDATE schema_version SET version = ?", (SCHEMA_VERSION + 1,))
+    connection.commit()
+    connection.close()
+    with pytest.raises(ValueError, match="newer|supports up to"):
+        SchemaManager(fn_db=fn_upgrade)
+    fn_upgrade.unlink()
+
+
+def test_foreign_keys_only_on_own_engine():
+    from sqlalchemy import create_engine, text
+
+    manager = SchemaManager()
+    with manager._engine.connect() as connection:
+        assert connection.execute(text("PRAGMA foreign_keys")).scalar() == 1
+    # engines of other libraries keep the sqlite default
+    with create_engine("sqlite://").connect() as connection:
+        assert connection.execute(text("PRAGMA foreign_keys")).scalar() == 0
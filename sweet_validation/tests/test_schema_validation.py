@@ -2,10 +2,19 @@ import json
 from copy import deepcopy
 from pathlib import Path
 
+import jsonschema
 import pytest
+import yaml
 from jsonschema.exceptions import ValidationError
 
 from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.schema_manager.metaschema import (
+    combine_metaschemas,
+    validate_against,
+)
+from sweet_validation.schema_manager.schema_manager import SWEET_EXTENSIONS
+
+dir_tmp = Path(__file__).parent / "_tmp"
 
 # valid and invalid schema under frictionless standard only
 fl_valid = {
@@ -117,3 +126,39 @@ def test_sweet_extensions_no_additional_fields():
     schema["additional"] = "field"
     with pytest.raises(ValidationError):
         SchemaManager().validate_schema(schema)
+
+
+def test_prebuilt_sweet_metastandard():
+    # the json artifact must be rebuilt whenever the yaml source changes
+    with open(SWEET_EXTENSIONS[0]) as f:
+        prebuilt = json.load(f)
+    with open(SWEET_EXTENSIONS[0].with_suffix(".yaml")) as f:
+        assert prebuilt == yaml.safe_load(f)
+
+
+def test_combined_metaschema_is_cached():
+    fn = dir_tmp / "extension.json"
+    with open(fn, "w") as f:
+        json.dump({"required": ["name"]}, f)
+    combined = combine_metaschemas([fl_valid, fn])
+    assert combine_metaschemas([fl_valid, fn]) is combined
+    assert SchemaManager()._metaschema is SchemaManager()._metaschema
+    # a modified file is read again
+    with open(fn, "w") as f:
+        json.dump({"required": ["name", "title"]}, f)
+    changed = combine_metaschemas([fl_valid, fn])
+    assert changed is not combined
+    assert changed["definitions"]["schema1"]["required"] == ["name", "title"]
+    fn.unlink()
+
+
+def test_validate_against_matches_jsonschema():
+    metaschema = SchemaManager()._metaschema
+    invalid = deepcopy(fl_valid)
+    invalid["fields"][0]["name"] = "Id"
+    with pytest.raises(ValidationError) as expected:
+        jsonschema.validate(instance=invalid, schema=metaschema)
+    with pytest.raises(ValidationError) as result:
+        validate_against(invalid, metaschema)
+    assert result.value.message == expected.value.message
+    assert list(result.value.path) == list(expected.value.path)
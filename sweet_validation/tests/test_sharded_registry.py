@@ -0,0 +1,178 @@
+from copy import deepcopy
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sweet_validation.exceptions import DataValidationError
+from sweet_validation.instrumentation import AggregatingCollector, Instrumentation
+from sweet_validation.protocols import ShardProtocol
+from sweet_validation.registry import InMemoryRegistry, ShardedRegistry
+from sweet_validation.registry.sharded import HashRing
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.validator import DefaultValidator
+
+fn_schema = Path(__file__).parent / "data" / "example_generation.yaml"
+
+
+def generation(start: str, periods: int = 24, value: float = 0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "country": pd.Series("DE", index=range(periods), dtype="string"),
+            "datetime": pd.date_range(start, periods=periods, freq="h"),
+            "value": np.arange(periods, dtype=float) + value,
+        }
+    )
+
+
+class CountingValidator(DefaultValidator):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def validate(self, data, schema, max_errors=None):
+        self.calls += 1
+        return super().validate(data, schema, max_errors)
+
+
+def shards(names, validator=None) -> dict[str, InMemoryRegistry]:
+    return {
+        name: InMemoryRegistry(validator or DefaultValidator(), SchemaManager())
+        for name in names
+    }
+
+
+def test_hash_ring():
+    ring = HashRing(["a", "b", "c"])
+    keys = [f"key_{i}" for i in range(3000)]
+    owners = [ring[key] for key in keys]
+    assert owners == [HashRing(["c", "b", "a"])[key] for key in keys]
+    counts = pd.Series(owners).value_counts()
+    assert set(counts.index) == {"a", "b", "c"} and counts.min() > 500
+
+    # adding a shard only moves keys to the new shard
+    extended = HashRing(["a", "b", "c", "d"])
+    moved = [key for key in keys if extended[key] != ring[key]]
+    assert all(extended[key] == "d" for key in moved)
+    assert len(moved) < len(keys) / 2
+    with pytest.raises(ValueError):
+        HashRing([])
+
+
+def test_sharded_registry():
+    registry = ShardedRegistry(shards(["a", "b", "c"]))
+    registry.add_schema("generation", fn_schema)
+    assert registry.schemas == ["generation"]
+    assert all(s.schemas == ["generation"] for s in registry.shards.values())
+    with pytest.raises(KeyError):
+        registry.add_schema("generation", fn_schema)
+
+    for i in range(12):
+        registry.add_data(f"data_{i}", "generation", generation(f"2024-01-{i + 1}"))
+    for name, shard in registry.shards.items():
+        assert all(registry.shard_for(key) == name for key in shard.data)
+    assert sorted(registry.data) == sorted(f"data_{i}" for i in range(12))
+    assert len(registry.list_data()) == 12
+    assert registry.get_data("data_3")["value"].sum() == 276
+    assert registry.get_data_info("data_3")["n_rows"] == 24
+    assert len(registry.query_data("data_3", filters=[("value", "<", 2)])) == 2
+    assert registry.list_data_in_window("2024-01-03", "2024-01-05") == [
+        "data_2",
+        "data_3",
+    ]
+    with pytest.raises(KeyError):
+        registry.add_data("data_3", "generation", generation("2024-01-01"))
+    with pytest.raises(KeyError):
+        registry.get_data("missing")
+
+    registry.replace_data("data_3", generation("2024-01-04", value=1))
+    assert registry.get_data("data_3")["value"].sum() == 300
+    with pytest.raises(ValueError):
+        registry.delete_schema("generation")
+    for key in registry.data:
+        registry.delete_data(key)
+    registry.delete_schema("generation")
+    assert registry.schemas == [] and registry.data == []
+
+
+def test_list_data_in_window_one_query_per_shard():
+    collector = AggregatingCollector()
+    instrumentation = Instrumentation(callbacks=[collector])
+    registry = ShardedRegistry(
+        {
+            name: InMemoryRegistry(
+                DefaultValidator(), SchemaManager(instrumentation=instrumentation)
+            )
+            for name in ["a", "b", "c"]
+        }
+    )
+    assert all(isinstance(s, ShardProtocol) for s in registry.shards.values())
+    registry.add_schema("generation", fn_schema)
+    for i in range(6):
+        registry.add_data(f"data_{i}", "generation", generation(f"2024-01-{i + 1}"))
+    collector.clear()
+    assert registry.list_data_in_window("2024-01-03", "2024-01-05") == [
+        "data_2",
+        "data_3",
+    ]
+    summary = collector.summary()
+    assert summary[("registry.list_data_starts", "total")]["queries"] == 3
+    assert ("registry.get_data_info", "total") not in summary
+
+
+def test_replace_schema_checks_all_shards():
+    registry = ShardedRegistry(shards(["a", "b"]))
+    registry.add_schema("generation", fn_schema)
+    for i in range(6):
+        registry.add_data(f"data_{i}", "generation", generation("2024-01-01", value=i))
+    schema = deepcopy(dict(registry.get_schema("generation")))
+    schema["fields"][2]["constraints"]["maximum"] = 25
+    with pytest.raises(DataValidationError):
+        registry.replace_schema("generation", schema)
+    # no shard applied the schema
+    for shard in registry.shards.values():
+        assert (
+            "maximum" not in shard.get_schema("generation")["fields"][2]["constraints"]
+        )
+
+    schema["fields"][2]["constraints"]["maximum"] = 100
+    registry.replace_schema("generation", schema)
+    for shard in registry.shards.values():
+        assert shard.get_schema("generation")["fields"][2]["constraints"]["maximum"]
+
+
+def test_reshard():
+    validator = CountingValidator()
+    registry = ShardedRegistry(shards(["a", "b"], validator))
+    registry.add_schema("generation", fn_schema)
+    for i in range(20):
+        registry.add_data(f"data_{i}", "generation", generation("2024-01-01", value=i))
+    validator.calls = 0
+
+    pending = registry.reshard({**registry.shards, **shards(["c"], validator)})
+    assert registry.resharding and 0 < pending < 20
+    assert registry.shards["c"].schemas == ["generation"]
+    assert registry.migrate(max_items=1) == pending - 1
+    # all data stays available during the migration
+    assert sorted(registry.data) == sorted(f"data_{i}" for i in range(20))
+    for i in range(20):
+        assert registry.get_data(f"data_{i}")["value"].iloc[0] == i
+    with pytest.raises(KeyError):
+        registry.add_data("data_0", "generation", generation("2024-01-01"))
+
+    assert registry.migrate() == 0
+    assert not registry.resharding
+    assert validator.calls == 0
+    for name, shard in registry.shards.items():
+        assert all(registry.shard_for(key) == name for key in shard.data)
+    assert registry.shards["c"].data
+
+    # removing a shard moves all of its data
+    n_removed = len(registry.shards["b"].data)
+    pending = registry.reshard({name: registry.shards[name] for name in ["a", "c"]})
+    assert pending == n_removed
+    registry.migrate()
+    assert sorted(registry.data) == sorted(f"data_{i}" for i in range(20))
+    with pytest.raises(ValueError):
+        registry.reshard({})
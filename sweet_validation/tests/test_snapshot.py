@@ -0,0 +1,135 @@
+import json
+import pickle
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sweet_validation.registry import InMemoryRegistry
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.utils import data_fingerprint
+from sweet_validation.validator import DefaultValidator
+from sweet_validation.validator.dummy import DummyValidator
+
+from .schemas import valid_schema
+
+pytest.importorskip("pyarrow")
+
+fn_schema = Path(__file__).parent / "data" / "example_generation.yaml"
+dir_tmp = Path(__file__).parent / "_tmp"
+
+
+def generation(country: str, periods: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "country": pd.Series(country, index=range(periods), dtype="string"),
+            "datetime": pd.date_range("2024-01-01", periods=periods, freq="h"),
+            "value": np.arange(periods, dtype=float),
+        }
+    )
+
+
+class CountingValidator(DefaultValidator):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def validate(self, data, schema):
+        self.calls += 1
+        return super().validate(data, schema)
+
+
+@pytest.fixture
+def path():
+    path = dir_tmp / "snapshot"
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def test_snapshot_and_restore(path: Path):
+    registry = InMemoryRegistry(DefaultValidator(), SchemaManager())
+    registry.add_schema("generation", fn_schema)
+    for country in ["DE", "FR", "a/b"]:
+        registry.add_data(country, "generation", generation(country, 24))
+    registry.snapshot(path, max_workers=2)
+
+    manifest = json.loads((path / "manifest.json").read_text())
+    formats = {info["id"]: info["format"] for info in manifest["data"]}
+    assert formats == {"DE": "arrow", "FR": "arrow", "a/b": "arrow"}
+
+    validator = CountingValidator()
+    restored = InMemoryRegistry(validator, SchemaManager())
+    restored.restore(path, max_workers=2)
+    # nothing is validated on restore
+    assert validator.calls == 0
+    assert restored.schemas == ["generation"]
+    assert restored.get_schema("generation") == registry.get_schema("generation")
+    assert sorted(restored.list_data()) == sorted(registry.list_data())
+    for key in registry.data:
+        assert restored.get_data_info(key) == registry.get_data_info(key)
+    data = restored.get_data("a/b")
+    pd.testing.assert_frame_equal(data, registry.get_data("a/b"))
+    # the stored content hash still matches the restored content
+    assert data_fingerprint(data) == restored.get_data_info("a/b")["content_hash"]
+    # time windows work on the restored metadata
+    assert restored.list_data_in_window("2024-01-01 12:00", "2024-01-02") == [
+        "DE",
+        "FR",
+        "a/b",
+    ]
+
+
+def test_snapshot_replaces_existing(path: Path):
+    registry = InMemoryRegistry(DummyValidator(), SchemaManager())
+    registry.add_schema("skey", valid_schema)
+    registry.add_data("old", "skey", data=1)
+    registry.snapshot(path)
+    registry.delete_data("old")
+    registry.add_data("new", "skey", data=2)
+    # data other than dataframes is pickled
+    registry.snapshot(path)
+    assert not path.with_name(path.name + ".tmp").exists()
+
+    restored = InMemoryRegistry(DummyValidator(), SchemaManager())
+    restored.restore(path)
+    assert restored.data == ["new"]
+    assert restored.get_data("new") == 2
+    assert sorted(p.name for p in (path / "data").iterdir()) == ["new.pickle"]
+
+
+def test_restore_existing_keys(path: Path):
+    registry = InMemoryRegistry(DummyValidator(), SchemaManager())
+    registry.add_schema("skey", valid_schema)
+    registry.add_data("dkey", "skey", data="data")
+    registry.snapshot(path)
+    # keys of the snapshot already exist
+    with pytest.raises(KeyError):
+        registry.restore(path)
+    with pytest.raises(FileNotFoundError):
+        registry.restore(dir_tmp / "missing_snapshot")
+
+
+def test_snapshot_mixed_columns(path: Path):
+    registry = InMemoryRegistry(DummyValidator(), SchemaManager())
+    registry.add_schema("skey", valid_schema)
+    mixed = pd.DataFrame({"id": [1, "a"], "name": ["a", "b"]})
+    registry.add_data("mixed", "skey", data=mixed)
+    registry.add_data("typed", "skey", data=pd.DataFrame({"id": [1], "name": ["a"]}))
+    # object columns of mixed types have no Arrow type and are pickled
+    registry.snapshot(path)
+    assert sorted(p.name for p in (path / "data").iterdir()) == [
+        "mixed.pickle",
+        "typed.arrow",
+    ]
+    restored = InMemoryRegistry(DummyValidator(), SchemaManager())
+    restored.restore(path)
+    pd.testing.assert_frame_equal(restored.get_data("mixed"), mixed)
+
+    # a failing snapshot keeps the existing one and leaves no temporary files
+    registry.add_data("unpicklable", "skey", data=lambda: None)
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        registry.snapshot(path)
+    assert not path.with_name(path.name + ".tmp").exists()
+    assert (path / "manifest.json").exists()
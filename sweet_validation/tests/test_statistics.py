@@ -0,0 +1,164 @@
+from copy import deepcopy
+from datetime import date, time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sweet_validation.exceptions import DataValidationError
+from sweet_validation.registry import InMemoryRegistry
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.utils import read_schema_from_file
+from sweet_validation.validator import DefaultValidator
+from sweet_validation.validator.schema_diff import diff_schemas
+from sweet_validation.validator.statistics import (
+    column_statistics,
+    undecided_changes,
+)
+
+fn_schema = Path(__file__).parent / "data" / "example_generation.yaml"
+
+
+def generation(periods: int = 24) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "country": pd.Series(["DE", "FR"] * (periods // 2), dtype="string"),
+            "datetime": pd.date_range("2024-01-01", periods=periods, freq="h"),
+            "value": np.arange(periods, dtype=float),
+        }
+    )
+
+
+class CountingValidator(DefaultValidator):
+    def __init__(self) -> None:
+        super().__init__(check_time_series=False)
+        self.calls = 0
+
+    def validate(self, data, schema, max_errors=None):
+        self.calls += 1
+        return super().validate(data, schema, max_errors)
+
+
+def test_column_statistics():
+    data = generation()
+    data.loc[3, "value"] = np.nan
+    stats = column_statistics(data)
+    assert stats["country"] == {
+        "count": 24,
+        "n_null": 0,
+        "min_length": 2,
+        "max_length": 2,
+        "n_distinct": 2,
+        "values": ["DE", "FR"],
+    }
+    assert stats["datetime"]["min"] == "2024-01-01T00:00:00"
+    assert stats["datetime"]["max"] == "2024-01-01T23:00:00"
+    assert stats["value"]["n_null"] == 1
+    assert stats["value"]["min"] == 0.0 and stats["value"]["max"] == 23.0
+    assert stats["value"]["n_distinct"] == 23
+    assert "values" in stats["value"]
+    assert column_statistics(generation(100))["value"].get("values") is None
+    assert column_statistics("data") is None
+
+
+def test_object_column_statistics():
+    data = pd.DataFrame(
+        {
+            "day": [date(2024, 1, 1), date(2024, 1, 2), None],
+            "at": [time(10, 30), time(11), time(10, 30)],
+            "count": pd.Series([1, 2, 3], dtype=object),
+            "name": ["a", "bcd", None],
+        }
+    )
+    stats = column_statistics(data)
+    for column in ["day", "at", "count"]:
+        assert "min_length" not in stats[column]
+    assert stats["day"]["n_distinct"] == 2 and stats["day"]["n_null"] == 1
+    assert stats["at"]["n_distinct"] == 2
+    assert stats["count"]["n_distinct"] == 3
+    assert stats["name"]["min_length"] == 1 and stats["name"]["max_length"] == 3
+
+    schema = {
+        "name": "objects",
+        "title": "Objects",
+        "description": "Object columns",
+        "fields": [
+            {"name": "day", "type": "date"},
+            {"name": "at", "type": "time"},
+            {"name": "count", "type": "any"},
+            {"name": "name", "type": "string"},
+        ],
+    }
+    registry = InMemoryRegistry(DefaultValidator(), SchemaManager())
+    registry.add_schema("objects", schema)
+    registry.add_data("objects", "objects", data.iloc[:2])
+    registry.replace_data("objects", data.iloc[1:2])
+    assert registry.get_data_info("objects")["statistics"]["day"]["count"] == 1
+
+
+def test_undecided_changes():
+    schema = read_schema_from_file(fn_schema)
+    stats = column_statistics(generation())
+    new = deepcopy(schema)
+    value, country, time = new["fields"][2], new["fields"][0], new["fields"][1]
+    value["constraints"]["maximum"] = 100
+    value["constraints"]["unique"] = True
+    country["constraints"]["enum"] = ["DE", "FR", "NL"]
+    country["constraints"]["maxLength"] = 2
+    time["constraints"]["minimum"] = "2023-12-31T00:00:00"
+    tightened = diff_schemas(schema, new).tightened
+    assert len(tightened) == 5
+    assert undecided_changes(tightened, new, stats) == []
+    assert undecided_changes(tightened, new, None) == tightened
+
+    value["constraints"]["maximum"] = 10
+    country["constraints"]["pattern"] = "D.*"
+    time["constraints"]["minimum"] = "2024-01-01T01:00:00"
+    tightened = diff_schemas(schema, new).tightened
+    undecided = {(c.field, c.item) for c in undecided_changes(tightened, new, stats)}
+    assert undecided == {
+        ("value", "maximum"),
+        ("country", "pattern"),
+        ("datetime", "minimum"),
+    }
+
+
+def test_replace_schema_decided_by_statistics():
+    validator = CountingValidator()
+    registry = InMemoryRegistry(validator, SchemaManager())
+    registry.add_schema("generation", fn_schema)
+    for i in range(3):
+        registry.add_data(f"data_{i}", "generation", generation())
+    assert registry.get_data_info("data_0")["statistics"]["value"]["max"] == 23.0
+    validator.calls = 0
+
+    schema = deepcopy(dict(registry.get_schema("generation")))
+    schema["fields"][2]["constraints"]["maximum"] = 100
+    schema["fields"][0]["constraints"]["enum"] = ["DE", "FR"]
+    registry.replace_schema("generation", schema)
+    assert validator.calls == 0
+    assert registry.get_schema("generation")["fields"][2]["constraints"]["maximum"]
+
+    # replaced data gets new statistics
+    registry.replace_data("data_0", generation(48))
+    assert registry.get_data_info("data_0")["statistics"]["value"]["max"] == 47.0
+    validator.calls = 0
+    schema = deepcopy(schema)
+    schema["fields"][2]["constraints"]["maximum"] = 30
+    with pytest.raises(DataValidationError):
+        registry.replace_schema("generation", schema)
+    # only the data whose statistics exceed the maximum is scanned
+    assert validator.calls == 1
+
+
+def test_statistics_disabled():
+    validator = CountingValidator()
+    registry = InMemoryRegistry(validator, SchemaManager(), collect_statistics=False)
+    registry.add_schema("generation", fn_schema)
+    registry.add_data("data", "generation", generation())
+    assert registry.get_data_info("data")["statistics"] is None
+    schema = deepcopy(dict(registry.get_schema("generation")))
+    schema["fields"][2]["constraints"]["maximum"] = 100
+    registry.replace_schema("generation", schema)
+    assert validator.calls == 2
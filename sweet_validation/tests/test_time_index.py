@@ -0,0 +1,136 @@
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sweet_validation.metadata import time_field
+from sweet_validation.registry import InMemoryRegistry
+from sweet_validation.registry.time_index import TimeIndex, time_range
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.utils import read_schema_from_file
+from sweet_validation.validator import DefaultValidator
+
+fn_schema = Path(__file__).parent / "data" / "example_generation.yaml"
+dir_tmp = Path(__file__).parent / "_tmp"
+
+
+def generation(start: str, periods: int, shuffle: bool = False) -> pd.DataFrame:
+    data = pd.DataFrame(
+        {
+            "country": "DE",
+            "datetime": pd.date_range(start, periods=periods, freq="h"),
+            "value": np.arange(periods, dtype=float),
+        }
+    )
+    if shuffle:
+        data = data.sample(frac=1, random_state=0).reset_index(drop=True)
+    return data
+
+
+def make_registry(storage=None) -> InMemoryRegistry:
+    # shuffled test data is not monotonic in time
+    validator = DefaultValidator(check_time_series=False)
+    registry = InMemoryRegistry(
+        validator=validator, schema_manager=SchemaManager(), storage=storage
+    )
+    registry.add_schema("generation", fn_schema)
+    return registry
+
+
+def test_time_field():
+    schema = read_schema_from_file(fn_schema)
+    assert time_field(schema) == "datetime"
+    assert time_field({"fields": [{"name": "a", "type": "integer"}]}) is None
+    # time fields must refer to a datetime or date field
+    assert time_field({**schema, "timeFields": [{"field": "value"}]}) is None
+
+
+def test_time_range_converts_to_utc():
+    schema = read_schema_from_file(fn_schema)
+    data = generation("2024-01-01 01:00", 3)
+    data["datetime"] = data["datetime"].dt.tz_localize("Europe/Berlin")
+    assert time_range(data, schema) == (
+        datetime(2024, 1, 1, 0),
+        datetime(2024, 1, 1, 2),
+    )
+    assert time_range("no dataframe", schema) == (None, None)
+
+
+def test_sorted_time_index_slices():
+    index = TimeIndex(generation("2024-01-01", 48)["datetime"])
+    assert index.order is None
+    assert index.positions("2024-01-01 10:00", "2024-01-01 20:00") == slice(10, 20)
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_time_index(shuffle: bool):
+    data = generation("2024-01-01", 48, shuffle=shuffle)
+    data.loc[3, "datetime"] = pd.NaT
+    index = TimeIndex(data["datetime"])
+    # missing times are sorted last
+    assert index.order is not None
+    positions = index.positions("2024-01-01 10:00", "2024-01-01 20:00")
+    expected = data["datetime"].between(
+        "2024-01-01 10:00", "2024-01-01 20:00", inclusive="left"
+    )
+    assert data.iloc[positions].index.tolist() == data.index[expected].tolist()
+    assert len(data.iloc[index.positions()]) == 47
+    assert len(data.iloc[index.positions(end="2023-01-01")]) == 0
+
+
+def test_registry_time_window():
+    registry = make_registry()
+    registry.add_data("january", "generation", generation("2024-01-01", 31 * 24))
+    registry.add_data("february", "generation", generation("2024-02-01", 29 * 24, True))
+    info = registry.get_data_info("february")
+    assert info["time_min"] == datetime(2024, 2, 1)
+    assert info["time_max"] == datetime(2024, 2, 29, 23)
+
+    assert registry.list_data_in_window("2024-01-31", "2024-02-02") == [
+        "january",
+        "february",
+    ]
+    assert registry.list_data_in_window(start="2024-02-01") == ["february"]
+    assert registry.list_data_in_window(end="2024-02-01") == ["january"]
+    assert registry.list_data_in_window("2025-01-01", "2025-02-01") == []
+
+    day = registry.get_data("february", start="2024-02-10", end="2024-02-11")
+    assert len(day) == 24
+    # rows keep the order of the stored data
+    assert day.index.is_monotonic_increasing
+    assert day["datetime"].min() == pd.Timestamp("2024-02-10")
+    assert day["datetime"].max() == pd.Timestamp("2024-02-10 23:00")
+
+    # replaced data is indexed again
+    registry.replace_data("january", generation("2024-01-15", 24))
+    assert registry.get_data_info("january")["time_min"] == datetime(2024, 1, 15)
+    assert len(registry.get_data("january", start="2024-01-01", end="2024-01-16")) == 24
+
+
+def test_registry_time_window_requires_time_field():
+    registry = make_registry()
+    schema = read_schema_from_file(fn_schema)
+    registry.add_data("january", "generation", generation("2024-01-01", 24))
+    registry.replace_schema(
+        "generation", {k: v for k, v in schema.items() if k != "timeFields"}
+    )
+    assert registry.get_data_info("january")["time_min"] is None
+    assert registry.list_data_in_window() == []
+    with pytest.raises(ValueError):
+        registry.get_data("january", start="2024-01-01")
+
+
+def test_registry_time_window_pushdown():
+    pytest.importorskip("pyarrow")
+    from sweet_validation.storage import ParquetStorage
+
+    directory = dir_tmp / "time_index_parquet"
+    shutil.rmtree(directory, ignore_errors=True)
+    registry = make_registry(ParquetStorage(directory))
+    registry.add_data("january", "generation", generation("2024-01-01", 31 * 24))
+    day = registry.get_data("january", start="2024-01-10", end="2024-01-11")
+    assert len(day) == 24
+    assert day["datetime"].min() == pd.Timestamp("2024-01-10")
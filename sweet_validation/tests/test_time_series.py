@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sweet_validation.metadata import series_group_fields, time_fields
+from sweet_validation.utils import read_schema_from_file
+from sweet_validation.validator import DefaultValidator
+from sweet_validation.validator.time_series import (
+    parse_frequency,
+    time_series_failures,
+)
+
+fn_schema = Path(__file__).parent / "data" / "example_generation.yaml"
+
+
+def generation(countries: list[str], periods: int) -> pd.DataFrame:
+    times = pd.date_range("2024-01-01", periods=periods, freq="h")
+    return pd.DataFrame(
+        {
+            "country": np.repeat(countries, periods),
+            "datetime": np.tile(times, len(countries)),
+            "value": 1.0,
+        }
+    )
+
+
+def test_metadata():
+    schema = read_schema_from_file(fn_schema)
+    assert time_fields(schema) == [("datetime", "hourly")]
+    # with a valueField, all other fields but the time form the series key
+    assert series_group_fields(schema) == ["country"]
+    schema.pop("valueField")
+    assert series_group_fields(schema) == ["country"]
+    schema.pop("locationFields")
+    assert series_group_fields(schema) == []
+
+
+def test_parse_frequency():
+    assert parse_frequency("hourly").n == 1
+    assert parse_frequency("15min").n == 15
+    assert parse_frequency("monthly") is not None
+    assert parse_frequency("sometimes") is None
+
+
+def test_valid_series():
+    schema = read_schema_from_file(fn_schema)
+    data = generation(["DE", "FR"], 48)
+    assert time_series_failures(data, schema) is None
+    assert DefaultValidator().validate(data, schema).valid
+
+
+def test_failures():
+    schema = read_schema_from_file(fn_schema)
+    data = generation(["DE", "FR"], 6)
+    # DE: hour 3 missing; FR: hour 3 replaced by a second hour 1
+    data = data.drop(index=3)
+    data.loc[9, "datetime"] = pd.Timestamp("2024-01-01 01:00")
+    cases = time_series_failures(data, schema)
+    counts = cases.groupby("check").size().to_dict()
+    assert counts == {
+        "frequency('hourly')": 2,
+        "monotonic_increasing": 1,
+        "unique_time": 2,
+    }
+    checks = cases.groupby("check")["index"].apply(sorted).to_dict()
+    # the rows after the missing hours fail the frequency check
+    assert checks["frequency('hourly')"] == [4, 10]
+    assert checks["monotonic_increasing"] == [9]
+    assert checks["unique_time"] == [7, 9]
+
+    report = DefaultValidator().validate(data, schema)
+    assert not report.valid
+    assert report.failure_counts[("datetime", "unique_time")] == 2
+    # the duplicated hour also duplicates the key implied by the valueField
+    validator = DefaultValidator(check_time_series=False)
+    assert set(validator.validate(data, schema).errors["datetime"]) == {
+        "key_uniqueness"
+    }
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Berlin"])
+def test_daylight_saving_time(tz: str | None):
+    schema = read_schema_from_file(fn_schema)
+    # hourly series across the change to summer time is regular in UTC
+    times = pd.date_range("2024-03-31", periods=6, freq="h", tz="UTC")
+    data = pd.DataFrame({"country": "DE", "datetime": times, "value": 1.0})
+    if tz is not None:
+        data["datetime"] = data["datetime"].dt.tz_convert(tz)
+    assert time_series_failures(data, schema) is None
@@ -4,7 +4,14 @@ from pathlib import Path
 import pytest
 import yaml
 
-from sweet_validation.utils import read_schema_from_file
+from sweet_validation.utils import (
+    FingerprintedSchema,
+    read_schema_from_file,
+    read_schemas_from_directory,
+    schema_fingerprint,
+)
+
+dir_tmp = Path(__file__).parent / "_tmp"
 
 
 def test_read_json():
@@ -36,3 +43,59 @@ def test_read_invalid():
     # file not found
     with pytest.raises(FileNotFoundError):
         read_schema_from_file(fn)
+
+
+def test_schema_fingerprint():
+    schema = {"name": "test", "fields": [{"name": "id", "type": "integer"}]}
+    reordered = {"fields": [{"type": "integer", "name": "id"}], "name": "test"}
+    assert schema_fingerprint(schema) == schema_fingerprint(reordered)
+    assert schema_fingerprint(schema) != schema_fingerprint({"name": "test"})
+    fingerprinted = FingerprintedSchema(schema)
+    assert fingerprinted == schema
+    assert fingerprinted.fingerprint == schema_fingerprint(schema)
+    # the stored fingerprint is used without serializing the schema again
+    assert schema_fingerprint(FingerprintedSchema(schema, "abc")) == "abc"
+
+
+def test_read_cached_returns_copies():
+    fn = dir_tmp / "cached.yaml"
+    with open(fn, "w") as f:
+        yaml.dump({"fields": [{"name": "a"}], "date": "2020-01-01"}, f)
+    first = read_schema_from_file(fn)
+    first["fields"].append({"name": "b"})
+    assert read_schema_from_file(fn)["fields"] == [{"name": "a"}]
+    # a changed file is parsed again
+    with open(fn, "w") as f:
+        yaml.dump({"fields": [{"name": "c"}, {"name": "d"}]}, f)
+    assert read_schema_from_file(fn) == {"fields": [{"name": "c"}, {"name": "d"}]}
+    # content that is not json serializable is copied as well
+    with open(fn, "w") as f:
+        f.write("date: 2020-01-01\nfields: []\n")
+    content = read_schema_from_file(fn)
+    content["fields"].append("x")
+    assert read_schema_from_file(fn)["fields"] == []
+    fn.unlink()
+
+
+def test_read_schemas_from_directory():
+    directory = dir_tmp / "schemas"
+    directory.mkdir(exist_ok=True)
+    for i in range(5):
+        with open(directory / f"schema{i}.yaml", "w") as f:
+            yaml.dump({"name": f"schema{i}"}, f)
+    with open(directory / "other.json", "w") as f:
+        json.dump({"name": "other"}, f)
+    (directory / "notes.txt").write_text("ignored")
+    schemas = read_schemas_from_directory(directory, max_workers=2)
+    assert sorted(schemas) == ["other"] + [f"schema{i}" for i in range(5)]
+    assert schemas["schema3"] == {"name": "schema3"}
+    # file names must be unique without suffix
+    with open(directory / "other.yaml", "w") as f:
+        yaml.dump({"name": "other"}, f)
+    with pytest.raises(ValueError):
+        read_schemas_from_directory(directory)
+    for f in directory.iterdir():
+        f.unlink()
+    directory.rmdir()
+    with pytest.raises(FileNotFoundError):
+        read_schemas_from_directory(directory)
@@ -0,0 +1,125 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from sweet_validation.exceptions import DataValidationError
+from sweet_validation.registry import InMemoryRegistry, ValidationCache
+from sweet_validation.schema_manager import SchemaManager
+from sweet_validation.utils import data_fingerprint
+from sweet_validation.validator import (
+    DefaultValidator,
+    DummyValidator,
+    ValidationReport,
+)
+
+from .schemas import valid_schema
+
+fn_cache = Path(__file__).parent / "_tmp" / "validation_cache.json"
+
+
+class CountingValidator(DefaultValidator):
+    calls: int = 0
+
+    def validate(self, data, schema):
+        self.calls += 1
+        return DefaultValidator.validate(data, schema)
+
+
+def test_data_fingerprint():
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    assert data_fingerprint(df) == data_fingerprint(df.copy())
+    assert data_fingerprint(df) != data_fingerprint(df.iloc[::-1])
+    assert data_fingerprint(df) != data_fingerprint(df.astype({"id": float}))
+    assert data_fingerprint(df) != data_fingerprint(df.rename(columns={"id": "x"}))
+    # values of object columns with the same string representation
+    mixed = pd.DataFrame({"a": [1, "a"]})
+    assert data_fingerprint(mixed) != data_fingerprint(pd.DataFrame({"a": ["1", "a"]}))
+    missing = pd.Series([1.0, None], dtype=object)
+    assert data_fingerprint(missing) != data_fingerprint(
+        pd.Series([1.0, float("nan")], dtype=object)
+    )
+    assert data_fingerprint(mixed) == data_fingerprint(mixed.copy())
+    # missing values of columns with a single inferred type
+    strings = pd.Series(["a", None])
+    assert data_fingerprint(strings) == data_fingerprint(strings.copy())
+    assert data_fingerprint(strings) != data_fingerprint(pd.Series(["a", pd.NA]))
+    assert data_fingerprint(pd.Series([None, None])) != data_fingerprint(
+        pd.Series([float("nan")] * 2, dtype=object)
+    )
+    # data that cannot be hashed
+    assert data_fingerprint("data") is None
+    assert data_fingerprint(pd.DataFrame({"a": [[1], [2]]})) is None
+
+
+def test_cache_bounded_and_stats():
+    cache = ValidationCache(maxsize=2)
+    report = ValidationReport(valid=True, errors={})
+    assert cache.get("d1", "s") is None
+    cache.put("d1", "s", report)
+    cache.put("d2", "s", report)
+    assert cache.get("d1", "s") == report
+    # d2 is the least recently used and is dropped
+    cache.put("d3", "s", report)
+    assert len(cache) == 2
+    assert cache.get("d2", "s") is None
+    assert cache.stats == {
+        "hits": 1,
+        "misses": 2,
+        "hit_rate": 1 / 3,
+        "size": 2,
+        "maxsize": 2,
+    }
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hit_rate == 0.0
+    with pytest.raises(ValueError):
+        ValidationCache(maxsize=0)
+
+
+def test_cache_persistence():
+    validator = DefaultValidator()
+    cache = ValidationCache(path=fn_cache, validator=validator)
+    report = ValidationReport(valid=False, errors={"a": "b"})
+    counts = ValidationReport.from_counts({("id", "dtype"): 2})
+    cache.put("d1", "s", report)
+    cache.put("d2", "s", counts)
+    cache.save()
+    # the file is only read on an explicit load
+    restored = ValidationCache(path=fn_cache, validator=DefaultValidator())
+    assert len(restored) == 0
+    restored.load()
+    assert restored.get("d1", "s") == report
+    assert restored.get("d2", "s") == counts
+    # reports of another validator or other settings are rejected
+    for other in [DummyValidator(), DefaultValidator(max_errors=10), None]:
+        with pytest.raises(ValueError, match="validator"):
+            ValidationCache(validator=other).load(fn_cache)
+    fn_cache.write_text("not json")
+    with pytest.raises(ValueError, match="not a validation cache"):
+        ValidationCache(validator=validator).load(fn_cache)
+    fn_cache.unlink()
+    with pytest.raises(ValueError):
+        ValidationCache().save()
+    with pytest.raises(ValueError):
+        ValidationCache().load()
+
+
+def test_registry_uses_cache():
+    validator = CountingValidator()
+    cache = ValidationCache()
+    registry = InMemoryRegistry(
+        validator=validator, schema_manager=SchemaManager(), validation_cache=cache
+    )
+    registry.add_schema("skey", valid_schema)
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+    registry.add_data("dkey", "skey", data=df)
+    registry.add_data("dkey2", "skey", data=df.copy())
+    assert validator.calls == 1
+    assert cache.hits == 1
+    # invalid reports are cached as well
+    df_invalid = pd.DataFrame({"id": ["a", "b"], "name": ["a", "b"]})
+    for _ in range(2):
+        with pytest.raises(DataValidationError):
+            registry.replace_data("dkey", df_invalid)
+    assert validator.calls == 2
@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 
+from sweet_validation.protocols import ValidatorProtocol
+from sweet_validation.utils import FingerprintedSchema
 from sweet_validation.validator import (
     DefaultValidator,
     DummyValidator,
@@ -82,3 +85,91 @@ def test_default_validator_invalid():
     assert not report.valid
     assert report.errors
     assert not DefaultValidator.is_valid(df_invalid, schema)
+
+
+def test_default_validator_caches_compiled_schema():
+    schema = FingerprintedSchema(FRICTIONLESS_SCHEMA)
+    compiled = DefaultValidator._compile(schema)
+    assert DefaultValidator._compile(schema) is compiled
+    # schemas with identical content share the compiled schema
+    assert DefaultValidator._compile(dict(FRICTIONLESS_SCHEMA)) is compiled
+
+
+def test_default_validator_compact_report():
+    df_invalid = pd.DataFrame(
+        {
+            "column_1": [10, 20, 30, 5, 50, 999],
+            "column_2": ["a", "b", "c", "d", "e", "thisistoolong"],
+            "column_3": [1, 2, 3, 4, 5, 6],
+        }
+    )
+    report = DefaultValidator.validate(df_invalid, FRICTIONLESS_SCHEMA)
+    assert report.failure_counts == {
+        (None, "column_in_schema"): 1,
+        ("column_1", "in_range(10, 99)"): 2,
+        ("column_2", "str_length(None, 10)"): 1,
+    }
+    assert report.errors["column_1"] == {"in_range(10, 99)": 2}
+    np.testing.assert_array_equal(report.failing_rows, [3, 5])
+    assert len(report.failure_cases) == 4
+    assert not report.truncated
+    assert report.to_dict()["n_failing_rows"] == 2
+    assert "column_1: in_range(10, 99): 2" in report.summary()
+
+
+def test_default_validator_bounded_errors():
+    n = 1000
+    df = pd.DataFrame(
+        {
+            "column_1": np.where(np.arange(n) % 2 == 0, 5, np.arange(n) + 10),
+            "column_2": ["a"] * n,
+        }
+    )
+    full = DefaultValidator.validate(df, FRICTIONLESS_SCHEMA)
+    assert full.failure_counts == {
+        ("column_1", "field_uniqueness"): 500,  # primary key
+        ("column_1", "in_range(10, 99)"): 955,
+    }
+    # chunked validation without reaching the cap gives the same counts and
+    # detects duplicates across chunks
+    validator = DefaultValidator(max_errors=10_000, chunk_size=100)
+    chunked = validator.validate(df, FRICTIONLESS_SCHEMA)
+    assert chunked.failure_counts == full.failure_counts
+    np.testing.assert_array_equal(chunked.failing_rows, full.failing_rows)
+    # the validation stops after the chunk that reaches the cap
+    validator = DefaultValidator(max_errors=10, chunk_size=100, max_failure_cases=5)
+    bounded = validator.validate(df, FRICTIONLESS_SCHEMA)
+    assert not bounded.valid
+    assert bounded.truncated
+    assert bounded.n_failures < full.n_failures
+    assert len(bounded.failing_rows) <= 100
+    assert len(bounded.failure_cases) == 5
+    assert not validator.is_valid(df, FRICTIONLESS_SCHEMA)
+
+
+def test_default_validator_hybrid_methods():
+    df = pd.DataFrame({"column_1": [5, 20], "column_2": ["a", "b"]})
+    validator = DefaultValidator(max_errors=1)
+    assert isinstance(validator, ValidatorProtocol)
+    assert DefaultValidator.validate.__doc__ == validator.validate.__doc__
+    # the class uses the default settings
+    assert not DefaultValidator.validate(df, FRICTIONLESS_SCHEMA).truncated
+    assert DefaultValidator.__dict__["validate"](df, FRICTIONLESS_SCHEMA) == (
+        DefaultValidator.validate(df, FRICTIONLESS_SCHEMA)
+    )
+    assert not DefaultValidator.is_valid(df, FRICTIONLESS_SCHEMA)
+    assert not validator.is_valid(df, FRICTIONLESS_SCHEMA)
+
+
+def test_validation_error_uses_summary():
+    from sweet_validation.exceptions import DataValidationError
+
+    report = ValidationReport(
+        valid=False,
+        errors={"column_1": {"in_range": 10**6}},
+        failure_counts={("column_1", "in_range"): 10**6},
+        failing_rows=np.arange(10**6),
+    )
+    message = str(DataValidationError("msg", report=report))
+    assert message.startswith("msg\ncolumn_1: in_range: 1000000")
+    assert len(message) < 200
@@ -1,15 +1,46 @@
+import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from pathlib import Path
 from typing import Any, cast
 
-import yaml  # type: ignore
+# parsed schema files keyed by path, modification time and size. Contents are
+# kept as json text (or as object if not json serializable) so that every call
+# returns a fresh copy that callers may modify.
+_file_cache: OrderedDict[tuple[str, int, int], tuple[str | None, Any]] = OrderedDict()
+_file_cache_maxsize = 256
+_file_cache_lock = threading.Lock()
 
+SCHEMA_FILE_SUFFIXES = (".json", ".yaml", ".yml")
+DATA_SUFFIXES = (".csv", ".parquet")
 
-def read_schema_from_file(file: str | Path | dict[str, Any]) -> dict[str, Any]:
+
+def _parse_schema_file(file: Path) -> Any:
+    """Parse a json or yaml file, using the libyaml loader if available"""
+    with open(file, "rb") as f:
+        if file.suffix == ".json":
+            return json.load(f)
+        import yaml  # type: ignore
+
+        return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def read_schema_from_file(
+    file: str | Path | dict[str, Any], cache: bool = True
+) -> dict[str, Any]:
     """Read a file in either json or yaml format
 
+    Parsed files are cached by path, modification time and size, so that reading
+    an unchanged file again does not parse it. Each call returns a new object.
+    YAML files are parsed with the libyaml loader if available.
+
     Args:
         file (str | Path): File path
+        cache (bool, optional): Whether to use the parse cache. Defaults to True.
 
     Returns:
         dict: File contents
@@ -21,12 +52,222 @@ def read_schema_from_file(file: str | Path | dict[str, Any]) -> dict[str, Any]:
     if isinstance(file, dict):
         return file
     file = Path(file)
-    with open(file) as f:
-        if file.suffix == ".json":
-            return cast(dict[str, Any], json.load(f))
-        elif file.suffix in [".yaml", ".yml"]:
-            return cast(dict[str, Any], yaml.safe_load(f))
-        else:
-            raise ValueError(
-                f"File {file} is not json or yaml. Use .json, .yaml, or .yml"
-            )
+    stat = os.stat(file)
+    if file.suffix not in SCHEMA_FILE_SUFFIXES:
+        raise ValueError(f"File {file} is not json or yaml. Use .json, .yaml, or .yml")
+    if not cache:
+        return cast(dict[str, Any], _parse_schema_file(file))
+    key = (str(file.resolve()), stat.st_mtime_ns, stat.st_size)
+    with _file_cache_lock:
+        entry = _file_cache.get(key)
+        if entry is not None:
+            _file_cache.move_to_end(key)
+    if entry is None:
+        content = _parse_schema_file(file)
+        try:
+            entry = (json.dumps(content), None)
+        except (TypeError, ValueError):  # e.g. dates in yaml
+            entry = (None, content)
+        with _file_cache_lock:
+            _file_cache[key] = entry
+            if len(_file_cache) > _file_cache_maxsize:
+                _file_cache.popitem(last=False)
+    text, content = entry
+    if text is not None:
+        return cast(dict[str, Any], json.loads(text))
+    return cast(dict[str, Any], deepcopy(content))
+
+
+def read_schemas_from_directory(
+    directory: str | Path, max_workers: int | None = None
+) -> dict[str, dict[str, Any]]:
+    """Read all json and yaml files of a directory in parallel
+
+    Args:
+        directory (str | Path): Directory with schema files
+        max_workers (int | None, optional): Number of threads. Defaults to None
+            which uses the default of ThreadPoolExecutor.
+
+    Returns:
+        dict[str, dict[str, Any]]: File contents by file name without suffix
+
+    Raises:
+        ValueError: If several files have the same name without suffix
+        FileNotFoundError: If the directory is not found
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        raise FileNotFoundError(f"Directory {directory} not found")
+    files = sorted(f for f in directory.iterdir() if f.suffix in SCHEMA_FILE_SUFFIXES)
+    stems = [f.stem for f in files]
+    duplicates = sorted({s for s in stems if stems.count(s) > 1})
+    if duplicates:
+        raise ValueError(f"Several schema files with the same name: {duplicates}")
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        contents = list(pool.map(read_schema_from_file, files))
+    return dict(zip(stems, contents, strict=True))
+
+
+def clear_schema_file_cache() -> None:
+    """Remove all parsed schema files from the cache"""
+    with _file_cache_lock:
+        _file_cache.clear()
+
+
+def read_data_file(path: str | Path, schema: dict[str, Any] | None = None) -> Any:
+    """Read a csv or parquet file into a pandas dataframe
+
+    If the schema is known, csv files are parsed into the data types of its
+    fields with `read_csv_with_schema` instead of inferring them.
+
+    Args:
+        path (str | Path): File path
+        schema (dict[str, Any] | None, optional): Frictionless schema of the
+            data. Defaults to None.
+
+    Returns:
+        pd.DataFrame: Data
+
+    Raises:
+        ValueError: If the file is neither csv nor parquet
+        DataValidationError: If values of the csv file cannot be parsed into
+            the types of their fields or fields are missing. The report lists
+            the parse errors.
+    """
+    import pandas as pd
+
+    path = Path(path)
+    if path.suffix == ".csv" and schema is not None:
+        from .exceptions import DataValidationError
+        from .validator.csv_reader import read_csv_with_schema
+
+        data, report = read_csv_with_schema(path, schema)
+        if not report.valid:
+            raise DataValidationError(f"Cannot parse {path}", report=report)
+        return data
+    if path.suffix == ".csv":
+        return pd.read_csv(path)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    raise ValueError(f"File {path} is not csv or parquet. Use .csv or .parquet")
+
+
+def canonical_json(schema: dict[str, Any]) -> str:
+    """Serialize a schema to its canonical json representation
+
+    The canonical form sorts keys and removes insignificant whitespace, so that
+    schemas with the same content always yield the same string.
+
+    Args:
+        schema (dict[str, Any]): Schema to serialize
+
+    Returns:
+        str: Canonical json string
+    """
+    return json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def schema_fingerprint(schema: dict[str, Any]) -> str:
+    """Return the content hash of a schema
+
+    If the schema is a FingerprintedSchema, the stored fingerprint is returned
+    without serializing the schema again.
+
+    Args:
+        schema (dict[str, Any]): Schema
+
+    Returns:
+        str: Hex encoded sha256 hash of the canonical json representation
+    """
+    fingerprint = getattr(schema, "fingerprint", None)
+    if fingerprint is not None:
+        return cast(str, fingerprint)
+    return hashlib.sha256(canonical_json(schema).encode("utf-8")).hexdigest()
+
+
+class FingerprintedSchema(dict[str, Any]):
+    """A schema dictionary that carries the hash of its content
+
+    The fingerprint is computed once on creation and can be used as cache key,
+    e.g., for compiled validation schemas. Note that the fingerprint is not
+    updated if the dictionary is modified afterwards.
+    """
+
+    fingerprint: str
+
+    def __init__(self, schema: dict[str, Any], fingerprint: str | None = None):
+        super().__init__(schema)
+        self.fingerprint = fingerprint or schema_fingerprint(schema)
+
+
+def data_fingerprint(data: Any) -> str | None:
+    """Return the content hash of a data item
+
+    Pandas dataframes and series are hashed row-wise using the vectorized
+    `pd.util.hash_pandas_object` including the index. Column names and dtypes are
+    part of the hash. Since `hash_pandas_object` hashes object columns by their
+    string representation and all missing values alike, the type inferred by
+    `pd.api.types.infer_dtype` is hashed per object column, e.g., 1 and "1" yield
+    different hashes. Only columns of mixed types and missing values, e.g., None
+    and NaN, are tagged with the type of each value.
+
+    Args:
+        data (Any): Data item
+
+    Returns:
+        str | None: Hex encoded sha256 hash or None if the data cannot be hashed
+    """
+    import numpy as np
+    import pandas as pd
+
+    if not isinstance(data, pd.DataFrame | pd.Series):
+        return None
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    n_columns = frame.shape[1]
+    hashed = frame.set_axis(range(n_columns), axis=1)
+    inferred: list[str | None] = []
+    for i, dtype in enumerate(frame.dtypes):
+        if dtype.kind != "O":
+            inferred.append(None)
+            continue
+        values = frame.iloc[:, i].to_numpy()
+        inferred_type = pd.api.types.infer_dtype(values, skipna=True)
+        inferred.append(inferred_type)
+        if inferred_type.startswith("mixed"):
+            hashed[n_columns + i] = [type(value).__qualname__ for value in values]
+            continue
+        missing = pd.isna(values)
+        if missing.any():
+            tags = np.full(len(values), "", dtype=object)
+            tags[missing] = [type(value).__qualname__ for value in values[missing]]
+            hashed[n_columns + i] = tags
+    try:
+        row_hashes = pd.util.hash_pandas_object(hashed, index=True)
+    except TypeError:  # unhashable values like lists or dicts
+        return None
+    if isinstance(data, pd.DataFrame):
+        header = [(str(c), str(t)) for c, t in data.dtypes.items()]
+    else:
+        header = [(str(data.name), str(data.dtype))]
+    digest = hashlib.sha256(repr((header, inferred)).encode("utf-8"))
+    digest.update(row_hashes.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def data_size(data: Any) -> tuple[int | None, int | None]:
+    """Return the number of rows and the memory size of a data item
+
+    Args:
+        data (Any): Data item
+
+    Returns:
+        tuple[int | None, int | None]: Number of rows and size in bytes. None if
+            the size cannot be determined for the type of data.
+    """
+    import pandas as pd
+
+    if isinstance(data, pd.DataFrame):
+        return len(data), int(data.memory_usage(index=True, deep=True).sum())
+    if isinstance(data, pd.Series):
+        return len(data), int(data.memory_usage(index=True, deep=True))
+    return None, None
@@ -1,5 +1,35 @@
-from .default import DefaultValidator
-from .dummy import DummyValidator
-from .validation_report import ValidationReport
+from typing import TYPE_CHECKING
 
-__all__ = ["DummyValidator", "DefaultValidator", "ValidationReport"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .arrow_validator import ArrowValidator
+    from .csv_reader import read_csv_with_schema
+    from .default import DefaultValidator
+    from .dummy import DummyValidator
+    from .parquet_validator import ParquetValidator
+    from .polars_validator import PolarsValidator
+    from .validation_report import ValidationReport
+
+__all__ = [
+    "ArrowValidator",
+    "DummyValidator",
+    "DefaultValidator",
+    "ParquetValidator",
+    "PolarsValidator",
+    "ValidationReport",
+    "read_csv_with_schema",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ArrowValidator": ".arrow_validator",
+        "DefaultValidator": ".default",
+        "DummyValidator": ".dummy",
+        "ParquetValidator": ".parquet_validator",
+        "PolarsValidator": ".polars_validator",
+        "ValidationReport": ".validation_report",
+        "read_csv_with_schema": ".csv_reader",
+    },
+)
@@ -0,0 +1,441 @@
+import os
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "The ArrowValidator requires pyarrow. Install it with "
+        "`pip install sweet_validation[arrow]`."
+    ) from e
+
+import numpy as np
+import pandas as pd
+
+from .rules import FieldRule, SchemaRules, compile_rules
+from .validation_report import ValidationReport
+
+__all__ = ["ArrowValidator"]
+
+# failure mask of a check given the column of a record batch
+Check = Callable[[pa.Array], pa.Array]
+# check of a field as tuple of the field's rule, the check name and the mask
+_Check = tuple[FieldRule, str, Check]
+
+_ROW = "__row__"
+
+
+def _type_matches(field_type: str, dtype: pa.DataType) -> bool:
+    """Check if an Arrow data type can hold a frictionless type"""
+    if pa.types.is_dictionary(dtype):
+        dtype = dtype.value_type
+    if pa.types.is_null(dtype):  # all values missing
+        return True
+    if field_type in ("integer", "year"):
+        return bool(pa.types.is_integer(dtype))
+    if field_type == "number":
+        return bool(
+            pa.types.is_integer(dtype)
+            or pa.types.is_floating(dtype)
+            or pa.types.is_decimal(dtype)
+        )
+    if field_type == "string":
+        return bool(pa.types.is_string(dtype) or pa.types.is_large_string(dtype))
+    if field_type == "boolean":
+        return bool(pa.types.is_boolean(dtype))
+    if field_type == "date":
+        return bool(pa.types.is_date(dtype))
+    if field_type == "datetime":
+        return bool(pa.types.is_timestamp(dtype))
+    if field_type == "time":
+        return bool(pa.types.is_time(dtype))
+    if field_type == "duration":
+        return bool(pa.types.is_duration(dtype))
+    return True  # any, object, array, geopoint, ... are not checked
+
+
+def _decoded(array: pa.Array) -> pa.Array:
+    if pa.types.is_dictionary(array.type):
+        return array.dictionary_decode()
+    return array
+
+
+def _field_checks(rule: FieldRule, dtype: pa.DataType) -> list[tuple[str, Check]]:
+    """Failure masks of the row level constraints of a field
+
+    Uniqueness is not row level and handled separately. Null values only fail
+    the not_nullable check.
+    """
+    value_type = dtype.value_type if pa.types.is_dictionary(dtype) else dtype
+    checks: list[tuple[str, Check]] = []
+    if rule.required:
+        checks.append(("not_nullable", lambda a: a.is_null()))
+    if rule.range_check is not None:
+        temporal = pa.types.is_temporal(value_type)
+        lower = pa.scalar(rule.minimum, value_type if temporal else None)
+        upper = pa.scalar(rule.maximum, value_type if temporal else None)
+
+        def out_of_range(a: pa.Array) -> pa.Array:
+            a = _decoded(a)
+            mask = pa.array(np.zeros(len(a), dtype=bool))
+            if rule.minimum is not None:
+                mask = pc.or_(mask, pc.less(a, lower))
+            if rule.maximum is not None:
+                mask = pc.or_(mask, pc.greater(a, upper))
+            return mask
+
+        checks.append((rule.range_check, out_of_range))
+    if rule.length_check is not None:
+
+        def wrong_length(a: pa.Array) -> pa.Array:
+            length = pc.utf8_length(_decoded(a))
+            mask = pa.array(np.zeros(len(a), dtype=bool))
+            if rule.min_length is not None:
+                mask = pc.or_(mask, pc.less(length, rule.min_length))
+            if rule.max_length is not None:
+                mask = pc.or_(mask, pc.greater(length, rule.max_length))
+            return mask
+
+        checks.append((rule.length_check, wrong_length))
+    if rule.pattern_check is not None:
+        pattern = rule.full_pattern
+        checks.append(
+            (
+                rule.pattern_check,
+                lambda a: pc.invert(pc.match_substring_regex(_decoded(a), pattern)),
+            )
+        )
+    if rule.enum_check is not None:
+        values = pa.array(rule.enum)
+        if values.type != value_type:
+            values = values.cast(value_type)
+        checks.append(
+            (
+                rule.enum_check,
+                lambda a: pc.invert(pc.is_in(_decoded(a), value_set=values)),
+            )
+        )
+    return checks
+
+
+class _BatchResult:
+    """Failures found in one record batch"""
+
+    __slots__ = ("counts", "rows", "cases")
+
+    def __init__(self) -> None:
+        self.counts: dict[tuple[str, str], int] = {}
+        self.rows: np.ndarray[Any, Any] = np.array([], dtype=np.int64)
+        self.cases: list[pd.DataFrame] = []
+
+
+class ArrowValidator:
+    """The ArrowValidator checks Arrow tables and record batches against a
+    frictionless schema using the vectorized kernels of `pyarrow.compute`.
+
+    Data types are checked against the Arrow schema, value constraints are
+    evaluated batch by batch. Record batch readers are consumed incrementally,
+    so only a few batches are held in memory at once, and batches are checked on
+    a thread pool since the Arrow kernels release the GIL. Uniqueness is checked
+    at the end on the unique columns only.
+
+    If `max_errors` is set, reading stops once `max_errors` failures have been
+    found and the report is marked as truncated.
+
+    Example:
+
+        .. code-block:: python
+        validator = ArrowValidator(batch_size=65_536)
+        report = validator.validate(pyarrow.parquet.read_table("data.parquet"), schema)
+        # or without loading the whole file
+        reader = pyarrow.parquet.ParquetFile("data.parquet").iter_batches()
+        report = validator.validate(reader, schema)
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 65_536,
+        max_errors: int | None = None,
+        max_failure_cases: int = 1000,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize the validator
+
+        Args:
+            batch_size (int, optional): Number of rows per batch if a table is
+                validated. Defaults to 65_536.
+            max_errors (int | None, optional): Number of failures after which the
+                validation stops. Defaults to None which checks all data.
+            max_failure_cases (int, optional): Maximum number of failure cases
+                kept as sample in the report. Defaults to 1000.
+            max_workers (int | None, optional): Number of threads checking
+                batches. Defaults to None which uses the default of
+                ThreadPoolExecutor.
+        """
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.max_failure_cases = max_failure_cases
+        self.max_workers = max_workers
+
+    def validate(
+        self, data: Any, schema: dict[str, Any], max_errors: int | None = None
+    ) -> ValidationReport:
+        """Validate Arrow data against a frictionless schema
+
+        Args:
+            data (pa.Table | pa.RecordBatch | pa.RecordBatchReader | Iterator):
+                Data to validate. Iterators of record batches, e.g., from
+                `ParquetFile.iter_batches`, are accepted as well.
+            schema (dict[str, Any]): Frictionless schema
+            max_errors (int | None, optional): Number of failures after which the
+                validation stops. Defaults to None which uses the setting of the
+                validator.
+
+        Returns:
+            ValidationReport: Validation report. Failing rows are row positions.
+
+        Raises:
+            TypeError: If the data is not Arrow data
+        """
+        max_errors = max_errors if max_errors is not None else self.max_errors
+        arrow_schema, batches = self._batches(data)
+        counts, checks, unique = self._plan(arrow_schema, compile_rules(schema))
+        unique_columns = sorted({c for columns, _ in unique for c in columns})
+        unique_batches: list[pa.RecordBatch] = []
+
+        def work() -> Iterator[tuple[pa.RecordBatch, list[_Check], int]]:
+            offset = 0
+            for batch in batches:
+                if unique_columns:
+                    unique_batches.append(batch.select(unique_columns))
+                yield batch, checks, offset
+                offset += batch.num_rows
+
+        def unique_table() -> pa.Table | None:
+            return pa.Table.from_batches(unique_batches) if unique_batches else None
+
+        return self._collect(counts, work(), unique, unique_table, max_errors)
+
+    def is_valid(self, data: Any, schema: dict[str, Any]) -> bool:
+        """Check if Arrow data is valid against a frictionless schema
+
+        Args:
+            data (pa.Table | pa.RecordBatch | pa.RecordBatchReader | Iterator):
+                Data to validate
+            schema (dict[str, Any]): Frictionless schema
+
+        Returns:
+            bool: True if the data is valid, False otherwise
+        """
+        # the first failure decides, so stop reading early
+        return self.validate(data, schema, max_errors=1).valid
+
+    @staticmethod
+    def _plan(
+        arrow_schema: pa.Schema, rules: SchemaRules
+    ) -> tuple[
+        dict[tuple[str | None, str], int], list[_Check], list[tuple[list[str], str]]
+    ]:
+        """Compare the Arrow schema with the rules and compile the checks
+
+        Args:
+            arrow_schema (pa.Schema): Schema of the data
+            rules (SchemaRules): Rules of the frictionless schema
+
+        Returns:
+            tuple: Counts of the structural failures, row level checks as tuples
+                of rule, check name and failure mask function, and uniqueness
+                constraints as tuples of columns and check name
+        """
+        counts: dict[tuple[str | None, str], int] = {}
+        for column in arrow_schema.names:
+            if column not in rules.names:
+                counts[(column, "column_in_schema")] = 1
+        checks: list[_Check] = []
+        checked = set()
+        for rule in rules.fields:
+            if rule.name not in arrow_schema.names:
+                counts[(rule.name, "column_in_dataframe")] = 1
+                continue
+            dtype = arrow_schema.field(rule.name).type
+            if not _type_matches(rule.type, dtype):
+                counts[(rule.name, rule.dtype_check)] = 1
+                continue
+            checked.add(rule.name)
+            checks += [(rule, c, f) for c, f in _field_checks(rule, dtype)]
+        unique = [([r.name], "field_uniqueness") for r in rules.fields if r.unique]
+        if rules.primary_key:
+            unique.append((rules.primary_key, "multiple_fields_uniqueness"))
+        unique = [(c, check) for c, check in unique if set(c) <= checked]
+        return counts, checks, unique
+
+    def _collect(
+        self,
+        counts: dict[tuple[str | None, str], int],
+        work: Iterator[tuple[pa.RecordBatch, list[_Check], int]],
+        unique: list[tuple[list[str], str]],
+        unique_table: Callable[[], pa.Table | None],
+        max_errors: int | None,
+    ) -> ValidationReport:
+        """Check batches, then uniqueness, and create the report
+
+        Args:
+            counts (dict[tuple[str | None, str], int]): Structural failures
+            work (Iterator[tuple[pa.RecordBatch, list[_Check], int]]): Batches
+                with the checks to apply and the position of their first row
+            unique (list[tuple[list[str], str]]): Uniqueness constraints
+            unique_table (Callable[[], pa.Table | None]): Returns the columns of
+                the uniqueness constraints for all rows once the batches are
+                checked
+            max_errors (int | None): Number of failures after which the
+                validation stops
+
+        Returns:
+            ValidationReport: Validation report
+        """
+        rows: list[np.ndarray[Any, Any]] = []
+        cases: list[pd.DataFrame] = []
+        n_cases = 0
+        truncated = False
+        for result in self._check_batches(work):
+            for key, count in result.counts.items():
+                counts[key] = counts.get(key, 0) + count
+            rows.append(result.rows)
+            for sample in result.cases:
+                if n_cases < self.max_failure_cases:
+                    sample = sample.head(self.max_failure_cases - n_cases)
+                    cases.append(sample)
+                    n_cases += len(sample)
+            if max_errors is not None and sum(counts.values()) >= max_errors:
+                truncated = True
+                break
+        table = unique_table() if unique else None
+        if table is not None:
+            for columns, check in unique:
+                positions = self._duplicated(table, columns)
+                if not len(positions):
+                    continue
+                rows.append(positions)
+                for column in columns:
+                    counts[(column, check)] = len(positions)
+                    if n_cases < self.max_failure_cases:
+                        sample = self._cases(
+                            table.column(column).take(positions),
+                            positions,
+                            column,
+                            check,
+                            self.max_failure_cases - n_cases,
+                        )
+                        cases.append(sample)
+                        n_cases += len(sample)
+        failing_rows = (
+            np.unique(np.concatenate(rows)) if rows else np.array([], dtype=np.int64)
+        )
+        return ValidationReport.from_counts(
+            counts,
+            failing_rows=failing_rows.astype(np.int64),
+            failure_cases=pd.concat(cases, ignore_index=True) if cases else None,
+            truncated=truncated,
+        )
+
+    def _batches(self, data: Any) -> tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+        """Arrow schema and record batches of the data"""
+        if isinstance(data, pa.Table):
+            return data.schema, iter(data.to_batches(max_chunksize=self.batch_size))
+        if isinstance(data, pa.RecordBatch):
+            return data.schema, iter([data])
+        if isinstance(data, pa.RecordBatchReader):
+            return data.schema, iter(data)
+        if isinstance(data, Iterator):
+            try:
+                first = next(data)
+            except StopIteration:
+                return pa.schema([]), iter([])
+            if not isinstance(first, pa.RecordBatch):
+                raise TypeError(f"Expected record batches, got {type(first)}")
+
+            def chain() -> Iterator[pa.RecordBatch]:
+                yield first
+                yield from data
+
+            return first.schema, chain()
+        raise TypeError(f"Expected Arrow data, got {type(data)}")
+
+    def _check_batches(
+        self, work: Iterator[tuple[pa.RecordBatch, list[_Check], int]]
+    ) -> Iterator[_BatchResult]:
+        """Check batches on a thread pool and yield the results in order
+
+        At most two batches per thread are read ahead, which bounds the memory.
+        """
+        workers = self.max_workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending: deque[Future[_BatchResult]] = deque()
+            for batch, checks, offset in work:
+                pending.append(pool.submit(self._check_batch, batch, checks, offset))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _check_batch(
+        self, batch: pa.RecordBatch, checks: list[_Check], offset: int
+    ) -> _BatchResult:
+        result = _BatchResult()
+        failing = None
+        for rule, check, func in checks:
+            column = rule.name
+            mask = func(batch.column(column)).fill_null(False)
+            count = pc.sum(mask).as_py() or 0
+            if not count:
+                continue
+            result.counts[(column, check)] = count
+            failing = mask if failing is None else pc.or_(failing, mask)
+            positions = pc.indices_nonzero(mask)
+            head = positions[: self.max_failure_cases]
+            result.cases.append(
+                self._cases(
+                    batch.column(column).take(head),
+                    head.to_numpy().astype(np.int64) + offset,
+                    column,
+                    check,
+                    self.max_failure_cases,
+                )
+            )
+        if failing is not None:
+            result.rows = (
+                pc.indices_nonzero(failing).to_numpy().astype(np.int64) + offset
+            )
+        return result
+
+    @staticmethod
+    def _duplicated(table: pa.Table, columns: list[str]) -> np.ndarray[Any, Any]:
+        """Sorted positions of the rows whose values in columns occur repeatedly"""
+        keys = table.select(columns)
+        keys = keys.append_column(_ROW, pa.array(np.arange(len(keys))))
+        counts = keys.group_by(columns).aggregate([(_ROW, "count")])
+        repeated = counts.filter(pc.greater(counts[f"{_ROW}_count"], 1))
+        if not len(repeated):
+            return np.array([], dtype=np.int64)
+        rows = keys.join(repeated.select(columns), keys=columns, join_type="inner")[
+            _ROW
+        ]
+        return np.sort(rows.to_numpy())
+
+    @staticmethod
+    def _cases(
+        values: Any, positions: Any, column: str, check: str, limit: int
+    ) -> pd.DataFrame:
+        values = values[:limit].to_pylist()
+        return pd.DataFrame(
+            {
+                "column": column,
+                "check": check,
+                "failure_case": [None if v is None else str(v) for v in values],
+                "index": np.asarray(positions)[:limit],
+            }
+        )
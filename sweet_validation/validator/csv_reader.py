@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .rules import FieldRule, compile_rules
+from .validation_report import ValidationReport
+
+__all__ = ["read_csv_with_schema"]
+
+# pandas data types matching the data types pandera derives from frictionless
+# types, so that validation does not need to coerce the columns again. Integer
+# columns are parsed as nullable types first and converted to numpy types if
+# they have no missing values.
+_DTYPES = {
+    "integer": "Int64",
+    "year": "Int64",
+    "number": "float64",
+}
+# types parsed column by column after reading. Dates and times become
+# datetime.date and datetime.time objects as with pd.read_parquet, booleans use
+# the true and false values of their own field.
+_PARSED_TYPES = ("boolean", "datetime", "date", "time")
+# frictionless defaults for boolean fields
+_TRUE_VALUES = ["true", "True", "TRUE", "1"]
+_FALSE_VALUES = ["false", "False", "FALSE", "0"]
+_NUMPY_DTYPES = {"Int64": "int64", "boolean": "bool"}
+# formats of the frictionless "default" format
+_DEFAULT_FORMATS = {"datetime": "ISO8601", "date": "%Y-%m-%d", "time": "%H:%M:%S"}
+
+
+def _datetime_format(field: dict[str, Any]) -> str | None:
+    """Format passed to pd.to_datetime for a datetime, date or time field"""
+    fmt = field.get("format", "default")
+    if fmt == "default":
+        return _DEFAULT_FORMATS[field["type"]]
+    if fmt == "any":
+        return None
+    return str(fmt)
+
+
+def _parse(
+    values: pd.Series[Any], rule: FieldRule, field: dict[str, Any]
+) -> tuple[pd.Series[Any], pd.Series[bool]]:
+    """Parse a string column into the data type of its field
+
+    Args:
+        values (pd.Series): Column as read from the file with string data type
+        rule (FieldRule): Rule of the field
+        field (dict[str, Any]): Frictionless field
+
+    Returns:
+        tuple[pd.Series, pd.Series]: Parsed column and mask of the values that
+            could not be parsed
+    """
+    parsed: pd.Series[Any]
+    if rule.type in ("integer", "year"):
+        numbers = pd.to_numeric(values, errors="coerce").astype("Float64")
+        integral = numbers.isna() | (numbers % 1 == 0)
+        parsed = numbers.where(integral.fillna(True)).astype("Int64")
+    elif rule.type == "number":
+        parsed = pd.to_numeric(values, errors="coerce").astype("float64")
+    elif rule.type == "boolean":
+        lookup = dict.fromkeys(field.get("trueValues", _TRUE_VALUES), True)
+        lookup.update(dict.fromkeys(field.get("falseValues", _FALSE_VALUES), False))
+        parsed = values.map(lookup).astype("boolean")
+    elif rule.type in ("datetime", "date", "time"):
+        times = pd.to_datetime(values, format=_datetime_format(field), errors="coerce")
+        if rule.type == "datetime":
+            parsed = times
+        else:
+            parts = times.dt.date if rule.type == "date" else times.dt.time
+            parsed = parts.astype(object).where(times.notna(), None)
+    else:
+        return values, pd.Series(False, index=values.index)
+    return parsed, values.notna() & parsed.isna()
+
+
+def read_csv_with_schema(
+    path: str | Path,
+    schema: dict[str, Any],
+    engine: str = "c",
+    max_failure_cases: int = 1000,
+    **kwargs: Any,
+) -> tuple[pd.DataFrame, ValidationReport]:
+    """Read a csv file into columns typed by a frictionless schema
+
+    `pd.read_csv` infers the data types of the columns, which creates object
+    columns that the DefaultValidator coerces in a second pass. This reader
+    derives the data types, the missing values, the boolean values, the
+    datetime formats and the columns to read from the schema instead, so that
+    the file is parsed directly into the data types the validator expects.
+    Dates and times are parsed into datetime.date and datetime.time objects,
+    and each boolean field uses its own `trueValues` and `falseValues`.
+
+    Values that cannot be parsed into the type of their field are set to
+    missing and reported with the check `dtype('<type>')`. Fields missing in
+    the file are reported with `column_in_dataframe` and columns not in the
+    schema with `column_in_schema`; such columns are not read. Only parse
+    errors are reported, the constraints of the schema are left to the
+    validator.
+
+    Example:
+
+        .. code-block:: python
+        data, report = read_csv_with_schema("generation.csv", schema)
+        if report.valid:
+            registry.add_data("generation", "generation", data)
+
+    Args:
+        path (str | Path): Path of the csv file
+        schema (dict[str, Any]): Frictionless schema
+        engine (str, optional): Parser engine of pd.read_csv, e.g., "pyarrow" for
+            the multithreaded pyarrow csv parser. Defaults to "c".
+        max_failure_cases (int, optional): Maximum number of failure cases kept
+            as sample in the report. Defaults to 1000.
+        **kwargs: Further arguments passed to pd.read_csv, e.g., sep
+
+    Returns:
+        tuple[pd.DataFrame, ValidationReport]: Data and report of the parse
+            errors. Failing rows are row positions.
+    """
+    rules = compile_rules(schema)
+    fields = {field["name"]: field for field in schema.get("fields", [])}
+    header = pd.read_csv(path, nrows=0, **kwargs).columns
+    counts: dict[tuple[str | None, str], int] = {}
+    for column in header:
+        if column not in fields:
+            counts[(column, "column_in_schema")] = 1
+    present = [rule for rule in rules.fields if rule.name in header]
+    for rule in rules.fields:
+        if rule.name not in header:
+            counts[(rule.name, "column_in_dataframe")] = 1
+
+    options = {
+        "usecols": [rule.name for rule in present],
+        "na_values": schema.get("missingValues", [""]),
+        "keep_default_na": False,
+        "engine": engine,
+        **kwargs,
+    }
+    typed = {rule.name: _DTYPES.get(rule.type, "string") for rule in present}
+    # parsed after reading to count unparsable values
+    parse = [rule for rule in present if rule.type in _PARSED_TYPES]
+    try:
+        data = pd.read_csv(path, dtype=typed, **options)
+    except (ValueError, TypeError):
+        # some value does not parse, read the typed columns as strings and parse
+        # them column by column
+        data = pd.read_csv(path, dtype=dict.fromkeys(typed, "string"), **options)
+        parse = [rule for rule in present if typed[rule.name] != "string"] + parse
+
+    failing = np.zeros(len(data), dtype=bool)
+    cases = []
+    for rule in parse:
+        text = data[rule.name]
+        values, unparsed = _parse(text, rule, fields[rule.name])
+        data[rule.name] = values
+        mask = unparsed.to_numpy(dtype=bool)
+        if mask.any():
+            counts[(rule.name, rule.dtype_check)] = int(mask.sum())
+            failing |= mask
+            positions = np.flatnonzero(mask)[:max_failure_cases]
+            cases.append(
+                pd.DataFrame(
+                    {
+                        "column": rule.name,
+                        "check": rule.dtype_check,
+                        "failure_case": text.iloc[positions].to_numpy(dtype=object),
+                        "index": positions.astype(np.int64),
+                    }
+                )
+            )
+    for rule in present:
+        column = data[rule.name]
+        numpy_dtype = _NUMPY_DTYPES.get(str(column.dtype))
+        if numpy_dtype is not None and not column.hasnans:
+            data[rule.name] = column.astype(numpy_dtype)
+    failure_cases = (
+        pd.concat(cases, ignore_index=True).head(max_failure_cases) if cases else None
+    )
+    return data, ValidationReport.from_counts(
+        counts, np.flatnonzero(failing).astype(np.int64), failure_cases
+    )
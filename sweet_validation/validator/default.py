@@ -1,45 +1,396 @@
-from typing import Any
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from copy import deepcopy
+from functools import partial, update_wrapper
+from typing import Any, Concatenate, Generic, ParamSpec, TypeVar, cast
 
+import numpy as np
 import pandas as pd
+from pandera import DataFrameSchema
 from pandera.errors import SchemaErrors
 from pandera.io import from_frictionless_schema
 
+from ..instrumentation import phase
+from ..utils import schema_fingerprint
+from .keys import key_failures
+from .time_series import time_series_failures
 from .validation_report import ValidationReport
 
 __all__ = ["DefaultValidator"]
 
+FAILURE_CASE_COLUMNS = ["column", "check", "failure_case", "index"]
+
+
+_T = TypeVar("_T")
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+class _hybridmethod(Generic[_T, _P, _R]):
+    """Method that receives the instance if called on an instance and the class
+    if called on the class. This allows to use the validator without creating
+    an instance while instances can carry their own settings.
+
+    The class serves as instance with the default settings, so the bound method
+    has the signature of the method without `self` in both cases. Calling the
+    descriptor itself behaves like calling the method on the class, which lets
+    type checkers match it against protocols.
+    """
+
+    def __init__(self, func: Callable[Concatenate[_T, _P], _R]) -> None:
+        self.func = func
+        self.owner: type[_T] | None = None
+        update_wrapper(self, func)
+
+    def __set_name__(self, owner: type[_T], name: str) -> None:
+        self.owner = owner
+
+    def __get__(self, obj: _T | None, cls: type[_T]) -> Callable[_P, _R]:
+        bound = partial(self.func, obj if obj is not None else cast(_T, cls))
+        return update_wrapper(bound, self.func)
+
+    def __call__(self, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        if self.owner is None:
+            raise TypeError(f"{self.func.__qualname__} is not bound to a class")
+        return self.func(cast(_T, self.owner), *args, **kwargs)
+
 
 class DefaultValidator:
     """The DefaultValidator class checks pandas dataframes against a frictionless
     schema.
+
+    Pandera schemas are compiled once per schema content and cached using the
+    schema fingerprint as key.
+
+    By default all failures are collected. If `max_errors` is set, the data is
+    validated in chunks of `chunk_size` rows and the validation stops collecting
+    failures once `max_errors` failure cases have been found. This keeps the
+    memory of the validation report bounded. Uniqueness constraints are checked
+    on the full data in any case.
+
+    If the schema declares `timeFields` as in the SWEET metastandard, the time
+    series are checked for monotonicity, duplicated times and gaps with respect
+    to the declared frequency, see `time_series_failures`. These checks can be
+    disabled with `check_time_series=False`. If the schema declares a
+    `valueField`, all other fields form a key that must be unique, see
+    `key_failures`. This check can be disabled with `check_keys=False`.
+
+    Example:
+
+        .. code-block:: python
+        # use the defaults
+        report = DefaultValidator.validate(df, schema)
+        # or configure an instance
+        validator = DefaultValidator(max_errors=1000)
+        report = validator.validate(df, schema)
     """
 
-    @staticmethod
-    def validate(data: pd.DataFrame, schema: dict[str, Any]) -> ValidationReport:
+    max_compiled_schemas: int = 128
+    _compiled_schemas: OrderedDict[str, DataFrameSchema] = OrderedDict()
+    _compiled_schemas_lock = threading.Lock()
+
+    max_errors: int | None = None
+    chunk_size: int = 100_000
+    max_failure_cases: int = 1000
+    check_time_series: bool = True
+    check_keys: bool = True
+
+    def __init__(
+        self,
+        max_errors: int | None = None,
+        chunk_size: int = 100_000,
+        max_failure_cases: int = 1000,
+        check_time_series: bool = True,
+        check_keys: bool = True,
+    ) -> None:
+        """Initialize the validator
+
+        Args:
+            max_errors (int | None, optional): Number of failure cases after which
+                the validation stops collecting failures. Defaults to None which
+                collects all failures.
+            chunk_size (int, optional): Number of rows validated at once if
+                max_errors is set. Defaults to 100_000.
+            max_failure_cases (int, optional): Maximum number of failure cases
+                kept as sample in the report. Defaults to 1000.
+            check_time_series (bool, optional): Whether to check the time series
+                declared by the `timeFields` of the schema. Defaults to True.
+            check_keys (bool, optional): Whether to check the uniqueness of the
+                key implied by the `valueField` of the schema. Defaults to True.
+        """
+        self.max_errors = max_errors
+        self.chunk_size = chunk_size
+        self.max_failure_cases = max_failure_cases
+        self.check_time_series = check_time_series
+        self.check_keys = check_keys
+
+    @_hybridmethod
+    def validate(
+        self,
+        data: pd.DataFrame,
+        schema: dict[str, Any],
+        max_errors: int | None = None,
+    ) -> ValidationReport:
         """Validate a pandas dataframe against a frictionless schema
 
         Args:
             data (pd.DataFrame): Data to validate
+            schema (dict[str, Any]): Frictionless schema
+            max_errors (int | None, optional): Number of failure cases after which
+                the validation stops collecting failures. Defaults to None which
+                uses the setting of the validator.
 
-        Raises:
-            ValidationError: If the data does not conform to the schema
+        Returns:
+            ValidationReport: Validation report
         """
+        max_errors = max_errors if max_errors is not None else self.max_errors
         # convert schema to pandera schema
-        pa_schema = from_frictionless_schema(schema)
-        try:
-            pa_schema.validate(data, lazy=True)
-            return ValidationReport(valid=True, errors={})
-        except SchemaErrors as e:
-            return ValidationReport(valid=False, errors=e.message)
+        with phase("validator.compile"):
+            pa_schema = DefaultValidator._compile(schema)
+        collector = _FailureCollector(max_errors, self.max_failure_cases)
+        truncated = False
+        with phase("validator.check", rows=len(data)):
+            if max_errors is None or len(data) <= self.chunk_size:
+                collector.add(_failure_cases(pa_schema, data))
+            else:
+                truncated = DefaultValidator._validate_chunks(
+                    pa_schema, data, collector, self.chunk_size
+                )
+        if self.check_time_series and not collector.full:
+            with phase("validator.time_series", rows=len(data)):
+                collector.add(time_series_failures(data, schema))
+        if self.check_keys and not collector.full:
+            with phase("validator.keys", rows=len(data)):
+                collector.add(key_failures(data, schema))
+        return collector.report(truncated=truncated)
 
-    @staticmethod
-    def is_valid(data: pd.DataFrame, schema: dict[str, Any]) -> bool:
+    @_hybridmethod
+    def is_valid(self, data: pd.DataFrame, schema: dict[str, Any]) -> bool:
         """Check if a pandas dataframe is valid against a frictionless schema
 
         Args:
             data (pd.DataFrame): Data to validate
+            schema (dict[str, Any]): Frictionless schema
 
         Returns:
             bool: True if the data is valid, False otherwise
         """
-        return DefaultValidator.validate(data, schema).valid
+        # the first failure decides, so stop collecting failures early
+        return bool(self.validate(data, schema, max_errors=1).valid)
+
+    @staticmethod
+    def _validate_chunks(
+        pa_schema: DataFrameSchema,
+        data: pd.DataFrame,
+        collector: "_FailureCollector",
+        chunk_size: int,
+    ) -> bool:
+        """Validate data in chunks of rows until the collector is full
+
+        Uniqueness is not chunk local and therefore checked on the full data.
+
+        Args:
+            pa_schema (DataFrameSchema): Pandera schema
+            data (pd.DataFrame): Data to validate
+            collector (_FailureCollector): Collector of failures
+            chunk_size (int): Number of rows per chunk
+
+        Returns:
+            bool: True if the validation stopped before all data was checked
+        """
+        row_schema, unique = _split_uniqueness(pa_schema)
+        for start in range(0, len(data), chunk_size):
+            chunk = data.iloc[start : start + chunk_size]
+            collector.add(_failure_cases(row_schema, chunk))
+            if collector.full:
+                return start + chunk_size < len(data) or bool(unique)
+        for i, (columns, check) in enumerate(unique):
+            present = [c for c in columns if c in data.columns]
+            if len(present) < len(columns):
+                continue  # missing columns are already reported
+            duplicated = data.duplicated(subset=present, keep=False).to_numpy()
+            if not duplicated.any():
+                continue
+            rows = data.index[duplicated]
+            for column in columns:
+                collector.add(
+                    pd.DataFrame(
+                        {
+                            "column": column,
+                            "check": check,
+                            "failure_case": data.loc[duplicated, column].to_numpy(),
+                            "index": rows,
+                        }
+                    )
+                )
+            if collector.full:
+                return i + 1 < len(unique)
+        return False
+
+    @staticmethod
+    def _compile(schema: dict[str, Any]) -> DataFrameSchema:
+        """Convert a frictionless schema to a pandera schema
+
+        Compiled schemas are kept in a thread safe least recently used cache keyed
+        by the fingerprint of the frictionless schema.
+
+        Args:
+            schema (dict[str, Any]): Frictionless schema
+
+        Returns:
+            DataFrameSchema: Pandera schema
+        """
+        cache = DefaultValidator._compiled_schemas
+        fingerprint = schema_fingerprint(schema)
+        with DefaultValidator._compiled_schemas_lock:
+            pa_schema = cache.get(fingerprint)
+            if pa_schema is not None:
+                cache.move_to_end(fingerprint)
+                return pa_schema
+        pa_schema = from_frictionless_schema(schema)
+        with DefaultValidator._compiled_schemas_lock:
+            cache[fingerprint] = pa_schema
+            if len(cache) > DefaultValidator.max_compiled_schemas:
+                cache.popitem(last=False)
+        return pa_schema
+
+
+def _failure_cases(
+    pa_schema: DataFrameSchema, data: pd.DataFrame
+) -> pd.DataFrame | None:
+    """Validate data and return the failure cases of pandera
+
+    Args:
+        pa_schema (DataFrameSchema): Pandera schema
+        data (pd.DataFrame): Data to validate
+
+    Returns:
+        pd.DataFrame | None: Failure cases or None if the data is valid
+    """
+    try:
+        pa_schema.validate(data, lazy=True)
+        return None
+    except SchemaErrors as e:
+        return cast(pd.DataFrame, e.failure_cases)
+
+
+def _split_uniqueness(
+    pa_schema: DataFrameSchema,
+) -> tuple[DataFrameSchema, list[tuple[list[str], str]]]:
+    """Remove the uniqueness constraints from a pandera schema
+
+    Args:
+        pa_schema (DataFrameSchema): Pandera schema
+
+    Returns:
+        tuple[DataFrameSchema, list[tuple[list[str], str]]]: Schema without
+            uniqueness constraints and the removed constraints as tuples of
+            columns and the name of the check
+    """
+    unique: list[tuple[list[str], str]] = []
+    updates = {}
+    for name, column in pa_schema.columns.items():
+        if column.unique:
+            unique.append(([name], "field_uniqueness"))
+            updates[name] = {"unique": False}
+    row_schema = pa_schema.update_columns(updates) if updates else deepcopy(pa_schema)
+    if pa_schema.unique:
+        columns = pa_schema.unique
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        unique.append((columns, "multiple_fields_uniqueness"))
+        row_schema.unique = None
+    return row_schema, unique
+
+
+class _FailureCollector:
+    """Collects pandera failure cases into a compact representation
+
+    Failures are counted per (column, check). Failures without row index, e.g.,
+    missing columns or wrong data types, are counted once even if they are
+    reported for several chunks.
+    """
+
+    def __init__(self, max_errors: int | None, max_failure_cases: int) -> None:
+        self.max_errors = max_errors
+        self.max_failure_cases = max_failure_cases
+        self.counts: dict[tuple[str | None, str], int] = {}
+        self.n_collected = 0
+        self._rows: list[np.ndarray[Any, Any]] = []
+        self._cases: list[pd.DataFrame] = []
+        self._n_cases = 0
+        self._schema_level: set[tuple[str | None, str]] = set()
+
+    @property
+    def full(self) -> bool:
+        """True if the maximum number of errors has been reached"""
+        return self.max_errors is not None and self.n_collected >= self.max_errors
+
+    def add(self, failure_cases: pd.DataFrame | None) -> None:
+        """Add the failure cases of one validation run
+
+        Args:
+            failure_cases (pd.DataFrame | None): Failure cases of pandera
+        """
+        if failure_cases is None or failure_cases.empty:
+            return
+        cases = failure_cases.reindex(columns=FAILURE_CASE_COLUMNS)
+        has_index = cases["index"].notna().to_numpy()
+        # failures without row reference are counted once
+        no_index = cases.loc[~has_index]
+        for column, check in zip(no_index["column"], no_index["check"], strict=False):
+            key = (column if isinstance(column, str) else None, str(check))
+            if key not in self._schema_level:
+                self._schema_level.add(key)
+                self.counts[key] = self.counts.get(key, 0) + 1
+        with_index = cases.loc[has_index]
+        if not with_index.empty:
+            groups = with_index.groupby(["column", "check"], dropna=False, sort=False)
+            sizes = groups.size()
+            for group, count in sizes.items():
+                column, check = cast(tuple[Any, Any], group)
+                key = (column if isinstance(column, str) else None, str(check))
+                self.counts[key] = self.counts.get(key, 0) + int(count)
+            self._rows.append(pd.unique(with_index["index"].to_numpy()))
+        self.n_collected += len(cases)
+        if self._n_cases < self.max_failure_cases:
+            sample = cases.head(self.max_failure_cases - self._n_cases)
+            self._cases.append(sample)
+            self._n_cases += len(sample)
+
+    def report(self, truncated: bool = False) -> ValidationReport:
+        """Create the validation report
+
+        The errors of the report contain the failure counts by column and check.
+
+        Args:
+            truncated (bool, optional): Whether the validation stopped before all
+                data was checked. Defaults to False.
+
+        Returns:
+            ValidationReport: Validation report with compact failure information
+        """
+        if not self.counts:
+            return ValidationReport(
+                valid=True,
+                errors={},
+                failure_counts={},
+                failing_rows=np.array([], dtype=np.int64),
+            )
+        errors: dict[str | None, dict[str, int]] = {}
+        for (column, check), count in self.counts.items():
+            errors.setdefault(column, {})[check] = count
+        rows = pd.unique(np.concatenate(self._rows)) if self._rows else np.array([])
+        try:
+            rows = np.sort(rows)
+        except TypeError:  # index labels of mixed types
+            pass
+        cases = pd.concat(self._cases, ignore_index=True) if self._cases else None
+        return ValidationReport(
+            valid=False,
+            errors=errors,
+            failure_counts=dict(self.counts),
+            failing_rows=np.asarray(rows),
+            failure_cases=cases,
+            truncated=truncated,
+        )
@@ -0,0 +1,96 @@
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ..metadata import key_fields
+
+__all__ = ["duplicated_keys", "group_codes", "key_failures"]
+
+
+def group_codes(data: pd.DataFrame, columns: Sequence[str]) -> np.ndarray[Any, Any]:
+    """Integer code per row that is equal for rows with equal values in columns
+
+    Each column is factorized and the codes are combined as digits of a mixed
+    radix number. If the combined codes could overflow, they are factorized
+    again, so that the memory stays at a few integer arrays independent of the
+    number of columns. Missing values are treated as equal values.
+
+    Args:
+        data (pd.DataFrame): Data
+        columns (Sequence[str]): Columns forming the key
+
+    Returns:
+        np.ndarray: int64 codes; all zero without columns
+    """
+    codes = np.zeros(len(data), dtype=np.int64)
+    n_groups = 1
+    for column in columns:
+        column_codes, uniques = pd.factorize(data[column], use_na_sentinel=False)
+        n_values = max(len(uniques), 1)
+        if n_groups * n_values >= 2**62:
+            codes, groups = pd.factorize(codes)
+            n_groups = max(len(groups), 1)
+        codes = codes * n_values + column_codes
+        n_groups *= n_values
+    return codes
+
+
+def duplicated_keys(data: pd.DataFrame, columns: Sequence[str]) -> np.ndarray[Any, Any]:
+    """Mask of the rows whose key occurs more than once
+
+    Unlike `DataFrame.duplicated`, no tuples of the key values are built: the
+    key is reduced to one integer code per row by `group_codes` and duplicates
+    are found with a hash table on the codes.
+
+    Args:
+        data (pd.DataFrame): Data
+        columns (Sequence[str]): Columns forming the key
+
+    Returns:
+        np.ndarray: Boolean mask, True for all rows of duplicated keys
+    """
+    codes = group_codes(data, columns)
+    return pd.Series(codes, copy=False).duplicated(keep=False).to_numpy()
+
+
+def key_failures(data: pd.DataFrame, schema: dict[str, Any]) -> pd.DataFrame | None:
+    """Check that the key implied by the `valueField` of a schema is unique
+
+    According to the SWEET metastandard all fields other than the value field
+    jointly form the key of a row. Rows of duplicated keys fail the check
+    `key_uniqueness`, which is reported for each key column like pandera's
+    `multiple_fields_uniqueness`.
+
+    Args:
+        data (pd.DataFrame): Data
+        schema (dict[str, Any]): Schema
+
+    Returns:
+        pd.DataFrame | None: Failure cases in the format of pandera with the
+            columns column, check, failure_case and index, or None if there are
+            no failures or the schema has no value field
+    """
+    columns = key_fields(schema)
+    if not columns or any(column not in data.columns for column in columns):
+        return None  # missing columns are reported by the schema checks
+    duplicated = duplicated_keys(data, columns)
+    if not duplicated.any():
+        return None
+    positions = np.flatnonzero(duplicated)
+    rows = data.index[positions]
+    return pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "column": column,
+                    "check": "key_uniqueness",
+                    "failure_case": data[column].to_numpy()[positions],
+                    "index": rows,
+                }
+            )
+            for column in columns
+        ],
+        ignore_index=True,
+    )
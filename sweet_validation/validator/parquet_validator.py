@@ -0,0 +1,167 @@
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "The ParquetValidator requires pyarrow. Install it with "
+        "`pip install sweet_validation[arrow]`."
+    ) from e
+
+from .arrow_validator import ArrowValidator, _Check
+from .rules import compile_rules
+from .validation_report import ValidationReport
+
+__all__ = ["ParquetValidator"]
+
+
+def _settled(check: _Check, stats: Any) -> bool:
+    """Check if the statistics of a column chunk prove that a check holds
+
+    Args:
+        check (_Check): Check as tuple of rule, check name and mask function
+        stats (pq.Statistics | None): Statistics of the column chunk
+
+    Returns:
+        bool: True if no row of the column chunk can fail the check
+    """
+    rule, name, _ = check
+    if stats is None:
+        return False
+    if name == "not_nullable":
+        return bool(stats.has_null_count and stats.null_count == 0)
+    if not stats.has_min_max:
+        return False
+    try:
+        if name == rule.range_check:
+            return bool(
+                (rule.minimum is None or stats.min >= rule.minimum)
+                and (rule.maximum is None or stats.max <= rule.maximum)
+            )
+        if name == rule.enum_check and rule.enum is not None:
+            return bool(stats.min == stats.max and stats.min in rule.enum)
+    except TypeError:  # statistics not comparable with the constraint
+        return False
+    return False
+
+
+class ParquetValidator(ArrowValidator):
+    """The ParquetValidator checks Parquet files against a frictionless schema
+    without reading data that the file's statistics prove valid.
+
+    Parquet files store the minimum, maximum and number of nulls of each column
+    per row group. The validator reads this metadata from the file footer first.
+    A check is skipped for a row group if the statistics prove that it holds,
+    e.g., the minimum of the row group is above the minimum of the field. Only
+    the row groups and columns with checks that could fail are decoded and
+    checked batch by batch as in the ArrowValidator. Columns with uniqueness
+    constraints are always read completely.
+
+    Arrow data is validated as by the ArrowValidator.
+
+    Example:
+
+        .. code-block:: python
+        validator = ParquetValidator()
+        report = validator.validate("generation_2024.parquet", schema)
+        # row groups and columns that need to be decoded
+        validator.plan("generation_2024.parquet", schema)
+    """
+
+    def validate(
+        self, data: Any, schema: dict[str, Any], max_errors: int | None = None
+    ) -> ValidationReport:
+        """Validate a Parquet file against a frictionless schema
+
+        Args:
+            data (str | Path | pq.ParquetFile | pa.Table | ...): Path of the
+                Parquet file or Arrow data
+            schema (dict[str, Any]): Frictionless schema
+            max_errors (int | None, optional): Number of failures after which the
+                validation stops. Defaults to None which uses the setting of the
+                validator.
+
+        Returns:
+            ValidationReport: Validation report. Failing rows are row positions
+                in the file.
+        """
+        if not isinstance(data, str | Path | pq.ParquetFile):
+            return super().validate(data, schema, max_errors=max_errors)
+        max_errors = max_errors if max_errors is not None else self.max_errors
+        pf = data if isinstance(data, pq.ParquetFile) else pq.ParquetFile(data)
+        counts, checks, unique = self._plan(pf.schema_arrow, compile_rules(schema))
+        plan = self._prune(pf, checks)
+        unique_columns = sorted({c for columns, _ in unique for c in columns})
+
+        def work() -> Iterator[tuple[pa.RecordBatch, list[_Check], int]]:
+            for i, offset, group_checks in plan:
+                columns = sorted({rule.name for rule, _, _ in group_checks})
+                table = pf.read_row_group(i, columns=columns)
+                for batch in table.to_batches(max_chunksize=self.batch_size):
+                    yield batch, group_checks, offset
+                    offset += batch.num_rows
+
+        def unique_table() -> pa.Table:
+            return pf.read(columns=unique_columns)
+
+        return self._collect(counts, work(), unique, unique_table, max_errors)
+
+    def plan(self, data: str | Path, schema: dict[str, Any]) -> dict[int, list[str]]:
+        """Row groups and columns that need to be decoded to validate a file
+
+        Columns with uniqueness constraints, which are always read, are not
+        included.
+
+        Args:
+            data (str | Path): Path of the Parquet file
+            schema (dict[str, Any]): Frictionless schema
+
+        Returns:
+            dict[int, list[str]]: Columns to decode by row group index. Row groups
+                proven valid by their statistics are omitted.
+        """
+        pf = pq.ParquetFile(data)
+        _, checks, _ = self._plan(pf.schema_arrow, compile_rules(schema))
+        return {
+            i: sorted({rule.name for rule, _, _ in group_checks})
+            for i, _, group_checks in self._prune(pf, checks)
+        }
+
+    @staticmethod
+    def _prune(
+        pf: pq.ParquetFile, checks: list[_Check]
+    ) -> list[tuple[int, int, list[_Check]]]:
+        """Remove the checks that the statistics of a row group settle
+
+        Args:
+            pf (pq.ParquetFile): Parquet file
+            checks (list[_Check]): Checks of the fields
+
+        Returns:
+            list[tuple[int, int, list[_Check]]]: Row groups with remaining checks
+                as tuples of row group index, position of the first row, and
+                checks
+        """
+        metadata = pf.metadata
+        plan = []
+        offset = 0
+        for i in range(metadata.num_row_groups):
+            group = metadata.row_group(i)
+            stats = {}
+            for j in range(group.num_columns):
+                column = group.column(j)
+                stats[column.path_in_schema] = (
+                    column.statistics if column.is_stats_set else None
+                )
+            remaining = [
+                check
+                for check in checks
+                if not _settled(check, stats.get(check[0].name))
+            ]
+            if remaining and group.num_rows:
+                plan.append((i, offset, remaining))
+            offset += group.num_rows
+        return plan
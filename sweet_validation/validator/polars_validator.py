@@ -0,0 +1,224 @@
+from typing import Any
+
+try:
+    import polars as pl
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "The PolarsValidator requires polars. Install it with "
+        "`pip install sweet_validation[polars]`."
+    ) from e
+
+import numpy as np
+import pandas as pd
+
+from .rules import FieldRule, compile_rules
+from .validation_report import ValidationReport
+
+__all__ = ["PolarsValidator"]
+
+_ROW = "__row__"
+
+
+def _dtype_matches(field_type: str, dtype: Any) -> bool:
+    """Check if a polars data type can hold a frictionless type"""
+    if dtype == pl.Null:  # all values missing
+        return True
+    if field_type in ("integer", "year"):
+        return bool(dtype.is_integer())
+    if field_type == "number":
+        return bool(dtype.is_numeric())
+    if field_type == "string":
+        return dtype in (pl.String, pl.Categorical) or isinstance(dtype, pl.Enum)
+    if field_type == "boolean":
+        return bool(dtype == pl.Boolean)
+    if field_type == "date":
+        return bool(dtype == pl.Date)
+    if field_type == "datetime":
+        return isinstance(dtype, pl.Datetime)
+    if field_type == "time":
+        return bool(dtype == pl.Time)
+    if field_type == "duration":
+        return isinstance(dtype, pl.Duration)
+    return True  # any, object, array, geopoint, ... are not checked
+
+
+def _field_checks(rule: FieldRule, dtype: Any) -> list[tuple[str, pl.Expr]]:
+    """Failure masks of the value constraints of a field
+
+    Each mask is true for the rows that fail the check. Null values only fail
+    the not_nullable check.
+    """
+    col = pl.col(rule.name)
+    text = col.cast(pl.String) if dtype != pl.String else col
+    checks: list[tuple[str, pl.Expr]] = []
+    if rule.required:
+        checks.append(("not_nullable", col.is_null()))
+    if rule.unique:
+        checks.append(("field_uniqueness", col.is_duplicated()))
+    if rule.range_check is not None:
+        mask = pl.lit(False)
+        if rule.minimum is not None:
+            mask = mask | (col < rule.minimum)
+        if rule.maximum is not None:
+            mask = mask | (col > rule.maximum)
+        checks.append((rule.range_check, mask))
+    if rule.length_check is not None:
+        length = text.str.len_chars()
+        mask = pl.lit(False)
+        if rule.min_length is not None:
+            mask = mask | (length < rule.min_length)
+        if rule.max_length is not None:
+            mask = mask | (length > rule.max_length)
+        checks.append((rule.length_check, mask))
+    if rule.pattern_check is not None and rule.full_pattern is not None:
+        checks.append((rule.pattern_check, ~text.str.contains(rule.full_pattern)))
+    if rule.enum_check is not None and rule.enum is not None:
+        checks.append((rule.enum_check, ~col.is_in(rule.enum)))
+    return [(check, mask.fill_null(False)) for check, mask in checks]
+
+
+class PolarsValidator:
+    """The PolarsValidator checks Polars dataframes against a frictionless schema
+    without converting them to pandas.
+
+    The constraints of the schema are compiled into Polars expressions. All
+    failures are counted in a single lazy query, which Polars executes on all
+    cores. Only if there are failures, the failing rows and a bounded sample of
+    failure cases are collected in a second pass.
+
+    In contrast to the DefaultValidator, data types are not coerced: a column
+    must already have a Polars data type matching the frictionless type, e.g.,
+    an integer type for integer fields.
+
+    Example:
+
+        .. code-block:: python
+        validator = PolarsValidator()
+        report = validator.validate(pl.read_parquet("data.parquet"), schema)
+        registry = InMemoryRegistry(validator, SchemaManager())
+    """
+
+    max_failure_cases: int
+
+    def __init__(self, max_failure_cases: int = 1000) -> None:
+        """Initialize the validator
+
+        Args:
+            max_failure_cases (int, optional): Maximum number of failure cases
+                kept as sample in the report. Defaults to 1000.
+        """
+        self.max_failure_cases = max_failure_cases
+
+    def validate(self, data: Any, schema: dict[str, Any]) -> ValidationReport:
+        """Validate a Polars dataframe against a frictionless schema
+
+        Args:
+            data (pl.DataFrame | pl.LazyFrame): Data to validate
+            schema (dict[str, Any]): Frictionless schema
+
+        Returns:
+            ValidationReport: Validation report. Failing rows are row positions.
+
+        Raises:
+            TypeError: If the data is not a Polars dataframe
+        """
+        return self._validate(data, schema, collect_failures=True)
+
+    def is_valid(self, data: Any, schema: dict[str, Any]) -> bool:
+        """Check if a Polars dataframe is valid against a frictionless schema
+
+        Args:
+            data (pl.DataFrame | pl.LazyFrame): Data to validate
+            schema (dict[str, Any]): Frictionless schema
+
+        Returns:
+            bool: True if the data is valid, False otherwise
+        """
+        return self._validate(data, schema, collect_failures=False).valid
+
+    def _validate(
+        self, data: Any, schema: dict[str, Any], collect_failures: bool
+    ) -> ValidationReport:
+        if isinstance(data, pl.DataFrame):
+            lf = data.lazy()
+        elif isinstance(data, pl.LazyFrame):
+            lf = data
+        else:
+            raise TypeError(f"Expected a Polars dataframe, got {type(data)}")
+        rules = compile_rules(schema)
+        dtypes = lf.collect_schema()
+        counts: dict[tuple[str | None, str], int] = {}
+        # structural failures are counted once
+        for column in dtypes:
+            if column not in rules.names:
+                counts[(column, "column_in_schema")] = 1
+        checks: list[tuple[str, str, pl.Expr]] = []
+        for rule in rules.fields:
+            if rule.name not in dtypes:
+                counts[(rule.name, "column_in_dataframe")] = 1
+            elif not _dtype_matches(rule.type, dtypes[rule.name]):
+                counts[(rule.name, rule.dtype_check)] = 1
+            else:
+                checks += [
+                    (rule.name, check, mask)
+                    for check, mask in _field_checks(rule, dtypes[rule.name])
+                ]
+        if rules.primary_key and all(c in dtypes for c in rules.primary_key):
+            mask = pl.struct(rules.primary_key).is_duplicated()
+            checks += [
+                (column, "multiple_fields_uniqueness", mask)
+                for column in rules.primary_key
+            ]
+        if checks:
+            totals = lf.select(
+                [mask.sum().alias(str(i)) for i, (_, _, mask) in enumerate(checks)]
+            ).collect()
+            for i, (column, check, _) in enumerate(checks):
+                counts[(column, check)] = int(totals[str(i)][0])
+        failing = [c for c in checks if counts[(c[0], c[1])]]
+        if not collect_failures or not failing:
+            return ValidationReport.from_counts(
+                counts, failing_rows=np.array([], dtype=np.int64)
+            )
+        failing_rows, cases = self._collect_failures(lf, failing)
+        return ValidationReport.from_counts(counts, failing_rows, cases)
+
+    def _collect_failures(
+        self, lf: pl.LazyFrame, failing: list[tuple[str, str, pl.Expr]]
+    ) -> tuple[np.ndarray[Any, Any], pd.DataFrame]:
+        """Collect the failing rows and a sample of failure cases
+
+        Args:
+            lf (pl.LazyFrame): Data
+            failing (list[tuple[str, str, pl.Expr]]): Failing checks as tuples of
+                column, check and failure mask
+
+        Returns:
+            tuple[np.ndarray, pd.DataFrame]: Sorted failing row positions and
+                failure cases with the columns column, check, failure_case, and
+                index
+        """
+        indexed = lf.with_row_index(_ROW)
+        queries = [
+            indexed.filter(pl.any_horizontal([mask for _, _, mask in failing])).select(
+                _ROW
+            )
+        ]
+        per_check = -(-self.max_failure_cases // len(failing))  # ceil division
+        for column, check, mask in failing:
+            queries.append(
+                indexed.filter(mask)
+                .select(
+                    pl.lit(column).alias("column"),
+                    pl.lit(check).alias("check"),
+                    pl.col(column).cast(pl.String).alias("failure_case"),
+                    pl.col(_ROW).alias("index"),
+                )
+                .head(per_check)
+            )
+        rows, *cases = pl.collect_all(queries)
+        sample = pl.concat(cases).head(self.max_failure_cases)
+        failure_cases = pd.DataFrame(
+            {name: sample[name].to_list() for name in sample.columns}
+        )
+        return rows[_ROW].to_numpy().astype(np.int64), failure_cases
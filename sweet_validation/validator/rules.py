@@ -0,0 +1,169 @@
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from ..utils import schema_fingerprint
+
+__all__ = ["FieldRule", "SchemaRules", "compile_rules"]
+
+# frictionless types whose constraints are given as iso formatted strings
+_TEMPORAL_PARSERS: dict[str, Any] = {
+    "date": datetime.date.fromisoformat,
+    "datetime": datetime.datetime.fromisoformat,
+    "time": datetime.time.fromisoformat,
+}
+
+
+def _format(value: Any) -> str:
+    return repr(value) if isinstance(value, str) else str(value)
+
+
+class FieldRule:
+    """Constraints of a single frictionless field
+
+    Backends that do not use pandera, e.g., the Polars and Arrow validators,
+    translate these rules into their own expressions. Check names follow the
+    naming of pandera, so that reports of all validators look alike.
+
+    Attributes:
+        name (str): Name of the field
+        type (str): Frictionless type, e.g., integer
+        required (bool): Whether null values are forbidden
+        unique (bool): Whether values must be unique
+        minimum (Any): Minimum value or None
+        maximum (Any): Maximum value or None
+        min_length (int | None): Minimum string length
+        max_length (int | None): Maximum string length
+        pattern (str | None): Regular expression the full value must match
+        enum (list[Any] | None): Allowed values
+    """
+
+    __slots__ = (
+        "name",
+        "type",
+        "required",
+        "unique",
+        "minimum",
+        "maximum",
+        "min_length",
+        "max_length",
+        "pattern",
+        "enum",
+    )
+
+    def __init__(self, field: dict[str, Any]) -> None:
+        constraints = field.get("constraints", {})
+        parse = _TEMPORAL_PARSERS.get(field.get("type", "any"))
+        self.name: str = field["name"]
+        self.type: str = field.get("type", "any")
+        self.required: bool = bool(constraints.get("required", False))
+        self.unique: bool = bool(constraints.get("unique", False))
+        self.minimum = constraints.get("minimum")
+        self.maximum = constraints.get("maximum")
+        if parse is not None:
+            if isinstance(self.minimum, str):
+                self.minimum = parse(self.minimum)
+            if isinstance(self.maximum, str):
+                self.maximum = parse(self.maximum)
+        self.min_length: int | None = constraints.get("minLength")
+        self.max_length: int | None = constraints.get("maxLength")
+        self.pattern: str | None = constraints.get("pattern")
+        self.enum: list[Any] | None = constraints.get("enum")
+
+    @property
+    def dtype_check(self) -> str:
+        """Name of the data type check"""
+        return f"dtype({self.type!r})"
+
+    @property
+    def range_check(self) -> str | None:
+        """Name of the minimum/maximum check or None without range constraint"""
+        if self.minimum is not None and self.maximum is not None:
+            return f"in_range({_format(self.minimum)}, {_format(self.maximum)})"
+        if self.minimum is not None:
+            return f"greater_than_or_equal_to({_format(self.minimum)})"
+        if self.maximum is not None:
+            return f"less_than_or_equal_to({_format(self.maximum)})"
+        return None
+
+    @property
+    def length_check(self) -> str | None:
+        """Name of the string length check or None without length constraint"""
+        if self.min_length is None and self.max_length is None:
+            return None
+        return f"str_length({self.min_length}, {self.max_length})"
+
+    @property
+    def pattern_check(self) -> str | None:
+        """Name of the pattern check or None without pattern"""
+        return None if self.pattern is None else f"str_matches({self.pattern!r})"
+
+    @property
+    def enum_check(self) -> str | None:
+        """Name of the enum check or None without enum"""
+        return None if self.enum is None else f"isin({self.enum!r})"
+
+    @property
+    def full_pattern(self) -> str | None:
+        """Pattern anchored to match the full value as frictionless requires"""
+        return None if self.pattern is None else f"^(?:{self.pattern})$"
+
+
+class SchemaRules:
+    """Constraints of a frictionless schema
+
+    Attributes:
+        fields (list[FieldRule]): Rules of the fields in schema order
+        primary_key (list[str]): Fields whose combination must be unique. Empty
+            if the schema has no primary key or a single field primary key,
+            which is treated as unique constraint of that field.
+    """
+
+    __slots__ = ("fields", "primary_key")
+
+    def __init__(self, schema: dict[str, Any]) -> None:
+        self.fields = [FieldRule(field) for field in schema.get("fields", [])]
+        primary_key = schema.get("primaryKey") or []
+        primary_key = [primary_key] if isinstance(primary_key, str) else primary_key
+        if len(primary_key) == 1:
+            for rule in self.fields:
+                if rule.name == primary_key[0]:
+                    rule.unique = True
+            primary_key = []
+        self.primary_key: list[str] = list(primary_key)
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the fields"""
+        return [rule.name for rule in self.fields]
+
+
+_rules_cache: OrderedDict[str, SchemaRules] = OrderedDict()
+_rules_cache_maxsize = 128
+_rules_cache_lock = threading.Lock()
+
+
+def compile_rules(schema: dict[str, Any]) -> SchemaRules:
+    """Parse the constraints of a frictionless schema
+
+    Parsed rules are cached by the fingerprint of the schema.
+
+    Args:
+        schema (dict[str, Any]): Frictionless schema
+
+    Returns:
+        SchemaRules: Rules of the schema
+    """
+    fingerprint = schema_fingerprint(schema)
+    with _rules_cache_lock:
+        rules = _rules_cache.get(fingerprint)
+        if rules is not None:
+            _rules_cache.move_to_end(fingerprint)
+            return rules
+    rules = SchemaRules(schema)
+    with _rules_cache_lock:
+        _rules_cache[fingerprint] = rules
+        if len(_rules_cache) > _rules_cache_maxsize:
+            _rules_cache.popitem(last=False)
+    return rules
@@ -0,0 +1,367 @@
+from collections.abc import Sequence
+from typing import Any
+
+from ..metadata import key_fields, series_group_fields, time_fields
+from .rules import FieldRule
+
+__all__ = [
+    "LOOSENING",
+    "METADATA",
+    "TIGHTENING",
+    "SchemaChange",
+    "SchemaDiff",
+    "diff_schemas",
+    "select_columns",
+]
+
+METADATA = "metadata"
+LOOSENING = "loosening"
+TIGHTENING = "tightening"
+
+# constraints with an order and whether a larger value is the tighter one
+_BOUNDS = {
+    "minimum": ("minimum", True),
+    "maximum": ("maximum", False),
+    "minLength": ("min_length", True),
+    "maxLength": ("max_length", False),
+}
+# entries of a field that can affect validity
+_COMPARED = ("name", "type", "constraints")
+# constraints interpreted by FieldRule; others are compared as they are
+_RULE_CONSTRAINTS = {*_BOUNDS, "required", "unique", "pattern", "enum"}
+# keys of the SWEET metastandard that add checks on the whole table
+_TABLE_KEYS = ("valueField", "timeFields", "locationFields")
+
+
+class SchemaChange:
+    """Change of a schema between two versions
+
+    Attributes:
+        field (str | None): Name of the changed field or None for a change of
+            the table
+        item (str): Changed entry, e.g., description, type, a constraint like
+            maximum, or field if the field was added or removed
+        kind (str): METADATA if the change cannot affect the validity of data,
+            LOOSENING if all data valid before stays valid, and TIGHTENING if
+            data valid before may become invalid
+    """
+
+    __slots__ = ("field", "item", "kind")
+
+    def __init__(self, field: str | None, item: str, kind: str) -> None:
+        self.field = field
+        self.item = item
+        self.kind = kind
+
+    def __repr__(self) -> str:
+        return f"SchemaChange({self.field!r}, {self.item!r}, {self.kind!r})"
+
+
+def _compare_bound(old: Any, new: Any, larger_is_tighter: bool) -> str | None:
+    if old == new:
+        return None
+    if new is None:
+        return LOOSENING
+    if old is None:
+        return TIGHTENING
+    try:
+        larger = new > old
+    except TypeError:
+        return TIGHTENING
+    return TIGHTENING if larger == larger_is_tighter else LOOSENING
+
+
+def _compare_flag(old: bool, new: bool) -> str | None:
+    if old == new:
+        return None
+    return TIGHTENING if new else LOOSENING
+
+
+def _compare_enum(old: list[Any] | None, new: list[Any] | None) -> str | None:
+    if old == new:
+        return None
+    if new is None:
+        return LOOSENING
+    if old is None:
+        return TIGHTENING
+    try:
+        return LOOSENING if set(old) <= set(new) else TIGHTENING
+    except TypeError:
+        return TIGHTENING
+
+
+def _field_changes(old: dict[str, Any], new: dict[str, Any]) -> list[SchemaChange]:
+    """Changes of a field present in both schemas"""
+    name = new["name"]
+    changes = [
+        SchemaChange(name, item, METADATA)
+        for item in sorted(set(old) | set(new))
+        if item not in ("name", "type", "constraints")
+        and old.get(item) != new.get(item)
+    ]
+    if old.get("type", "any") != new.get("type", "any"):
+        # constraints depend on the type, so all of them are checked again
+        return changes + [SchemaChange(name, "type", TIGHTENING)]
+    old_rule, new_rule = FieldRule(old), FieldRule(new)
+    kinds = {
+        "required": _compare_flag(old_rule.required, new_rule.required),
+        "unique": _compare_flag(old_rule.unique, new_rule.unique),
+        "enum": _compare_enum(old_rule.enum, new_rule.enum),
+        "pattern": (
+            None
+            if old_rule.pattern == new_rule.pattern
+            else LOOSENING
+            if new_rule.pattern is None
+            else TIGHTENING
+        ),
+    }
+    for item, (attribute, larger_is_tighter) in _BOUNDS.items():
+        kinds[item] = _compare_bound(
+            getattr(old_rule, attribute),
+            getattr(new_rule, attribute),
+            larger_is_tighter,
+        )
+    old_constraints = old.get("constraints") or {}
+    new_constraints = new.get("constraints") or {}
+    for item in sorted(set(old_constraints) | set(new_constraints)):
+        if item not in _RULE_CONSTRAINTS:
+            same = old_constraints.get(item) == new_constraints.get(item)
+            kinds[item] = None if same else TIGHTENING
+    return changes + [
+        SchemaChange(name, item, kind) for item, kind in kinds.items() if kind
+    ]
+
+
+def _primary_key(schema: dict[str, Any]) -> list[str]:
+    primary_key = schema.get("primaryKey") or []
+    return [primary_key] if isinstance(primary_key, str) else list(primary_key)
+
+
+class SchemaDiff:
+    """Field by field comparison of two versions of a frictionless schema
+
+    Each change is classified as metadata only, loosening or tightening. Data
+    that is valid against the old schema only needs to be checked against the
+    tightened constraints of the new schema, which `revalidation_schema`
+    collects into a reduced schema over the affected columns.
+
+    The classification is conservative: changes that are not understood, e.g.,
+    of constraints not covered by the validators, count as tightening. Entries
+    that only describe how text is parsed, like `format` or `trueValues`, are
+    metadata since stored data is already parsed. Removed fields are tightening
+    as the validators reject columns that are not in the schema.
+
+    Attributes:
+        old (dict[str, Any]): Old schema
+        new (dict[str, Any]): New schema
+        changes (list[SchemaChange]): Changes from the old to the new schema
+    """
+
+    def __init__(self, old: dict[str, Any], new: dict[str, Any]) -> None:
+        self.old = old
+        self.new = new
+        self.changes = self._diff()
+
+    @property
+    def tightened(self) -> list[SchemaChange]:
+        """Changes that may make valid data invalid"""
+        return [change for change in self.changes if change.kind == TIGHTENING]
+
+    @property
+    def metadata_only(self) -> bool:
+        """True if no change can affect the validity of data"""
+        return all(change.kind == METADATA for change in self.changes)
+
+    def _diff(self) -> list[SchemaChange]:
+        old, new = self.old, self.new
+        old_fields = {field["name"]: field for field in old.get("fields", [])}
+        new_fields = {field["name"]: field for field in new.get("fields", [])}
+        changes = [
+            SchemaChange(name, "field", TIGHTENING)
+            for name in list(old_fields) + list(new_fields)
+            if (name in old_fields) != (name in new_fields)
+        ]
+        for name, field in new_fields.items():
+            if name in old_fields and old_fields[name] != field:
+                changes.extend(_field_changes(old_fields[name], field))
+        common = [name for name in old_fields if name in new_fields]
+        if common != [name for name in new_fields if name in old_fields]:
+            changes.append(SchemaChange(None, "fields", METADATA))
+
+        old_key, new_key = _primary_key(old), _primary_key(new)
+        if set(old_key) != set(new_key):
+            if not new_key:
+                kind = LOOSENING
+            elif old_key and set(old_key) <= set(new_key):
+                # a superset of a unique key is unique; only nulls are checked
+                kind = LOOSENING
+                changes.extend(
+                    SchemaChange(name, "required", TIGHTENING)
+                    for name in new_key
+                    if name not in old_key
+                    and not FieldRule(new_fields.get(name, {"name": name})).required
+                )
+            else:
+                kind = TIGHTENING
+            changes.append(SchemaChange(None, "primaryKey", kind))
+        elif old_key != new_key:
+            changes.append(SchemaChange(None, "primaryKey", METADATA))
+        changes.extend(self._table_changes())
+        for item in sorted(set(old) | set(new)):
+            if item not in ("fields", "primaryKey", *_TABLE_KEYS) and old.get(
+                item
+            ) != new.get(item):
+                changes.append(SchemaChange(None, item, METADATA))
+        return changes
+
+    def _table_changes(self) -> list[SchemaChange]:
+        """Changes of the checks implied by the SWEET metastandard"""
+        old, new = self.old, self.new
+        changes = []
+        old_keys, new_keys = set(key_fields(old)), set(key_fields(new))
+        if old_keys != new_keys:
+            # a superset of a unique key is unique
+            implied = not new_keys or (old_keys and old_keys <= new_keys)
+            kind = LOOSENING if implied else TIGHTENING
+            changes.append(SchemaChange(None, "valueField", kind))
+        old_times, new_times = set(time_fields(old)), set(time_fields(new))
+        same_series = series_group_fields(old) == series_group_fields(new)
+        if new_times and not (new_times <= old_times and same_series):
+            changes.append(SchemaChange(None, "timeFields", TIGHTENING))
+        elif old_times != new_times:
+            changes.append(SchemaChange(None, "timeFields", LOOSENING))
+        reported = {change.item for change in changes}
+        for item in _TABLE_KEYS:
+            if item not in reported and old.get(item) != new.get(item):
+                changes.append(SchemaChange(None, item, METADATA))
+        return changes
+
+    def revalidation_schema(
+        self, changes: Sequence[SchemaChange] | None = None
+    ) -> dict[str, Any] | None:
+        """Reduced schema with the tightened constraints of the new schema
+
+        Fields appear with their type and only the tightened constraints. Added
+        fields and fields with a changed type appear with all constraints.
+        Enumerations are always kept since they change the data type. If the
+        checks of the SWEET metastandard are tightened, all fields and the
+        `valueField`, `timeFields` and `locationFields` are included.
+
+        Args:
+            changes (Sequence[SchemaChange] | None, optional): Tightened changes
+                to check, e.g., those not decided by column statistics. Defaults
+                to None which uses all tightened changes.
+
+        Returns:
+            dict[str, Any] | None: Schema to validate the `revalidation_columns`
+                of data valid against the old schema, or None if nothing is to
+                be checked
+        """
+        tightened = self.tightened if changes is None else list(changes)
+        if not tightened:
+            return None
+        new_fields = {field["name"]: field for field in self.new.get("fields", [])}
+        items = {change.item for change in tightened if change.field is None}
+        table = bool(items & set(_TABLE_KEYS))
+        selected: dict[str, dict[str, Any]] = {}
+
+        def select(name: str, constraints: dict[str, Any] | None = None) -> None:
+            field = new_fields[name]
+            reduced = selected.setdefault(
+                name, {"name": name, "type": field.get("type", "any")}
+            )
+            enum = (field.get("constraints") or {}).get("enum")
+            kept = {"enum": enum} if enum is not None else {}
+            kept.update(constraints or {})
+            if kept:
+                reduced.setdefault("constraints", {}).update(kept)
+
+        if table:
+            for name in new_fields:
+                select(name)
+        for change in tightened:
+            if change.field is None or change.field not in new_fields:
+                continue
+            constraints = new_fields[change.field].get("constraints") or {}
+            if change.item in ("field", "type"):
+                select(change.field, constraints)
+            elif change.item == "required":
+                # also required if the field was added to the primary key
+                select(change.field, {"required": True})
+            else:
+                select(change.field, {change.item: constraints[change.item]})
+        schema: dict[str, Any] = {}
+        if "primaryKey" in items:
+            for name in _primary_key(self.new):
+                if name in new_fields:
+                    select(name)
+            schema["primaryKey"] = self.new["primaryKey"]
+        schema["fields"] = [selected[name] for name in new_fields if name in selected]
+        if table:
+            for item in _TABLE_KEYS:
+                if item in self.new:
+                    schema[item] = self.new[item]
+        return schema
+
+    def revalidation_columns(self, schema: dict[str, Any] | None = None) -> list[str]:
+        """Columns of the data to validate against a reduced schema
+
+        These are the fields of the reduced schema and the removed fields, which
+        must be reported as not in the schema.
+
+        Args:
+            schema (dict[str, Any] | None, optional): Reduced schema. Defaults to
+                None which uses `revalidation_schema` of all tightened changes.
+
+        Returns:
+            list[str]: Column names
+        """
+        if schema is None:
+            schema = self.revalidation_schema() or {"fields": []}
+        new_names = {field["name"] for field in self.new.get("fields", [])}
+        removed = [
+            field["name"]
+            for field in self.old.get("fields", [])
+            if field["name"] not in new_names
+        ]
+        return [field["name"] for field in schema["fields"]] + removed
+
+
+def diff_schemas(old: dict[str, Any], new: dict[str, Any]) -> SchemaDiff:
+    """Compare two versions of a frictionless schema field by field
+
+    Example:
+
+        .. code-block:: python
+        diff = diff_schemas(old, {**old, "description": "Updated"})
+        diff.metadata_only  # True, no data needs to be validated again
+
+    Args:
+        old (dict[str, Any]): Old schema
+        new (dict[str, Any]): New schema
+
+    Returns:
+        SchemaDiff: Classified changes from the old to the new schema
+    """
+    return SchemaDiff(old, new)
+
+
+def select_columns(data: Any, columns: Sequence[str]) -> Any:
+    """Select the present columns of a pandas, Polars or Arrow table
+
+    Args:
+        data (Any): Data
+        columns (Sequence[str]): Columns to select; missing columns are skipped
+
+    Returns:
+        Any: Data with the selected columns or None if the columns of the data
+            cannot be selected, e.g., for a file path
+    """
+    names = getattr(data, "columns", None)
+    if names is None:
+        return None
+    names = list(getattr(data, "column_names", names))
+    present = [column for column in columns if column in names]
+    if hasattr(data, "select"):  # polars and pyarrow
+        return data.select(present)
+    return data[present]
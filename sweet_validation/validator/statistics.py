@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import datetime
+import re
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .rules import FieldRule
+from .schema_diff import SchemaChange
+
+__all__ = ["LOW_CARDINALITY", "column_statistics", "undecided_changes"]
+
+# columns with at most this many distinct values keep their value set
+LOW_CARDINALITY = 32
+
+# constraints on values that missing values never violate
+_VALUE_CONSTRAINTS = ("minimum", "maximum", "minLength", "maxLength", "enum", "pattern")
+# temporal frictionless types whose statistics are stored as iso strings
+_TEMPORAL_TYPES = ("datetime", "date")
+
+
+def _to_json(value: Any) -> tuple[bool, Any]:
+    """Convert a scalar to a json value
+
+    Returns:
+        tuple[bool, Any]: Whether the value could be converted and the value
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or value is pd.NaT:
+        return True, None
+    if isinstance(value, datetime.date | datetime.time):
+        return True, value.isoformat()
+    if isinstance(value, float) and np.isnan(value):
+        return True, None
+    if isinstance(value, bool | int | float | str):
+        return True, value
+    return False, None
+
+
+def _n_distinct(values: pd.Series[Any]) -> int | None:
+    """Distinct count of numeric or datetime values by sorting
+
+    Sorting native arrays is considerably faster than hashing them.
+
+    Returns:
+        int | None: Distinct count or None if the values are not native numbers
+    """
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        array = values.to_numpy(dtype="datetime64[ns]")
+    else:
+        array = values.to_numpy()
+    if array.dtype.kind not in "iufM":
+        return None
+    array = np.sort(array)
+    return int(np.count_nonzero(array[1:] != array[:-1])) + min(len(array), 1)
+
+
+def _series_statistics(series: pd.Series[Any]) -> dict[str, Any]:
+    n_null = int(series.isna().sum())
+    values = series.dropna() if n_null else series
+    stats: dict[str, Any] = {"count": len(values), "n_null": n_null}
+    dtype = series.dtype
+    n_distinct = None
+    if not pd.api.types.is_bool_dtype(dtype) and (
+        pd.api.types.is_numeric_dtype(dtype)
+        or pd.api.types.is_datetime64_any_dtype(dtype)
+    ):
+        stats["min"] = _to_json(values.min())[1] if len(values) else None
+        stats["max"] = _to_json(values.max())[1] if len(values) else None
+        n_distinct = _n_distinct(values)
+    uniques = None
+    if n_distinct is None or n_distinct <= LOW_CARDINALITY:
+        uniques = pd.unique(values.to_numpy())
+        n_distinct = len(uniques)
+    stats["n_distinct"] = n_distinct
+    # object columns are string dtypes as well, e.g., of dates or decimals
+    if (
+        pd.api.types.is_string_dtype(dtype)
+        and uniques is not None
+        and pd.api.types.infer_dtype(uniques, skipna=True) in ("string", "empty")
+    ):
+        # lengths of the distinct values bound the lengths of all values
+        lengths = [len(value) for value in uniques]
+        stats["min_length"] = min(lengths) if lengths else None
+        stats["max_length"] = max(lengths) if lengths else None
+    if n_distinct <= LOW_CARDINALITY and uniques is not None:
+        converted = [_to_json(value) for value in uniques]
+        if all(ok for ok, _ in converted):
+            stats["values"] = [value for _, value in converted]
+    return stats
+
+
+def column_statistics(data: Any) -> dict[str, dict[str, Any]] | None:
+    """Summary statistics of the columns of a dataframe
+
+    For each column the number of non-null values (count), the null count
+    (n_null) and the distinct count (n_distinct) are computed. Numeric and
+    datetime columns get their min and max, string columns the min_length and
+    max_length of their values. Columns with at most `LOW_CARDINALITY` distinct
+    values keep their value set (values). All statistics are json serializable;
+    times are stored as iso strings.
+
+    Args:
+        data (Any): Data
+
+    Returns:
+        dict[str, dict[str, Any]] | None: Statistics by column name or None if
+            the data is not a pandas dataframe
+    """
+    if not isinstance(data, pd.DataFrame):
+        return None
+    return {str(column): _series_statistics(data[column]) for column in data.columns}
+
+
+def _decode(value: Any, field_type: str) -> Any:
+    if field_type in _TEMPORAL_TYPES and isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+    return value
+
+
+def _holds(change: SchemaChange, rule: FieldRule, stats: dict[str, Any]) -> bool:
+    """Whether the statistics prove that a tightened constraint holds"""
+    item = change.item
+    if item == "required":
+        return bool(stats["n_null"] == 0)
+    if item == "unique":
+        return bool(stats["n_null"] <= 1 and stats["n_distinct"] == stats["count"])
+    if stats["count"] == 0:  # only nulls, which pass all value constraints
+        return item in _VALUE_CONSTRAINTS
+    if item in ("minimum", "maximum") and "min" in stats:
+        low = _decode(stats["min"], rule.type)
+        high = _decode(stats["max"], rule.type)
+        if item == "minimum":
+            return bool(low >= rule.minimum)
+        return bool(high <= rule.maximum)
+    if item == "minLength" and "min_length" in stats:
+        return bool(stats["min_length"] >= rule.min_length)
+    if item == "maxLength" and "max_length" in stats:
+        return bool(stats["max_length"] <= rule.max_length)
+    values = stats.get("values")
+    if values is None:
+        return False
+    if item == "enum":
+        allowed = [_decode(value, rule.type) for value in rule.enum or []]
+        return all(_decode(value, rule.type) in allowed for value in values)
+    if item == "pattern" and all(isinstance(value, str) for value in values):
+        pattern = re.compile(rule.full_pattern or "")
+        return all(pattern.match(value) for value in values)
+    return False
+
+
+def undecided_changes(
+    changes: Sequence[SchemaChange],
+    schema: dict[str, Any],
+    statistics: dict[str, dict[str, Any]] | None,
+) -> list[SchemaChange]:
+    """Tightened changes that the column statistics of data cannot decide
+
+    The constraints required, unique, minimum, maximum, minLength, maxLength,
+    enum and pattern of a field are decided from the statistics computed by
+    `column_statistics`. A constraint that provably holds needs no data scan.
+    All other changes, e.g., added fields, changed types or failing constraints,
+    whose failures must be reported, are left to the validator.
+
+    Args:
+        changes (Sequence[SchemaChange]): Tightened changes, see `SchemaDiff`
+        schema (dict[str, Any]): New schema
+        statistics (dict[str, dict[str, Any]] | None): Column statistics of
+            the data
+
+    Returns:
+        list[SchemaChange]: Changes to check by validating the data
+    """
+    if not statistics:
+        return list(changes)
+    fields = {field["name"]: field for field in schema.get("fields", [])}
+    undecided = []
+    for change in changes:
+        stats = statistics.get(change.field or "")
+        field = fields.get(change.field or "")
+        if stats is None or field is None:
+            undecided.append(change)
+            continue
+        try:
+            holds = _holds(change, FieldRule(field), stats)
+        except (TypeError, ValueError):  # e.g., naive and aware times
+            holds = False
+        if not holds:
+            undecided.append(change)
+    return undecided
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ..metadata import series_group_fields, time_fields
+from .keys import group_codes
+
+__all__ = ["parse_frequency", "time_series_failures"]
+
+# frequencies of the SWEET metastandard and the pandas offset they stand for
+FREQUENCIES = {
+    "minutely": "min",
+    "quarter_hourly": "15min",
+    "quarter-hourly": "15min",
+    "half_hourly": "30min",
+    "half-hourly": "30min",
+    "hourly": "h",
+    "daily": "D",
+    "weekly": "W",
+    "monthly": "M",
+    "quarterly": "Q",
+    "yearly": "Y",
+    "annual": "Y",
+    "annually": "Y",
+}
+
+
+def parse_frequency(frequency: str) -> Any:
+    """Convert the frequency of a time field to a pandas period frequency
+
+    Args:
+        frequency (str): SWEET frequency, e.g., hourly, or pandas period alias,
+            e.g., 15min
+
+    Returns:
+        pd.DateOffset | None: Period frequency or None if the frequency is unknown
+    """
+    alias = FREQUENCIES.get(frequency.lower(), frequency)
+    try:
+        return pd.Period("2000-01-01", freq=alias).freq
+    except ValueError:
+        return None
+
+
+def _slots(
+    times: pd.Series[Any], nanos: np.ndarray[Any, Any], freq: Any
+) -> tuple[np.ndarray[Any, Any], int]:
+    """Number the times by the period of the frequency they fall in
+
+    Args:
+        times (pd.Series): Times
+        nanos (np.ndarray): Times as int64 nanoseconds
+        freq (pd.DateOffset): Period frequency
+
+    Returns:
+        tuple[np.ndarray, int]: Period numbers as int64 and the difference of
+            the numbers of consecutive periods
+    """
+    if isinstance(freq, pd.offsets.Tick):
+        # periods of fixed length are counted from the epoch as by pandas
+        base = freq.nanos // freq.n
+        return nanos // base, int(freq.n)
+    periods = times.dt.to_period(freq).astype(np.int64)  # period ordinals
+    return periods.to_numpy(), int(freq.n)
+
+
+def _cases(
+    data: pd.DataFrame, column: str, check: str, positions: np.ndarray[Any, Any]
+) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "column": column,
+            "check": check,
+            "failure_case": data[column].to_numpy()[positions],
+            "index": data.index[positions],
+        }
+    )
+
+
+def time_series_failures(
+    data: pd.DataFrame, schema: dict[str, Any]
+) -> pd.DataFrame | None:
+    """Check the time series of data against the `timeFields` of a schema
+
+    The rows are split into series by the fields returned by
+    `metadata.series_group_fields`, e.g., one series per country. Within each
+    series the following checks are made on the time fields:
+
+    - `monotonic_increasing`: a time is before the time of the previous row
+    - `unique_time`: a time occurs more than once
+    - `frequency('<frequency>')`: the distance to the previous time differs
+      from the declared frequency, e.g., an hour is missing. The row after the
+      gap fails.
+
+    All checks are vectorized: the series are numbered by `group_codes` and the
+    differences of consecutive times are computed on the rows sorted by series
+    and time. Missing times and values that are not times are left to the
+    other checks of the validator.
+
+    Args:
+        data (pd.DataFrame): Data
+        schema (dict[str, Any]): Schema
+
+    Returns:
+        pd.DataFrame | None: Failure cases in the format of pandera with the
+            columns column, check, failure_case and index, or None if there are
+            no failures
+    """
+    fields = [(name, freq) for name, freq in time_fields(schema) if name in data]
+    if not fields:
+        return None
+    groups = [c for c in series_group_fields(schema) if c in data.columns]
+    codes = group_codes(data, groups)
+    cases = []
+    for name, frequency in fields:
+        times = pd.to_datetime(data[name], errors="coerce")
+        if getattr(times.dtype, "tz", None) is not None:
+            times = times.dt.tz_convert("UTC").dt.tz_localize(None)
+        valid = times.notna().to_numpy()
+        nanos = times.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        rows = np.flatnonzero(valid)
+
+        # monotonicity in row order within each series
+        row_codes = codes[rows]
+        if np.all(row_codes[1:] >= row_codes[:-1]):  # rows grouped by series
+            order = rows
+        else:
+            order = rows[np.argsort(row_codes, kind="stable")]
+        same = codes[order][1:] == codes[order][:-1]
+        step = np.diff(nanos[order])
+        decreasing = same & (step < 0)
+        if decreasing.any():
+            positions = np.sort(order[1:][decreasing])
+            cases.append(_cases(data, name, "monotonic_increasing", positions))
+            # duplicates and gaps in time order within each series
+            order = rows[np.lexsort((nanos[rows], row_codes))]
+            same = codes[order][1:] == codes[order][:-1]
+            step = np.diff(nanos[order])
+        # else the rows are already sorted by series and time
+        duplicated = same & (step == 0)
+        if duplicated.any():
+            positions = np.union1d(order[1:][duplicated], order[:-1][duplicated])
+            cases.append(_cases(data, name, "unique_time", positions))
+        freq = parse_frequency(frequency) if frequency else None
+        if freq is None:
+            continue
+        slots, distance = _slots(times.iloc[order], nanos[order], freq)
+        off_grid = same & (step > 0) & (np.diff(slots) != distance)
+        if off_grid.any():
+            check = f"frequency({frequency!r})"
+            cases.append(_cases(data, name, check, np.sort(order[1:][off_grid])))
+    return pd.concat(cases, ignore_index=True) if cases else None
@@ -1,4 +1,10 @@
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 __all__ = ["ValidationReport"]
 
@@ -10,18 +16,184 @@ class ValidationReport:
 
     - `valid` - a boolean flag indicating whether the validation was successful
     - `errors` - a list of validation errors
+
+    Validators may additionally provide a compact representation of the failures
+    that stays small also for data with millions of failing rows:
+
+    - `failure_counts` - number of failures per (column, check). Schema level
+      failures have the column None.
+    - `failing_rows` - sorted index labels of the rows that fail at least one
+      check as numpy array
+    - `failure_cases` - a bounded sample of failure cases as dataframe with the
+      columns column, check, failure_case, and index
+    - `truncated` - True if the validator stopped collecting failures after
+      reaching its maximum number of errors. Counts and rows then only cover the
+      part of the data checked until then.
     """
 
     valid: bool
     errors: dict[Any, Any]
+    failure_counts: dict[tuple[str | None, str], int] | None
+    failing_rows: np.ndarray[Any, Any] | None
+    failure_cases: pd.DataFrame | None
+    truncated: bool
 
-    def __init__(self, valid: bool, errors: dict[Any, Any]) -> None:
+    def __init__(
+        self,
+        valid: bool,
+        errors: dict[Any, Any],
+        failure_counts: dict[tuple[str | None, str], int] | None = None,
+        failing_rows: np.ndarray[Any, Any] | None = None,
+        failure_cases: pd.DataFrame | None = None,
+        truncated: bool = False,
+    ) -> None:
         self.valid = valid
         self.errors = errors
+        self.failure_counts = failure_counts
+        self.failing_rows = failing_rows
+        self.failure_cases = failure_cases
+        self.truncated = truncated
+
+    @classmethod
+    def from_counts(
+        cls,
+        failure_counts: dict[tuple[str | None, str], int],
+        failing_rows: np.ndarray[Any, Any] | None = None,
+        failure_cases: pd.DataFrame | None = None,
+        truncated: bool = False,
+    ) -> ValidationReport:
+        """Create a compact report from the failure counts per (column, check)
+
+        The report is valid if there are no failures. The errors contain the
+        counts by column and check.
+
+        Args:
+            failure_counts (dict[tuple[str | None, str], int]): Number of
+                failures per (column, check). Checks without failures may be
+                included with a count of zero.
+            failing_rows (np.ndarray | None, optional): Sorted failing rows.
+                Defaults to None.
+            failure_cases (pd.DataFrame | None, optional): Sample of failure
+                cases. Defaults to None.
+            truncated (bool, optional): Whether the validation stopped early.
+                Defaults to False.
+
+        Returns:
+            ValidationReport: Validation report
+        """
+        counts = {key: count for key, count in failure_counts.items() if count}
+        errors: dict[str | None, dict[str, int]] = {}
+        for (column, check), count in counts.items():
+            errors.setdefault(column, {})[check] = count
+        return cls(
+            valid=not counts,
+            errors=errors,
+            failure_counts=counts,
+            failing_rows=failing_rows,
+            failure_cases=failure_cases if counts else None,
+            truncated=truncated,
+        )
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, ValidationReport):
             return False
-        if self.valid == value.valid and self.errors == value.errors:
+        if (
+            self.valid == value.valid
+            and self.errors == value.errors
+            and self.failure_counts == value.failure_counts
+            and self.truncated == value.truncated
+        ):
             return True
         return False
+
+    @property
+    def n_failures(self) -> int | None:
+        """Total number of failures or None if no failure counts are available"""
+        if self.failure_counts is None:
+            return None
+        return sum(self.failure_counts.values())
+
+    def summary(self, max_lines: int = 20) -> str:
+        """Short description of the failures
+
+        Uses the failure counts if available and falls back to the errors.
+
+        Args:
+            max_lines (int, optional): Maximum number of (column, check) lines.
+                Defaults to 20.
+
+        Returns:
+            str: Summary of the failures
+        """
+        if self.failure_counts is None:
+            return str(self.errors)
+        lines = [
+            f"{column if column is not None else '<schema>'}: {check}: {count}"
+            for (column, check), count in list(self.failure_counts.items())[:max_lines]
+        ]
+        if len(self.failure_counts) > max_lines:
+            lines.append(f"... {len(self.failure_counts) - max_lines} more checks")
+        if self.failing_rows is not None:
+            lines.append(f"failing rows: {len(self.failing_rows)}")
+        if self.truncated:
+            lines.append("(truncated after reaching the maximum number of errors)")
+        return "\n".join(lines)
+
+    def to_dict(self, max_cases: int = 10) -> dict[str, Any]:
+        """Convert the report to a json serializable dictionary
+
+        The errors are only included if no failure counts are available.
+
+        Args:
+            max_cases (int, optional): Maximum number of failure cases included.
+                Defaults to 10.
+
+        Returns:
+            dict[str, Any]: Dictionary representation
+        """
+        result: dict[str, Any] = {"valid": self.valid, "truncated": self.truncated}
+        if self.failure_counts is None:
+            result["errors"] = self.errors
+            return result
+        result["failure_counts"] = [
+            {"column": column, "check": check, "count": count}
+            for (column, check), count in self.failure_counts.items()
+        ]
+        if self.failing_rows is not None:
+            result["n_failing_rows"] = len(self.failing_rows)
+        if self.failure_cases is not None:
+            cases = self.failure_cases.head(max_cases).astype(str)
+            result["failure_cases"] = cases.to_dict(orient="records")
+        return result
+
+    @classmethod
+    def from_dict(cls, value: dict[str, Any]) -> ValidationReport:
+        """Create a report from its dictionary representation
+
+        The failing rows are not part of the dictionary and therefore missing,
+        the failure cases are limited to the included sample.
+
+        Args:
+            value (dict[str, Any]): Dictionary as returned by `to_dict`
+
+        Returns:
+            ValidationReport: Validation report
+        """
+        if "failure_counts" not in value:
+            return cls(
+                valid=value["valid"],
+                errors=value.get("errors", {}),
+                truncated=value.get("truncated", False),
+            )
+        import pandas as pd
+
+        counts = {
+            (item["column"], item["check"]): item["count"]
+            for item in value["failure_counts"]
+        }
+        cases = value.get("failure_cases")
+        return cls.from_counts(
+            counts,
+            failure_cases=pd.DataFrame(cases) if cases is not None else None,
+            truncated=value.get("truncated", False),
+        )